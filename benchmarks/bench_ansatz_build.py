@@ -0,0 +1,52 @@
+"""
+Benchmark: `create_custom_ansatz` build time from 10^3 to 10^5 gates.
+
+The structure is a list of hardware-efficient layers (one RY per qubit and a CX
+ladder), each layer a nested block, so both the flattening and the gate
+application are exercised. Linear scaling shows as a constant time per gate.
+The second table isolates the flattening of a flat structure: the previous
+`pop(0)` queue against the stack-based walk now used by the builder.
+"""
+import time
+from easy_vqe import create_custom_ansatz
+from easy_vqe.circuit import _iter_instructions
+
+NUM_QUBITS = 20
+GATES_PER_LAYER = 2 * NUM_QUBITS - 1
+REPEATS = 3
+
+def layered_structure(num_layers):
+    return [[('ry', list(range(NUM_QUBITS))), [('cx', [q, q + 1]) for q in range(NUM_QUBITS - 1)]]
+            for _ in range(num_layers)]
+
+def best_time(function):
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def queue_flatten(structure):
+    # The former flattening: quadratic in the number of top-level elements
+    queue, flat = list(structure), []
+    while queue:
+        element = queue.pop(0)
+        if isinstance(element, list):
+            queue[0:0] = element
+        else:
+            flat.append(element)
+    return flat
+
+print(f"{'gates':>8s} {'parameters':>11s} {'build (s)':>10s} {'us / gate':>10s}")
+for target_gates in (10**3, 10**4, 10**5):
+    structure = layered_structure(target_gates // GATES_PER_LAYER)
+    elapsed, (ansatz, parameters) = best_time(lambda: create_custom_ansatz(NUM_QUBITS, structure))
+    print(f"{ansatz.size():8d} {len(parameters):11d} {elapsed:10.3f} {1e6 * elapsed / ansatz.size():10.2f}")
+
+print(f"\n{'elements':>8s} {'pop(0) queue (s)':>17s} {'stack walk (s)':>15s}")
+for num_elements in (10**3, 10**4, 10**5, 2 * 10**5):
+    structure = [('h', [0])] * num_elements
+    queue_time, _ = best_time(lambda: queue_flatten(structure))
+    stack_time, _ = best_time(lambda: list(_iter_instructions(structure)))
+    print(f"{num_elements:8d} {queue_time:17.3f} {stack_time:15.3f}")
@@ -0,0 +1,55 @@
+"""
+Benchmark: time to first evaluation, from scratch against a saved prepared state.
+
+From scratch, a fresh process builds the ansatz, groups the Hamiltonian terms,
+builds and transpiles the measurement circuits and then runs them. From a state
+saved with `PreparedEvaluation.save`, it only reads the file and runs. Each row
+uses a fresh `ExecutionEngine`, so no transpilation cache is shared between the
+two columns.
+"""
+import os
+import time
+import tempfile
+import numpy as np
+from easy_vqe import create_custom_ansatz, parse_hamiltonian_expression, ExecutionEngine
+from easy_vqe.prepared import PreparedEvaluation, prepare_evaluation
+
+SHOTS = 1024
+LAYERS = 4
+
+def layered_structure(num_qubits):
+    return [[('ry', list(range(num_qubits))), [('cx', [q, q + 1]) for q in range(num_qubits - 1)]]
+            for _ in range(LAYERS)]
+
+def hamiltonian(num_qubits):
+    terms = []
+    for q in range(num_qubits - 1):
+        for a, b in (('Z', 'Z'), ('X', 'X'), ('Y', 'Y')):
+            label = ['I'] * num_qubits
+            label[q], label[q + 1] = a, b
+            terms.append(f"0.5 * {''.join(label)}")
+    return " + ".join(terms)
+
+def from_scratch(num_qubits, values):
+    start = time.perf_counter()
+    ansatz, _ = create_custom_ansatz(num_qubits, layered_structure(num_qubits))
+    prepared = prepare_evaluation(ansatz, parse_hamiltonian_expression(hamiltonian(num_qubits)), engine=ExecutionEngine())
+    prepared.evaluate(values, n_shots=SHOTS, engine=ExecutionEngine())
+    return time.perf_counter() - start, prepared
+
+def from_file(path, values):
+    start = time.perf_counter()
+    PreparedEvaluation.load(path).evaluate(values, n_shots=SHOTS, engine=ExecutionEngine())
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    print(f"{'qubits':>6} {'terms':>6} {'scratch':>10} {'loaded':>10} {'file':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        for num_qubits in (4, 8, 12, 16):
+            values = np.linspace(-1.0, 1.0, LAYERS * num_qubits)
+            path = os.path.join(directory, f"state_{num_qubits}.npz")
+            scratch_seconds, prepared = from_scratch(num_qubits, values)
+            prepared.save(path)
+            loaded_seconds = from_file(path, values)
+            print(f"{num_qubits:6d} {3 * (num_qubits - 1):6d} {1e3 * scratch_seconds:7.1f} ms "
+                  f"{1e3 * loaded_seconds:7.1f} ms {os.path.getsize(path) / 1024:6.1f} kB")
@@ -0,0 +1,41 @@
+"""
+Benchmark: independent energy evaluations run serially and from a thread pool.
+
+Each worker thread uses its own simulator of one shared `ExecutionEngine`,
+restricted to one OpenMP thread, so the speedup of the pool shows how well
+concurrent runs spread over the available cores.
+"""
+import os
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from easy_vqe import ExecutionEngine, create_custom_ansatz, parse_hamiltonian_expression, get_hamiltonian_expectation_value
+
+NUM_QUBITS = 8
+NUM_EVALUATIONS = 8
+WORKERS = os.cpu_count() or 1
+
+parsed_hamiltonian = parse_hamiltonian_expression(
+    " + ".join(f"0.5 * {'I' * q}ZZ{'I' * (NUM_QUBITS - q - 2)}" for q in range(NUM_QUBITS - 1))
+    + " + " + " + ".join(f"0.3 * {'I' * q}X{'I' * (NUM_QUBITS - q - 1)}" for q in range(NUM_QUBITS)))
+ansatz, parameters = create_custom_ansatz(NUM_QUBITS, [('ry', list(range(NUM_QUBITS))),
+                                                       *[('cx', [q, q + 1]) for q in range(NUM_QUBITS - 1)],
+                                                       ('ry', list(range(NUM_QUBITS)))])
+rng = np.random.default_rng(3)
+points = rng.uniform(0, 2 * np.pi, size=(2, NUM_EVALUATIONS, len(parameters))) # Fresh points per run, so no transpile cache hits
+engine = ExecutionEngine(max_parallel_threads=1)
+
+def evaluate(point):
+    return get_hamiltonian_expectation_value(ansatz, parsed_hamiltonian, point, n_shots=2048, engine=engine)
+
+def timed(label, function):
+    start = time.perf_counter()
+    value = function()
+    print(f"{label:<32s} {time.perf_counter() - start:8.3f} s")
+    return value
+
+print(f"{NUM_EVALUATIONS} evaluations, {len(parsed_hamiltonian)} terms on {NUM_QUBITS} qubits, {WORKERS} workers")
+timed("serial", lambda: [evaluate(point) for point in points[0]])
+with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+    timed("thread pool", lambda: list(pool.map(evaluate, points[1])))
+print(engine.stats())
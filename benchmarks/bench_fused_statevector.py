@@ -0,0 +1,45 @@
+"""
+Benchmark: exact simulation of a layered ansatz with new parameters per call.
+
+Compares binding the ansatz and simulating it with Qiskit's `Statevector`
+(the former exact-mode path) with the gate-fused `CompiledAnsatz`, for single
+parameter vectors and for a batch of them. The one-time compilation cost is
+shown separately.
+"""
+import time
+import numpy as np
+from qiskit.quantum_info import Statevector
+from easy_vqe import create_custom_ansatz, Repeat
+from easy_vqe.circuit import bind_parameter_array
+from easy_vqe.fusion import compile_ansatz
+
+NUM_LAYERS = 4
+BATCH = 16
+REPEATS = 5
+
+def best_time(function, repeats=REPEATS):
+    """Best of several runs, so that garbage collection pauses do not distort the comparison."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+print(f"{'qubits':>6s} {'gates':>6s} {'kernels':>8s} {'Statevector':>12s} {'fused':>10s} {'fused/batch':>12s} {'compile':>10s}")
+for num_qubits in (6, 10, 14, 18):
+    layer = [('ry', list(range(num_qubits))), ('rz', list(range(num_qubits)))] + \
+            [('cx', [q, q + 1]) for q in range(num_qubits - 1)]
+    ansatz, parameters = create_custom_ansatz(num_qubits, [('h', list(range(num_qubits))), Repeat(layer, NUM_LAYERS)])
+    rng = np.random.default_rng(3)
+    values = rng.uniform(0, 2 * np.pi, len(parameters))
+    batch = rng.uniform(0, 2 * np.pi, (BATCH, len(parameters)))
+
+    compile_seconds = best_time(lambda: compile_ansatz(ansatz), repeats=2)
+    compiled = compile_ansatz(ansatz)
+    assert np.allclose(compiled.statevector(values), Statevector(bind_parameter_array(ansatz, values)).data)
+    statevector_seconds = best_time(lambda: Statevector(bind_parameter_array(ansatz, values)))
+    fused_seconds = best_time(lambda: compiled.statevector(values))
+    batch_seconds = best_time(lambda: compiled.statevectors(batch)) / BATCH
+    print(f"{num_qubits:6d} {ansatz.size():6d} {compiled.num_kernels:8d} {1e3 * statevector_seconds:9.2f} ms "
+          f"{1e3 * fused_seconds:7.2f} ms {1e3 * batch_seconds:9.2f} ms {1e3 * compile_seconds:7.2f} ms")
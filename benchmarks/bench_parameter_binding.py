@@ -0,0 +1,54 @@
+"""
+Benchmark: binding a 1000-parameter ansatz.
+
+Compares the former binding path (regex-sorting `ansatz.parameters`, building a
+{Parameter: float} dictionary and assigning it) with `bind_parameter_array`,
+which uses the parameter order stored by `create_custom_ansatz` and assigns a
+NumPy array positionally. For scale, the cost of one exact energy evaluation of
+the same ansatz is shown, with the share of it spent binding parameters
+(measured with cProfile).
+"""
+import re
+import time
+import cProfile
+import pstats
+import numpy as np
+from easy_vqe import create_custom_ansatz, Repeat, parse_hamiltonian_expression, get_hamiltonian_expectation_value
+from easy_vqe.circuit import bind_parameter_array
+
+NUM_QUBITS = 10
+NUM_LAYERS = 50 # 2 * NUM_QUBITS parameters per layer
+REPEATS = 20
+
+ansatz, parameters = create_custom_ansatz(NUM_QUBITS, [Repeat([('ry', list(range(NUM_QUBITS))), ('rz', list(range(NUM_QUBITS))),
+                                                               [('cx', [q, q + 1]) for q in range(NUM_QUBITS - 1)]], NUM_LAYERS)])
+parsed_hamiltonian = parse_hamiltonian_expression(
+    " + ".join(f"1.0 * {'I' * q}ZZ{'I' * (NUM_QUBITS - q - 2)}" for q in range(NUM_QUBITS - 1)))
+values = np.random.default_rng(1).uniform(0, 2 * np.pi, len(parameters))
+
+def former_binding():
+    sorted_params = sorted(ansatz.parameters, key=lambda p: int(re.search(r'\d+', p.name).group()) if re.search(r'\d+', p.name) else float('inf'))
+    return ansatz.assign_parameters({p: float(v) for p, v in zip(sorted_params, values)})
+
+def timed(label, function):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        function()
+    elapsed = (time.perf_counter() - start) / REPEATS
+    print(f"{label:<36s} {1e3 * elapsed:8.2f} ms")
+    return elapsed
+
+print(f"{len(parameters)} parameters, {ansatz.size()} gates on {NUM_QUBITS} qubits")
+timed("former: sort + dict + assign", former_binding)
+timed("bind_parameter_array", lambda: bind_parameter_array(ansatz, values))
+timed("exact energy evaluation", lambda: get_hamiltonian_expectation_value(ansatz, parsed_hamiltonian, values, n_shots=None))
+
+profiler = cProfile.Profile()
+profiler.enable()
+for _ in range(REPEATS):
+    get_hamiltonian_expectation_value(ansatz, parsed_hamiltonian, values, n_shots=None)
+profiler.disable()
+stats = pstats.Stats(profiler)
+total = stats.total_tt
+binding = sum(timing[3] for (_, _, name), timing in stats.stats.items() if name in ('assign_parameters', '_resolve_ansatz_parameter_map'))
+print(f"binding share of an exact evaluation (profiled): {100 * binding / total:.1f} %")
@@ -0,0 +1,49 @@
+"""
+Benchmark: per-term Pauli expectation values on a 16-qubit statevector.
+
+Compares the matrix-free kernel `easy_vqe.pauli.pauli_expectations` with
+Qiskit operator-based evaluation of the same random 1000-term Hamiltonian.
+"""
+import time
+import numpy as np
+from qiskit.quantum_info import SparsePauliOp, random_statevector
+from easy_vqe.pauli import compile_hamiltonian, pauli_expectations
+
+NUM_QUBITS = 16
+NUM_TERMS = 1000
+
+rng = np.random.default_rng(7)
+parsed_hamiltonian = [(float(rng.normal()), ''.join(rng.choice(list('IXYZ'), NUM_QUBITS))) for _ in range(NUM_TERMS)]
+state = random_statevector(2**NUM_QUBITS, seed=7)
+
+def timed(label, function):
+    start = time.perf_counter()
+    value = function()
+    print(f"{label:<42s} {time.perf_counter() - start:8.3f} s")
+    return value
+
+def kernel_energy():
+    coefficients, x_masks, z_masks = compile_hamiltonian(parsed_hamiltonian)
+    return float(coefficients @ pauli_expectations(state.data, x_masks, z_masks))
+
+# Qiskit labels put qubit 0 last, easy_vqe strings put it first
+labels = [pauli_string[::-1] for _, pauli_string in parsed_hamiltonian]
+coefficients = [coefficient for coefficient, _ in parsed_hamiltonian]
+
+def qiskit_per_term_energy():
+    return float(sum(c * state.expectation_value(SparsePauliOp(label)).real for c, label in zip(coefficients, labels)))
+
+def qiskit_sparse_matrix_energy():
+    matrix = SparsePauliOp(labels, coefficients).to_matrix(sparse=True)
+    return float(np.vdot(state.data, matrix @ state.data).real)
+
+def qiskit_operator_energy():
+    return float(state.expectation_value(SparsePauliOp(labels, coefficients)).real)
+
+print(f"{NUM_TERMS} terms on {NUM_QUBITS} qubits")
+reference = timed("easy_vqe pauli_expectations (per term)", kernel_energy)
+for label, function in [("Qiskit expectation_value per term", qiskit_per_term_energy),
+                        ("Qiskit SparsePauliOp.to_matrix(sparse)", qiskit_sparse_matrix_energy),
+                        ("Qiskit expectation_value (total only)", qiskit_operator_energy)]:
+    value = timed(label, function)
+    assert np.isclose(value, reference), (label, value, reference)
@@ -8,26 +8,88 @@ __version__ = "1.1.0"
 
 # Public API exports
 from .hamiltonian import parse_hamiltonian_expression, get_theoretical_ground_state_energy
-from .circuit import create_custom_ansatz
+from .circuit import create_custom_ansatz, Repeat, parameter_order, bind_parameter_array
 from .measurement import (
     apply_measurement_basis,
     run_circuit_and_get_counts,
-    calculate_term_expectation, 
-    get_hamiltonian_expectation_value
+    run_circuit_and_get_outcomes,
+    calculate_term_expectation,
+    calculate_outcome_expectation,
+    get_hamiltonian_expectation_value,
+    estimate_expectation_value
 )
+from .engine import ExecutionEngine, get_default_engine
+from .target import TargetProfile, TargetTranspilation, load_target_profile, transpile_for_target
+from .prepared import PreparedEvaluation, prepare_evaluation
+from .shots import allocate_shots, ShotAllocator, ShotSchedule
+from .shadows import ClassicalShadow, collect_classical_shadow
+from .cache import ExpectationCache
+from .ansatz_cache import AnsatzCache, structure_fingerprint
+from .simplify import simplify_circuit
+from .ansatz_library import (hardware_efficient_ansatz, brick_wall_ansatz, particle_conserving_ansatz, uccsd_ansatz,
+                             build_ansatz, get_ansatz_metadata)
+from .fusion import compile_ansatz, CompiledAnsatz, CheckpointedAnsatz, clear_compiled_ansatz_cache
+from .lightcone import reduce_to_light_cone, clear_light_cone_cache
+from .parallel import ParallelEvaluator
+from .distributed import DistributedEvaluator, run_worker
+from .decomposition import find_qubit_clusters, split_into_subsystems
 from .vqe_core import find_ground_state, OptimizationLogger
+from .aio import get_hamiltonian_expectation_value_async, gather_expectation_values, find_ground_state_async
 from .visualization import print_results_summary, draw_final_bound_circuit
 
 __all__ = [
     'parse_hamiltonian_expression',
     'get_theoretical_ground_state_energy',
     'create_custom_ansatz',
+    'Repeat',
+    'parameter_order',
+    'bind_parameter_array',
     'apply_measurement_basis',
     'run_circuit_and_get_counts',
+    'run_circuit_and_get_outcomes',
     'calculate_term_expectation',
+    'calculate_outcome_expectation',
     'get_hamiltonian_expectation_value',
+    'estimate_expectation_value',
+    'ExecutionEngine',
+    'get_default_engine',
+    'TargetProfile',
+    'TargetTranspilation',
+    'load_target_profile',
+    'transpile_for_target',
+    'PreparedEvaluation',
+    'prepare_evaluation',
+    'allocate_shots',
+    'ShotAllocator',
+    'ShotSchedule',
+    'ClassicalShadow',
+    'collect_classical_shadow',
+    'ExpectationCache',
+    'AnsatzCache',
+    'structure_fingerprint',
+    'simplify_circuit',
+    'hardware_efficient_ansatz',
+    'brick_wall_ansatz',
+    'particle_conserving_ansatz',
+    'uccsd_ansatz',
+    'build_ansatz',
+    'get_ansatz_metadata',
+    'compile_ansatz',
+    'CompiledAnsatz',
+    'CheckpointedAnsatz',
+    'clear_compiled_ansatz_cache',
+    'reduce_to_light_cone',
+    'clear_light_cone_cache',
+    'ParallelEvaluator',
+    'DistributedEvaluator',
+    'run_worker',
+    'find_qubit_clusters',
+    'split_into_subsystems',
     'find_ground_state',
     'OptimizationLogger',
+    'get_hamiltonian_expectation_value_async',
+    'gather_expectation_values',
+    'find_ground_state_async',
     'print_results_summary',
     'draw_final_bound_circuit',
     '_version_',
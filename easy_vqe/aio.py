@@ -0,0 +1,107 @@
+"""
+Asyncio interface for Easy VQE.
+
+Simulations block the calling thread until Aer returns, so the coroutines in
+this module run the regular (blocking) functions in an executor and await the
+result. The event loop stays free while a VQE search or an expectation value is
+computed, and independent jobs can be overlapped with `asyncio.gather`.
+
+By default the loop's default thread pool is used. Circuit execution is
+thread-safe (see `easy_vqe.engine`) and Aer releases the GIL while simulating,
+so concurrent jobs overlap. Pass a `concurrent.futures.ProcessPoolExecutor` to
+run jobs in separate processes instead.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import List, Tuple, Dict, Union, Optional, Sequence, Any
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+
+from .measurement import get_hamiltonian_expectation_value
+from .vqe_core import find_ground_state
+
+
+async def get_hamiltonian_expectation_value_async(
+    ansatz: QuantumCircuit,
+    parsed_hamiltonian: List[Tuple[float, str]],
+    param_values: Union[Sequence[float], Dict[Parameter, float], None],
+    n_shots: Optional[int] = 1024,
+    executor: Optional[Executor] = None,
+    **expectation_options
+) -> Union[float, Dict[str, Any]]:
+    """
+    Awaitable version of `get_hamiltonian_expectation_value`.
+
+    Args:
+        ansatz: The (parameterized) ansatz circuit. *Should not contain measurements.*
+        parsed_hamiltonian: List of (coefficient, pauli_string) tuples.
+        param_values: Numerical parameter values for the ansatz (Sequence, dict or None).
+        n_shots: Shots per measurement circuit, as in `get_hamiltonian_expectation_value`.
+        executor: Executor that runs the evaluation; None uses the event loop's default executor.
+        **expectation_options: Further options for `get_hamiltonian_expectation_value`
+                               (e.g. `return_details`, `engine`).
+
+    Returns:
+        The result of `get_hamiltonian_expectation_value`.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(get_hamiltonian_expectation_value, ansatz, parsed_hamiltonian,
+                             param_values, n_shots, **expectation_options)
+    return await loop.run_in_executor(executor, call)
+
+
+async def gather_expectation_values(
+    ansatz: QuantumCircuit,
+    parsed_hamiltonian: List[Tuple[float, str]],
+    param_sets: Sequence[Union[Sequence[float], Dict[Parameter, float], None]],
+    n_shots: Optional[int] = 1024,
+    executor: Optional[Executor] = None,
+    **expectation_options
+) -> List[Union[float, Dict[str, Any]]]:
+    """
+    Evaluates <H> at several parameter points concurrently.
+
+    Args:
+        ansatz: The (parameterized) ansatz circuit.
+        parsed_hamiltonian: List of (coefficient, pauli_string) tuples.
+        param_sets: One parameter vector (or dict) per evaluation.
+        n_shots: Shots per measurement circuit.
+        executor: Executor that runs the evaluations; None uses the event loop's default executor.
+        **expectation_options: Further options for `get_hamiltonian_expectation_value`.
+
+    Returns:
+        List: The results, in the order of `param_sets`.
+    """
+    return list(await asyncio.gather(*[
+        get_hamiltonian_expectation_value_async(ansatz, parsed_hamiltonian, param_values, n_shots,
+                                                executor=executor, **expectation_options)
+        for param_values in param_sets]))
+
+
+async def find_ground_state_async(
+    ansatz_structure: List[Union[Tuple[str, List[int]], List]],
+    hamiltonian_expression: str,
+    executor: Optional[Executor] = None,
+    **vqe_options
+) -> Dict[str, Any]:
+    """
+    Awaitable version of `find_ground_state`.
+
+    The search runs in `executor` and cannot be interrupted once started; cancelling
+    the awaiting task only stops waiting for it. Progress output is usually best
+    disabled (`display_progress=False`) when several searches run at once.
+
+    Args:
+        ansatz_structure: Definition for `create_custom_ansatz`.
+        hamiltonian_expression: Hamiltonian string (e.g., "-1.0*ZZ + 0.5*X").
+        executor: Executor that runs the search; None uses the event loop's default executor.
+        **vqe_options: Further keyword arguments for `find_ground_state`.
+
+    Returns:
+        Dict[str, Any]: The result dictionary of `find_ground_state`.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(find_ground_state, ansatz_structure, hamiltonian_expression, **vqe_options)
+    return await loop.run_in_executor(executor, call)
@@ -0,0 +1,223 @@
+"""
+Build cache for ansatz circuits.
+
+Parameter sweeps call `find_ground_state` with one `ansatz_structure` for many
+Hamiltonians. `AnsatzCache` builds every distinct (num_qubits, structure) pair
+once with `create_custom_ansatz`, keyed by `structure_fingerprint`, and returns
+the same circuit and parameter order on later requests. The simplified ansatz
+(see `easy_vqe.simplify`) and the ansatz transpiled for the simulator can be
+kept with it. With a `directory`, entries are also
+written as QPY files, so that new processes start with a warm cache.
+"""
+
+import os
+import hashlib
+import tempfile
+import threading
+import warnings
+from collections import OrderedDict
+from typing import List, Tuple, Dict, Union, Optional, Any
+from qiskit import QuantumCircuit, qpy
+from qiskit.circuit import Parameter
+
+from .circuit import create_custom_ansatz, Repeat, parameter_order
+from .engine import ExecutionEngine, get_default_engine
+from .simplify import simplify_circuit
+
+_END = object() # Marks an exhausted block while walking a structure
+
+
+def structure_fingerprint(num_qubits: int, ansatz_structure: List[Union[Tuple[str, List[int]], List, Repeat]]) -> str:
+    """
+    Computes a canonical hash of an ansatz definition.
+
+    Structures that are equal element by element (gate names compared
+    case-insensitively) share a fingerprint; the block nesting and `Repeat`
+    arguments are part of it. The structure is not validated.
+
+    Args:
+        num_qubits: The number of qubits of the ansatz.
+        ansatz_structure: Definition for `create_custom_ansatz`.
+
+    Returns:
+        str: A hexadecimal digest identifying the definition.
+    """
+    hasher = hashlib.sha1()
+    hasher.update(f"{num_qubits}|".encode())
+    stack = [iter([ansatz_structure])]
+    while stack:
+        element = next(stack[-1], _END)
+        if element is _END:
+            stack.pop()
+            hasher.update(b']')
+        elif isinstance(element, list):
+            hasher.update(b'[')
+            stack.append(iter(element))
+        elif isinstance(element, Repeat):
+            hasher.update(f"R{element.count},{element.share_params}".encode())
+            stack.append(iter([element.block]))
+        elif isinstance(element, tuple) and len(element) == 2 and isinstance(element[0], str):
+            hasher.update(repr((element[0].lower(), element[1])).encode())
+        else:
+            hasher.update(repr(element).encode())
+    return hasher.hexdigest()
+
+
+class AnsatzCache:
+    """
+    LRU memoization of `create_custom_ansatz`, optionally persisted as QPY files.
+
+    `get` returns the cached circuit itself, so it is shared by all callers and must
+    not be modified in place (binding parameters with `assign_parameters` creates a
+    new circuit and is fine). A cache can be shared between threads; builds run
+    outside its lock.
+
+    Attributes:
+        max_size (int): Maximum number of ansatzes kept in memory; the least recently used is evicted first.
+        directory (Optional[str]): Directory of the QPY files (None keeps the cache in memory only).
+        hits (int): Requests answered from memory (plain and simplified ansatzes are counted separately).
+        disk_hits (int): Requests answered by loading a QPY file.
+        misses (int): Requests that built the ansatz.
+    """
+    def __init__(self, max_size: int = 32, directory: Optional[str] = None):
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}.")
+        self.max_size = max_size
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Removes all entries from memory (files on disk are kept) and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+    def get(self,
+            num_qubits: int,
+            ansatz_structure: List[Union[Tuple[str, List[int]], List, Repeat]],
+            simplify: bool = False) -> Tuple[QuantumCircuit, List[Parameter]]:
+        """
+        Returns the ansatz for a definition, building it only on the first request.
+
+        Args:
+            num_qubits: The number of qubits for the circuit.
+            ansatz_structure: Definition for `create_custom_ansatz`.
+            simplify: If True, return the ansatz after `simplify_circuit` (cached separately).
+
+        Returns:
+            Tuple[QuantumCircuit, List[Parameter]]: The (shared) circuit and its sorted
+            parameters, as returned by `create_custom_ansatz`.
+
+        Raises:
+            The errors of `create_custom_ansatz` for invalid definitions (nothing is cached then).
+        """
+        entry = self._entry(num_qubits, ansatz_structure, simplify)
+        return entry['ansatz'], list(entry['parameters'])
+
+    def transpiled(self,
+                   num_qubits: int,
+                   ansatz_structure: List[Union[Tuple[str, List[int]], List, Repeat]],
+                   engine: Optional[ExecutionEngine] = None,
+                   simplify: bool = False) -> QuantumCircuit:
+        """
+        Returns the ansatz transpiled for the simulator, transpiling it only once.
+
+        Args:
+            num_qubits: The number of qubits for the circuit.
+            ansatz_structure: Definition for `create_custom_ansatz`.
+            engine: Engine whose simulator is the target (default: the shared default engine).
+                    All engines target the Aer simulator, so the result is stored once per definition.
+            simplify: If True, transpile the simplified ansatz.
+
+        Returns:
+            QuantumCircuit: The transpiled ansatz (shared, must not be modified in place).
+        """
+        key = self._key(num_qubits, ansatz_structure, simplify)
+        entry = self._entry(num_qubits, ansatz_structure, simplify, key)
+        if entry['transpiled'] is None:
+            entry['transpiled'] = (engine or get_default_engine()).transpile(entry['ansatz'])
+            self._save(key, entry)
+        return entry['transpiled']
+
+    @staticmethod
+    def _key(num_qubits: int, ansatz_structure: List[Union[Tuple[str, List[int]], List, Repeat]], simplify: bool) -> str:
+        return structure_fingerprint(num_qubits, ansatz_structure) + ('-simplified' if simplify else '')
+
+    def _entry(self,
+               num_qubits: int,
+               ansatz_structure: List[Union[Tuple[str, List[int]], List, Repeat]],
+               simplify: bool = False,
+               key: Optional[str] = None) -> Dict[str, Any]:
+        key = key or self._key(num_qubits, ansatz_structure, simplify)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._load(key)
+        if entry is None:
+            if simplify:
+                built = self._entry(num_qubits, ansatz_structure) # Simplified from the (cached) plain ansatz
+                entry = {'ansatz': simplify_circuit(built['ansatz']), 'parameters': built['parameters'], 'transpiled': None}
+            else:
+                ansatz, parameters = create_custom_ansatz(num_qubits, ansatz_structure)
+                entry = {'ansatz': ansatz, 'parameters': tuple(parameters), 'transpiled': None}
+            self._save(key, entry)
+        from_disk = entry.pop('from_disk', False)
+        with self._lock:
+            if from_disk:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+            entry = self._entries.setdefault(key, entry) # Keep the first of concurrent builds
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return entry
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"ansatz_{key}.qpy")
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Reads an entry from its QPY file; None if there is no (readable) file."""
+        if self.directory is None or not os.path.exists(self._path(key)):
+            return None
+        try:
+            with open(self._path(key), 'rb') as file:
+                circuits = qpy.load(file)
+        except Exception as e:
+            warnings.warn(f"Could not load cached ansatz '{self._path(key)}': {e}. Rebuilding it.", UserWarning)
+            return None
+        ansatz = circuits[0]
+        return {'ansatz': ansatz,
+                'parameters': tuple(parameter_order(ansatz)), # Stored in the QPY metadata
+                'transpiled': circuits[1] if len(circuits) > 1 else None,
+                'from_disk': True}
+
+    def _save(self, key: str, entry: Dict[str, Any]) -> None:
+        """Writes an entry to its QPY file (atomically, so concurrent readers never see a partial file)."""
+        if self.directory is None:
+            return
+        circuits = [entry['ansatz']] + ([entry['transpiled']] if entry['transpiled'] is not None else [])
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as file:
+                qpy.dump(circuits, file)
+            os.replace(temp_path, self._path(key))
+        except Exception as e:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            warnings.warn(f"Could not write cached ansatz '{self._path(key)}': {e}", UserWarning)
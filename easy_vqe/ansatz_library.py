@@ -0,0 +1,334 @@
+"""
+Built-in ansatz generators for Easy VQE.
+
+Each generator returns an ansatz structure for `create_custom_ansatz` together
+with a metadata dictionary describing it: the gate and parameter range of every
+layer, the entangling pairs of each layer and the backward light cone of every
+qubit. `build_ansatz` stores the metadata on the circuit, where the execution
+paths read it instead of recovering the same information from the gate list.
+
+Metadata keys shared by all generators:
+    - 'name' (str): The generator ('hardware_efficient', 'brick_wall', ...).
+    - 'num_qubits' (int), 'num_parameters' (int), 'num_gates' (int).
+    - 'layers' (List[Dict]): One entry per layer with 'gates' and 'parameters'
+      ([start, stop) ranges over the circuit instructions and the binding order)
+      and 'entangling_pairs' (the distinct qubit pairs coupled in the layer).
+    - 'light_cone' (List[List[int]]): For each qubit, the sorted qubits whose
+      initial state can influence it at the end of the circuit.
+    - 'occupied' (List[int]): Qubits flipped to |1> before the first layer.
+
+All values are plain lists, ints and strings, so the metadata survives QPY.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+
+from .circuit import (create_custom_ansatz, Repeat, PARAMETRIC_SINGLE_QUBIT_TARGET, ANSATZ_METADATA_KEY,
+                      _GATE_CLASSES)
+
+ENTANGLEMENT_PATTERNS: Tuple[str, ...] = ('linear', 'circular', 'full')
+
+# Pauli strings on (i, j, a, b) of the qubit double excitation generator (odd number of Y's)
+_DOUBLE_EXCITATION_TERMS: Tuple[str, ...] = ('XXXY', 'XXYX', 'XYXX', 'YXXX', 'YYYX', 'YYXY', 'YXYY', 'XYYY')
+
+
+def _check_positive(name: str, value: int, minimum: int = 1) -> None:
+    if not isinstance(value, int) or isinstance(value, bool) or value < minimum:
+        raise ValueError(f"{name} must be an integer >= {minimum}, got {value}")
+
+
+def _check_rotations(rotations: Sequence[str]) -> List[str]:
+    rotations = [rotation.lower() for rotation in rotations]
+    for rotation in rotations:
+        if rotation not in PARAMETRIC_SINGLE_QUBIT_TARGET:
+            raise ValueError(f"Unknown rotation gate '{rotation}'. "
+                             f"Expected one of {sorted(PARAMETRIC_SINGLE_QUBIT_TARGET)}.")
+    return rotations
+
+
+def _check_entangler(entangler: str) -> str:
+    entangler = entangler.lower()
+    entry = _GATE_CLASSES.get(entangler)
+    if entry is None or entry[1] != 2:
+        raise ValueError(f"Entangler '{entangler}' is not a supported two-qubit gate.")
+    return entangler
+
+
+def _entangling_pairs(num_qubits: int, entanglement: str) -> List[Tuple[int, int]]:
+    """The (control, target) pairs of one entangling layer, in application order."""
+    if entanglement == 'linear':
+        return [(q, q + 1) for q in range(num_qubits - 1)]
+    if entanglement == 'circular':
+        pairs = [(q, q + 1) for q in range(num_qubits - 1)]
+        return pairs + [(num_qubits - 1, 0)] if num_qubits > 2 else pairs
+    if entanglement == 'full':
+        return [(a, b) for a in range(num_qubits) for b in range(a + 1, num_qubits)]
+    raise ValueError(f"Unknown entanglement '{entanglement}'. Expected one of {list(ENTANGLEMENT_PATTERNS)}.")
+
+
+def _brick_pairs(num_qubits: int, offset: int) -> List[Tuple[int, int]]:
+    """Disjoint neighbouring pairs (offset, offset + 1), (offset + 2, offset + 3), ..."""
+    return [(q, q + 1) for q in range(offset, num_qubits - 1, 2)]
+
+
+def _givens(a: int, b: int) -> List[Tuple[str, List[int]]]:
+    """One-parameter rotation between |01> and |10> of qubits a and b; conserves the number of ones."""
+    return [('cx', [a, b]), ('cry', [b, a]), ('cx', [a, b])]
+
+
+def _pauli_rotation(pauli_string: str, qubits: Sequence[int]) -> List[Tuple[str, List[int]]]:
+    """exp(-i theta/2 P) for a Pauli string P on `qubits`: basis change, CX ladder, RZ(theta) and back."""
+    basis_in, basis_out = [], []
+    for op, q in zip(pauli_string, qubits):
+        if op == 'X':
+            basis_in.append(('h', [q]))
+            basis_out.append(('h', [q]))
+        elif op == 'Y':
+            basis_in += [('sdg', [q]), ('h', [q])]
+            basis_out += [('h', [q]), ('s', [q])]
+    ladder = [('cx', [qubits[k], qubits[k + 1]]) for k in range(len(qubits) - 1)]
+    return basis_in + ladder + [('rz', [qubits[-1]])] + ladder[::-1] + basis_out
+
+
+def _summarize(instructions: Sequence[Tuple[str, List[int]]]) -> Tuple[int, int, List[Tuple[int, ...]]]:
+    """Number of circuit instructions, number of parameters and multi-qubit gates (in order) of a flat block."""
+    num_gates = num_parameters = 0
+    couplings = []
+    for gate_name, qubits in instructions:
+        _, gate_num_qubits, parametric = _GATE_CLASSES[gate_name]
+        count = len(qubits) if gate_num_qubits == 1 else 1
+        num_gates += count
+        num_parameters += count if parametric else 0
+        if gate_num_qubits > 1:
+            couplings.append(tuple(qubits))
+    return num_gates, num_parameters, couplings
+
+
+class _MetadataBuilder:
+    """Accumulates layers and light cones while a generator lays out its structure."""
+
+    def __init__(self, name: str, num_qubits: int, occupied: Sequence[int] = ()):
+        self.num_qubits = num_qubits
+        self.metadata: Dict[str, Any] = {'name': name, 'num_qubits': num_qubits, 'occupied': sorted(occupied),
+                                         'layers': []}
+        self.num_gates = len(occupied)
+        self.num_parameters = 0
+        self.cones = [{q} for q in range(num_qubits)]
+
+    def add_layer(self, instructions: Sequence[Tuple[str, List[int]]], **extra: Any) -> None:
+        num_gates, num_parameters, couplings = _summarize(instructions)
+        for coupled in couplings:
+            cone = set().union(*(self.cones[q] for q in coupled))
+            for q in coupled:
+                self.cones[q] = cone
+        pairs = list(dict.fromkeys(tuple(sorted(coupled)) for coupled in couplings))
+        self.metadata['layers'].append({
+            'gates': [self.num_gates, self.num_gates + num_gates],
+            'parameters': [self.num_parameters, self.num_parameters + num_parameters],
+            'entangling_pairs': [list(pair) for pair in pairs],
+            **extra,
+        })
+        self.num_gates += num_gates
+        self.num_parameters += num_parameters
+
+    def finish(self, **extra: Any) -> Dict[str, Any]:
+        self.metadata.update(num_parameters=self.num_parameters, num_gates=self.num_gates,
+                             light_cone=[sorted(cone) for cone in self.cones], **extra)
+        return self.metadata
+
+
+def hardware_efficient_ansatz(num_qubits: int,
+                              layers: int,
+                              rotations: Sequence[str] = ('ry', 'rz'),
+                              entanglement: str = 'linear',
+                              entangler: str = 'cx',
+                              final_rotations: bool = True) -> Tuple[List, Dict[str, Any]]:
+    """
+    Layers of single-qubit rotations on every qubit followed by an entangling layer.
+
+    Args:
+        num_qubits: Number of qubits.
+        layers: Number of rotation + entangling layers.
+        rotations: Parametric single-qubit gates applied, in order, to every qubit in each layer.
+        entanglement: 'linear' (q, q+1), 'circular' (linear plus (n-1, 0)) or 'full' (all pairs).
+        entangler: The two-qubit gate of the entangling layers (e.g. 'cx', 'cz', 'rzz').
+        final_rotations: Whether to end with one more rotation layer, recorded as its own layer.
+
+    Returns:
+        Tuple[List, Dict[str, Any]]: The ansatz structure and its metadata (see the module
+        docstring), with the extra key 'entanglement'.
+
+    Raises:
+        ValueError: If an argument is out of range or names an unknown gate or pattern.
+    """
+    _check_positive("num_qubits", num_qubits)
+    _check_positive("layers", layers, minimum=0)
+    rotations = _check_rotations(rotations)
+    entangler = _check_entangler(entangler)
+    all_qubits = list(range(num_qubits))
+    rotation_layer = [(rotation, all_qubits) for rotation in rotations]
+    layer = rotation_layer + [(entangler, list(pair)) for pair in _entangling_pairs(num_qubits, entanglement)]
+
+    builder = _MetadataBuilder('hardware_efficient', num_qubits)
+    for _ in range(layers):
+        builder.add_layer(layer)
+    structure = [Repeat(layer, layers)]
+    if final_rotations:
+        builder.add_layer(rotation_layer)
+        structure += rotation_layer
+    return structure, builder.finish(entanglement=entanglement)
+
+
+def brick_wall_ansatz(num_qubits: int,
+                      layers: int,
+                      rotations: Sequence[str] = ('ry',),
+                      entangler: str = 'cx') -> Tuple[List, Dict[str, Any]]:
+    """
+    Rotation layers alternating with two-qubit gates on even (0-1, 2-3, ...) and odd (1-2, 3-4, ...) pairs.
+
+    Every layer entangles disjoint neighbouring pairs, so the light cone of a qubit
+    grows by at most one qubit on each side per layer.
+
+    Args:
+        num_qubits: Number of qubits.
+        layers: Number of brick rows; row k starts at pair offset k % 2.
+        rotations: Parametric single-qubit gates applied to every qubit before each row.
+        entangler: The two-qubit gate of the bricks.
+
+    Returns:
+        Tuple[List, Dict[str, Any]]: The ansatz structure and its metadata (see the module docstring).
+
+    Raises:
+        ValueError: If an argument is out of range or names an unknown gate.
+    """
+    _check_positive("num_qubits", num_qubits)
+    _check_positive("layers", layers, minimum=0)
+    rotations = _check_rotations(rotations)
+    entangler = _check_entangler(entangler)
+    rows = [[(rotation, list(range(num_qubits))) for rotation in rotations] +
+            [(entangler, list(pair)) for pair in _brick_pairs(num_qubits, offset)] for offset in (0, 1)]
+
+    builder = _MetadataBuilder('brick_wall', num_qubits)
+    for k in range(layers):
+        builder.add_layer(rows[k % 2])
+    structure = [Repeat(rows, layers // 2)] + (rows[0] if layers % 2 else [])
+    return structure, builder.finish()
+
+
+def particle_conserving_ansatz(num_qubits: int, num_particles: int, layers: int) -> Tuple[List, Dict[str, Any]]:
+    """
+    Brick-wall layers of Givens rotations acting on a fixed number of occupied qubits.
+
+    The first `num_particles` qubits are flipped to |1>; every two-qubit block
+    rotates between |01> and |10> with one parameter, so all prepared states keep
+    exactly `num_particles` ones (e.g. electrons in a Jordan-Wigner encoding).
+
+    Args:
+        num_qubits: Number of qubits (at least 2).
+        num_particles: Number of qubits initially in |1>, between 0 and `num_qubits`.
+        layers: Number of Givens layers; each covers the even pairs and then the odd pairs.
+
+    Returns:
+        Tuple[List, Dict[str, Any]]: The ansatz structure and its metadata (see the module
+        docstring), with the extra key 'num_particles'.
+
+    Raises:
+        ValueError: If an argument is out of range.
+    """
+    _check_positive("num_qubits", num_qubits, minimum=2)
+    _check_positive("layers", layers, minimum=0)
+    if not isinstance(num_particles, int) or not 0 <= num_particles <= num_qubits:
+        raise ValueError(f"num_particles must be an integer between 0 and {num_qubits}, got {num_particles}")
+    occupied = list(range(num_particles))
+    layer = [gate for offset in (0, 1) for a, b in _brick_pairs(num_qubits, offset) for gate in _givens(a, b)]
+
+    builder = _MetadataBuilder('particle_conserving', num_qubits, occupied)
+    for _ in range(layers):
+        builder.add_layer(layer)
+    structure = ([('x', occupied)] if occupied else []) + [Repeat(layer, layers)]
+    return structure, builder.finish(num_particles=num_particles)
+
+
+def uccsd_ansatz(num_qubits: int,
+                 num_particles: int,
+                 singles: bool = True,
+                 doubles: bool = True) -> Tuple[List, Dict[str, Any]]:
+    """
+    UCCSD-style excitation blocks on top of a reference state with the first `num_particles` qubits occupied.
+
+    Excitations are qubit excitations (no Jordan-Wigner parity strings). A single
+    excitation i -> a is a Givens rotation with one parameter. A double excitation
+    (i, j) -> (a, b) is the product of the eight Pauli rotations of its generator;
+    each rotation gets its own parameter, so it conserves the number of ones when
+    the eight angles of the block are equal (as at the all-zero starting point).
+
+    Args:
+        num_qubits: Number of qubits.
+        num_particles: Number of occupied qubits in the reference state, between 1 and `num_qubits` - 1.
+        singles: Whether to include single excitations.
+        doubles: Whether to include double excitations.
+
+    Returns:
+        Tuple[List, Dict[str, Any]]: The ansatz structure and its metadata (see the module
+        docstring). Every excitation is one layer, with the extra keys 'occupied' and
+        'virtual' (the qubits it moves from and to); the metadata adds 'num_particles'.
+
+    Raises:
+        ValueError: If an argument is out of range.
+    """
+    _check_positive("num_qubits", num_qubits, minimum=2)
+    if not isinstance(num_particles, int) or not 0 < num_particles < num_qubits:
+        raise ValueError(f"num_particles must be an integer between 1 and {num_qubits - 1}, got {num_particles}")
+    occupied = list(range(num_particles))
+    virtual = list(range(num_particles, num_qubits))
+
+    builder = _MetadataBuilder('uccsd', num_qubits, occupied)
+    structure: List = [('x', occupied)]
+    if singles:
+        for i in occupied:
+            for a in virtual:
+                block = _givens(i, a)
+                builder.add_layer(block, occupied=[i], virtual=[a])
+                structure.append(block)
+    if doubles:
+        for j_index, j in enumerate(occupied):
+            for i in occupied[:j_index]:
+                for b_index, b in enumerate(virtual):
+                    for a in virtual[:b_index]:
+                        block = [gate for term in _DOUBLE_EXCITATION_TERMS for gate in _pauli_rotation(term, (i, j, a, b))]
+                        builder.add_layer(block, occupied=[i, j], virtual=[a, b])
+                        structure.append(block)
+    return structure, builder.finish(num_particles=num_particles)
+
+
+def build_ansatz(structure: List, metadata: Dict[str, Any]) -> Tuple[QuantumCircuit, List[Parameter]]:
+    """
+    Builds a generated ansatz and stores its metadata on the circuit.
+
+    Args:
+        structure: The structure returned by a generator.
+        metadata: The metadata returned with it.
+
+    Returns:
+        Tuple[QuantumCircuit, List[Parameter]]: Same as `create_custom_ansatz`; the circuit
+        metadata holds the generator metadata under `ANSATZ_METADATA_KEY`.
+    """
+    ansatz, parameters = create_custom_ansatz(metadata['num_qubits'], structure)
+    ansatz.metadata = {**ansatz.metadata, ANSATZ_METADATA_KEY: metadata}
+    return ansatz, parameters
+
+
+def get_ansatz_metadata(quantum_circuit: QuantumCircuit) -> Optional[Dict[str, Any]]:
+    """
+    Returns the generator metadata stored by `build_ansatz`, or None.
+
+    The metadata describes the circuit as built and is ignored if the qubit count
+    no longer matches. Removing gates (e.g. `simplify_circuit`) only shrinks the
+    true light cones and adding gates only grows them, so a stored light cone that
+    already covers every qubit stays exact either way.
+    """
+    metadata = (quantum_circuit.metadata or {}).get(ANSATZ_METADATA_KEY)
+    if not isinstance(metadata, dict) or metadata.get('num_qubits') != quantum_circuit.num_qubits:
+        return None
+    return metadata
@@ -0,0 +1,163 @@
+"""
+Expectation-value result cache for Easy VQE.
+
+Optimizers such as COBYLA and Nelder-Mead regularly re-evaluate parameter
+vectors they have already visited. `ExpectationCache` remembers the results
+of `get_hamiltonian_expectation_value` for recently evaluated points so that
+repeated points are not simulated again, and can optionally pool the shots of
+repeated shot-based evaluations into one more precise estimate.
+"""
+
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import List, Tuple, Dict, Union, Optional, Sequence, Any
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+
+from .circuit import circuit_fingerprint
+from .engine import ExecutionEngine
+from .measurement import get_hamiltonian_expectation_value
+from .shots import ShotAllocator
+
+
+def _param_key(param_values: Union[Sequence[float], Dict[Parameter, float], None]) -> bytes:
+    """Bit-exact key for a parameter vector or parameter dictionary."""
+    if param_values is None:
+        return b''
+    if isinstance(param_values, dict):
+        items = sorted((p.name, float(v)) for p, v in param_values.items())
+        return repr([name for name, _ in items]).encode() + np.array([v for _, v in items], dtype=float).tobytes()
+    return np.asarray(param_values, dtype=float).tobytes()
+
+
+def _option_key(value: Any) -> Any:
+    """Hashable key for an estimator option; engines are distinguished by their hardware target."""
+    if isinstance(value, ExecutionEngine):
+        return ('ExecutionEngine', value.target.key if value.target is not None else None)
+    return repr(value)
+
+
+class ExpectationCache:
+    """
+    LRU cache in front of `get_hamiltonian_expectation_value`.
+
+    Entries are keyed by the ansatz fingerprint, the Hamiltonian, the bit pattern of the
+    parameter values, the number of shots, the seed and any other estimator options.
+
+    - Exact mode (`n_shots=None`) and seeded evaluations are deterministic, so a hit
+      returns the stored result without simulating (also with `pool_shots`).
+    - Unseeded shot-based evaluations are also returned from the cache, unless
+      `pool_shots` is set. Then every evaluation still samples `n_shots` new shots and
+      adds them to all earlier samples of the same point, regardless of their shot
+      counts, and returns the estimate of the combined samples (shot-weighted mean).
+
+    A cache can be shared between threads; lookups and updates are guarded by a lock,
+    while the simulations themselves run outside it.
+
+    Attributes:
+        max_size (int): Maximum number of stored points; the least recently used is evicted first.
+        pool_shots (bool): Whether repeated shot-based evaluations are pooled.
+        hits (int): Number of evaluations answered without simulating.
+        misses (int): Number of evaluations that ran a simulation.
+    """
+    def __init__(self, max_size: int = 1024, pool_shots: bool = False):
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}.")
+        self.max_size = max_size
+        self.pool_shots = pool_shots
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Removes all entries and resets the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def evaluate(self,
+                 ansatz: QuantumCircuit,
+                 parsed_hamiltonian: List[Tuple[float, str]],
+                 param_values: Union[Sequence[float], Dict[Parameter, float], None],
+                 n_shots: Optional[int] = 1024,
+                 return_details: bool = False,
+                 **expectation_options) -> Union[float, Dict[str, Any]]:
+        """
+        Cached equivalent of `get_hamiltonian_expectation_value`.
+
+        Args:
+            ansatz: The (parameterized) ansatz circuit.
+            parsed_hamiltonian: List of (coefficient, pauli_string) tuples.
+            param_values: Numerical parameter values for the ansatz (Sequence, dict or None).
+            n_shots: Shots as in `get_hamiltonian_expectation_value`; None for exact mode.
+            return_details: If True, return the details dictionary. Its 'shots_used' counts
+                            only the shots spent by this call (0 on a hit); with pooling,
+                            'pooled_shots' holds the total shots behind the estimate.
+            **expectation_options: Further options for `get_hamiltonian_expectation_value`. Engines
+                                   are keyed by their hardware target; calls with a `ShotAllocator`
+                                   always run and are not stored.
+
+        Returns:
+            float: The expectation value, or the details dictionary if `return_details` is True.
+        """
+        if any(isinstance(value, ShotAllocator) for value in expectation_options.values()):
+            # A stateful allocator learns from every call and changes later allocations: never reuse its results
+            with self._lock:
+                self.misses += 1
+            details = get_hamiltonian_expectation_value(ansatz, parsed_hamiltonian, param_values, n_shots,
+                                                        return_details=True, **expectation_options)
+            return dict(details, pooled_shots=details['shots_used']) if return_details else details['value']
+
+        # A seeded evaluation repeats its own shots, so pooling it would only double count them
+        pooling = self.pool_shots and n_shots is not None and expectation_options.get('seed') is None
+        options_key = tuple(sorted((name, _option_key(value)) for name, value in expectation_options.items()))
+        key = (circuit_fingerprint(ansatz), hash(tuple(parsed_hamiltonian)), _param_key(param_values),
+               None if pooling else n_shots, options_key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not pooling:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return dict(entry, shots_used=0) if return_details else entry['value']
+            self.misses += 1
+
+        details = get_hamiltonian_expectation_value(ansatz, parsed_hamiltonian, param_values, n_shots,
+                                                    return_details=True, **expectation_options)
+        details = dict(details, pooled_shots=details['shots_used'])
+        with self._lock:
+            entry = self._entries.get(key) # Another thread may have stored this point meanwhile
+            if entry is not None and pooling:
+                details = self._pool(entry, details)
+            self._entries[key] = details
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return details if return_details else details['value']
+
+    @staticmethod
+    def _pool(previous: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Merges two independent estimates of the same point as if their shots had been taken together.
+
+        Each estimate is turned back into the sums of its per-shot values (n * value) and
+        their squares (n * (n * variance + value^2)), the sums are added, and value and
+        variance are recomputed from them. Weighting by shots rather than by the estimated
+        variances keeps the pooled value unbiased: a variance estimated from few shots is
+        correlated with the value it belongs to.
+        """
+        shots = np.array([previous['pooled_shots'], new['shots_used']], dtype=float)
+        values = np.array([previous['value'], new['value']])
+        variances = np.array([previous['variance'], new['variance']])
+        total_shots = shots.sum()
+        value = float(np.dot(shots, values) / total_shots)
+        square_sum = float(np.dot(shots, shots * variances + values**2))
+        variance = max(square_sum / total_shots - value**2, 0.0) / total_shots
+        return dict(new, value=value, variance=variance, std_error=float(np.sqrt(variance)),
+                    pooled_shots=int(total_shots))
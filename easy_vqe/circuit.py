@@ -7,9 +7,15 @@ that serve as ansatzes for the VQE algorithm.
 
 import warnings
 import re
-from typing import Set, List, Tuple, Union, Dict
+import hashlib
+import numpy as np
+from typing import Set, List, Tuple, Union, Dict, Iterator, Sequence
 from qiskit import QuantumCircuit, ClassicalRegister
-from qiskit.circuit import Parameter
+from qiskit.circuit import Parameter, CircuitInstruction, Barrier
+from qiskit.circuit.library import (RXGate, RYGate, RZGate, PhaseGate, HGate, SGate, TGate, XGate, YGate, ZGate,
+                                    SdgGate, TdgGate, IGate, CRXGate, CRYGate, CRZGate, CPhaseGate, RXXGate,
+                                    RYYGate, RZZGate, RZXGate, CXGate, CYGate, CZGate, SwapGate, CCXGate,
+                                    CSwapGate, CHGate)
 
 # Gate type categorization
 PARAMETRIC_SINGLE_QUBIT_TARGET: Set[str] = {'rx', 'ry', 'rz', 'p', 'u1'} # Added u1 as alias for p
@@ -18,8 +24,348 @@ NON_PARAM_SINGLE: Set[str] = {'h', 's', 't', 'x', 'y', 'z', 'sdg', 'tdg', 'id'}
 NON_PARAM_MULTI: Set[str] = {'cx', 'cy', 'cz', 'swap', 'ccx', 'cswap', 'ch'}
 MULTI_PARAM_GATES: Set[str] = {'u', 'cu', 'r', 'u2', 'u3', 'cu3'} # Gates requiring specific parameter handling
 
+# Metadata key under which `create_custom_ansatz` stores, for p_0, p_1, ..., their positions in `circuit.parameters`
+PARAMETER_ORDER_KEY: str = 'parameter_order'
+# Metadata key under which `ansatz_library.build_ansatz` stores the generator metadata (layers, light cones, ...)
+ANSATZ_METADATA_KEY: str = 'ansatz'
+
+_PARAMETER_INDEX_PATTERN = re.compile(r'\d+')
+
+# Fast path of `create_custom_ansatz`: gate name (aliases included) -> (gate class, number of qubits, parametric).
+# Single-qubit gates are applied to every listed qubit; the others need exactly `number of qubits` distinct qubits.
+# Anything not in here (measure, cu1, ...) or failing these checks goes through `_apply_instruction`.
+_GATE_CLASSES: Dict[str, Tuple[type, int, bool]] = {
+    'rx': (RXGate, 1, True), 'ry': (RYGate, 1, True), 'rz': (RZGate, 1, True),
+    'p': (PhaseGate, 1, True), 'u1': (PhaseGate, 1, True),
+    'h': (HGate, 1, False), 's': (SGate, 1, False), 't': (TGate, 1, False), 'x': (XGate, 1, False),
+    'y': (YGate, 1, False), 'z': (ZGate, 1, False), 'sdg': (SdgGate, 1, False), 'tdg': (TdgGate, 1, False),
+    'id': (IGate, 1, False),
+    'crx': (CRXGate, 2, True), 'cry': (CRYGate, 2, True), 'crz': (CRZGate, 2, True), 'cp': (CPhaseGate, 2, True),
+    'rxx': (RXXGate, 2, True), 'ryy': (RYYGate, 2, True), 'rzz': (RZZGate, 2, True), 'rzx': (RZXGate, 2, True),
+    'cx': (CXGate, 2, False), 'cnot': (CXGate, 2, False), 'cy': (CYGate, 2, False), 'cz': (CZGate, 2, False),
+    'swap': (SwapGate, 2, False), 'ch': (CHGate, 2, False),
+    'ccx': (CCXGate, 3, False), 'toffoli': (CCXGate, 3, False), 'cswap': (CSwapGate, 3, False),
+    'barrier': (Barrier, 0, False), # Any number of qubits; none means all
+}
+# Whether this Qiskit can append native (Rust-side) standard gates without building a Python gate object per
+# instruction. This relies on `CircuitInstruction.from_standard`, the gate classes' `_standard_gate` and a
+# `QuantumCircuit._data` with `extend`; without any of them, the fast path builds gate objects instead.
+_NATIVE_STANDARD_GATES: bool = (
+    hasattr(CircuitInstruction, 'from_standard')
+    and hasattr(QuantumCircuit(1)._data, 'extend')
+    and all(getattr(gate_class, '_standard_gate', None) is not None
+            for gate_class, num_gate_qubits, _ in _GATE_CLASSES.values() if num_gate_qubits > 0)
+)
+# The same table with what the fast path appends: the native standard gate where available, else the gate class
+_GATE_DISPATCH: Dict[str, Tuple[object, int, bool]] = {
+    name: (gate_class._standard_gate if _NATIVE_STANDARD_GATES and num_gate_qubits > 0 else gate_class,
+           num_gate_qubits, parametric)
+    for name, (gate_class, num_gate_qubits, parametric) in _GATE_CLASSES.items()
+}
+
+
+def _iter_instructions(ansatz_structure: List) -> Iterator:
+    """
+    Yields the non-list elements of a nested ansatz structure in order.
+
+    Uses an explicit stack of iterators, so each element is visited once and the
+    nesting depth is not limited by the recursion limit.
+    """
+    stack = [iter(ansatz_structure)]
+    while stack:
+        for element in stack[-1]:
+            if isinstance(element, list):
+                stack.append(iter(element))
+                break
+            yield element
+        else:
+            stack.pop()
+
+
+def _parameter_index(parameter: Parameter) -> Union[int, float]:
+    """Sort key: the first number in the parameter name (p_10 -> 10), infinity if there is none."""
+    match = _PARAMETER_INDEX_PATTERN.search(parameter.name)
+    return int(match.group()) if match else float('inf')
+
+
+def _next_parameter(params_dict: Dict[str, Parameter], p_idx_ref: List[int]) -> Parameter:
+    """Returns the parameter p_<n> for the next parametric gate slot."""
+    param_name = f"p_{p_idx_ref[0]}"
+    p_idx_ref[0] += 1
+    if param_name not in params_dict:
+        params_dict[param_name] = Parameter(param_name)
+    return params_dict[param_name]
+
+
+def _apply_instruction(instruction: Tuple[str, List[int]],
+                       current_ansatz: QuantumCircuit,
+                       params_dict: Dict[str, Parameter],
+                       p_idx_ref: List[int]):
+    """Applies one gate instruction through the QuantumCircuit methods, validating it fully."""
+    if not isinstance(instruction, tuple) or len(instruction) != 2:
+        raise TypeError(f"Instruction must be a tuple of (gate_name, qubit_list). Got: {instruction}")
+
+    gate_name, qubit_indices = instruction
+
+    if not isinstance(gate_name, str) or not isinstance(qubit_indices, list):
+         raise TypeError(f"Instruction tuple must contain (str, list). Got: ({type(gate_name)}, {type(qubit_indices)})")
+
+    gate_name = gate_name.lower()
+
+    if gate_name == 'barrier' and not qubit_indices:
+         qubit_indices = list(range(current_ansatz.num_qubits))
+    elif not qubit_indices and gate_name != 'barrier':
+        warnings.warn(f"Gate '{gate_name}' specified with empty qubit list. Skipping.", UserWarning)
+        return
+
+    for q in qubit_indices:
+         if not isinstance(q, int) or q < 0:
+              raise ValueError(f"Invalid qubit index '{q}' in {qubit_indices} for gate '{gate_name}'. Indices must be non-negative integers.")
+         if q >= current_ansatz.num_qubits:
+              raise ValueError(f"Qubit index {q} in {qubit_indices} for gate '{gate_name}' is out of bounds. "
+                           f"Circuit has {current_ansatz.num_qubits} qubits (indices 0 to {current_ansatz.num_qubits - 1}).")
+
+    original_gate_name = gate_name
+    gate_method = None # Initialize gate_method
+
+    # Handle aliases first
+    if gate_name == 'cnot': gate_name = 'cx'
+    elif gate_name == 'toffoli': gate_name = 'ccx'
+    elif gate_name == 'meas': gate_name = 'measure'
+    elif gate_name == 'u1': gate_name = 'p' # U1 is Phase gate
 
-def create_custom_ansatz(num_qubits: int, ansatz_structure: List[Union[Tuple[str, List[int]], List]]) -> Tuple[QuantumCircuit, List[Parameter]]:
+    if hasattr(current_ansatz, gate_name):
+         gate_method = getattr(current_ansatz, gate_name)
+    else:
+         raise ValueError(f"Gate '{original_gate_name}' is not a valid method of QuantumCircuit (or a known alias like 'cnot', 'toffoli', 'meas', 'u1').")
+
+
+    try:
+        if gate_name in MULTI_PARAM_GATES:
+             raise ValueError(f"Gate '{original_gate_name}' requires multiple parameters which are not auto-generated "
+                              "by this simple format. Construct this gate explicitly if needed.")
+
+        if gate_name in PARAMETRIC_SINGLE_QUBIT_TARGET:
+            for q_idx in qubit_indices:
+                gate_method(_next_parameter(params_dict, p_idx_ref), q_idx)
+
+        elif gate_name in NON_PARAM_SINGLE:
+            for q_idx in qubit_indices:
+                gate_method(q_idx)
+
+        elif gate_name in PARAMETRIC_MULTI_QUBIT: # Excludes MULTI_PARAM_GATES now
+             gate_method(_next_parameter(params_dict, p_idx_ref), *qubit_indices)
+
+        elif gate_name in NON_PARAM_MULTI:
+             gate_method(*qubit_indices)
+
+        elif gate_name == 'barrier':
+             gate_method(qubit_indices)
+
+        elif gate_name == 'measure':
+             warnings.warn("Explicit 'measure' instruction found in ansatz structure. "
+                           "Measurements are typically added separately based on Hamiltonian terms.", UserWarning)
+
+             # Try to find or create a suitable classical register
+             creg_name = 'meas_reg' # Default name
+             target_creg = None
+             if current_ansatz.cregs:
+                 # Look for existing register of correct size
+                 for reg in current_ansatz.cregs:
+                     if len(reg) == len(qubit_indices):
+                          target_creg = reg
+                          break
+                 # If no suitable existing register, create one
+                 if target_creg is None:
+                      reg_suffix = 0
+                      while f"{creg_name}{reg_suffix}" in [r.name for r in current_ansatz.cregs]:
+                          reg_suffix += 1
+                      target_creg = ClassicalRegister(len(qubit_indices), name=f"{creg_name}{reg_suffix}")
+                      current_ansatz.add_register(target_creg)
+                      warnings.warn(f"Auto-added ClassicalRegister({len(qubit_indices)}) named '{target_creg.name}' for measure.", UserWarning)
+             else: # No classical registers exist yet
+                 target_creg = ClassicalRegister(len(qubit_indices), name=creg_name)
+                 current_ansatz.add_register(target_creg)
+                 warnings.warn(f"Auto-added ClassicalRegister({len(qubit_indices)}) named '{target_creg.name}' for measure.", UserWarning)
+
+             try:
+                  current_ansatz.measure(qubit_indices, target_creg) # Measure into the found/created register
+             except Exception as me:
+                  raise RuntimeError(f"Failed to apply 'measure' to qubits {qubit_indices} and register {target_creg.name}. Error: {me}")
+
+        else: # Fallback / Unknown by categories - should not happen if alias/gate check works
+             raise RuntimeError(f"Internal Error: Gate '{original_gate_name}' passed initial checks but was not categorized.")
+
+
+    except TypeError as e:
+         # Determine expected number of qubits based on common gates
+         num_expected_qubits = 'unknown'
+         # Simple gates
+         if gate_name in PARAMETRIC_SINGLE_QUBIT_TARGET or gate_name in NON_PARAM_SINGLE: num_expected_qubits = 1
+         # Common 2-qubit gates
+         elif gate_name in {'cx','cz','cy','swap','cp','crx','cry','crz','rxx','ryy','rzz','rzx','cu1'}: num_expected_qubits = 2
+         # Common 3-qubit gates
+         elif gate_name in {'ccx', 'cswap'}: num_expected_qubits = 3
+         # Use inspect? Could be complex. Keep simple mapping for now.
+
+         raise ValueError(
+             f"Error applying gate '{original_gate_name}'. Qiskit TypeError: {e}. "
+             f"Provided {len(qubit_indices)} qubits: {qubit_indices}. "
+             f"Gate likely expects a different number of qubits (approx. {num_expected_qubits}) or parameters. "
+             f"(Check Qiskit docs for '{gate_method.__name__}' signature)."
+         )
+    except ValueError as ve: # Catch the specific ValueError raised for MULTI_PARAM_GATES
+        raise ve # Re-raise it directly
+    except Exception as e:
+         raise RuntimeError(f"Unexpected error applying gate '{original_gate_name}' to qubits {qubit_indices}: {e}")
+
+
+def _dispatch_entry(instruction: tuple, num_qubits: int) -> Union[Tuple[object, int, bool], None]:
+    """
+    Returns the `_GATE_DISPATCH` entry if the fast path can apply `instruction`, else None.
+
+    The fast path takes well-formed instructions on valid, distinct qubits with the
+    gate's exact qubit count; everything else is left to `_apply_instruction`, which
+    raises the detailed errors and warnings.
+    """
+    if len(instruction) != 2:
+        return None
+    gate_name, qubit_indices = instruction
+    if type(gate_name) is not str or type(qubit_indices) is not list:
+        return None
+    entry = _GATE_DISPATCH.get(gate_name.lower())
+    if entry is None:
+        return None
+    for q in qubit_indices:
+        if type(q) is not int or not 0 <= q < num_qubits:
+            return None
+    gate_num_qubits = entry[1]
+    if gate_num_qubits == 1:
+        return entry if qubit_indices else None # Empty list: skipped with a warning
+    if gate_num_qubits == 0:
+        return entry
+    if len(qubit_indices) != gate_num_qubits or len(set(qubit_indices)) != gate_num_qubits:
+        return None
+    return entry
+
+
+class Repeat:
+    """
+    A block repeated several times in an ansatz structure, e.g. `[('h', [0, 1]), Repeat(layer, 4)]`.
+
+    `create_custom_ansatz` validates and builds the block once and appends `count`
+    copies of its instructions, without expanding the structure itself. Every copy
+    gets fresh parameters, numbered as if the block had been written out `count`
+    times. With `share_params=True`, all copies reuse the parameters of the first
+    one, so the ansatz has only as many parameters as a single block.
+
+    Attributes:
+        block (List): The repeated structure (instructions, nested lists or other Repeats).
+        count (int): Number of repetitions.
+        share_params (bool): Whether all repetitions use the same parameters.
+    """
+    def __init__(self, block: Union[List, Tuple[str, List[int]]], count: int, share_params: bool = False):
+        if isinstance(block, (tuple, Repeat)):
+            block = [block]
+        if not isinstance(block, list):
+            raise TypeError(f"Repeat block must be a list (or a single instruction tuple). Got: {type(block)}")
+        if not isinstance(count, int) or isinstance(count, bool) or count < 0:
+            raise ValueError(f"Repeat count must be a non-negative integer, got {count}")
+        self.block = block
+        self.count = count
+        self.share_params = bool(share_params)
+
+    def __repr__(self) -> str:
+        return f"Repeat({self.block!r}, {self.count}, share_params={self.share_params})"
+
+
+def _append_structure(ansatz: QuantumCircuit,
+                      ansatz_structure: List,
+                      params_dict: Dict[str, Parameter],
+                      p_idx_ref: List[int]) -> None:
+    """Appends the instructions of a (nested) ansatz structure to `ansatz`, creating parameters as it goes."""
+    num_qubits = ansatz.num_qubits
+    qubits = ansatz.qubits
+    pending: List[CircuitInstruction] = [] # Validated instructions, appended to the circuit in bulk
+
+    for element in _iter_instructions(ansatz_structure):
+        if isinstance(element, Repeat):
+            _append_repeat(ansatz, element, params_dict, p_idx_ref, pending)
+            continue
+        if not isinstance(element, tuple):
+            raise TypeError(f"Elements in ansatz_structure must be tuple (gate, qubits) or list (block). "
+                            f"Found type '{type(element)}': {element}")
+        entry = _dispatch_entry(element, num_qubits)
+        if entry is None:
+            # Measurements, unlisted gates and anything needing a warning or an error
+            _flush_instructions(ansatz, pending)
+            _apply_instruction(element, ansatz, params_dict, p_idx_ref)
+            continue
+
+        standard_gate, gate_num_qubits, parametric = entry
+        qubit_indices = element[1]
+        if gate_num_qubits == 1:
+            for q in qubit_indices:
+                gate_params = (_next_parameter(params_dict, p_idx_ref),) if parametric else ()
+                pending.append(_gate_instruction(standard_gate, (qubits[q],), gate_params))
+        elif gate_num_qubits == 0: # Barrier
+            barrier_qubits = list(dict.fromkeys(qubit_indices)) if qubit_indices else range(num_qubits)
+            pending.append(CircuitInstruction(Barrier(len(barrier_qubits)), tuple(qubits[q] for q in barrier_qubits)))
+        else:
+            gate_params = (_next_parameter(params_dict, p_idx_ref),) if parametric else ()
+            pending.append(_gate_instruction(standard_gate, tuple(qubits[q] for q in qubit_indices), gate_params))
+    _flush_instructions(ansatz, pending)
+
+
+def _append_repeat(ansatz: QuantumCircuit,
+                   repeat: Repeat,
+                   params_dict: Dict[str, Parameter],
+                   p_idx_ref: List[int],
+                   pending: List[CircuitInstruction]) -> None:
+    """Builds the block of `repeat` once and queues `repeat.count` copies with their own (or shared) parameters."""
+    template = QuantumCircuit(ansatz.num_qubits)
+    template_params: Dict[str, Parameter] = {}
+    _append_structure(template, repeat.block, template_params, [0])
+    if template.num_clbits:
+        raise ValueError("Repeat blocks cannot contain measurements. Add them outside the Repeat.")
+
+    slots = list(template_params.values()) # The block's parameters in order of appearance
+    qubit_map = dict(zip(template.qubits, ansatz.qubits))
+    # Instructions are immutable: those without parameters are shared by all copies
+    layer = [instruction.replace(qubits=tuple(qubit_map[q] for q in instruction.qubits)) for instruction in template.data]
+    for repetition in range(repeat.count):
+        if repetition == 0 or not repeat.share_params:
+            slot_values = {slot: _next_parameter(params_dict, p_idx_ref) for slot in slots}
+        for instruction in layer:
+            params = instruction.operation.params if not _NATIVE_STANDARD_GATES else instruction.params
+            if any(isinstance(value, Parameter) for value in params):
+                params = [slot_values.get(value, value) if isinstance(value, Parameter) else value for value in params]
+                if _NATIVE_STANDARD_GATES:
+                    instruction = instruction.replace(params=params)
+                else:
+                    operation = instruction.operation.copy()
+                    operation.params = params
+                    instruction = instruction.replace(operation=operation)
+            pending.append(instruction)
+
+def _gate_instruction(gate: object, qubits: Tuple, params: Tuple) -> CircuitInstruction:
+    """An instruction of the fast path: `gate` is a `_GATE_DISPATCH` entry (standard gate or gate class)."""
+    if _NATIVE_STANDARD_GATES:
+        return CircuitInstruction.from_standard(gate, qubits, params)
+    return CircuitInstruction(gate(*params), qubits)
+
+def _flush_instructions(ansatz: QuantumCircuit, pending: List[CircuitInstruction]) -> None:
+    """One bulk append of pre-validated instructions: no broadcasting or per-gate argument checks."""
+    if pending:
+        if _NATIVE_STANDARD_GATES:
+            ansatz._data.extend(pending)
+        else:
+            for instruction in pending:
+                ansatz.append(instruction.operation, instruction.qubits, instruction.clbits)
+        pending.clear()
+
+
+def create_custom_ansatz(num_qubits: int, ansatz_structure: List[Union[Tuple[str, List[int]], List, Repeat]]) -> Tuple[QuantumCircuit, List[Parameter]]:
     """
     Creates a parameterized quantum circuit (ansatz) from a simplified structure.
 
@@ -31,6 +377,7 @@ def create_custom_ansatz(num_qubits: int, ansatz_structure: List[Union[Tuple[str
         ansatz_structure: A list defining the circuit structure. Elements can be:
             - Tuple[str, List[int]]: (gate_name, target_qubit_indices)
             - List: A nested list representing a block of operations, processed sequentially.
+            - Repeat: A block repeated several times, optionally with shared parameters.
 
     Returns:
         Tuple[QuantumCircuit, List[Parameter]]: A tuple containing:
@@ -51,153 +398,12 @@ def create_custom_ansatz(num_qubits: int, ansatz_structure: List[Union[Tuple[str
     ansatz = QuantumCircuit(num_qubits, name="CustomAnsatz")
     parameters_dict: Dict[str, Parameter] = {}
     param_idx_ref: List[int] = [0]
-
-    def _process_instruction(instruction: Tuple[str, List[int]],
-                             current_ansatz: QuantumCircuit,
-                             params_dict: Dict[str, Parameter],
-                             p_idx_ref: List[int]):
-        """Internal helper to apply one gate instruction."""
-        if not isinstance(instruction, tuple) or len(instruction) != 2:
-            raise TypeError(f"Instruction must be a tuple of (gate_name, qubit_list). Got: {instruction}")
-
-        gate_name, qubit_indices = instruction
-
-        if not isinstance(gate_name, str) or not isinstance(qubit_indices, list):
-             raise TypeError(f"Instruction tuple must contain (str, list). Got: ({type(gate_name)}, {type(qubit_indices)})")
-
-        gate_name = gate_name.lower()
-
-        if gate_name == 'barrier' and not qubit_indices:
-             qubit_indices = list(range(current_ansatz.num_qubits))
-        elif not qubit_indices and gate_name != 'barrier':
-            warnings.warn(f"Gate '{gate_name}' specified with empty qubit list. Skipping.", UserWarning)
-            return
-
-        for q in qubit_indices:
-             if not isinstance(q, int) or q < 0:
-                  raise ValueError(f"Invalid qubit index '{q}' in {qubit_indices} for gate '{gate_name}'. Indices must be non-negative integers.")
-             if q >= current_ansatz.num_qubits:
-                  raise ValueError(f"Qubit index {q} in {qubit_indices} for gate '{gate_name}' is out of bounds. "
-                               f"Circuit has {current_ansatz.num_qubits} qubits (indices 0 to {current_ansatz.num_qubits - 1}).")
-
-        original_gate_name = gate_name
-        gate_method = None # Initialize gate_method
-
-        # Handle aliases first
-        if gate_name == 'cnot': gate_name = 'cx'
-        elif gate_name == 'toffoli': gate_name = 'ccx'
-        elif gate_name == 'meas': gate_name = 'measure'
-        elif gate_name == 'u1': gate_name = 'p' # U1 is Phase gate
-
-        if hasattr(current_ansatz, gate_name):
-             gate_method = getattr(current_ansatz, gate_name)
-        else:
-             raise ValueError(f"Gate '{original_gate_name}' is not a valid method of QuantumCircuit (or a known alias like 'cnot', 'toffoli', 'meas', 'u1').")
-
-
-        try:
-            if gate_name in MULTI_PARAM_GATES:
-                 raise ValueError(f"Gate '{original_gate_name}' requires multiple parameters which are not auto-generated "
-                                  "by this simple format. Construct this gate explicitly if needed.")
-
-            if gate_name in PARAMETRIC_SINGLE_QUBIT_TARGET:
-                for q_idx in qubit_indices:
-                    param_name = f"p_{p_idx_ref[0]}"
-                    p_idx_ref[0] += 1
-                    if param_name not in params_dict:
-                         params_dict[param_name] = Parameter(param_name)
-                    gate_method(params_dict[param_name], q_idx)
-
-            elif gate_name in NON_PARAM_SINGLE:
-                for q_idx in qubit_indices:
-                    gate_method(q_idx)
-
-            elif gate_name in PARAMETRIC_MULTI_QUBIT: # Excludes MULTI_PARAM_GATES now
-                 param_name = f"p_{p_idx_ref[0]}"
-                 p_idx_ref[0] += 1
-                 if param_name not in params_dict:
-                      params_dict[param_name] = Parameter(param_name)
-                 gate_method(params_dict[param_name], *qubit_indices)
-
-            elif gate_name in NON_PARAM_MULTI:
-                 gate_method(*qubit_indices)
-
-            elif gate_name == 'barrier':
-                 gate_method(qubit_indices)
-
-            elif gate_name == 'measure':
-                 warnings.warn("Explicit 'measure' instruction found in ansatz structure. "
-                               "Measurements are typically added separately based on Hamiltonian terms.", UserWarning)
-
-                 # Try to find or create a suitable classical register
-                 creg_name = 'meas_reg' # Default name
-                 target_creg = None
-                 if current_ansatz.cregs:
-                     # Look for existing register of correct size
-                     for reg in current_ansatz.cregs:
-                         if len(reg) == len(qubit_indices):
-                              target_creg = reg
-                              break
-                     # If no suitable existing register, create one
-                     if target_creg is None:
-                          reg_suffix = 0
-                          while f"{creg_name}{reg_suffix}" in [r.name for r in current_ansatz.cregs]:
-                              reg_suffix += 1
-                          target_creg = ClassicalRegister(len(qubit_indices), name=f"{creg_name}{reg_suffix}")
-                          current_ansatz.add_register(target_creg)
-                          warnings.warn(f"Auto-added ClassicalRegister({len(qubit_indices)}) named '{target_creg.name}' for measure.", UserWarning)
-                 else: # No classical registers exist yet
-                     target_creg = ClassicalRegister(len(qubit_indices), name=creg_name)
-                     current_ansatz.add_register(target_creg)
-                     warnings.warn(f"Auto-added ClassicalRegister({len(qubit_indices)}) named '{target_creg.name}' for measure.", UserWarning)
-
-                 try:
-                      current_ansatz.measure(qubit_indices, target_creg) # Measure into the found/created register
-                 except Exception as me:
-                      raise RuntimeError(f"Failed to apply 'measure' to qubits {qubit_indices} and register {target_creg.name}. Error: {me}")
-
-            else: # Fallback / Unknown by categories - should not happen if alias/gate check works
-                 raise RuntimeError(f"Internal Error: Gate '{original_gate_name}' passed initial checks but was not categorized.")
-
-
-        except TypeError as e:
-             # Determine expected number of qubits based on common gates
-             num_expected_qubits = 'unknown'
-             # Simple gates
-             if gate_name in PARAMETRIC_SINGLE_QUBIT_TARGET or gate_name in NON_PARAM_SINGLE: num_expected_qubits = 1
-             # Common 2-qubit gates
-             elif gate_name in {'cx','cz','cy','swap','cp','crx','cry','crz','rxx','ryy','rzz','rzx','cu1'}: num_expected_qubits = 2
-             # Common 3-qubit gates
-             elif gate_name in {'ccx', 'cswap'}: num_expected_qubits = 3
-             # Use inspect? Could be complex. Keep simple mapping for now.
-
-             raise ValueError(
-                 f"Error applying gate '{original_gate_name}'. Qiskit TypeError: {e}. "
-                 f"Provided {len(qubit_indices)} qubits: {qubit_indices}. "
-                 f"Gate likely expects a different number of qubits (approx. {num_expected_qubits}) or parameters. "
-                 f"(Check Qiskit docs for '{gate_method.__name__}' signature)."
-             )
-        except ValueError as ve: # Catch the specific ValueError raised for MULTI_PARAM_GATES
-            raise ve # Re-raise it directly
-        except Exception as e:
-             raise RuntimeError(f"Unexpected error applying gate '{original_gate_name}' to qubits {qubit_indices}: {e}")
-
-
-    structure_queue = list(ansatz_structure)
-    while structure_queue:
-        element = structure_queue.pop(0)
-        if isinstance(element, tuple):
-             _process_instruction(element, ansatz, parameters_dict, param_idx_ref)
-        elif isinstance(element, list):
-             structure_queue[0:0] = element
-        else:
-             raise TypeError(f"Elements in ansatz_structure must be tuple (gate, qubits) or list (block). "
-                             f"Found type '{type(element)}': {element}")
+    _append_structure(ansatz, ansatz_structure, parameters_dict, param_idx_ref)
 
     # Sort parameters collected during processing
     try:
         # Try numerical sort first based on index in name (e.g., p_0, p_1, p_10)
-        sorted_collected_parameters = sorted(parameters_dict.values(), key=lambda p: int(re.search(r'\d+', p.name).group()) if re.search(r'\d+', p.name) else float('inf'))
+        sorted_collected_parameters = sorted(parameters_dict.values(), key=_parameter_index)
     except (AttributeError, IndexError, ValueError, TypeError):
         # Fallback to string sort if numerical fails
         warnings.warn("Could not sort collected parameters numerically by name. Using default string sorting.", UserWarning)
@@ -214,7 +420,7 @@ def create_custom_ansatz(num_qubits: int, ansatz_structure: List[Union[Tuple[str
                       "Using sorted list derived directly from circuit.parameters.", UserWarning)
         try:
             # Sort the circuit's parameters using the same logic
-            circuit_params_sorted = sorted(list(circuit_parameter_set), key=lambda p: int(re.search(r'\d+', p.name).group()) if re.search(r'\d+', p.name) else float('inf'))
+            circuit_params_sorted = sorted(list(circuit_parameter_set), key=_parameter_index)
         except (AttributeError, IndexError, ValueError, TypeError):
             warnings.warn("Could not sort circuit parameters numerically by name. Using default string sorting for final list.", UserWarning)
             circuit_params_sorted = sorted(list(circuit_parameter_set), key=lambda p: p.name)
@@ -227,7 +433,103 @@ def create_custom_ansatz(num_qubits: int, ansatz_structure: List[Union[Tuple[str
              missing_in_collected = circuit_parameter_set - collected_parameter_set
              warnings.warn(f"Internal bookkeeping issue: Circuit parameters {[p.name for p in missing_in_collected]} were NOT collected during processing.", UserWarning)
 
+        _store_parameter_order(ansatz, circuit_params_sorted)
         return ansatz, circuit_params_sorted # Return the list derived FROM the circuit
 
     # If sets match, return the sorted list derived from the collected dict
-    return ansatz, sorted_collected_parameters
\ No newline at end of file
+    _store_parameter_order(ansatz, sorted_collected_parameters)
+    return ansatz, sorted_collected_parameters
+
+
+def _store_parameter_order(ansatz: QuantumCircuit, sorted_parameters: List[Parameter]) -> None:
+    """Records the binding order in the circuit metadata, so that later binds need no sorting."""
+    positions = {p: i for i, p in enumerate(ansatz.parameters)}
+    ansatz.metadata = {**(ansatz.metadata or {}), PARAMETER_ORDER_KEY: [positions[p] for p in sorted_parameters]}
+
+
+def _parameter_positions(quantum_circuit: QuantumCircuit) -> np.ndarray:
+    """Positions in `quantum_circuit.parameters` of the parameters in binding order."""
+    stored = (quantum_circuit.metadata or {}).get(PARAMETER_ORDER_KEY)
+    if stored is not None and len(stored) == quantum_circuit.num_parameters:
+        return np.asarray(stored, dtype=np.intp)
+    circuit_parameters = list(quantum_circuit.parameters)
+    positions = {p: i for i, p in enumerate(circuit_parameters)}
+    return np.array([positions[p] for p in sorted(circuit_parameters, key=_parameter_index)], dtype=np.intp)
+
+
+def parameter_order(quantum_circuit: QuantumCircuit) -> List[Parameter]:
+    """
+    Returns the parameters of a circuit in binding order (p_0, p_1, ..., p_10, ...).
+
+    Circuits built by `create_custom_ansatz` carry this order in their metadata
+    (`PARAMETER_ORDER_KEY`), so no sorting is needed. Other circuits are sorted by
+    the first number in each parameter name. The stored order describes the circuit
+    as built; it is ignored once the number of parameters changes.
+
+    Args:
+        quantum_circuit: The parameterized circuit.
+
+    Returns:
+        List[Parameter]: The parameters, in the order parameter sequences are bound.
+    """
+    circuit_parameters = quantum_circuit.parameters
+    return [circuit_parameters[i] for i in _parameter_positions(quantum_circuit)]
+
+
+def bind_parameter_array(quantum_circuit: QuantumCircuit, values: Union[Sequence[float], np.ndarray]) -> QuantumCircuit:
+    """
+    Binds a parameter vector given in binding order (see `parameter_order`).
+
+    The values are permuted into Qiskit's own parameter order with one NumPy
+    operation and assigned positionally, so no {Parameter: float} dictionary is built.
+
+    Args:
+        quantum_circuit: The parameterized circuit.
+        values: One numeric value per parameter.
+
+    Returns:
+        QuantumCircuit: A new circuit with all parameters bound.
+
+    Raises:
+        ValueError: If the number of values does not match the circuit.
+        TypeError: If the values are not numeric.
+    """
+    try:
+        values = np.asarray(values, dtype=float)
+    except (ValueError, TypeError) as e:
+        raise TypeError(f"Parameter sequence values must be numeric. Error converting: {e}")
+    if values.shape != (quantum_circuit.num_parameters,):
+        raise ValueError(f"Circuit expects {quantum_circuit.num_parameters} parameters, but received {values.size}.")
+    if values.size == 0:
+        return quantum_circuit
+    circuit_order_values = np.empty_like(values)
+    circuit_order_values[_parameter_positions(quantum_circuit)] = values
+    return quantum_circuit.assign_parameters(circuit_order_values)
+
+
+def circuit_fingerprint(quantum_circuit: QuantumCircuit) -> str:
+    """
+    Computes a content hash of a circuit's structure.
+
+    Two circuits with the same qubit/clbit counts and the same sequence of
+    operations (names, target qubits and parameter expressions) share a
+    fingerprint, regardless of object identity. Used as a cache key for
+    derived circuits.
+
+    Args:
+        quantum_circuit: The circuit to fingerprint.
+
+    Returns:
+        str: A hexadecimal digest identifying the circuit structure.
+    """
+    hasher = hashlib.sha1()
+    hasher.update(f"{quantum_circuit.num_qubits}|{quantum_circuit.num_clbits}".encode())
+    qubit_index = {q: i for i, q in enumerate(quantum_circuit.qubits)}
+    clbit_index = {c: i for i, c in enumerate(quantum_circuit.clbits)}
+    for instruction in quantum_circuit.data:
+        # The instruction's own name and params do not build a Python gate object per instruction
+        qubit_indices = tuple(qubit_index[q] for q in instruction.qubits)
+        clbit_indices = tuple(clbit_index[c] for c in instruction.clbits)
+        params = tuple(str(p) for p in instruction.params)
+        hasher.update(repr((instruction.name, qubit_indices, clbit_indices, params)).encode())
+    return hasher.hexdigest()
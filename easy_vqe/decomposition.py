@@ -0,0 +1,189 @@
+"""
+Disconnected-subsystem decomposition for Easy VQE.
+
+If no Hamiltonian term and no multi-qubit gate of the ansatz connects two groups
+of qubits, the ansatz prepares a product state over those groups and every term
+lives entirely inside one of them. The energy then splits exactly into a sum of
+independent cluster energies, each of which can be simulated on its own qubits.
+"""
+
+import numpy as np
+from typing import List, Tuple, Dict, Any, Sequence, Union, Optional
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+
+from .measurement import get_hamiltonian_expectation_value
+from .cache import ExpectationCache
+
+
+def _find_root(parents: List[int], q: int) -> int:
+    """Union-find root lookup with path halving."""
+    while parents[q] != q:
+        parents[q] = parents[parents[q]]
+        q = parents[q]
+    return q
+
+
+def find_qubit_clusters(ansatz: QuantumCircuit, parsed_hamiltonian: List[Tuple[float, str]]) -> List[List[int]]:
+    """
+    Splits the qubits into clusters that are never coupled by the problem.
+
+    Two qubits end up in the same cluster if they are both acted on (non-identity)
+    by some Hamiltonian term, or both touched by some multi-qubit ansatz gate.
+    Barriers are ignored since they do not couple qubits.
+
+    Args:
+        ansatz: The (parameterized) ansatz circuit.
+        parsed_hamiltonian: List of (coefficient, pauli_string) tuples.
+
+    Returns:
+        List[List[int]]: Sorted qubit lists, one per cluster, ordered by their smallest qubit.
+                         Returns a single cluster with all qubits if the ansatz contains
+                         classical operations, since those cannot be split safely.
+    """
+    num_qubits = ansatz.num_qubits
+    if any(instr.clbits for instr in ansatz.data):
+        return [list(range(num_qubits))]
+
+    parents = list(range(num_qubits))
+
+    def _union(qubits: Sequence[int]):
+        if len(qubits) < 2:
+            return
+        root = _find_root(parents, qubits[0])
+        for q in qubits[1:]:
+            other = _find_root(parents, q)
+            if other != root:
+                parents[other] = root
+
+    for _, pauli_string in parsed_hamiltonian:
+        _union([i for i, op in enumerate(pauli_string) if op != 'I'])
+    for instruction in ansatz.data:
+        if instruction.operation.name == 'barrier' or len(instruction.qubits) < 2:
+            continue
+        _union([ansatz.find_bit(q).index for q in instruction.qubits])
+
+    clusters: Dict[int, List[int]] = {}
+    for q in range(num_qubits):
+        clusters.setdefault(_find_root(parents, q), []).append(q)
+    return sorted(clusters.values(), key=lambda cluster: cluster[0])
+
+
+def split_into_subsystems(ansatz: QuantumCircuit,
+                          parsed_hamiltonian: List[Tuple[float, str]]) -> Tuple[List[Dict[str, Any]], float]:
+    """
+    Builds independent sub-problems for each qubit cluster that carries Hamiltonian terms.
+
+    Args:
+        ansatz: The (parameterized) ansatz circuit. *Should not contain measurements.*
+        parsed_hamiltonian: List of (coefficient, pauli_string) tuples.
+
+    Returns:
+        Tuple[List[Dict[str, Any]], float]: A tuple containing:
+            - One dictionary per cluster with keys:
+                - 'qubits' (List[int]): Original qubit indices of the cluster.
+                - 'ansatz' (QuantumCircuit): The ansatz gates acting on the cluster, re-indexed.
+                - 'hamiltonian' (List[Tuple[float, str]]): Terms of the cluster, restricted to its qubits.
+                - 'parameters' (List[Parameter]): Parameters of the cluster's ansatz.
+            - The constant energy offset from all-identity terms.
+
+    Raises:
+        ValueError: If a Pauli string length mismatches the ansatz qubits.
+    """
+    num_qubits = ansatz.num_qubits
+    for _, pauli_string in parsed_hamiltonian:
+        if len(pauli_string) != num_qubits:
+            raise ValueError(f"Hamiltonian term '{pauli_string}' length {len(pauli_string)} "
+                             f"mismatches ansatz qubits {num_qubits}.")
+
+    clusters = find_qubit_clusters(ansatz, parsed_hamiltonian)
+    cluster_of = {q: k for k, cluster in enumerate(clusters) for q in cluster}
+
+    constant_offset = 0.0
+    cluster_terms: Dict[int, List[Tuple[float, str]]] = {}
+    for coefficient, pauli_string in parsed_hamiltonian:
+        support = [i for i, op in enumerate(pauli_string) if op != 'I']
+        if not support:
+            constant_offset += coefficient
+            continue
+        k = cluster_of[support[0]]
+        cluster_terms.setdefault(k, []).append(
+            (coefficient, ''.join(pauli_string[q] for q in clusters[k])))
+
+    sub_circuits = {k: QuantumCircuit(len(clusters[k]), name=f"{ansatz.name}_sub{k}") for k in cluster_terms}
+    for instruction in ansatz.data:
+        if instruction.operation.name == 'barrier' or not instruction.qubits:
+            continue
+        qubit_indices = [ansatz.find_bit(q).index for q in instruction.qubits]
+        k = cluster_of[qubit_indices[0]]
+        if k in sub_circuits:
+            local = {q: i for i, q in enumerate(clusters[k])}
+            sub_circuits[k].append(instruction.operation, [local[q] for q in qubit_indices])
+
+    subsystems = []
+    for k in sorted(cluster_terms):
+        subsystems.append({
+            'qubits': clusters[k],
+            'ansatz': sub_circuits[k],
+            'hamiltonian': cluster_terms[k],
+            'parameters': list(sub_circuits[k].parameters),
+        })
+    return subsystems, constant_offset
+
+
+def get_decomposed_expectation_value(subsystems: List[Dict[str, Any]],
+                                     constant_offset: float,
+                                     param_values: Union[Sequence[float], Dict[Parameter, float]],
+                                     parameters: Sequence[Parameter],
+                                     n_shots: int = 1024,
+                                     return_details: bool = False,
+                                     cache: Optional[ExpectationCache] = None,
+                                     **expectation_options) -> Union[float, Dict[str, Any]]:
+    """
+    Evaluates <H> as the sum of independent cluster expectation values.
+
+    Args:
+        subsystems: Cluster descriptions from `split_into_subsystems`.
+        constant_offset: Energy offset from all-identity terms.
+        param_values: Values for the full ansatz, either a dict or a sequence ordered like `parameters`.
+        parameters: Parameter objects of the full ansatz, in the order of `param_values`.
+        n_shots: Shots per term measurement circuit, as in `get_hamiltonian_expectation_value`.
+        return_details: If True, return a dictionary with 'value', 'variance', 'std_error'
+                        and 'shots_used' summed over the clusters.
+        cache: If given, cluster energies are evaluated through this cache.
+        **expectation_options: Extra options forwarded to `get_hamiltonian_expectation_value`.
+
+    Returns:
+        float: The total expectation value <H>, or the details dictionary if `return_details` is True.
+    """
+    if isinstance(param_values, dict):
+        value_map = param_values
+    else:
+        if len(param_values) != len(parameters):
+            raise ValueError(f"Ansatz expects {len(parameters)} parameters, but received sequence of length {len(param_values)}.")
+        value_map = dict(zip(parameters, np.asarray(param_values, dtype=float)))
+
+    evaluate = cache.evaluate if cache is not None else get_hamiltonian_expectation_value
+    total = constant_offset
+    total_variance = 0.0
+    total_shots = 0
+    for subsystem in subsystems:
+        sub_values = {p: value_map[p] for p in subsystem['parameters']} if subsystem['parameters'] else None
+        if return_details:
+            details = evaluate(subsystem['ansatz'], subsystem['hamiltonian'],
+                               sub_values, n_shots, return_details=True, **expectation_options)
+            total += details['value']
+            total_variance += details['variance'] # Clusters are sampled independently
+            total_shots += details['shots_used']
+        else:
+            total += evaluate(subsystem['ansatz'], subsystem['hamiltonian'],
+                              sub_values, n_shots, **expectation_options)
+
+    if not return_details:
+        return total
+    return {
+        'value': total,
+        'variance': total_variance,
+        'std_error': float(np.sqrt(total_variance)),
+        'shots_used': total_shots,
+    }
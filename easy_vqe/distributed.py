@@ -0,0 +1,327 @@
+"""
+Coordinator/worker evaluation of Hamiltonian expectation values over sockets.
+
+A `DistributedEvaluator` (the coordinator) listens on a TCP address (or a Unix
+socket path) and splits the measured Hamiltonian terms into groups. Workers, on
+this or other machines, connect with `run_worker` or
+
+    python -m easy_vqe.distributed --address HOST:PORT
+
+with the shared secret in the environment variable `EASY_VQE_AUTHKEY` (hex).
+Each worker receives the ansatz and the term groups once when it joins, and
+transpiles the measurement circuits of every group right away with its own
+execution engine. After that, every evaluation sends only the parameter
+vector, a group index and a shot count, and receives the group's partial energy
+and variance. If a worker disconnects or exceeds `task_timeout`, it is dropped
+and its group is reassigned to another worker.
+
+Connections use `multiprocessing.connection`, which authenticates both ends with
+the shared key but does not encrypt the traffic; messages are pickled, so only
+run workers and coordinators that trust each other.
+"""
+
+import os
+import sys
+import time
+import socket
+import argparse
+import subprocess
+import threading
+from collections import deque
+from multiprocessing.connection import Listener, Client, Connection, wait
+from typing import List, Tuple, Dict, Union, Optional, Any
+
+import numpy as np
+from qiskit import QuantumCircuit
+
+from .engine import ExecutionEngine
+from .prepared import PreparedEvaluation
+from .parallel import _TermGroupEvaluator, prepare_term_groups, evaluate_term_group
+
+AUTHKEY_ENV_VAR = 'EASY_VQE_AUTHKEY'
+
+Address = Union[Tuple[str, int], str]
+
+
+def _parse_address(address: str) -> Address:
+    """'host:port' becomes a TCP address; anything else is taken as a Unix socket path."""
+    host, _, port = address.rpartition(':')
+    if host and port.isdigit():
+        return (host, int(port))
+    return address
+
+
+def run_worker(address: Address, authkey: bytes, engine: Optional[ExecutionEngine] = None) -> int:
+    """
+    Connects to a coordinator and serves evaluation requests until it shuts the worker down.
+
+    Args:
+        address: The coordinator's address, (host, port) or a Unix socket path.
+        authkey: The shared secret of the coordinator.
+        engine: Execution engine for the measurement circuits; a new one by default.
+
+    Returns:
+        int: Number of group evaluations served.
+    """
+    engine = engine or ExecutionEngine()
+    connection = Client(address, authkey=authkey)
+    prepared: List[PreparedEvaluation] = []
+    served = 0
+    try:
+        while True:
+            try:
+                message = connection.recv()
+            except (EOFError, OSError):
+                break # Coordinator went away
+            kind = message[0]
+            if kind == 'setup':
+                _, ansatz, groups, options = message
+                try:
+                    prepared = prepare_term_groups(ansatz, groups, engine, options)
+                except Exception as e:
+                    connection.send(('error', f"{type(e).__name__}: {e}"))
+                    break
+                connection.send(('ready',))
+            elif kind == 'evaluate':
+                _, group_index, values, n_shots = message
+                try:
+                    details = evaluate_term_group(prepared[group_index], values, n_shots, engine)
+                    connection.send(('result', details))
+                    served += 1
+                except Exception as e:
+                    connection.send(('error', f"{type(e).__name__}: {e}"))
+            elif kind == 'shutdown':
+                break
+    finally:
+        connection.close()
+    return served
+
+
+class DistributedEvaluator(_TermGroupEvaluator):
+    """
+    Coordinator that evaluates <H> by sending term groups to socket-connected workers.
+
+    Workers may join at any time; each joining worker is set up with the ansatz and
+    term groups in a background thread. `evaluate` hands out one group at a time to
+    idle workers and collects the partial results. Use it as a context manager, or
+    call `close()` to shut down the workers and stop listening.
+
+    Attributes:
+        address: The address workers connect to (with the actual port if port 0 was requested).
+        authkey (bytes): The shared secret workers must present.
+        groups (List[List[Tuple[float, str]]]): The term groups, one task per group per evaluation.
+        task_timeout (Optional[float]): Seconds after which a busy worker counts as lost.
+        worker_timeout (float): Seconds `evaluate` waits for a worker to join if none is connected.
+        workers_lost (int): Number of workers dropped so far.
+    """
+    def __init__(self,
+                 ansatz: QuantumCircuit,
+                 parsed_hamiltonian: List[Tuple[float, str]],
+                 address: Address = ('localhost', 0),
+                 authkey: Optional[bytes] = None,
+                 num_groups: int = 16,
+                 light_cone: bool = False,
+                 group_diagonal: bool = True,
+                 task_timeout: Optional[float] = None,
+                 worker_timeout: float = 60.0):
+        super().__init__(ansatz, parsed_hamiltonian, num_groups, light_cone, group_diagonal)
+        self.authkey = authkey if authkey is not None else os.urandom(32)
+        self.task_timeout = task_timeout
+        self.worker_timeout = worker_timeout
+        self.workers_lost = 0
+        self._listener: Optional[Listener] = Listener(address, authkey=self.authkey)
+        self.address = self._listener.address
+        self._workers: List[Connection] = []
+        self._workers_changed = threading.Condition()
+        self._processes: List[subprocess.Popen] = []
+        self._accept_thread = threading.Thread(target=self._accept_workers, name="easy_vqe-accept", daemon=True)
+        self._accept_thread.start()
+
+    @property
+    def num_workers(self) -> int:
+        """Number of connected, set-up workers."""
+        with self._workers_changed:
+            return len(self._workers)
+
+    def _accept_workers(self) -> None:
+        """Background loop: accepts connecting workers and sends them the problem."""
+        while True:
+            listener = self._listener
+            if listener is None:
+                return
+            try:
+                connection = listener.accept()
+            except Exception:
+                if self._listener is None:
+                    return # Closed
+                continue # Failed handshake (e.g. wrong key)
+            try:
+                connection.send(('setup', self.ansatz, self.groups, self.options))
+                if not connection.poll(self.worker_timeout) or connection.recv() != ('ready',):
+                    raise OSError("Worker did not confirm setup.")
+            except Exception:
+                connection.close()
+                continue
+            with self._workers_changed:
+                self._workers.append(connection)
+                self._workers_changed.notify_all()
+
+    def wait_for_workers(self, count: int, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until at least `count` workers are connected.
+
+        Returns:
+            bool: True if enough workers joined before the timeout.
+        """
+        with self._workers_changed:
+            return self._workers_changed.wait_for(lambda: len(self._workers) >= count, timeout)
+
+    def start_local_workers(self, count: int, wait_timeout: Optional[float] = 120.0) -> List[subprocess.Popen]:
+        """
+        Starts `count` worker subprocesses on this machine and waits for them to join.
+
+        Args:
+            count: Number of workers to start.
+            wait_timeout: Seconds to wait for them to connect (None waits forever).
+
+        Returns:
+            List[subprocess.Popen]: The started processes (terminated by `close()`).
+
+        Raises:
+            RuntimeError: If the workers do not connect in time.
+        """
+        if not isinstance(self.address, tuple):
+            address = str(self.address)
+        else:
+            address = f"{self.address[0]}:{self.address[1]}"
+        env = dict(os.environ, **{AUTHKEY_ENV_VAR: self.authkey.hex()})
+        package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # Workers import this copy
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [package_root, env.get('PYTHONPATH')]))
+        expected = self.num_workers + count
+        started = [subprocess.Popen([sys.executable, '-m', 'easy_vqe.distributed', '--address', address],
+                                    env=env, stdout=subprocess.DEVNULL)
+                   for _ in range(count)]
+        self._processes.extend(started)
+        if not self.wait_for_workers(expected, wait_timeout):
+            raise RuntimeError(f"Only {self.num_workers} of {expected} workers connected within {wait_timeout} s.")
+        return started
+
+    def _wake_accept_thread(self) -> None:
+        """Unblocks the accept loop with a throwaway connection (closing a listening socket does not)."""
+        try:
+            if isinstance(self.address, tuple):
+                probe = socket.create_connection(self.address, timeout=1)
+            else:
+                probe = socket.socket(socket.AF_UNIX)
+                probe.settimeout(1)
+                probe.connect(self.address)
+            probe.close()
+        except OSError:
+            pass
+
+    def _drop_worker(self, connection: Connection) -> None:
+        with self._workers_changed:
+            if connection in self._workers:
+                self._workers.remove(connection)
+                self.workers_lost += 1
+        connection.close()
+
+    def evaluate(self,
+                 param_values,
+                 n_shots: int = 1024,
+                 return_details: bool = False) -> Union[float, Dict[str, Any]]:
+        """Estimates <H> with the term groups spread over the connected workers (see `_TermGroupEvaluator.evaluate`)."""
+        if self._listener is None:
+            raise ValueError("DistributedEvaluator is closed.")
+        return super().evaluate(param_values, n_shots, return_details)
+
+    def _run_groups(self, values: np.ndarray, n_shots: int) -> List[Dict[str, Any]]:
+        pending = deque(range(len(self.groups)))
+        results: List[Optional[Dict[str, Any]]] = [None] * len(self.groups)
+        busy: Dict[Connection, Tuple[int, float]] = {} # Worker -> (group index, start time)
+        failure: Optional[str] = None
+
+        while pending or busy:
+            with self._workers_changed:
+                idle = [w for w in self._workers if w not in busy]
+            while pending and idle:
+                worker = idle.pop()
+                group_index = pending.popleft()
+                try:
+                    worker.send(('evaluate', group_index, values, n_shots))
+                    busy[worker] = (group_index, time.monotonic())
+                except (OSError, ValueError):
+                    self._drop_worker(worker)
+                    pending.appendleft(group_index)
+
+            if not busy:
+                # Work left but nobody to do it: wait for a worker to (re)join
+                if not self.wait_for_workers(1, self.worker_timeout):
+                    raise RuntimeError(f"No workers connected to {self.address} within {self.worker_timeout} s.")
+                continue
+
+            for worker in wait(list(busy), timeout=0.1):
+                group_index, _ = busy.pop(worker)
+                try:
+                    message = worker.recv()
+                except (EOFError, OSError):
+                    self._drop_worker(worker) # Lost: reassign its group
+                    pending.append(group_index)
+                    continue
+                if message[0] == 'error':
+                    # Stop handing out work, but collect the running tasks so no stale replies remain
+                    failure = failure or f"Worker failed to evaluate term group {group_index}: {message[1]}"
+                    pending.clear()
+                    continue
+                results[group_index] = message[1]
+
+            if self.task_timeout is not None:
+                now = time.monotonic()
+                for worker, (group_index, started) in list(busy.items()):
+                    if now - started > self.task_timeout:
+                        busy.pop(worker)
+                        self._drop_worker(worker)
+                        if failure is None:
+                            pending.append(group_index)
+        if failure is not None:
+            raise RuntimeError(failure)
+        return results
+
+    def close(self) -> None:
+        """Shuts down connected workers, stops listening and terminates local worker processes."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            self._wake_accept_thread()
+            self._accept_thread.join(timeout=5)
+            listener.close()
+        with self._workers_changed:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            try:
+                worker.send(('shutdown',))
+            except (OSError, ValueError):
+                pass
+            worker.close()
+        for process in self._processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        self._processes = []
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point for worker processes."""
+    parser = argparse.ArgumentParser(description="Easy VQE distributed evaluation worker.")
+    parser.add_argument('--address', required=True, help="Coordinator address, HOST:PORT or a Unix socket path.")
+    args = parser.parse_args(argv)
+    authkey_hex = os.environ.get(AUTHKEY_ENV_VAR)
+    if not authkey_hex:
+        print(f"[Error] Set {AUTHKEY_ENV_VAR} to the coordinator's authkey (hex).")
+        return 2
+    run_worker(_parse_address(args.address), bytes.fromhex(authkey_hex))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
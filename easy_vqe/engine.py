@@ -0,0 +1,323 @@
+"""
+Circuit execution engine for Easy VQE.
+
+An `ExecutionEngine` owns everything that circuit execution keeps between calls:
+the simulator handles, a cache of transpiled circuits and usage counters. Engines
+are safe to share between threads: every thread gets its own `AerSimulator`, and
+the cache and counters are guarded by a lock. Aer releases the GIL while it
+simulates, so independent VQE runs in a thread pool execute concurrently.
+
+Functions that run circuits take an optional `engine` argument and fall back to
+a process-wide default engine (see `get_default_engine`).
+
+Exact (statevector) simulations of compiled ansatzes also go through the engine,
+which keeps per-thread checkpoints of intermediate states (see
+`easy_vqe.fusion.CheckpointedAnsatz`) within a memory budget.
+
+An engine created with a hardware `target` (see `easy_vqe.target`) transpiles
+each ansatz for it once and keeps the result, so shot-based evaluations measure
+the routed, device-native circuit without routing it again.
+"""
+
+import threading
+import time
+import numpy as np
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from qiskit import QuantumCircuit, transpile
+from qiskit.result import Result
+from qiskit_aer import AerSimulator
+
+from .circuit import circuit_fingerprint
+from .fusion import CompiledAnsatz, CheckpointedAnsatz, DEFAULT_CHECKPOINT_MEMORY
+from .target import TargetProfile, TargetTranspilation, load_target_profile
+
+_MAX_CHECKPOINTED_PROGRAMS: int = 16 # Per thread
+
+
+class ExecutionEngine:
+    """
+    Thread-safe simulator handles, transpilation cache and execution counters.
+
+    Transpiled circuits are cached by circuit name, register layout and
+    `circuit_fingerprint`, so circuits that are submitted repeatedly are
+    transpiled once. Expectation values transpile their measurement circuits
+    before binding the parameters (see `measurement_units`), so the cache hits
+    at every new parameter point of an optimization.
+
+    Attributes:
+        simulator_options (Dict[str, Any]): Options passed to every `AerSimulator` the engine creates,
+                                            e.g. `max_parallel_threads=1` when many runs share the cores.
+        transpile_cache_size (int): Maximum number of cached transpiled circuits (0 disables the cache).
+        checkpoint_memory (int): Bytes of intermediate statevectors each thread may keep for
+                                 exact simulations (0 disables checkpoints).
+        target (Optional[TargetProfile]): Hardware target that shot-based evaluations transpile
+                                          the ansatz for (None: the ideal simulator only).
+    """
+    def __init__(self,
+                 transpile_cache_size: int = 256,
+                 checkpoint_memory: int = DEFAULT_CHECKPOINT_MEMORY,
+                 target: Union[TargetProfile, str, None] = None,
+                 **simulator_options):
+        if transpile_cache_size < 0:
+            raise ValueError(f"transpile_cache_size must be non-negative, got {transpile_cache_size}.")
+        if checkpoint_memory < 0:
+            raise ValueError(f"checkpoint_memory must be non-negative, got {checkpoint_memory}.")
+        self.simulator_options = simulator_options
+        self.transpile_cache_size = transpile_cache_size
+        self.checkpoint_memory = checkpoint_memory
+        self.target = load_target_profile(target) if isinstance(target, str) else target
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._transpiled: "OrderedDict[Tuple, QuantumCircuit]" = OrderedDict()
+        self._target_transpiled: "OrderedDict[str, TargetTranspilation]" = OrderedDict()
+        self._measurement_units: "OrderedDict[Tuple, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._counters: Dict[str, float] = {}
+        self._num_simulators = 0
+        self.reset_stats()
+
+    @property
+    def simulator(self) -> AerSimulator:
+        """The calling thread's simulator instance (created on first use)."""
+        sim = getattr(self._local, 'simulator', None)
+        if sim is None:
+            sim = AerSimulator(**self.simulator_options)
+            self._local.simulator = sim
+            with self._lock:
+                self._num_simulators += 1
+        return sim
+
+    def transpile(self, circuits: Union[QuantumCircuit, List[QuantumCircuit]]) -> Union[QuantumCircuit, List[QuantumCircuit]]:
+        """
+        Transpiles circuits for the engine's simulator, reusing cached results.
+
+        Args:
+            circuits: A circuit or a list of circuits.
+
+        Returns:
+            The transpiled circuit(s), in the same form as the input. Cached circuits
+            are shared and must not be modified in place.
+        """
+        single = isinstance(circuits, QuantumCircuit)
+        circuit_list = [circuits] if single else list(circuits)
+        if self.transpile_cache_size == 0:
+            compiled = transpile(circuit_list, self.simulator)
+            with self._lock:
+                self._counters['transpile_misses'] += len(circuit_list)
+            return compiled[0] if single else compiled
+
+        keys = [(qc.name, tuple((creg.name, creg.size) for creg in qc.cregs), circuit_fingerprint(qc))
+                for qc in circuit_list]
+        compiled: List[Optional[QuantumCircuit]] = [None] * len(circuit_list)
+        with self._lock:
+            for i, key in enumerate(keys):
+                cached = self._transpiled.get(key)
+                if cached is not None:
+                    self._transpiled.move_to_end(key)
+                    compiled[i] = cached
+            missing = [i for i, qc in enumerate(compiled) if qc is None]
+            self._counters['transpile_hits'] += len(circuit_list) - len(missing)
+            self._counters['transpile_misses'] += len(missing)
+
+        if missing:
+            # Transpile outside the lock so other threads are not blocked
+            fresh = transpile([circuit_list[i] for i in missing], self.simulator)
+            with self._lock:
+                for i, qc in zip(missing, fresh):
+                    compiled[i] = qc
+                    self._transpiled[keys[i]] = qc
+                    self._transpiled.move_to_end(keys[i])
+                while len(self._transpiled) > self.transpile_cache_size:
+                    self._transpiled.popitem(last=False)
+        return compiled[0] if single else compiled
+
+    def measurement_units(self,
+                          key: Tuple,
+                          build: Callable[[], Tuple[float, List[Dict[str, Any]]]]) -> Tuple[float, List[Dict[str, Any]]]:
+        """
+        Transpiled, parameterized measurement circuits, built and transpiled once per key.
+
+        `build` returns the constant energy contribution and the measurement units
+        (dictionaries with a 'circuit' entry) of one ansatz and Hamiltonian, with the
+        circuits still unbound. On the first request for `key`, the circuits are
+        transpiled and the units stored (up to `transpile_cache_size` entries); later
+        requests return the stored units, and evaluations only bind and run them.
+
+        Args:
+            key: Hashable identification of the ansatz structure, Hamiltonian and grouping options.
+            build: Callable building the units on a miss.
+
+        Returns:
+            Tuple[float, List[Dict[str, Any]]]: The constant contribution and the units, whose
+            'circuit' is transpiled. The units are shared and must not be modified in place.
+        """
+        with self._lock:
+            cached = self._measurement_units.get(key)
+            if cached is not None:
+                self._measurement_units.move_to_end(key)
+                self._counters['transpile_hits'] += len(cached[1])
+                return cached
+        constant_value, units = build()
+        compiled = self.transpile([unit['circuit'] for unit in units]) if units else []
+        entry = (constant_value, [dict(unit, circuit=circuit) for unit, circuit in zip(units, compiled)])
+        if self.transpile_cache_size == 0:
+            return entry
+        with self._lock:
+            entry = self._measurement_units.setdefault(key, entry)
+            self._measurement_units.move_to_end(key)
+            while len(self._measurement_units) > self.transpile_cache_size:
+                self._measurement_units.popitem(last=False)
+        return entry
+
+    def transpile_for_target(self, ansatz: QuantumCircuit) -> TargetTranspilation:
+        """
+        Transpiles an unbound ansatz for the engine's target, once per circuit structure.
+
+        Layout, routing and basis translation are cached by `circuit_fingerprint`
+        (up to `transpile_cache_size` ansatzes), so every evaluation and every
+        measurement basis reuses them.
+
+        Args:
+            ansatz: The (parameterized) ansatz circuit, without measurements.
+
+        Returns:
+            TargetTranspilation: The shared transpiled ansatz; must not be modified in place.
+
+        Raises:
+            ValueError: If the engine has no target or the ansatz does not fit it.
+        """
+        if self.target is None:
+            raise ValueError("This engine has no target; create it with ExecutionEngine(target=...).")
+        key = circuit_fingerprint(ansatz)
+        with self._lock:
+            cached = self._target_transpiled.get(key)
+            if cached is not None:
+                self._target_transpiled.move_to_end(key)
+                return cached
+        transpiled = TargetTranspilation(ansatz, self.target) # Outside the lock, as in `transpile`
+        with self._lock:
+            self._counters['target_transpiles'] += 1
+            transpiled = self._target_transpiled.setdefault(key, transpiled)
+            self._target_transpiled.move_to_end(key)
+            while len(self._target_transpiled) > max(1, self.transpile_cache_size):
+                self._target_transpiled.popitem(last=False)
+        return transpiled
+
+    def run(self, compiled_circuits: Union[QuantumCircuit, List[QuantumCircuit]], shots: int, **run_options) -> Result:
+        """
+        Runs transpiled circuits on the calling thread's simulator and waits for the result.
+
+        Args:
+            compiled_circuits: Circuit(s) returned by `transpile`.
+            shots: Number of shots per circuit.
+            **run_options: Further options for `AerSimulator.run` (e.g. `memory`, `seed_simulator`).
+
+        Returns:
+            Result: The simulation result.
+        """
+        num_circuits = 1 if isinstance(compiled_circuits, QuantumCircuit) else len(compiled_circuits)
+        start = time.perf_counter()
+        result = self.simulator.run(compiled_circuits, shots=shots, **run_options).result()
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._counters['jobs'] += 1
+            self._counters['circuits_run'] += num_circuits
+            self._counters['shots_run'] += num_circuits * shots
+            self._counters['run_seconds'] += elapsed
+        return result
+
+    def statevector(self, compiled: CompiledAnsatz, parameter_values) -> np.ndarray:
+        """
+        Simulates a compiled ansatz exactly, reusing the calling thread's checkpoints.
+
+        When only some parameters changed since this thread last simulated the same
+        program, the simulation resumes from the stored state before the first kernel
+        that uses them. The checkpoints of the programs a thread used most recently
+        are kept, within `checkpoint_memory` bytes in total.
+
+        Args:
+            compiled: The program (from `easy_vqe.fusion.compile_ansatz`).
+            parameter_values: Sequence of `len(compiled.parameters)` values.
+
+        Returns:
+            np.ndarray: The statevector of length 2**num_qubits.
+        """
+        if self.checkpoint_memory == 0:
+            state = compiled.statevector(parameter_values)
+            applied, skipped = compiled.num_kernels, 0
+        else:
+            programs = getattr(self._local, 'checkpoints', None)
+            if programs is None:
+                programs = self._local.checkpoints = OrderedDict()
+            # Keyed by identity: the entry holds a reference, so the id is not reused while it exists
+            checkpointed = programs.get(id(compiled))
+            if checkpointed is None:
+                checkpointed = programs[id(compiled)] = CheckpointedAnsatz(compiled, self.checkpoint_memory)
+            programs.move_to_end(id(compiled))
+            applied, skipped = checkpointed.kernels_applied, checkpointed.kernels_skipped
+            state = checkpointed.statevector(parameter_values)
+            applied, skipped = checkpointed.kernels_applied - applied, checkpointed.kernels_skipped - skipped
+            while len(programs) > 1 and (len(programs) > _MAX_CHECKPOINTED_PROGRAMS or
+                                         sum(entry.nbytes for entry in programs.values()) > self.checkpoint_memory):
+                programs.popitem(last=False)
+        with self._lock:
+            self._counters['kernels_applied'] += applied
+            self._counters['kernels_skipped'] += skipped
+        return state
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of the engine's counters.
+
+        Returns:
+            Dict[str, Any]: Dictionary with keys:
+                - 'simulators' (int): Simulator instances created (one per thread that ran circuits).
+                - 'jobs' (int): Calls to the simulator.
+                - 'circuits_run' (int): Circuits executed.
+                - 'shots_run' (int): Shots executed over all circuits.
+                - 'transpile_hits' / 'transpile_misses' (int): Transpilation cache lookups (each circuit
+                  of a reused measurement unit counts as a hit).
+                - 'run_seconds' (float): Wall time spent waiting for the simulator, summed over threads.
+                - 'kernels_applied' / 'kernels_skipped' (int): Fused kernels applied by exact simulations,
+                  and kernels skipped by resuming from a checkpoint.
+                - 'target_transpiles' (int): Ansatzes transpiled for the target (layout and routing runs).
+                - 'cached_circuits' (int): Current size of the transpilation cache.
+        """
+        with self._lock:
+            stats: Dict[str, Any] = {name: int(value) for name, value in self._counters.items() if name != 'run_seconds'}
+            stats['run_seconds'] = float(self._counters['run_seconds'])
+            stats['simulators'] = self._num_simulators
+            stats['cached_circuits'] = len(self._transpiled)
+        return stats
+
+    def reset_stats(self) -> None:
+        """Resets the execution and cache counters to zero (the cache and simulators are kept)."""
+        with self._lock:
+            self._counters = dict.fromkeys(('jobs', 'circuits_run', 'shots_run', 'transpile_hits',
+                                            'transpile_misses', 'run_seconds', 'kernels_applied', 'kernels_skipped',
+                                            'target_transpiles'), 0)
+
+    def clear_cache(self) -> None:
+        """Removes all cached transpiled circuits, including measurement units and those for the target."""
+        with self._lock:
+            self._transpiled.clear()
+            self._target_transpiled.clear()
+            self._measurement_units.clear()
+
+
+_default_engine: Optional[ExecutionEngine] = None
+_default_engine_lock = threading.Lock()
+
+def get_default_engine() -> ExecutionEngine:
+    """
+    Returns the process-wide engine used when no `engine` is passed (lazy initialization).
+
+    Returns:
+        ExecutionEngine: The shared default engine.
+    """
+    global _default_engine
+    if _default_engine is None:
+        with _default_engine_lock:
+            if _default_engine is None:
+                _default_engine = ExecutionEngine()
+    return _default_engine
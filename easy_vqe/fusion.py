@@ -0,0 +1,528 @@
+"""
+Gate-fused statevector simulation of ansatz circuits for Easy VQE.
+
+Exact-mode evaluations simulate the same ansatz over and over with new parameter
+values. `compile_ansatz` does the per-gate work once: it fuses runs of one- and
+two-qubit gates acting on the same qubits into kernels, multiplies the constant
+gates of every kernel together in advance, and expresses each parameterized gate
+as a fixed linear combination of trigonometric functions of its angle,
+
+    U(theta) = K_0 + cos(theta/2) K_1 + sin(theta/2) K_2 + cos(theta) K_3 + sin(theta) K_4,
+
+which holds for all rotation and phase gates. A `CompiledAnsatz` then evaluates
+all gate angles with one matrix product from the parameter array, the trig
+functions of all angles in one vectorized call, builds the kernel unitaries and
+applies them to a batch of statevectors with one tensor contraction per kernel.
+`CheckpointedAnsatz` additionally keeps intermediate states, so that evaluations
+that change only some parameters re-simulate only the kernels from the first
+one that uses them.
+"""
+
+import threading
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter, ParameterExpression
+
+from .circuit import circuit_fingerprint, parameter_order
+
+MAX_FUSED_QUBITS: int = 2
+DEFAULT_CHECKPOINT_MEMORY: int = 64 * 2**20 # Bytes of stored states per `CheckpointedAnsatz`
+
+_FIT_ANGLES = np.array([0.3, 1.1, 2.0, 2.9, 4.4, 5.3])
+_FIT_TOLERANCE = 1e-10
+_trig_forms: Dict[Tuple[type, str], Optional[np.ndarray]] = {} # Gate class -> fitted coefficients K (or None)
+
+_COMPILED_CACHE_SIZE: int = 256
+_compiled_cache: Dict[Tuple, "CompiledAnsatz"] = {}
+_compiled_cache_lock = threading.Lock()
+
+
+def _trig_features(angles: np.ndarray) -> np.ndarray:
+    """The functions [1, cos(a/2), sin(a/2), cos(a), sin(a)] of each angle, stacked on a new last axis."""
+    half = 0.5 * angles
+    return np.stack([np.ones_like(angles), np.cos(half), np.sin(half), np.cos(angles), np.sin(angles)], axis=-1)
+
+
+def _trig_form(operation) -> Optional[np.ndarray]:
+    """
+    Fits the matrix of a one-parameter gate as a combination of `_trig_features`.
+
+    Returns:
+        Optional[np.ndarray]: Coefficients of shape (5, d, d), or None if the gate's
+        matrix is not of this form (it is then evaluated gate by gate).
+    """
+    key = (type(operation), operation.name)
+    if key not in _trig_forms:
+        form = None
+        try:
+            matrices = np.array([type(operation)(angle).to_matrix() for angle in _FIT_ANGLES])
+            features = _trig_features(_FIT_ANGLES)
+            flat = matrices.reshape(len(_FIT_ANGLES), -1)
+            coefficients = np.linalg.lstsq(features, flat, rcond=None)[0]
+            if np.allclose(features @ coefficients, flat, atol=_FIT_TOLERANCE):
+                form = coefficients.reshape((5,) + matrices.shape[1:])
+        except Exception:
+            pass
+        _trig_forms[key] = form
+    return _trig_forms[key]
+
+
+def _embedding_indices(positions: Sequence[int], num_block_qubits: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Index arrays that place a gate matrix into the matrix of a larger kernel.
+
+    Gate qubit i is kernel qubit `positions[i]`. Entry (r, c) of the kernel matrix is
+    gate entry (sub(r), sub(c)) if r and c agree on all other kernel qubits, else 0.
+
+    Returns:
+        Tuple of the kernel rows, kernel columns, gate rows and gate columns of the nonzero entries.
+    """
+    indices = np.arange(2**num_block_qubits)
+    sub = np.zeros_like(indices)
+    for i, position in enumerate(positions):
+        sub |= ((indices >> position) & 1) << i
+    rest = indices & ~sum(1 << position for position in positions)
+    rows, cols = np.nonzero(rest[:, None] == rest[None, :])
+    return rows, cols, sub[rows], sub[cols]
+
+
+def _embed(matrix: np.ndarray, positions: Sequence[int], num_block_qubits: int) -> np.ndarray:
+    """Places `matrix` (any leading axes) on `positions` of a kernel with `num_block_qubits` qubits."""
+    rows, cols, gate_rows, gate_cols = _embedding_indices(positions, num_block_qubits)
+    dimension = 2**num_block_qubits
+    embedded = np.zeros(matrix.shape[:-2] + (dimension, dimension), dtype=complex)
+    embedded[..., rows, cols] = matrix[..., gate_rows, gate_cols]
+    return embedded
+
+
+def _state_view(qubits: Sequence[int], num_qubits: int) -> Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]]:
+    """
+    How to apply a kernel on `qubits` (ascending) to a batch of statevectors.
+
+    The state index is split into the kernel's bits and the blocks of bits between
+    them. Moving the kernel's axes to the front turns the kernel application into
+    one (batched) matrix product.
+
+    Returns:
+        Tuple of the view shape (without the batch axis), the axis order that moves the
+        kernel's axes (most significant bit first) behind the batch axis, its inverse,
+        and the shape of the moved view (without the batch axis).
+    """
+    shape: List[int] = []
+    axes: List[int] = []
+    upper = num_qubits
+    for q in reversed(qubits): # Most significant kernel bit first, matching the kernel's index order
+        if upper - q - 1 > 0:
+            shape.append(2**(upper - q - 1))
+        shape.append(2)
+        axes.append(len(shape)) # Axis 0 of the full view is the batch
+        upper = q
+    if upper > 0:
+        shape.append(2**upper)
+    rest = [axis for axis in range(1, len(shape) + 1) if axis not in axes]
+    order = (0,) + tuple(axes) + tuple(rest)
+    moved_shape = tuple((2,) * len(axes)) + tuple(shape[axis - 1] for axis in rest)
+    return tuple(shape), order, tuple(np.argsort(order).tolist()), moved_shape
+
+
+class _Kernel:
+    """A fused block of gates on up to `MAX_FUSED_QUBITS` qubits (more only for a single wider gate)."""
+    def __init__(self, qubits: Sequence[int]):
+        self.qubits: List[int] = sorted(qubits)
+        self.gates: List[Tuple] = [] # (operation, qubit indices) in circuit order
+
+    def extend_qubits(self, qubits: Sequence[int]) -> None:
+        self.qubits = sorted(set(self.qubits).union(qubits))
+
+
+class CompiledAnsatz:
+    """
+    An ansatz compiled into fused statevector kernels for repeated exact simulation.
+
+    Create it with `compile_ansatz`. Parameter values are positional, in the order of
+    `parameters` (the ansatz's `parameter_order`), like `bind_parameter_array`.
+
+    Attributes:
+        num_qubits (int): Number of qubits of the ansatz.
+        parameters (List[Parameter]): The parameters, in the order of the value arrays.
+        num_gates (int): Number of gates in the ansatz (barriers not counted).
+        num_kernels (int): Number of fused kernels applied per simulation.
+    """
+    def __init__(self, quantum_circuit: QuantumCircuit):
+        self.num_qubits = quantum_circuit.num_qubits
+        self.parameters: List[Parameter] = parameter_order(quantum_circuit)
+        self._parameter_index = {p: i for i, p in enumerate(self.parameters)}
+        self._linear_rows: List[Tuple[np.ndarray, float]] = [] # Coefficients and offset of each angle
+        self._nonlinear: List[Tuple[int, ParameterExpression]] = [] # Angles evaluated one by one
+
+        kernels = self._fuse(quantum_circuit)
+        self.num_gates = sum(len(kernel.gates) for kernel in kernels)
+        self.num_kernels = len(kernels)
+        self._global_phase = self._angle(quantum_circuit.global_phase)
+
+        fitted: List[Tuple[int, np.ndarray]] = [] # (angle index, embedded coefficients) per fitted gate
+        self._generic: List[Tuple[object, List[Union[int, float]], List[int], int]] = []
+        self._kernels: List[Tuple] = [] # Factors and the state view of `_state_view`
+        kernel_angles: List[List[int]] = [] # Indices of the angles each kernel depends on
+        for kernel in kernels:
+            kernel_angles.append([])
+            positions = {q: i for i, q in enumerate(kernel.qubits)}
+            num_block_qubits = len(kernel.qubits)
+            factors: List = [] # Constant matrices and ('fitted' | 'generic', index) references
+            for operation, qubits in kernel.gates:
+                local = [positions[q] for q in qubits]
+                if not any(isinstance(p, ParameterExpression) and p.parameters for p in operation.params):
+                    matrix = _embed(np.asarray(operation.to_matrix(), dtype=complex), local, num_block_qubits)
+                    if factors and isinstance(factors[-1], np.ndarray):
+                        factors[-1] = matrix @ factors[-1]
+                    else:
+                        factors.append(matrix)
+                    continue
+                params = [self._angle(p) for p in operation.params]
+                kernel_angles[-1].extend(p for p in params if not isinstance(p, float))
+                form = _trig_form(operation) if len(params) == 1 else None
+                if form is not None:
+                    factors.append(('fitted', len(fitted)))
+                    fitted.append((params[0], _embed(form, local, num_block_qubits)))
+                else:
+                    factors.append(('generic', len(self._generic)))
+                    self._generic.append((operation, params, local, num_block_qubits))
+            self._kernels.append((factors,) + _state_view(kernel.qubits, self.num_qubits))
+
+        num_angles = len(self._linear_rows)
+        self._angle_coefficients = np.zeros((num_angles, len(self.parameters)))
+        self._angle_offsets = np.zeros(num_angles)
+        for i, (coefficients, offset) in enumerate(self._linear_rows):
+            self._angle_coefficients[i] = coefficients
+            self._angle_offsets[i] = offset
+        # First kernel that depends on each parameter: simulations with only later parameters
+        # changed can resume from the state before it (see `CheckpointedAnsatz`)
+        angle_parameters = [set(np.flatnonzero(row).tolist()) for row in self._angle_coefficients]
+        for index, expression in self._nonlinear:
+            angle_parameters[index] = {self._parameter_index[p] for p in expression.parameters}
+        self._first_kernel = np.full(len(self.parameters), self.num_kernels, dtype=int)
+        for k in range(self.num_kernels - 1, -1, -1):
+            for index in kernel_angles[k]:
+                self._first_kernel[list(angle_parameters[index])] = k
+        # Fitted gates grouped by kernel size, so each group's matrices are built with one contraction
+        self._fitted_groups: Dict[int, Tuple[np.ndarray, np.ndarray]] = {} # Angle indices and coefficients
+        self._fitted_location: List[Tuple[int, int]] = [(0, 0)] * len(fitted)
+        for dimension in sorted({form.shape[-1] for _, form in fitted}):
+            members = [i for i, (_, form) in enumerate(fitted) if form.shape[-1] == dimension]
+            for position, i in enumerate(members):
+                self._fitted_location[i] = (dimension, position)
+            self._fitted_groups[dimension] = (np.array([fitted[i][0] for i in members], dtype=int),
+                                              np.array([fitted[i][1].reshape(5, -1) for i in members]))
+
+    def _angle(self, value) -> Union[int, float]:
+        """
+        Registers a gate angle: a float if it is constant, else the index of its row in the angle map.
+
+        Angles that are affine in the parameters (all angles the ansatz builder and
+        `simplify_circuit` produce) become a row of one matrix product; any other
+        expression is evaluated separately for every parameter vector.
+        """
+        if not isinstance(value, ParameterExpression) or not value.parameters:
+            try:
+                return float(value)
+            except TypeError as e:
+                raise ValueError(f"Cannot compile gate parameter {value!r}: {e}")
+        index = len(self._linear_rows)
+        coefficients = np.zeros(len(self.parameters))
+        linear = True
+        for p in value.parameters:
+            if p not in self._parameter_index:
+                raise ValueError(f"Parameter '{p.name}' is not a parameter of the circuit.")
+            gradient = value.gradient(p)
+            if isinstance(gradient, ParameterExpression) and gradient.parameters:
+                linear = False
+                break
+            coefficients[self._parameter_index[p]] = float(gradient)
+        if linear:
+            offset = float(value.bind({p: 0.0 for p in value.parameters}))
+            self._linear_rows.append((coefficients, offset))
+        else:
+            self._linear_rows.append((np.zeros(len(self.parameters)), 0.0))
+            self._nonlinear.append((index, value))
+        return index
+
+    def _fuse(self, quantum_circuit: QuantumCircuit) -> List[_Kernel]:
+        """
+        Groups the gates into kernels in one pass.
+
+        A gate joins the most recent kernel touching any of its qubits if no later
+        kernel touches them and the kernel stays within `MAX_FUSED_QUBITS` qubits (or
+        the gate acts only on the kernel's qubits). A single-qubit kernel is then
+        merged into the next kernel on its qubit, which is exact because no kernel in
+        between touches that qubit.
+        """
+        qubit_index = {q: i for i, q in enumerate(quantum_circuit.qubits)}
+        kernels: List[_Kernel] = []
+        last: Dict[int, int] = {} # Qubit -> index of the latest kernel touching it
+        for instruction in quantum_circuit.data:
+            operation = instruction.operation
+            if operation.name == 'barrier':
+                continue
+            if instruction.clbits or not hasattr(operation, 'to_matrix') or operation.name in ('measure', 'reset'):
+                raise ValueError(f"Cannot compile '{operation.name}': only unitary gates can be simulated as a statevector.")
+            qubits = [qubit_index[q] for q in instruction.qubits]
+            candidates = [last[q] for q in qubits if q in last]
+            target = max(candidates) if candidates else None
+            if target is not None:
+                merged = set(kernels[target].qubits).union(qubits)
+                if len(merged) <= max(MAX_FUSED_QUBITS, len(kernels[target].qubits)):
+                    kernels[target].extend_qubits(qubits)
+                    kernels[target].gates.append((operation, qubits))
+                    for q in qubits:
+                        last[q] = target
+                    continue
+            kernels.append(_Kernel(qubits))
+            kernels[-1].gates.append((operation, qubits))
+            for q in qubits:
+                last[q] = len(kernels) - 1
+
+        next_on_qubit: Dict[int, int] = {}
+        absorbed = [False] * len(kernels)
+        for k in range(len(kernels) - 1, -1, -1):
+            kernel = kernels[k]
+            if len(kernel.qubits) == 1 and kernel.qubits[0] in next_on_qubit:
+                later = kernels[next_on_qubit[kernel.qubits[0]]]
+                later.gates[:0] = kernel.gates
+                absorbed[k] = True
+                continue
+            for q in kernel.qubits:
+                next_on_qubit[q] = k
+        return [kernel for k, kernel in enumerate(kernels) if not absorbed[k]]
+
+    def _angles(self, values: np.ndarray) -> np.ndarray:
+        angles = self._angle_offsets + values @ self._angle_coefficients.T
+        for index, expression in self._nonlinear:
+            angles[:, index] = [float(expression.bind({p: row[self._parameter_index[p]] for p in expression.parameters}))
+                                for row in values]
+        return angles
+
+    def statevectors(self, parameter_values) -> np.ndarray:
+        """
+        Simulates the ansatz for a batch of parameter vectors.
+
+        All statevectors advance through the kernels together, so the per-kernel
+        overhead is shared by the batch. This pays off while the batch of states
+        fits in the CPU caches; for large registers, simulate vectors one at a time.
+
+        Args:
+            parameter_values: Array of shape (batch, num_parameters).
+
+        Returns:
+            np.ndarray: The statevectors, shape (batch, 2**num_qubits), index bit q for qubit q.
+
+        Raises:
+            ValueError: If the number of parameter values mismatches the ansatz.
+            TypeError: If the values are not numeric.
+        """
+        values = self._validate(parameter_values)
+        angles, fitted_matrices = self._prepare(values)
+        states = np.zeros((len(values), 2**self.num_qubits), dtype=complex)
+        states[:, 0] = 1.0
+        states = self._apply_kernels(states, 0, self.num_kernels, angles, fitted_matrices)
+        return self._apply_global_phase(states, angles)
+
+    def _validate(self, parameter_values) -> np.ndarray:
+        try:
+            values = np.asarray(parameter_values, dtype=float)
+        except (ValueError, TypeError) as e:
+            raise TypeError(f"Parameter values must be numeric. Error converting: {e}")
+        if values.ndim != 2 or values.shape[1] != len(self.parameters):
+            raise ValueError(f"Compiled ansatz expects parameter values of shape (batch, {len(self.parameters)}), "
+                             f"but received shape {values.shape}.")
+        return values
+
+    def _prepare(self, values: np.ndarray) -> Tuple[np.ndarray, Dict[int, np.ndarray]]:
+        """All gate angles and the matrices of all fitted gates (by kernel size) for a batch of parameter vectors."""
+        batch = len(values)
+        angles = self._angles(values)
+        fitted_matrices: Dict[int, np.ndarray] = {}
+        for dimension, (angle_indices, forms) in self._fitted_groups.items():
+            features = _trig_features(angles[:, angle_indices]) # (batch, gates, 5)
+            fitted_matrices[dimension] = np.einsum('bgf,gfx->bgx', features, forms).reshape(
+                batch, len(angle_indices), dimension, dimension)
+        return angles, fitted_matrices
+
+    def _apply_kernels(self,
+                       states: np.ndarray,
+                       start: int,
+                       stop: int,
+                       angles: np.ndarray,
+                       fitted_matrices: Dict[int, np.ndarray]) -> np.ndarray:
+        """Applies kernels `start` to `stop - 1`; returns a new array (the input states are not modified)."""
+        batch = len(states)
+        for factors, view_shape, order, inverse, moved_shape in self._kernels[start:stop]:
+            unitary = None
+            for factor in factors:
+                if isinstance(factor, np.ndarray):
+                    matrix = factor
+                elif factor[0] == 'fitted':
+                    dimension, position = self._fitted_location[factor[1]]
+                    matrix = fitted_matrices[dimension][:, position]
+                else:
+                    matrix = self._generic_matrices(factor[1], angles)
+                unitary = matrix if unitary is None else matrix @ unitary
+            moved = states.reshape((batch,) + view_shape).transpose(order).reshape(batch, unitary.shape[-1], -1)
+            states = (unitary @ moved).reshape((batch,) + moved_shape).transpose(inverse).reshape(batch, -1)
+        return states
+
+    def _apply_global_phase(self, states: np.ndarray, angles: np.ndarray) -> np.ndarray:
+        if isinstance(self._global_phase, float):
+            return states * np.exp(1j * self._global_phase) if self._global_phase != 0.0 else states
+        return states * np.exp(1j * angles[:, self._global_phase])[:, None]
+
+    def _generic_matrices(self, index: int, angles: np.ndarray) -> np.ndarray:
+        """Matrices of a gate without a fitted trig form, built from the gate class for every parameter vector."""
+        operation, params, local, num_block_qubits = self._generic[index]
+        matrices = np.array([type(operation)(*[p if isinstance(p, float) else row[p] for p in params]).to_matrix()
+                             for row in angles])
+        return _embed(matrices, local, num_block_qubits)
+
+    def statevector(self, parameter_values) -> np.ndarray:
+        """
+        Simulates the ansatz for one parameter vector.
+
+        Args:
+            parameter_values: Sequence of `num_parameters` values.
+
+        Returns:
+            np.ndarray: The statevector of length 2**num_qubits.
+        """
+        values = np.asarray(parameter_values, dtype=float).reshape(1, -1) if len(self.parameters) else np.zeros((1, 0))
+        return self.statevectors(values)[0]
+
+
+class CheckpointedAnsatz:
+    """
+    Simulates a `CompiledAnsatz` with stored intermediate states, for single-parameter updates.
+
+    Coordinate-wise optimizers and parameter-shift gradients change one parameter
+    between evaluations. The kernels before the first kernel that uses the changed
+    parameter produce the same state as in the previous evaluation, so `statevector`
+    keeps the states before selected kernels and resumes from the latest stored state
+    that is still valid. The checkpoints sit at parameter boundaries (kernels where a
+    parameter is used for the first time); if the memory budget does not allow one
+    state per boundary, they are spread evenly over the boundaries.
+
+    Not thread-safe: use one instance per thread (`ExecutionEngine.statevector` does).
+
+    Attributes:
+        compiled (CompiledAnsatz): The simulated program.
+        checkpoint_kernels (List[int]): Kernels before which the state is stored.
+        kernels_applied (int): Kernels applied by all simulations so far.
+        kernels_skipped (int): Kernels skipped by resuming from a checkpoint.
+    """
+    def __init__(self, compiled: CompiledAnsatz, memory_budget: int = DEFAULT_CHECKPOINT_MEMORY):
+        if memory_budget < 0:
+            raise ValueError(f"memory_budget must be non-negative, got {memory_budget}.")
+        self.compiled = compiled
+        boundaries = sorted({int(k) for k in compiled._first_kernel if k > 0})
+        max_checkpoints = memory_budget // (16 * 2**compiled.num_qubits) # complex128 amplitudes
+        if len(boundaries) > max_checkpoints:
+            picks = np.linspace(0, len(boundaries) - 1, max_checkpoints).round().astype(int) if max_checkpoints else []
+            boundaries = sorted({boundaries[i] for i in picks})
+        self.checkpoint_kernels: List[int] = boundaries
+        self.kernels_applied = 0
+        self.kernels_skipped = 0
+        self._states: Dict[int, np.ndarray] = {} # Kernel -> state before it, for the current values
+        self._values: Optional[np.ndarray] = None
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the stored states."""
+        return sum(state.nbytes for state in self._states.values())
+
+    def statevector(self, parameter_values) -> np.ndarray:
+        """
+        Simulates the ansatz for one parameter vector, resuming from a checkpoint where possible.
+
+        Args:
+            parameter_values: Sequence of `num_parameters` values.
+
+        Returns:
+            np.ndarray: The statevector of length 2**num_qubits (the same result as
+            `CompiledAnsatz.statevector`).
+        """
+        compiled = self.compiled
+        values = compiled._validate(np.reshape(parameter_values, (1, -1)) if len(compiled.parameters) else np.zeros((1, 0)))
+        start = 0
+        if self._values is not None:
+            changed = np.flatnonzero(values[0] != self._values)
+            first = int(compiled._first_kernel[changed].min()) if len(changed) else compiled.num_kernels
+            start = max((k for k in self._states if k <= first), default=0)
+        angles, fitted_matrices = compiled._prepare(values)
+        if start:
+            states = self._states[start]
+        else:
+            states = np.zeros((1, 2**compiled.num_qubits), dtype=complex)
+            states[0, 0] = 1.0
+        self._values = values[0].copy()
+        self.kernels_skipped += start
+        self.kernels_applied += compiled.num_kernels - start
+
+        # Run to each later checkpoint in turn and store the state there (kernels never modify their input)
+        for checkpoint in [k for k in self.checkpoint_kernels if k > start] + [compiled.num_kernels]:
+            states = compiled._apply_kernels(states, start, checkpoint, angles, fitted_matrices)
+            if checkpoint < compiled.num_kernels:
+                self._states[checkpoint] = states
+            start = checkpoint
+        return compiled._apply_global_phase(states, angles)[0]
+
+
+def compile_ansatz(quantum_circuit: QuantumCircuit) -> CompiledAnsatz:
+    """
+    Compiles a (parameterized) circuit into fused statevector kernels.
+
+    Args:
+        quantum_circuit: The circuit. Barriers are ignored; it must not contain
+                         measurements or other non-unitary operations.
+
+    Returns:
+        CompiledAnsatz: The compiled program.
+
+    Raises:
+        ValueError: If the circuit contains an operation that cannot be simulated as a statevector.
+    """
+    return CompiledAnsatz(quantum_circuit)
+
+
+def get_compiled_ansatz(quantum_circuit: QuantumCircuit, fingerprint: Optional[str] = None) -> CompiledAnsatz:
+    """
+    Cached wrapper around `compile_ansatz`.
+
+    Programs are keyed by the circuit's structural fingerprint, global phase and
+    parameter order, so re-evaluating an ansatz compiles it only once.
+
+    Args:
+        quantum_circuit: The circuit to compile.
+        fingerprint: Precomputed `circuit_fingerprint(quantum_circuit)`.
+
+    Returns:
+        CompiledAnsatz: The (shared) compiled program.
+    """
+    if fingerprint is None:
+        fingerprint = circuit_fingerprint(quantum_circuit)
+    key = (fingerprint, str(quantum_circuit.global_phase), tuple(p.name for p in parameter_order(quantum_circuit)))
+
+    with _compiled_cache_lock:
+        cached = _compiled_cache.get(key)
+    if cached is not None:
+        return cached
+
+    compiled = compile_ansatz(quantum_circuit)
+    with _compiled_cache_lock:
+        if len(_compiled_cache) >= _COMPILED_CACHE_SIZE:
+            _compiled_cache.pop(next(iter(_compiled_cache))) # Evict oldest entry
+        _compiled_cache[key] = compiled
+    return compiled
+
+
+def clear_compiled_ansatz_cache() -> None:
+    """Removes all cached compiled ansatzes."""
+    with _compiled_cache_lock:
+        _compiled_cache.clear()
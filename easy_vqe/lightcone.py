@@ -0,0 +1,122 @@
+"""
+Light-cone reduction of measurement circuits for Easy VQE.
+
+For a local Pauli term only the gates inside its backward light cone affect
+the measured expectation value. This module trims an ansatz down to those
+gates and to the qubits they touch, and caches the reduced circuits so each
+term is reduced once per ansatz instead of once per evaluation.
+"""
+
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+from qiskit import QuantumCircuit
+
+from .circuit import circuit_fingerprint
+from .ansatz_library import get_ansatz_metadata
+
+_LIGHT_CONE_CACHE_SIZE: int = 4096
+_light_cone_cache: Dict[Tuple[str, Tuple[int, ...]], Tuple[QuantumCircuit, List[int]]] = {}
+_light_cone_cache_lock = threading.Lock()
+
+
+def reduce_to_light_cone(quantum_circuit: QuantumCircuit,
+                         measured_qubits: Sequence[int]) -> Tuple[QuantumCircuit, List[int]]:
+    """
+    Drops all gates outside the backward light cone of the measured qubits.
+
+    Walks the circuit from the end towards the beginning, keeping every gate that
+    touches a qubit already in the cone and adding that gate's qubits to the cone.
+    The kept gates are re-indexed onto a smaller circuit containing only the
+    qubits of the cone. Barriers are dropped.
+
+    Args:
+        quantum_circuit: The (parameterized) circuit to reduce. Must not contain
+                         measurements or other classical operations.
+        measured_qubits: Indices of the qubits that will be measured.
+
+    Returns:
+        Tuple[QuantumCircuit, List[int]]: A tuple containing:
+            - The reduced circuit acting on `len(qubits)` qubits.
+            - The sorted original indices of the kept qubits; reduced qubit `i`
+              corresponds to original qubit `qubits[i]`.
+
+    Raises:
+        ValueError: If a measured qubit index is out of range, or the circuit
+                    contains classical operations.
+    """
+    num_qubits = quantum_circuit.num_qubits
+    for q in measured_qubits:
+        if not isinstance(q, int) or q < 0 or q >= num_qubits:
+            raise ValueError(f"Measured qubit index {q} is out of bounds for a circuit with {num_qubits} qubits.")
+
+    active = set(measured_qubits)
+    kept_instructions = []
+    for instruction in reversed(quantum_circuit.data):
+        operation = instruction.operation
+        if operation.name == 'barrier':
+            continue
+        if instruction.clbits or operation.name == 'measure':
+            raise ValueError(f"Light-cone reduction requires a circuit without classical operations, found '{operation.name}'.")
+        qubit_indices = [quantum_circuit.find_bit(q).index for q in instruction.qubits]
+        if active.intersection(qubit_indices):
+            active.update(qubit_indices)
+            kept_instructions.append((operation, qubit_indices))
+
+    kept_qubits = sorted(active)
+    index_map = {q: i for i, q in enumerate(kept_qubits)}
+    reduced = QuantumCircuit(len(kept_qubits), name=f"{quantum_circuit.name}_lightcone")
+    for operation, qubit_indices in reversed(kept_instructions):
+        reduced.append(operation, [index_map[q] for q in qubit_indices])
+
+    return reduced, kept_qubits
+
+
+def get_light_cone_circuit(quantum_circuit: QuantumCircuit,
+                           measured_qubits: Sequence[int],
+                           fingerprint: Optional[str] = None) -> Tuple[QuantumCircuit, List[int]]:
+    """
+    Cached wrapper around `reduce_to_light_cone`.
+
+    Reduced circuits are keyed by the circuit's structural fingerprint and the set of
+    measured qubits, so every Pauli term with the same support reuses one reduction.
+    For circuits from `ansatz_library.build_ansatz`, the stored light cones are checked
+    first: if the measured qubits' cones already cover every qubit, nothing can be
+    dropped and the circuit itself is returned without walking or hashing it.
+
+    Args:
+        quantum_circuit: The (unbound) circuit to reduce.
+        measured_qubits: Indices of the qubits that will be measured.
+        fingerprint: Precomputed `circuit_fingerprint(quantum_circuit)`. Pass it
+                     when reducing many terms of the same circuit to avoid rehashing.
+
+    Returns:
+        Tuple[QuantumCircuit, List[int]]: Same as `reduce_to_light_cone`. The returned
+        circuit is shared with the cache and must not be modified in place.
+    """
+    metadata = get_ansatz_metadata(quantum_circuit)
+    if metadata is not None and all(isinstance(q, int) and 0 <= q < quantum_circuit.num_qubits for q in measured_qubits):
+        cone = set().union(*(metadata['light_cone'][q] for q in measured_qubits))
+        if len(cone) == quantum_circuit.num_qubits:
+            return quantum_circuit, list(range(quantum_circuit.num_qubits))
+
+    if fingerprint is None:
+        fingerprint = circuit_fingerprint(quantum_circuit)
+    key = (fingerprint, tuple(sorted(measured_qubits)))
+
+    with _light_cone_cache_lock:
+        cached = _light_cone_cache.get(key)
+    if cached is not None:
+        return cached
+
+    reduced = reduce_to_light_cone(quantum_circuit, key[1])
+    with _light_cone_cache_lock:
+        if len(_light_cone_cache) >= _LIGHT_CONE_CACHE_SIZE:
+            _light_cone_cache.pop(next(iter(_light_cone_cache))) # Evict oldest entry
+        _light_cone_cache[key] = reduced
+    return reduced
+
+
+def clear_light_cone_cache() -> None:
+    """Removes all cached light-cone reductions."""
+    with _light_cone_cache_lock:
+        _light_cone_cache.clear()
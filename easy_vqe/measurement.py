@@ -11,23 +11,27 @@ import numpy as np
 from typing import List, Tuple, Dict, Union, Optional, Sequence, Any
 from qiskit import QuantumCircuit, ClassicalRegister
 from qiskit.circuit import Parameter
-from qiskit import transpile
+from qiskit.quantum_info import Statevector
 from qiskit_aer import AerSimulator
 from collections.abc import Sequence as ABCSequence # Use alias to avoid conflict
 
-_simulator_instance: Optional[AerSimulator] = None
+from .circuit import circuit_fingerprint, parameter_order, bind_parameter_array
+from .engine import ExecutionEngine, get_default_engine
+from .fusion import get_compiled_ansatz
+from .lightcone import get_light_cone_circuit
+from .shots import allocate_shots, ShotAllocator
+from .pauli import MAX_MASK_QUBITS, pauli_masks, bit_parity, z_parity_signs, compile_hamiltonian, pauli_expectations
+
+EXPECTATION_ESTIMATORS = ('terms', 'shadow', 'sampled')
 
 def get_simulator() -> AerSimulator:
     """
-    Initializes and returns the AerSimulator instance (lazy initialization).
+    Returns the calling thread's AerSimulator instance of the default engine (lazy initialization).
 
     Returns:
         AerSimulator: The simulator instance.
     """
-    global _simulator_instance
-    if _simulator_instance is None:
-        _simulator_instance = AerSimulator()
-    return _simulator_instance
+    return get_default_engine().simulator
 
 def apply_measurement_basis(quantum_circuit: QuantumCircuit, pauli_string: str) -> Tuple[QuantumCircuit, List[int]]:
     """
@@ -71,7 +75,8 @@ def apply_measurement_basis(quantum_circuit: QuantumCircuit, pauli_string: str)
 
 def run_circuit_and_get_counts(quantum_circuit: QuantumCircuit,
                                param_values: Optional[Union[Sequence[float], Dict[Parameter, float]]] = None,
-                               shots: int = 1024) -> Dict[str, int]:
+                               shots: int = 1024,
+                               engine: Optional[ExecutionEngine] = None) -> Dict[str, int]:
     """
     Assigns parameters (if any), runs the circuit on the simulator, and returns measurement counts.
 
@@ -82,6 +87,7 @@ def run_circuit_and_get_counts(quantum_circuit: QuantumCircuit,
             - Dict[Parameter, float]: Mapping Parameter objects to values.
             - None: If the circuit has no parameters.
         shots: Number of simulation shots.
+        engine: Execution engine to run on; defaults to the shared default engine.
 
     Returns:
         Dict[str, int]: A dictionary of measurement outcomes (bitstrings) and their counts.
@@ -96,7 +102,103 @@ def run_circuit_and_get_counts(quantum_circuit: QuantumCircuit,
         warnings.warn("run_circuit_and_get_counts called with shots <= 0. Returning empty counts.", UserWarning)
         return {}
     # Delay clbits check until after potential binding
+    bound_circuit = _bind_circuit_for_execution(quantum_circuit, param_values)
+
+    # --- Execution Logic ---
+    try:
+        # Check for measure instructions *after* binding, as binding might fail first
+        if not _has_measurements(bound_circuit, "counts"):
+             return {}
+
+        engine = engine or get_default_engine()
+        compiled_circuit = engine.transpile(bound_circuit)
+        result = engine.run(compiled_circuit, shots=shots)
+        counts = result.get_counts(compiled_circuit) # Use compiled circuit for get_counts
+    except Exception as e:
+        raise RuntimeError(f"Error during circuit transpilation or execution: {e}")
+
+    return counts
+
+
+def run_circuit_and_get_outcomes(quantum_circuit: QuantumCircuit,
+                                 param_values: Optional[Union[Sequence[float], Dict[Parameter, float]]] = None,
+                                 shots: int = 1024,
+                                 engine: Optional[ExecutionEngine] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Like `run_circuit_and_get_counts`, but returns the outcomes as NumPy arrays.
+
+    Reads the simulator's raw hex-keyed counts directly, skipping the formatting into
+    register-separated bitstrings and the per-string parsing that counts dictionaries
+    require downstream.
+
+    Args:
+        quantum_circuit: The QuantumCircuit to run (should include measurements).
+        param_values: Numerical parameter values, as in `run_circuit_and_get_counts`.
+        shots: Number of simulation shots.
+        engine: Execution engine to run on; defaults to the shared default engine.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: A tuple containing:
+            - The distinct outcomes (dtype uint64), bit j holding clbit j.
+            - How often each outcome occurred (dtype int64).
+          Both are empty if shots=0 or no measurements are present.
+
+    Raises:
+        ValueError: If the circuit has more than 63 clbits, or parameter issues as in
+                    `run_circuit_and_get_counts`.
+        RuntimeError: If simulation or transpilation fails.
+    """
+    empty = (np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64))
+    if shots <= 0:
+        warnings.warn("run_circuit_and_get_outcomes called with shots <= 0. Returning empty outcomes.", UserWarning)
+        return empty
+    if quantum_circuit.num_clbits > MAX_MASK_QUBITS:
+        raise ValueError(f"Outcome arrays support at most {MAX_MASK_QUBITS} clbits, circuit has {quantum_circuit.num_clbits}.")
+    bound_circuit = _bind_circuit_for_execution(quantum_circuit, param_values)
+
+    try:
+        if not _has_measurements(bound_circuit, "outcomes"):
+             return empty
+
+        engine = engine or get_default_engine()
+        compiled_circuit = engine.transpile(bound_circuit)
+        result = engine.run(compiled_circuit, shots=shots)
+        raw_counts = result.data(0)['counts'] # {'0x5': 12, ...}, bit j is clbit j
+    except Exception as e:
+        raise RuntimeError(f"Error during circuit transpilation or execution: {e}")
+
+    return _outcome_arrays(raw_counts)
+
+
+def _outcome_arrays(raw_counts: Dict[str, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Converts the simulator's hex-keyed counts into (outcomes, frequencies) arrays."""
+    outcomes = np.fromiter((int(key, 16) for key in raw_counts), dtype=np.uint64, count=len(raw_counts))
+    frequencies = np.fromiter(raw_counts.values(), dtype=np.int64, count=len(raw_counts))
+    return outcomes, frequencies
+
+
+def _has_measurements(bound_circuit: QuantumCircuit, returned: str) -> bool:
+    """Checks that a circuit measures something, warning as the run functions always have if not."""
+    if any(instruction.operation.name == 'measure' for instruction in bound_circuit.data):
+        return True
+    # Check if classical bits exist even without measure ops
+    if not bound_circuit.clbits:
+         warnings.warn(f"Circuit contains no classical bits for measurement. Returning empty {returned}.", UserWarning)
+    else:
+         warnings.warn(f"Circuit submitted for execution contains no measure instructions (but has classical bits). Returning empty {returned}.", RuntimeWarning)
+    return False
+
+
+def _bind_circuit_for_execution(quantum_circuit: QuantumCircuit,
+                                param_values: Optional[Union[Sequence[float], Dict[Parameter, float]]]) -> QuantumCircuit:
+    """
+    Validates `param_values` against the circuit's parameters and binds them.
 
+    Raises:
+        ValueError: If the number of parameters provided doesn't match the circuit.
+        TypeError: If the parameter container or values have unsupported types.
+        RuntimeError: If the assignment itself fails.
+    """
     bound_circuit: QuantumCircuit
     num_circuit_params = quantum_circuit.num_parameters
     param_map: Dict[Parameter, float] = {} # Initialize param_map
@@ -129,20 +231,13 @@ def run_circuit_and_get_counts(quantum_circuit: QuantumCircuit,
         elif isinstance(param_values, (list, np.ndarray)):
             if len(param_values) != num_circuit_params:
                  raise ValueError(f"Circuit expects {num_circuit_params} parameters, but received {len(param_values)}.")
-            # Sort parameters for consistent binding order
-            try:
-                # Try sorting numerically by index first (e.g., p_0, p_1, p_10)
-                sorted_params = sorted(quantum_circuit.parameters, key=lambda p: int(re.search(r'\d+', p.name).group()) if re.search(r'\d+', p.name) else float('inf'))
-            except (AttributeError, IndexError, ValueError, TypeError):
-                # Fallback to string sorting if numerical fails or name has no digits
-                warnings.warn("Could not sort parameters numerically for binding. Using default name sort.", UserWarning)
-                sorted_params = sorted(quantum_circuit.parameters, key=lambda p: p.name)
-
-            # Ensure values are numeric and create map
+            # Bind in the stored (or numerically sorted) parameter order, straight from an array
             try:
-                param_map = {p: float(v) for p, v in zip(sorted_params, param_values)}
-            except (ValueError, TypeError) as e:
-                 raise TypeError(f"Parameter sequence values must be numeric. Error converting: {e}")
+                return bind_parameter_array(quantum_circuit, param_values)
+            except TypeError:
+                raise
+            except Exception as e:
+                raise RuntimeError(f"Unexpected error during parameter assignment: {e}")
 
         # Catch other unsupported types (including strings, tuples unless explicitly supported)
         else:
@@ -160,26 +255,7 @@ def run_circuit_and_get_counts(quantum_circuit: QuantumCircuit,
              warnings.warn(f"Circuit has no parameters, but received parameters ({type(param_values)}). Ignoring them.", UserWarning)
         bound_circuit = quantum_circuit
 
-    # --- Execution Logic ---
-    try:
-        # Check for measure instructions *after* binding, as binding might fail first
-        has_measurements = any(instruction.operation.name == 'measure' for instruction in bound_circuit.data)
-        if not has_measurements:
-             # Check if classical bits exist even without measure ops
-             if not bound_circuit.clbits:
-                  warnings.warn("Circuit contains no classical bits for measurement. Returning empty counts.", UserWarning)
-             else:
-                  warnings.warn("Circuit submitted for execution contains no measure instructions (but has classical bits). Returning empty counts.", RuntimeWarning)
-             return {}
-
-        sim = get_simulator() # Get simulator instance here
-        compiled_circuit = transpile(bound_circuit, sim)
-        result = sim.run(compiled_circuit, shots=shots).result()
-        counts = result.get_counts(compiled_circuit) # Use compiled circuit for get_counts
-    except Exception as e:
-        raise RuntimeError(f"Error during circuit transpilation or execution: {e}")
-
-    return counts
+    return bound_circuit
 
 
 def calculate_term_expectation(counts: Dict[str, int]) -> float:
@@ -212,41 +288,37 @@ def calculate_term_expectation(counts: Dict[str, int]) -> float:
     return expectation_value_sum / total_counts
 
 
-def get_hamiltonian_expectation_value(
-    ansatz: QuantumCircuit,
-    parsed_hamiltonian: List[Tuple[float, str]],
-    param_values: Union[Sequence[float], Dict[Parameter, float], None], # Allow None explicitly
-    n_shots: int = 1024
-) -> float:
+def calculate_outcome_expectation(outcomes: np.ndarray, frequencies: np.ndarray) -> float:
     """
-    Calculates the total expectation value of a Hamiltonian for a given ansatz and parameters.
-
-    For each Pauli term in the Hamiltonian:
-    1. Copies the ansatz.
-    2. Binds the parameters.
-    3. Applies the appropriate basis change gates.
-    4. Adds measurement instructions for relevant qubits.
-    5. Runs the circuit and calculates the term's expectation value from counts.
-    6. Multiplies by the term's coefficient and sums the results.
+    Array counterpart of `calculate_term_expectation`: the parity expectation over all measured bits.
 
     Args:
-        ansatz: The (parameterized) ansatz circuit. *Should not contain measurements.*
-        parsed_hamiltonian: List of (coefficient, pauli_string) tuples from `parse_hamiltonian_expression`.
-        param_values: Numerical parameter values for the ansatz (Sequence, dict or None).
-        n_shots: Number of shots for *each* Pauli term measurement circuit.
+        outcomes: Distinct outcomes (dtype uint64), as returned by `run_circuit_and_get_outcomes`.
+        frequencies: Occurrence count of each outcome.
 
     Returns:
-        float: The total expectation value <H>.
+        float: The calculated expectation value for the term.
+               Returns 0.0 if there are no outcomes.
+    """
+    total_counts = int(np.sum(frequencies))
+    if total_counts == 0:
+        return 0.0
+    signs = 1 - 2 * bit_parity(np.asarray(outcomes, dtype=np.uint64)).astype(np.int64)
+    return float(np.dot(signs, frequencies) / total_counts)
+
+
+def _resolve_ansatz_parameter_map(ansatz: QuantumCircuit,
+                                  param_values: Union[Sequence[float], Dict[Parameter, float], None]) -> Dict[Parameter, float]:
+    """
+    Validates `param_values` against the ansatz and returns a {Parameter: float} map.
+
+    Returns an empty dict if the ansatz has no parameters.
 
     Raises:
-        ValueError: If Pauli string length mismatches ansatz qubits, or parameter issues during binding.
-        RuntimeError: If circuit execution fails for any term.
+        ValueError: If the number of parameters or the dictionary keys mismatch the ansatz.
+        TypeError: If the values are not numeric or `param_values` has an unsupported type.
     """
-    num_qubits = ansatz.num_qubits
-    total_expected_value = 0.0
-    bound_ansatz: QuantumCircuit
     num_ansatz_params = ansatz.num_parameters
-
     param_map: Dict[Parameter, float] = {}
     if num_ansatz_params > 0:
         if param_values is None:
@@ -273,68 +345,691 @@ def get_hamiltonian_expectation_value(
             if len(param_values) != num_ansatz_params:
                 raise ValueError(f"Ansatz expects {num_ansatz_params} parameters, but received sequence of length {len(param_values)}.")
             try:
-                sorted_params = sorted(ansatz.parameters, key=lambda p: int(re.search(r'\d+', p.name).group()) if re.search(r'\d+', p.name) else float('inf'))
-            except (AttributeError, IndexError, ValueError, TypeError):
-                warnings.warn("Could not sort ansatz parameters numerically for binding. Using default name sort.", UserWarning)
-                sorted_params = sorted(ansatz.parameters, key=lambda p: p.name)
-            try:
-                param_map = {p: float(v) for p, v in zip(sorted_params, param_values)}
+                values = np.asarray(param_values, dtype=float).tolist()
             except (ValueError, TypeError) as e:
                  raise TypeError(f"Ansatz parameter sequence values must be numeric. Error converting: {e}")
+            param_map = dict(zip(parameter_order(ansatz), values))
         else:
             raise TypeError(f"Unsupported type for 'param_values' for ansatz binding: {type(param_values)}. Use list, np.ndarray, dict, or None.")
-
-        try:
-            bound_ansatz = ansatz.assign_parameters(param_map)
-        except Exception as e:
-            raise ValueError(f"Failed to bind parameters to ansatz. Error: {e}")
     else: # No parameters in ansatz
         if param_values is not None and param_values != {} and param_values != []:
              warnings.warn(f"Ansatz has no parameters, but received parameters ({type(param_values)}). Ignoring them.", UserWarning)
-        bound_ansatz = ansatz
+    return param_map
+
+
+def _bind_circuit(quantum_circuit: QuantumCircuit, param_map: Dict[Parameter, float]) -> QuantumCircuit:
+    """Binds the subset of `param_map` used by `quantum_circuit`; returns the circuit itself if unparameterized."""
+    if quantum_circuit.num_parameters == 0:
+        return quantum_circuit
+    try:
+        # Positional binding in the circuit's own order avoids Qiskit's slower dictionary path
+        return quantum_circuit.assign_parameters([param_map[p] for p in quantum_circuit.parameters])
+    except Exception as e:
+        raise ValueError(f"Failed to bind parameters to ansatz. Error: {e}")
+
+
+def _build_term_measurement_circuit(bound_circuit: QuantumCircuit, pauli_string: str) -> Optional[QuantumCircuit]:
+    """
+    Copies a bound circuit and appends basis changes and measurements for one Pauli term.
+
+    Returns None if the term is the identity (nothing to measure).
+    """
+    qc_term = bound_circuit.copy(name=f"Measure_{pauli_string}")
+
+    # Apply basis transformation gates IN PLACE and get indices to measure
+    qc_term, measured_qubit_indices = apply_measurement_basis(qc_term, pauli_string)
+    if not measured_qubit_indices:
+        return None
+
+    num_measured = len(measured_qubit_indices)
+    cr_name = f"c_{pauli_string.replace('I','_')}" # Create a somewhat unique name
+    cr_name = re.sub(r'[^a-zA-Z0-9_]', '', cr_name)
+    cr_name = cr_name[:20] # Limit length
+
+    existing_regs = {reg.name for reg in qc_term.cregs}
+    reg_suffix = 0
+    final_cr_name = cr_name
+    while final_cr_name in existing_regs:
+        reg_suffix += 1
+        final_cr_name = f"{cr_name}_{reg_suffix}"
 
+    cr = ClassicalRegister(num_measured, name=final_cr_name)
+    qc_term.add_register(cr)
+    qc_term.measure(measured_qubit_indices, cr) # Measure to the newly added register
+    return qc_term
+
+
+def _prepare_term_circuits(ansatz: QuantumCircuit,
+                           measured_terms: List[Tuple[float, str]],
+                           light_cone: bool = False) -> List[QuantumCircuit]:
+    """
+    Builds one parameterized measurement circuit per (non-identity) Hamiltonian term.
+
+    With `light_cone`, each circuit starts from the (cached) light-cone reduction of
+    the ansatz to the term's support instead of the full ansatz.
+    """
+    ansatz_fingerprint = circuit_fingerprint(ansatz) if light_cone else None
+    term_circuits: List[QuantumCircuit] = []
+    for _, pauli_string in measured_terms:
+        if light_cone:
+            support = [q for q, op in enumerate(pauli_string) if op != 'I']
+            reduced_ansatz, kept_qubits = get_light_cone_circuit(ansatz, support, ansatz_fingerprint)
+            term_circuits.append(_build_term_measurement_circuit(reduced_ansatz, ''.join(pauli_string[q] for q in kept_qubits)))
+        else:
+            term_circuits.append(_build_term_measurement_circuit(ansatz, pauli_string))
+    return term_circuits
+
+
+def _map_to_target(ansatz: QuantumCircuit,
+                   parsed_hamiltonian: List[Tuple[float, str]],
+                   param_values: Union[Sequence[float], Dict[Parameter, float], None],
+                   engine: ExecutionEngine) -> Tuple[QuantumCircuit, List[Tuple[float, str]], Dict[Parameter, float]]:
+    """
+    Replaces the ansatz by its (cached) transpilation for the engine's target.
+
+    The Hamiltonian is moved onto the physical qubits holding the logical ones at the
+    end of the routed circuit, so the usual basis changes and measurements are appended
+    there and nothing is routed again.
+
+    Returns:
+        Tuple[QuantumCircuit, List[Tuple[float, str]], Dict[Parameter, float]]: The transpiled
+        ansatz, the mapped Hamiltonian and the parameter values for the transpiled ansatz.
+    """
+    param_map = _resolve_ansatz_parameter_map(ansatz, param_values)
+    transpiled = engine.transpile_for_target(ansatz)
+    values = [param_map[p] for p in parameter_order(ansatz)]
+    return transpiled.circuit, transpiled.map_hamiltonian(parsed_hamiltonian), transpiled.parameter_map(values)
+
+
+def _is_diagonal(pauli_string: str) -> bool:
+    """True if the Pauli string contains only 'I' and 'Z'."""
+    return all(op in 'IZ' for op in pauli_string)
+
+
+def _group_measured_terms(parsed_hamiltonian: List[Tuple[float, str]],
+                          num_qubits: int,
+                          group_diagonal: bool) -> Tuple[float, List[Tuple[float, str]], List[int], List[Tuple[float, str]]]:
+    """
+    Splits the terms into the constant, the Z/I-only terms read from one shared circuit and the rest.
+
+    Returns:
+        Tuple[float, List[Tuple[float, str]], List[int], List[Tuple[float, str]]]: The constant
+        contribution, the shared diagonal terms (empty unless at least two fit the bit masks),
+        their sorted support, and the terms measured with a circuit each.
+    """
+    constant_value, measured_terms = _split_identity_terms(parsed_hamiltonian, num_qubits)
+    diagonal_terms = [term for term in measured_terms if _is_diagonal(term[1])] if group_diagonal else []
+    diagonal_support = sorted({q for _, pauli_string in diagonal_terms for q, op in enumerate(pauli_string) if op == 'Z'})
+    if len(diagonal_terms) < 2 or len(diagonal_support) > MAX_MASK_QUBITS:
+        diagonal_terms = [] # Nothing to share, or too wide for bit masks
+
+    other_terms = [term for term in measured_terms if not diagonal_terms or not _is_diagonal(term[1])]
+    return constant_value, diagonal_terms, diagonal_support, other_terms
+
+
+def _diagonal_unit(qc_diagonal: QuantumCircuit,
+                   diagonal_terms: List[Tuple[float, str]],
+                   diagonal_support: List[int],
+                   local_index: Dict[int, int]) -> Dict[str, Any]:
+    """Adds the shared computational-basis measurements (in place) and returns the diagonal unit."""
+    cr = ClassicalRegister(len(diagonal_support), name="c_diag")
+    qc_diagonal.add_register(cr)
+    qc_diagonal.measure([local_index[q] for q in diagonal_support], cr) # Clbit j holds qubit diagonal_support[j]
+    clbit_strings = [''.join(pauli_string[q] for q in diagonal_support) for _, pauli_string in diagonal_terms]
+    return {'terms': diagonal_terms, 'circuit': qc_diagonal, 'z_masks': pauli_masks(clbit_strings)[1]}
+
+
+def _prepare_measurement_units(ansatz: QuantumCircuit,
+                               parsed_hamiltonian: List[Tuple[float, str]],
+                               light_cone: bool = False,
+                               group_diagonal: bool = True) -> Tuple[float, List[Dict[str, Any]]]:
+    """
+    Builds the parameterized measurement circuits of a Hamiltonian, sharing one circuit for all diagonal terms.
+
+    With `group_diagonal`, every Z/I-only term is read from a single computational-basis
+    circuit measuring the union of their supports; all other terms get their own
+    circuit as in `_prepare_term_circuits`. The circuits are left unbound, so they can
+    be transpiled once and bound at every evaluation (see `_transpiled_measurement_units`).
+
+    Returns:
+        Tuple[float, List[Dict[str, Any]]]: The constant energy contribution and one unit per circuit:
+            - 'terms' (List[Tuple[float, str]]): The (coefficient, pauli_string) terms read from the circuit.
+            - 'circuit' (QuantumCircuit): The parameterized measurement circuit.
+            - 'z_masks' (Optional[np.ndarray]): For the diagonal unit, each term's Z mask over
+              the circuit's clbits; None for single-term units.
 
+    Raises:
+        ValueError: If a Pauli string length mismatches the ansatz qubits.
+    """
+    constant_value, diagonal_terms, diagonal_support, other_terms = _group_measured_terms(
+        parsed_hamiltonian, ansatz.num_qubits, group_diagonal)
+    other_circuits = _prepare_term_circuits(ansatz, other_terms, light_cone)
+    units = [{'terms': [term], 'circuit': circuit, 'z_masks': None}
+             for term, circuit in zip(other_terms, other_circuits)]
+
+    if diagonal_terms:
+        if light_cone:
+            reduced_ansatz, kept_qubits = get_light_cone_circuit(ansatz, diagonal_support)
+            local_index = {q: i for i, q in enumerate(kept_qubits)}
+            qc_diagonal = reduced_ansatz.copy(name="Measure_diagonal")
+        else:
+            local_index = {q: q for q in diagonal_support}
+            qc_diagonal = ansatz.copy(name="Measure_diagonal")
+        units.append(_diagonal_unit(qc_diagonal, diagonal_terms, diagonal_support, local_index))
+
+    return constant_value, units
+
+
+def _transpiled_measurement_units(ansatz: QuantumCircuit,
+                                  parsed_hamiltonian: List[Tuple[float, str]],
+                                  light_cone: bool,
+                                  group_diagonal: bool,
+                                  engine: ExecutionEngine) -> Tuple[float, List[Dict[str, Any]]]:
+    """
+    The units of `_prepare_measurement_units`, with the circuits transpiled once per engine.
+
+    Keyed by the ansatz fingerprint, so equal ansatzes with distinct Parameter objects
+    share the entry; bind the circuits by parameter name with `_bind_units`.
+    """
+    key = (circuit_fingerprint(ansatz), tuple(parsed_hamiltonian), light_cone, group_diagonal)
+    return engine.measurement_units(
+        key, lambda: _prepare_measurement_units(ansatz, parsed_hamiltonian, light_cone, group_diagonal))
+
+
+def _bind_circuit_by_name(quantum_circuit: QuantumCircuit, values_by_name: Dict[str, float]) -> QuantumCircuit:
+    """
+    Binds a cached (transpiled) circuit by parameter name.
+
+    Cached circuits may hold the Parameter objects of an earlier, structurally equal
+    ansatz, which compare unequal to the caller's; their names match.
+    """
+    if quantum_circuit.num_parameters == 0:
+        return quantum_circuit
+    return quantum_circuit.assign_parameters([values_by_name[p.name] for p in quantum_circuit.parameters])
+
+
+def _bind_units(units: List[Dict[str, Any]], param_map: Dict[Parameter, float]) -> List[Dict[str, Any]]:
+    """Copies of the units with their (transpiled) circuits bound (see `_bind_circuit_by_name`)."""
+    values_by_name = {p.name: value for p, value in param_map.items()}
+    return [dict(unit, circuit=_bind_circuit_by_name(unit['circuit'], values_by_name)) for unit in units]
+
+
+def _run_unit(unit: Dict[str, Any], shots: int, engine: Optional[ExecutionEngine] = None) -> Tuple[float, float, int]:
+    """
+    Runs the transpiled, bound circuit of one measurement unit and reduces its outcomes to running sums.
+
+    The per-shot value of a unit is its energy sum_i c_i s_i divided by its weight
+    sum_i |c_i|, so it lies in [-1, 1] like a single Pauli outcome.
+
+    Returns:
+        Tuple[float, float, int]: The sum and the sum of squares of the normalized
+        per-shot unit values, and the number of shots taken.
+    """
+    circuit = unit['circuit']
+    try:
+        result = (engine or get_default_engine()).run(circuit, shots=shots)
+        raw_counts = result.data(0)['counts'] # {'0x5': 12, ...}, bit j is clbit j
+    except Exception as e:
+        raise RuntimeError(f"Error during circuit execution: {e}")
+
+    if unit['z_masks'] is None and circuit.num_clbits > MAX_MASK_QUBITS:
+        # Too wide for packed outcomes, fall back to bitstring counts
+        counts = {format(int(key, 16), 'b'): count for key, count in raw_counts.items()}
+        num_shots = sum(counts.values())
+        parity_sum = calculate_term_expectation(counts) * num_shots
+        return float(np.sign(unit['terms'][0][0]) * parity_sum), float(num_shots), num_shots
+
+    outcomes, frequencies = _outcome_arrays(raw_counts)
+    return _unit_outcome_sums(unit, outcomes, frequencies)
+
+
+def _unit_outcome_sums(unit: Dict[str, Any], outcomes: np.ndarray, frequencies: np.ndarray) -> Tuple[float, float, int]:
+    """The running sums of `_run_unit` from a unit's outcome arrays (see `run_circuit_and_get_outcomes`)."""
+    coefficients = np.array([coefficient for coefficient, _ in unit['terms']], dtype=float)
+    num_shots = int(frequencies.sum())
+    if unit['z_masks'] is None:
+        parity_sum = calculate_outcome_expectation(outcomes, frequencies) * num_shots
+        return float(np.sign(coefficients[0]) * parity_sum), float(num_shots), num_shots
+
+    signs = z_parity_signs(outcomes, unit['z_masks'])
+    unit_values = signs @ (coefficients / np.sum(np.abs(coefficients)))
+    return float(frequencies @ unit_values), float(frequencies @ unit_values**2), num_shots
+
+
+def _get_exact_expectation_value(ansatz: QuantumCircuit,
+                                 parsed_hamiltonian: List[Tuple[float, str]],
+                                 param_values: Union[Sequence[float], Dict[Parameter, float], None],
+                                 return_details: bool,
+                                 engine: Optional[ExecutionEngine] = None) -> Union[float, Dict[str, Any]]:
+    """
+    Exact (shot-free) branch of `get_hamiltonian_expectation_value`.
+
+    Simulates the ansatz once as a statevector, with its cached gate-fused program
+    (see `easy_vqe.fusion`) and the engine's checkpoints, and evaluates every term on
+    it with the matrix-free `pauli_expectations` kernel.
+    """
+    constant_value, measured_terms = _split_identity_terms(parsed_hamiltonian, ansatz.num_qubits)
+    param_map = _resolve_ansatz_parameter_map(ansatz, param_values)
+    try:
+        compiled = get_compiled_ansatz(ansatz)
+    except ValueError:
+        compiled = None # Not a pure gate circuit: let Statevector handle (or report) it
+    if compiled is not None:
+        values = [param_map[p] for p in parameter_order(ansatz)] # Cached programs may hold equal, not identical, parameters
+        state = (engine or get_default_engine()).statevector(compiled, values)
+    else:
+        state = Statevector(_bind_circuit(ansatz, param_map)).data
+    _, x_masks, z_masks = compile_hamiltonian(measured_terms)
+    expectations = pauli_expectations(state, x_masks, z_masks)
+
+    coefficients = np.array([coefficient for coefficient, _ in measured_terms], dtype=float)
+    total_expected_value = constant_value + float(np.dot(coefficients, expectations))
+    if not return_details:
+        return total_expected_value
+    return {
+        'value': total_expected_value,
+        'variance': 0.0,
+        'std_error': 0.0,
+        'shots_used': 0,
+        'term_shots': {},
+        'rounds': 1,
+        'converged': True,
+    }
+
+
+def _split_identity_terms(parsed_hamiltonian: List[Tuple[float, str]],
+                          num_qubits: int) -> Tuple[float, List[Tuple[float, str]]]:
+    """
+    Separates the constant all-identity contribution from the terms that need measuring.
+
+    Zero-coefficient terms are dropped.
+
+    Raises:
+        ValueError: If a Pauli string length mismatches `num_qubits`.
+    """
+    constant_value = 0.0
+    measured_terms: List[Tuple[float, str]] = []
     for coefficient, pauli_string in parsed_hamiltonian:
         if np.isclose(coefficient, 0.0):
-            continue # Skip terms with zero coefficient
-
+            continue
         if len(pauli_string) != num_qubits:
              raise ValueError(f"Hamiltonian term '{pauli_string}' length {len(pauli_string)} "
                               f"mismatches ansatz qubits {num_qubits}.")
+        if all(op == 'I' for op in pauli_string):
+            constant_value += coefficient
+        else:
+            measured_terms.append((coefficient, pauli_string))
+    return constant_value, measured_terms
 
-        # --- Build & Run Measurement Circuit for this Term ---
-        qc_term = bound_ansatz.copy(name=f"Measure_{pauli_string}")
 
-        # Apply basis transformation gates IN PLACE and get indices to measure
-        qc_term, measured_qubit_indices = apply_measurement_basis(qc_term, pauli_string)
+def _get_sampled_expectation_value(ansatz: QuantumCircuit,
+                                   parsed_hamiltonian: List[Tuple[float, str]],
+                                   param_values: Union[Sequence[float], Dict[Parameter, float], None],
+                                   n_shots: int,
+                                   term_sample_size: Optional[int],
+                                   light_cone: bool,
+                                   return_details: bool,
+                                   seed: Optional[int],
+                                   engine: Optional[ExecutionEngine] = None) -> Union[float, Dict[str, Any]]:
+    """
+    Importance-sampled branch of `get_hamiltonian_expectation_value`.
 
-        term_exp_val: float
-        # If no qubits are measured (Pauli string is all 'I'), expectation is 1.0
-        if not measured_qubit_indices:
-             term_exp_val = 1.0
-        else:
-             num_measured = len(measured_qubit_indices)
-             cr_name = f"c_{pauli_string.replace('I','_')}" # Create a somewhat unique name
-             cr_name = re.sub(r'[^a-zA-Z0-9_]', '', cr_name)
-             cr_name = cr_name[:20] # Limit length
-
-             existing_regs = {reg.name for reg in qc_term.cregs}
-             reg_suffix = 0
-             final_cr_name = cr_name
-             while final_cr_name in existing_regs:
-                 reg_suffix += 1
-                 final_cr_name = f"{cr_name}_{reg_suffix}"
-
-             cr = ClassicalRegister(num_measured, name=final_cr_name)
-             qc_term.add_register(cr)
-             qc_term.measure(measured_qubit_indices, cr) # Measure to the newly added register
-
-             # Run this specific measurement circuit
-             # Parameters are already bound, so pass param_values=None
-             counts = run_circuit_and_get_counts(qc_term, param_values=None, shots=n_shots)
-             term_exp_val = calculate_term_expectation(counts)
-
-        # Add the weighted term expectation value to the total
-        total_expected_value += coefficient * term_exp_val
-
-    return total_expected_value
\ No newline at end of file
+    Writing H = c_0 I + sum_i c_i P_i with lambda = sum_i |c_i|, each of the
+    `term_sample_size` draws picks term i with probability |c_i| / lambda and
+    contributes lambda * sign(c_i) * <P_i>. The mean of the draws is an unbiased
+    estimate of sum_i c_i <P_i>. Each distinct drawn term is measured once with
+    `n_shots` shots, so draws of the same term share one shot-noise realisation: the
+    reported variance is the sample variance of the draws divided by their number
+    (term sampling) plus sum_i (d_i / M)^2 lambda^2 sigma_i^2 / n_shots (shot noise),
+    where d_i counts the draws of term i among M and sigma_i^2 is its single-shot variance.
+    """
+    if term_sample_size is None or term_sample_size <= 0:
+        raise ValueError(f"estimator='sampled' needs a positive term_sample_size, got {term_sample_size}.")
+
+    constant_value, measured_terms = _split_identity_terms(parsed_hamiltonian, ansatz.num_qubits)
+    coefficients = np.array([coefficient for coefficient, _ in measured_terms], dtype=float)
+    total_weight = float(np.sum(np.abs(coefficients)))
+
+    draws = np.zeros(len(measured_terms), dtype=int)
+    if measured_terms:
+        rng = np.random.default_rng(seed)
+        draws = rng.multinomial(term_sample_size, np.abs(coefficients) / total_weight)
+    sampled = np.flatnonzero(draws)
+
+    # One transpiled circuit per term, in the order of `measured_terms`; only the drawn ones are bound and run
+    engine = engine or get_default_engine()
+    _, units = _transpiled_measurement_units(ansatz, parsed_hamiltonian, light_cone, False, engine)
+    sampled_units = _bind_units([units[i] for i in sampled], _resolve_ansatz_parameter_map(ansatz, param_values))
+    sampled_terms = [measured_terms[i] for i in sampled]
+    value_sums, square_sums, draw_shots = (np.zeros(len(sampled)) for _ in range(3))
+    for k, unit in enumerate(sampled_units):
+        value_sums[k], square_sums[k], draw_shots[k] = _run_unit(unit, n_shots, engine)
+    draw_values = total_weight * value_sums / np.maximum(draw_shots, 1) # value_sums carry sign(c_i)
+
+    weights = draws[sampled]
+    sampled_mean = float(np.dot(weights, draw_values) / term_sample_size) if len(sampled) else 0.0
+    total_expected_value = constant_value + sampled_mean
+
+    if not return_details:
+        return total_expected_value
+
+    if not measured_terms:
+        variance = 0.0
+    elif term_sample_size > 1:
+        sample_variance = float(np.dot(weights, (draw_values - sampled_mean)**2) / (term_sample_size - 1))
+        single_shot_variances = _unit_variances(value_sums, square_sums, draw_shots)
+        shot_variance = float(np.sum((weights / term_sample_size)**2 * total_weight**2
+                                     * single_shot_variances / np.maximum(draw_shots, 1)))
+        variance = sample_variance / term_sample_size + shot_variance
+    else:
+        variance = total_weight**2 # Single draw: bound by the range of the draw values
+    return {
+        'value': total_expected_value,
+        'variance': variance,
+        'std_error': float(np.sqrt(variance)),
+        'shots_used': n_shots * len(sampled),
+        'term_shots': {pauli_string: n_shots for _, pauli_string in sampled_terms},
+        'rounds': 1,
+        'converged': True,
+        'sampled_terms': len(sampled),
+    }
+
+
+def _unit_variances(value_sums: np.ndarray, square_sums: np.ndarray, shots: np.ndarray) -> np.ndarray:
+    """
+    Single-shot variance estimates of measurement units (1 - <P>^2 for a single Pauli term).
+
+    Floored at 1/n so that a unit seen with identical outcomes in few shots is not
+    reported as noise-free.
+    """
+    safe_shots = np.maximum(shots, 1)
+    means = value_sums / safe_shots
+    return np.maximum(square_sums / safe_shots - means**2, 1.0 / safe_shots)
+
+
+def _get_shadow_expectation_value(ansatz: QuantumCircuit,
+                                  parsed_hamiltonian: List[Tuple[float, str]],
+                                  param_values: Union[Sequence[float], Dict[Parameter, float], None],
+                                  n_snapshots: int,
+                                  return_details: bool,
+                                  seed: Optional[int],
+                                  engine: Optional[ExecutionEngine] = None) -> Union[float, Dict[str, Any]]:
+    """Classical-shadow branch of `get_hamiltonian_expectation_value`."""
+    from .shadows import collect_classical_shadow # Imported here, shadows depends on this module
+
+    constant_value, measured_terms = _split_identity_terms(parsed_hamiltonian, ansatz.num_qubits)
+    shadow = collect_classical_shadow(ansatz, param_values, n_snapshots, seed=seed, engine=engine)
+    value, variance = shadow.estimate_with_error(measured_terms) if measured_terms else (0.0, 0.0)
+    total_expected_value = constant_value + value
+
+    if not return_details:
+        return total_expected_value
+    return {
+        'value': total_expected_value,
+        'variance': variance,
+        'std_error': float(np.sqrt(variance)),
+        'shots_used': shadow.num_snapshots,
+        'term_shots': {},
+        'rounds': 1,
+        'converged': True,
+        'shadow': shadow,
+    }
+
+
+def get_hamiltonian_expectation_value(
+    ansatz: QuantumCircuit,
+    parsed_hamiltonian: List[Tuple[float, str]],
+    param_values: Union[Sequence[float], Dict[Parameter, float], None], # Allow None explicitly
+    n_shots: Optional[int] = 1024,
+    light_cone: bool = False,
+    shot_allocation: Union[str, ShotAllocator, None] = None,
+    return_details: bool = False,
+    target_std_error: Optional[float] = None,
+    max_shots: int = 1_000_000,
+    estimator: str = 'terms',
+    seed: Optional[int] = None,
+    term_sample_size: Optional[int] = None,
+    group_diagonal: bool = True,
+    engine: Optional[ExecutionEngine] = None,
+    evaluator: Optional[Any] = None
+) -> Union[float, Dict[str, Any]]:
+    """
+    Calculates the total expectation value of a Hamiltonian for a given ansatz and parameters.
+
+    For each Pauli term in the Hamiltonian:
+    1. Copies the ansatz.
+    2. Applies the appropriate basis change gates.
+    3. Adds measurement instructions for relevant qubits.
+    4. Transpiles the (still parameterized) circuit.
+    5. Binds the parameters, runs the circuit and calculates the term's expectation value from counts.
+    6. Multiplies by the term's coefficient and sums the results.
+
+    Steps 1-4 do not depend on the parameter values: the engine keeps their result
+    per ansatz structure and Hamiltonian (see `ExecutionEngine.measurement_units`), so
+    repeated evaluations, as in an optimization, only bind and run.
+
+    Terms containing only 'Z' and 'I' skip steps 1-5 individually: with
+    `group_diagonal=True` (default) they are all read from a single computational-basis
+    circuit, evaluated in one vectorized pass over the measured bitstrings using
+    Z masks.
+
+    With `n_shots=None` (exact mode), no shots are sampled: the ansatz is simulated
+    once as a statevector, by a gate-fused program compiled on first use (see
+    `easy_vqe.fusion`), and every term is evaluated exactly from it with bit
+    operations on the amplitudes (see `easy_vqe.pauli.pauli_expectations`). If
+    only some parameters changed since the previous exact evaluation of the ansatz
+    on the same engine and thread, the simulation resumes from a stored
+    intermediate state (see `ExecutionEngine.statevector`).
+
+    With `light_cone=True`, step 1 instead takes the (cached) reduction of the ansatz
+    to the backward light cone of the term's non-identity qubits, so local terms on
+    wide, shallow ansatzes are simulated on only the few qubits that influence them.
+
+    With `target_std_error` set, shots are drawn in rounds: after each round the
+    per-term means and variances are updated, and the next round's shots are split
+    variance-optimally and sized to reach the target. Sampling stops once the
+    standard error of <H> is at most `target_std_error` or `max_shots` is spent.
+
+    With `estimator='shadow'`, the steps above are replaced by a classical shadow:
+    `n_shots` snapshots in random single-qubit Pauli bases, from which every term is
+    estimated by median-of-means (see `easy_vqe.shadows`).
+
+    With `estimator='sampled'`, only `term_sample_size` terms are drawn, with
+    probability proportional to |coefficient|, and measured with `n_shots` shots
+    each. The estimate stays unbiased at a fraction of the cost for Hamiltonians
+    with very many terms, at the price of a larger variance.
+
+    If `engine` has a hardware target (`ExecutionEngine(target=...)`), shot-based
+    'terms' and 'sampled' evaluations run on the ansatz transpiled for it once
+    (see `ExecutionEngine.transpile_for_target`): the Pauli terms are moved to the
+    physical qubits holding the logical ones at the end of the routed circuit, so
+    'term_shots' is keyed by the physical Pauli strings. Exact and shadow estimates
+    do not depend on the target and ignore it.
+
+    Args:
+        ansatz: The (parameterized) ansatz circuit. *Should not contain measurements.*
+        parsed_hamiltonian: List of (coefficient, pauli_string) tuples from `parse_hamiltonian_expression`.
+        param_values: Numerical parameter values for the ansatz (Sequence, dict or None).
+        n_shots: Number of shots for *each* measurement circuit. If `shot_allocation` is
+                 set, the *total* shot budget for this evaluation instead. With
+                 `target_std_error`, this applies to the first round only. None selects
+                 exact mode.
+        light_cone: If True, simulate each term on its light-cone-reduced circuit.
+        shot_allocation: How to split `n_shots` over the measured terms (see `easy_vqe.shots`):
+            - None: Every term gets `n_shots` (default).
+            - 'uniform', 'proportional' or 'variance': Strategy name for `allocate_shots`.
+            - ShotAllocator: Stateful allocator; its running variance estimates are updated
+              with this evaluation's results.
+        return_details: If True, return a dictionary with the estimator statistics
+                        instead of only the value.
+        target_std_error: If set, keep sampling until the standard error of <H> reaches this value.
+        max_shots: Upper limit on the total shots spent when `target_std_error` is set.
+        estimator: How the terms are estimated:
+            - 'terms': One measurement circuit per term (default).
+            - 'shadow': Classical shadow with `n_shots` snapshots.
+            - 'sampled': Importance sampling of `term_sample_size` terms.
+        seed: Seed for the random measurement bases and simulator ('shadow') or
+              for the term draws ('sampled').
+        term_sample_size: Number of term draws per evaluation ('sampled' only).
+        group_diagonal: If True, measure all Z/I-only terms with one shared circuit.
+        engine: Execution engine for the measurement circuits (simulators, transpilation
+                cache, exact-mode checkpoints, hardware target, counters); defaults to the shared default engine.
+                Use one engine per worker, or share one, to run evaluations from several threads.
+        evaluator: A `ParallelEvaluator` or `DistributedEvaluator` set up for this ansatz
+                   and Hamiltonian. The term groups are then measured by its workers
+                   (with the evaluator's own `light_cone`/`group_diagonal` settings);
+                   an `engine` with a hardware target is rejected.
+
+    Returns:
+        float: The total expectation value <H>, or if `return_details` is True a dictionary with:
+            - 'value' (float): The expectation value <H>.
+            - 'variance' (float): Estimated variance of the value, sum_i c_i^2 Var(P_i) / n_i
+              (with the diagonal terms' covariance included for the shared circuit).
+            - 'std_error' (float): Square root of 'variance'.
+            - 'shots_used' (int): Total shots spent on this evaluation.
+            - 'term_shots' (Dict[str, int]): Shots spent on each measured Pauli term.
+            - 'rounds' (int): Number of sampling rounds (1 unless `target_std_error` is set).
+            - 'converged' (bool): Whether `target_std_error` was reached (True if not set).
+            - 'shadow' (ClassicalShadow): The collected snapshots ('shadow' estimator only),
+              reusable for further observables via `ClassicalShadow.estimate`.
+            - 'sampled_terms' (int): Number of distinct terms measured ('sampled' estimator only).
+
+    Raises:
+        ValueError: If Pauli string length mismatches ansatz qubits, or parameter issues during binding.
+        RuntimeError: If circuit execution fails for any term.
+    """
+    if evaluator is not None:
+        if n_shots is None or estimator != 'terms' or shot_allocation is not None or target_std_error is not None:
+            raise ValueError("An evaluator only supports shot-based 'terms' estimation without shot_allocation or target_std_error.")
+        if engine is not None and engine.target is not None:
+            raise ValueError("An evaluator measures on its workers' simulators and cannot use an engine with a hardware target.")
+        if not evaluator.matches(ansatz, parsed_hamiltonian):
+            raise ValueError("The evaluator was set up for a different ansatz or Hamiltonian.")
+        return evaluator.evaluate(param_values, n_shots, return_details)
+    if n_shots is None and estimator != 'terms':
+        raise ValueError(f"Exact mode (n_shots=None) is not supported by estimator='{estimator}'.")
+    if estimator == 'shadow':
+        if light_cone or shot_allocation is not None or target_std_error is not None:
+            raise ValueError("estimator='shadow' does not support light_cone, shot_allocation or target_std_error.")
+        return _get_shadow_expectation_value(ansatz, parsed_hamiltonian, param_values, n_shots, return_details, seed, engine)
+    if n_shots is not None and engine is not None and engine.target is not None:
+        ansatz, parsed_hamiltonian, param_values = _map_to_target(ansatz, parsed_hamiltonian, param_values, engine)
+    if estimator == 'sampled':
+        if shot_allocation is not None or target_std_error is not None:
+            raise ValueError("estimator='sampled' does not support shot_allocation or target_std_error.")
+        return _get_sampled_expectation_value(ansatz, parsed_hamiltonian, param_values, n_shots,
+                                              term_sample_size, light_cone, return_details, seed, engine)
+    if estimator not in EXPECTATION_ESTIMATORS:
+        raise ValueError(f"Unknown estimator '{estimator}'. Use one of {EXPECTATION_ESTIMATORS}.")
+
+    if n_shots is None:
+        if shot_allocation is not None or target_std_error is not None:
+            raise ValueError("Exact mode (n_shots=None) does not support shot_allocation or target_std_error.")
+        return _get_exact_expectation_value(ansatz, parsed_hamiltonian, param_values, return_details, engine)
+
+    engine = engine or get_default_engine()
+    param_map = _resolve_ansatz_parameter_map(ansatz, param_values)
+    constant_value, units = _transpiled_measurement_units(ansatz, parsed_hamiltonian, light_cone, group_diagonal, engine)
+    units = _bind_units(units, param_map)
+
+    # Each unit is one circuit; its normalized per-shot value lies in [-1, 1] and is
+    # weighted by the sum of |c_i| of its terms, so single Pauli terms and the shared
+    # diagonal circuit go through the same allocation and variance formulas.
+    unit_labels = ['+'.join(pauli_string for _, pauli_string in unit['terms']) for unit in units]
+    unit_weights = np.array([sum(abs(coefficient) for coefficient, _ in unit['terms']) for unit in units], dtype=float)
+    if shot_allocation is None:
+        round_shots = np.full(len(units), n_shots, dtype=int)
+    elif isinstance(shot_allocation, ShotAllocator):
+        round_shots = shot_allocation.allocate(unit_labels, unit_weights, n_shots)
+    else:
+        round_shots = allocate_shots(unit_weights, n_shots, shot_allocation)
+
+    unit_sums = np.zeros(len(units))
+    unit_square_sums = np.zeros(len(units))
+    unit_shots = np.zeros(len(units), dtype=int)
+    rounds = 0
+    while True:
+        for u, unit in enumerate(units):
+            if round_shots[u] <= 0:
+                continue
+            # Run this specific measurement circuit
+            value_sum, square_sum, shots = _run_unit(unit, int(round_shots[u]), engine)
+            unit_sums[u] += value_sum
+            unit_square_sums[u] += square_sum
+            unit_shots[u] += shots
+        rounds += 1
+
+        variances = _unit_variances(unit_sums, unit_square_sums, unit_shots)
+        total_variance = float(np.sum(unit_weights**2 * variances / np.maximum(unit_shots, 1)))
+        if target_std_error is None or not units:
+            break
+        shots_left = max_shots - int(unit_shots.sum())
+        if np.sqrt(total_variance) <= target_std_error or shots_left <= 0:
+            break
+
+        # Variance-optimal total to reach the target: (sum_u w_u sigma_u)^2 / target^2
+        std_devs = np.sqrt(variances)
+        shots_needed = int(np.ceil((np.sum(unit_weights * std_devs) / target_std_error)**2)) - int(unit_shots.sum())
+        next_total = min(max(shots_needed, len(units)), shots_left)
+        round_shots = allocate_shots(unit_weights, next_total, 'variance', std_devs, min_shots=0)
+
+    unit_means = unit_sums / np.maximum(unit_shots, 1)
+    total_expected_value = constant_value + float(np.dot(unit_weights, unit_means))
+
+    if isinstance(shot_allocation, ShotAllocator):
+        shot_allocation.update(unit_labels, unit_means, unit_shots)
+
+    if not return_details:
+        return total_expected_value
+
+    term_shots_by_pauli: Dict[str, int] = {}
+    for unit, shots in zip(units, unit_shots.tolist()):
+        for _, pauli_string in unit['terms']:
+            term_shots_by_pauli[pauli_string] = term_shots_by_pauli.get(pauli_string, 0) + shots
+    return {
+        'value': total_expected_value,
+        'variance': total_variance,
+        'std_error': float(np.sqrt(total_variance)),
+        'shots_used': int(unit_shots.sum()),
+        'term_shots': term_shots_by_pauli,
+        'rounds': rounds,
+        'converged': target_std_error is None or bool(np.sqrt(total_variance) <= target_std_error),
+    }
+
+
+def estimate_expectation_value(
+    ansatz: QuantumCircuit,
+    parsed_hamiltonian: List[Tuple[float, str]],
+    param_values: Union[Sequence[float], Dict[Parameter, float], None],
+    target_std_error: float,
+    initial_shots: int = 256,
+    max_shots: int = 1_000_000,
+    light_cone: bool = False
+) -> Dict[str, Any]:
+    """
+    Estimates <H> to a requested precision, drawing only as many shots as needed.
+
+    Convenience wrapper around `get_hamiltonian_expectation_value` with
+    `target_std_error` set and `return_details=True`.
+
+    Args:
+        ansatz: The (parameterized) ansatz circuit. *Should not contain measurements.*
+        parsed_hamiltonian: List of (coefficient, pauli_string) tuples.
+        param_values: Numerical parameter values for the ansatz (Sequence, dict or None).
+        target_std_error: Desired standard error of <H> (e.g. 1e-3 for 1 mHa).
+        initial_shots: Shots per term in the first round, used to estimate the variances.
+        max_shots: Upper limit on the total number of shots.
+        light_cone: If True, simulate each term on its light-cone-reduced circuit.
+
+    Returns:
+        Dict[str, Any]: The details dictionary of `get_hamiltonian_expectation_value`
+                        ('value', 'std_error', 'shots_used', 'converged', ...).
+
+    Raises:
+        ValueError: If `target_std_error` is not positive, or as in `get_hamiltonian_expectation_value`.
+    """
+    if target_std_error <= 0:
+        raise ValueError(f"target_std_error must be positive, got {target_std_error}.")
+    return get_hamiltonian_expectation_value(ansatz, parsed_hamiltonian, param_values, initial_shots,
+                                             light_cone=light_cone, return_details=True,
+                                             target_std_error=target_std_error, max_shots=max_shots)
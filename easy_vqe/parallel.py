@@ -0,0 +1,288 @@
+"""
+Process-pool evaluation of Hamiltonian expectation values for Easy VQE.
+
+`ParallelEvaluator` splits the measured terms of a Hamiltonian into groups and
+spreads the groups of every evaluation over a pool of worker processes. Each
+worker receives the ansatz and all groups once, when the pool starts, and
+builds and transpiles the measurement circuits of every group right away (see
+`easy_vqe.prepared`); a task then only binds them and runs the simulator.
+Per evaluation only the parameter vector changes hands: the parent writes it
+into a shared-memory block that every worker has attached, and each task
+carries nothing but a group index and a shot count. The partial energies and
+variances of the groups are summed in the parent.
+"""
+
+import threading
+import multiprocessing
+from abc import ABC, abstractmethod
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Tuple, Dict, Union, Optional, Sequence, Any
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+
+from .circuit import circuit_fingerprint, parameter_order
+from .engine import ExecutionEngine
+from .measurement import _split_identity_terms, _resolve_ansatz_parameter_map, _is_diagonal
+from .prepared import PreparedEvaluation, prepare_evaluation
+
+# State of a worker process, set once by `_init_worker`
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(ansatz: QuantumCircuit,
+                 groups: List[List[Tuple[float, str]]],
+                 shared_name: str,
+                 light_cone: bool,
+                 group_diagonal: bool) -> None:
+    """Pool initializer: transpiles every group's measurement circuits and attaches the shared parameter block."""
+    shared = shared_memory.SharedMemory(name=shared_name) # Owned and unlinked by the parent
+    engine = ExecutionEngine(max_parallel_threads=1) # The pool provides the parallelism
+    _worker_state.update({
+        'prepared': prepare_term_groups(ansatz, groups, engine, {'light_cone': light_cone, 'group_diagonal': group_diagonal}),
+        'shared': shared,
+        'values': np.ndarray((ansatz.num_parameters,), dtype=float, buffer=shared.buf),
+        'engine': engine,
+    })
+
+
+def _evaluate_group(group_index: int, n_shots: int) -> Dict[str, Any]:
+    """Worker task: estimates the energy of one term group at the current shared parameters."""
+    state = _worker_state
+    return evaluate_term_group(state['prepared'][group_index], state['values'], n_shots, state['engine'])
+
+
+def _worker_engine_stats() -> Dict[str, Any]:
+    """Worker task: the counters of the worker's execution engine."""
+    return _worker_state['engine'].stats()
+
+
+def prepare_term_groups(ansatz: QuantumCircuit,
+                        groups: List[List[Tuple[float, str]]],
+                        engine: ExecutionEngine,
+                        options: Dict[str, Any]) -> List[PreparedEvaluation]:
+    """
+    Worker-side setup: builds and transpiles the measurement circuits of every term group once.
+
+    Args:
+        ansatz: The ansatz circuit.
+        groups: The term groups, as from `partition_terms`.
+        engine: The worker's execution engine.
+        options: Fixed options for `prepare_evaluation` ('light_cone', 'group_diagonal').
+
+    Returns:
+        List[PreparedEvaluation]: One prepared evaluation per group.
+    """
+    return [prepare_evaluation(ansatz, group, engine=engine, **options) for group in groups]
+
+
+def evaluate_term_group(prepared: PreparedEvaluation,
+                        values: np.ndarray,
+                        n_shots: int,
+                        engine: ExecutionEngine) -> Dict[str, Any]:
+    """
+    Worker-side evaluation of one term group: binds its prepared circuits and runs them.
+
+    Args:
+        prepared: The group's prepared evaluation (from `prepare_term_groups`).
+        values: Parameter values in binding order (see `easy_vqe.circuit.parameter_order`).
+        n_shots: Shots per measurement circuit.
+        engine: The worker's execution engine.
+
+    Returns:
+        Dict[str, Any]: The details dictionary of `get_hamiltonian_expectation_value` for the group.
+    """
+    return prepared.evaluate(values, n_shots, return_details=True, engine=engine)
+
+
+def partition_terms(parsed_hamiltonian: List[Tuple[float, str]],
+                    num_groups: int,
+                    group_diagonal: bool = True) -> List[List[Tuple[float, str]]]:
+    """
+    Splits measured (non-identity) terms into at most `num_groups` groups of similar size.
+
+    With `group_diagonal`, all Z/I-only terms stay together so that they still share
+    one measurement circuit; the other terms are dealt round-robin over the groups,
+    starting with the ones that do not hold the diagonal terms.
+
+    Args:
+        parsed_hamiltonian: List of (coefficient, pauli_string) tuples without identity terms.
+        num_groups: Maximum number of groups.
+        group_diagonal: Whether the Z/I-only terms form a single group.
+
+    Returns:
+        List[List[Tuple[float, str]]]: The non-empty groups.
+    """
+    if num_groups <= 0:
+        raise ValueError(f"num_groups must be positive, got {num_groups}.")
+    diagonal = [term for term in parsed_hamiltonian if _is_diagonal(term[1])] if group_diagonal else []
+    if len(diagonal) < 2:
+        diagonal = []
+    others = [term for term in parsed_hamiltonian if not diagonal or not _is_diagonal(term[1])]
+
+    groups: List[List[Tuple[float, str]]] = [[] for _ in range(num_groups)]
+    if diagonal:
+        groups[0] = diagonal # One circuit, counts as one unit of work
+    offset = 1 if diagonal and num_groups > 1 else 0
+    for i, term in enumerate(others):
+        groups[offset + i % (num_groups - offset)].append(term)
+    return [group for group in groups if group]
+
+
+class _TermGroupEvaluator(ABC):
+    """
+    Common part of evaluators that measure the term groups of one ansatz and Hamiltonian elsewhere.
+
+    Subclasses implement `_run_groups`, which returns the details dictionary of
+    `get_hamiltonian_expectation_value` for every group at the given parameter vector,
+    and `close`, which releases the workers.
+    """
+    def __init__(self,
+                 ansatz: QuantumCircuit,
+                 parsed_hamiltonian: List[Tuple[float, str]],
+                 num_groups: int,
+                 light_cone: bool,
+                 group_diagonal: bool):
+        self.ansatz = ansatz
+        self.parameters: List[Parameter] = parameter_order(ansatz) # Binding order, as workers expect it
+        self.constant_value, measured_terms = _split_identity_terms(parsed_hamiltonian, ansatz.num_qubits)
+        self.groups = partition_terms(measured_terms, num_groups, group_diagonal)
+        self.options = {'light_cone': light_cone, 'group_diagonal': group_diagonal}
+        self._hamiltonian_key = tuple(parsed_hamiltonian)
+        self._fingerprint = circuit_fingerprint(ansatz)
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def matches(self, ansatz: QuantumCircuit, parsed_hamiltonian: List[Tuple[float, str]]) -> bool:
+        """True if the evaluator was set up for this ansatz (by content) and Hamiltonian."""
+        if tuple(parsed_hamiltonian) != self._hamiltonian_key:
+            return False
+        return ansatz is self.ansatz or circuit_fingerprint(ansatz) == self._fingerprint
+
+    def evaluate(self,
+                 param_values: Union[Sequence[float], Dict[Parameter, float], None],
+                 n_shots: int = 1024,
+                 return_details: bool = False) -> Union[float, Dict[str, Any]]:
+        """
+        Estimates <H> with every term group measured by a worker.
+
+        Args:
+            param_values: Numerical parameter values for the ansatz (Sequence, dict or None),
+                          as in `get_hamiltonian_expectation_value`.
+            n_shots: Number of shots for each measurement circuit.
+            return_details: If True, return a dictionary with 'value', 'variance', 'std_error',
+                            'shots_used', 'term_shots', 'rounds' and 'converged' as in
+                            `get_hamiltonian_expectation_value`.
+
+        Returns:
+            float: The expectation value <H>, or the details dictionary if `return_details` is True.
+
+        Raises:
+            ValueError: If the parameters mismatch the ansatz or the evaluator is closed.
+            RuntimeError: If a worker fails.
+        """
+        param_map = _resolve_ansatz_parameter_map(self.ansatz, param_values)
+        values = np.array([param_map[p] for p in self.parameters], dtype=float)
+        with self._lock: # One evaluation at a time per evaluator
+            group_details = self._run_groups(values, n_shots) if self.groups else []
+
+        value = self.constant_value + sum(details['value'] for details in group_details)
+        if not return_details:
+            return value
+        variance = float(sum(details['variance'] for details in group_details)) # Groups are sampled independently
+        term_shots: Dict[str, int] = {}
+        for details in group_details:
+            term_shots.update(details['term_shots'])
+        return {
+            'value': value,
+            'variance': variance,
+            'std_error': float(np.sqrt(variance)),
+            'shots_used': int(sum(details['shots_used'] for details in group_details)),
+            'term_shots': term_shots,
+            'rounds': 1,
+            'converged': True,
+        }
+
+    @abstractmethod
+    def _run_groups(self, values: np.ndarray, n_shots: int) -> List[Dict[str, Any]]:
+        """Measures every term group at the parameter vector `values` (in binding order)."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Releases the workers and any other resources."""
+
+
+class ParallelEvaluator(_TermGroupEvaluator):
+    """
+    Evaluates <H> for one ansatz and Hamiltonian with a pool of worker processes.
+
+    Worker setup (pickling the ansatz and terms, creating each worker's execution
+    engine, transpiling the measurement circuits) happens once, when the pool starts; `evaluate` only writes the parameters to
+    shared memory and dispatches one task per term group. Use it as a context manager,
+    or call `close()` to stop the workers and release the shared memory.
+
+    Workers are started with the 'spawn' method by default, since forking a process
+    whose simulator has already started threads is unsafe.
+
+    Attributes:
+        num_workers (int): Number of worker processes.
+        groups (List[List[Tuple[float, str]]]): The term groups, one task per group per evaluation.
+        constant_value (float): Energy contribution of all-identity terms, added in the parent.
+    """
+    def __init__(self,
+                 ansatz: QuantumCircuit,
+                 parsed_hamiltonian: List[Tuple[float, str]],
+                 num_workers: Optional[int] = None,
+                 light_cone: bool = False,
+                 group_diagonal: bool = True,
+                 mp_context: Optional[str] = 'spawn'):
+        self.num_workers = num_workers or multiprocessing.cpu_count()
+        if self.num_workers <= 0:
+            raise ValueError(f"num_workers must be positive, got {self.num_workers}.")
+        super().__init__(ansatz, parsed_hamiltonian, self.num_workers, light_cone, group_diagonal)
+
+        self._shared = shared_memory.SharedMemory(create=True, size=max(8 * len(self.parameters), 8))
+        self._values = np.ndarray((len(self.parameters),), dtype=float, buffer=self._shared.buf)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        if self.groups:
+            context = multiprocessing.get_context(mp_context) if mp_context else None
+            self._pool = ProcessPoolExecutor(
+                max_workers=min(self.num_workers, len(self.groups)), mp_context=context,
+                initializer=_init_worker,
+                initargs=(ansatz, self.groups, self._shared.name, light_cone, group_diagonal))
+
+    def evaluate(self,
+                 param_values: Union[Sequence[float], Dict[Parameter, float], None],
+                 n_shots: int = 1024,
+                 return_details: bool = False) -> Union[float, Dict[str, Any]]:
+        """Estimates <H> with the term groups spread over the worker processes (see `_TermGroupEvaluator.evaluate`)."""
+        if self._shared is None:
+            raise ValueError("ParallelEvaluator is closed.")
+        return super().evaluate(param_values, n_shots, return_details)
+
+    def _run_groups(self, values: np.ndarray, n_shots: int) -> List[Dict[str, Any]]:
+        self._values[:] = values # The shared block holds one parameter vector at a time
+        futures = [self._pool.submit(_evaluate_group, g, n_shots) for g in range(len(self.groups))]
+        try:
+            return [future.result() for future in futures]
+        except (ValueError, RuntimeError, TypeError):
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Parallel evaluation failed in a worker process: {e}")
+
+    def close(self) -> None:
+        """Shuts down the worker processes and releases the shared memory."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        if self._shared is not None:
+            self._values = None
+            self._shared.close()
+            self._shared.unlink()
+            self._shared = None
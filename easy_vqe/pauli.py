@@ -0,0 +1,242 @@
+"""
+Pauli bit-mask utilities for Easy VQE.
+
+Pauli strings are encoded as a pair of integer bit masks: bit q of the X mask is
+set if character q of the string is 'X' or 'Y', and bit q of the Z mask is set if
+it is 'Z' or 'Y'. Character q acts on qubit q, matching `apply_measurement_basis`.
+Masks let the estimators evaluate many terms at once with vectorized bit
+operations instead of per-term string handling.
+
+With P = i^{n_Y} X^x Z^z, a Pauli term acts on a basis state as
+P|j> = i^{n_Y} (-1)^{popcount(j & z)} |j ^ x>, which `pauli_expectations` uses
+to evaluate <psi|P|psi> directly on a statevector without building operators.
+"""
+
+import numpy as np
+from typing import Sequence, Tuple
+
+MAX_MASK_QUBITS: int = 63
+
+
+def pauli_masks(pauli_strings: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encodes Pauli strings as X and Z bit masks.
+
+    Args:
+        pauli_strings: Pauli strings of equal length over 'IXYZ'.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The X masks and Z masks (dtype uint64), one entry per string.
+
+    Raises:
+        ValueError: If a string is longer than 63 characters or contains invalid characters.
+    """
+    x_masks = np.zeros(len(pauli_strings), dtype=np.uint64)
+    z_masks = np.zeros(len(pauli_strings), dtype=np.uint64)
+    for t, pauli_string in enumerate(pauli_strings):
+        if len(pauli_string) > MAX_MASK_QUBITS:
+            raise ValueError(f"Pauli string '{pauli_string[:10]}...' has {len(pauli_string)} qubits; "
+                             f"bit-mask kernels support at most {MAX_MASK_QUBITS}.")
+        x_bits = 0
+        z_bits = 0
+        for q, op in enumerate(pauli_string):
+            if op == 'X':
+                x_bits |= 1 << q
+            elif op == 'Z':
+                z_bits |= 1 << q
+            elif op == 'Y':
+                x_bits |= 1 << q
+                z_bits |= 1 << q
+            elif op != 'I':
+                raise ValueError(f"Invalid Pauli operator '{op}' in string '{pauli_string}'. Use 'I', 'X', 'Y', 'Z'.")
+        x_masks[t] = x_bits
+        z_masks[t] = z_bits
+    return x_masks, z_masks
+
+
+def bit_parity(values: np.ndarray) -> np.ndarray:
+    """
+    Parity (popcount mod 2) of each element of an unsigned 64-bit integer array.
+
+    Args:
+        values: Array of dtype uint64 (any shape).
+
+    Returns:
+        np.ndarray: Array of the same shape with 0 for even and 1 for odd parity (dtype uint64).
+    """
+    v = np.asarray(values, dtype=np.uint64).copy()
+    for shift in (32, 16, 8, 4, 2, 1):
+        v ^= v >> np.uint64(shift)
+    return v & np.uint64(1)
+
+
+def bit_count(values: np.ndarray) -> np.ndarray:
+    """
+    Number of set bits of each element of an unsigned 64-bit integer array.
+
+    Args:
+        values: Array of dtype uint64 (any shape).
+
+    Returns:
+        np.ndarray: Array of the same shape with the popcounts (dtype uint64).
+    """
+    v = np.asarray(values, dtype=np.uint64)
+    v = v - ((v >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    v = (v & np.uint64(0x3333333333333333)) + ((v >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    v = (v + (v >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return (v * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+
+def z_parity_signs(outcomes: np.ndarray, z_masks: np.ndarray) -> np.ndarray:
+    """
+    Eigenvalues (+1 or -1) of diagonal Pauli terms on computational-basis outcomes.
+
+    Args:
+        outcomes: Measured bit patterns (dtype uint64), bit q for qubit (or clbit) q.
+        z_masks: Z masks of the diagonal terms in the same bit order.
+
+    Returns:
+        np.ndarray: Array of shape (len(outcomes), len(z_masks)) with entries +-1.0.
+    """
+    outcomes = np.asarray(outcomes, dtype=np.uint64)
+    z_masks = np.asarray(z_masks, dtype=np.uint64)
+    return 1.0 - 2.0 * bit_parity(outcomes[:, None] & z_masks[None, :]).astype(float)
+
+
+def diagonal_expectations(probabilities: np.ndarray, z_masks: np.ndarray, chunk_size: int = 64) -> np.ndarray:
+    """
+    Expectation values of diagonal Pauli terms from a full probability vector.
+
+    Args:
+        probabilities: Probabilities of all 2^n basis states, index bit q for qubit q.
+        z_masks: Z masks of the diagonal terms.
+        chunk_size: Number of terms evaluated per vectorized block.
+
+    Returns:
+        np.ndarray: One expectation value per term.
+    """
+    probabilities = np.asarray(probabilities, dtype=float)
+    z_masks = np.asarray(z_masks, dtype=np.uint64)
+    num_bits = len(probabilities).bit_length() - 1
+    expectations = np.empty(len(z_masks))
+    for start in range(0, len(z_masks), chunk_size):
+        stop = start + chunk_size
+        expectations[start:stop] = _signed_sums(probabilities, z_masks[start:stop], num_bits)
+    return expectations
+
+
+def compile_hamiltonian(parsed_hamiltonian: Sequence[Tuple[float, str]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converts a parsed Hamiltonian into coefficient and mask arrays.
+
+    Args:
+        parsed_hamiltonian: List of (coefficient, pauli_string) tuples.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The coefficients (float), X masks and Z masks (uint64).
+    """
+    coefficients = np.array([coefficient for coefficient, _ in parsed_hamiltonian], dtype=float)
+    x_masks, z_masks = pauli_masks([pauli_string for _, pauli_string in parsed_hamiltonian])
+    return coefficients, x_masks, z_masks
+
+
+def _signed_sums(values: np.ndarray, z_masks: np.ndarray, num_bits: int) -> np.ndarray:
+    """
+    Returns sum_j values[j] * (-1)^popcount(j & z) for each Z mask, for a real vector of length 2^num_bits.
+
+    The sign factorizes over a split of the index bits, so the vector is viewed as a
+    2^a x 2^b matrix and every sum becomes s_a^T V s_b, evaluated for all masks with
+    one matrix product.
+    """
+    row_bits = num_bits // 2
+    col_bits = num_bits - row_bits
+    matrix = values.reshape(2**row_bits, 2**col_bits)
+    parity_table = bit_parity(np.arange(2**max(row_bits, col_bits), dtype=np.uint64)).astype(float)
+    z_masks = z_masks.astype(np.int64)
+    row_signs = 1.0 - 2.0 * parity_table[np.arange(2**row_bits)[None, :] & (z_masks >> col_bits)[:, None]]
+    col_signs = 1.0 - 2.0 * parity_table[np.arange(2**col_bits)[None, :] & (z_masks & (2**col_bits - 1))[:, None]]
+    return np.einsum('tb,tb->t', row_signs @ matrix, col_signs)
+
+
+def pauli_expectations(statevector: np.ndarray,
+                       x_masks: np.ndarray,
+                       z_masks: np.ndarray) -> np.ndarray:
+    """
+    Computes <psi|P|psi> for many Pauli terms directly from a statevector.
+
+    Terms are grouped by X mask. For x = 0 the terms are signed sums of |psi|^2. For
+    x != 0 the indices pair up as (j, j ^ x); summing each pair once over the j with
+    the highest bit of x clear gives <P> = 2 i^{n_Y} sum_j (-1)^popcount(j & z) Re(conj(psi[j ^ x]) psi[j])
+    for even n_Y, and the same with i^{n_Y + 1} and Im for odd n_Y. Only half of the
+    state is gathered per X mask, and the signed sums of all terms sharing it are
+    evaluated together by `_signed_sums`.
+
+    Args:
+        statevector: Amplitudes of length 2^n, index bit q for qubit q.
+        x_masks: X masks of the terms (from `pauli_masks` or `compile_hamiltonian`).
+        z_masks: Z masks of the terms.
+
+    Returns:
+        np.ndarray: The real expectation value of each term.
+
+    Raises:
+        ValueError: If the statevector length is not a power of two or a mask exceeds it.
+    """
+    psi = np.asarray(statevector, dtype=complex)
+    dimension = len(psi)
+    if dimension == 0 or dimension & (dimension - 1):
+        raise ValueError(f"Statevector length {dimension} is not a power of two.")
+    num_qubits = dimension.bit_length() - 1
+    x_masks = np.asarray(x_masks, dtype=np.uint64)
+    z_masks = np.asarray(z_masks, dtype=np.uint64)
+    if len(x_masks) and int((x_masks | z_masks).max()) >= dimension:
+        raise ValueError(f"Pauli masks act on more than the statevector's {num_qubits} qubits.")
+
+    num_y = bit_count(x_masks & z_masks).astype(int)
+    real_part = np.ascontiguousarray(psi.real)
+    imag_part = np.ascontiguousarray(psi.imag)
+    partners = np.empty(dimension // 2, dtype=np.int64)
+    real_partner, imag_partner, part, scratch = (np.empty(dimension // 2) for _ in range(4))
+
+    expectations = np.empty(len(x_masks))
+    unique_x, group_of = np.unique(x_masks, return_inverse=True) # Sorted, so the highest X bit never decreases
+    order = np.argsort(np.asarray(group_of).reshape(-1), kind='stable')
+    group_starts = np.searchsorted(np.asarray(group_of).reshape(-1)[order], np.arange(len(unique_x) + 1))
+    current_top = -1
+    for g, x in enumerate(unique_x.tolist()):
+        terms = order[group_starts[g]:group_starts[g + 1]]
+        if x == 0:
+            # Diagonal terms: signed sums of the probabilities
+            expectations[terms] = _signed_sums(real_part**2 + imag_part**2, z_masks[terms], num_qubits)
+            continue
+
+        top = x.bit_length() - 1 # Highest qubit flipped by X
+        if top != current_top:
+            current_top = top
+            half = np.arange(dimension, dtype=np.int64).reshape(-1, 2, 1 << top)[:, 0, :].reshape(-1) # Bit `top` clear
+            real_half = real_part[half]
+            imag_half = imag_part[half]
+        # Write into preallocated buffers to avoid allocating half-state temporaries per X mask
+        np.bitwise_xor(half, x, out=partners)
+        np.take(real_part, partners, out=real_partner)
+        np.take(imag_part, partners, out=imag_partner)
+
+        z = z_masks[terms]
+        low_mask = np.uint64((1 << top) - 1)
+        compressed_z = ((z >> np.uint64(top + 1)) << np.uint64(top)) | (z & low_mask) # Drop bit `top`
+        for odd in (0, 1):
+            selected = np.flatnonzero(num_y[terms] % 2 == odd)
+            if len(selected) == 0:
+                continue
+            if odd: # Im(conj(psi[j ^ x]) psi[j])
+                np.multiply(real_partner, imag_half, out=part)
+                np.multiply(imag_partner, real_half, out=scratch)
+                np.subtract(part, scratch, out=part)
+            else: # Re(conj(psi[j ^ x]) psi[j])
+                np.multiply(real_partner, real_half, out=part)
+                np.multiply(imag_partner, imag_half, out=scratch)
+                np.add(part, scratch, out=part)
+            signed = _signed_sums(part, compressed_z[selected], num_qubits - 1)
+            # i^{n_Y} * 2 * Re(...) for even n_Y, i^{n_Y} * 2i * Im(...) for odd n_Y
+            expectations[terms[selected]] = 2.0 * (-1.0)**((num_y[terms[selected]] + odd) // 2) * signed
+    return expectations
@@ -0,0 +1,288 @@
+"""
+Prepared, serializable execution state for Easy VQE.
+
+Before its first shot-based evaluation, a process builds the ansatz, groups the
+Hamiltonian terms into measurement units, appends the basis changes and
+measurements, and transpiles every measurement circuit. `prepare_evaluation`
+does all of this once, with the circuits left parameterized, so that each
+evaluation only binds the parameter vector and runs the circuits. The prepared
+state can be saved to one versioned file and loaded by another process, which
+then skips construction and transpilation entirely.
+
+File format (a NumPy `.npz` archive, read without pickle):
+    - 'format_version': `PREPARED_FORMAT_VERSION`.
+    - 'circuits': QPY bytes of the ansatz followed by one circuit per unit.
+    - 'parameter_names': The ansatz parameters in binding order.
+    - 'constant_value': The contribution of the all-identity terms.
+    - 'term_coefficients', 'term_paulis', 'term_units': The measured terms and the unit of each.
+    - 'z_masks', 'z_mask_unit': Z masks of the shared diagonal unit and its index (-1 if none).
+    - 'options': JSON with 'group_diagonal', 'light_cone' and the target profile (or null).
+"""
+
+import io
+import os
+import json
+import time
+import tempfile
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from qiskit import QuantumCircuit, qpy
+from qiskit.circuit import Parameter
+
+from .circuit import parameter_order
+from .engine import ExecutionEngine, get_default_engine
+from .measurement import (_transpiled_measurement_units, _unit_outcome_sums,
+                          _unit_variances, _outcome_arrays, _resolve_ansatz_parameter_map)
+from .pauli import MAX_MASK_QUBITS
+
+PREPARED_FORMAT_VERSION: int = 1
+
+
+class PreparedEvaluation:
+    """
+    Transpiled, still parameterized measurement circuits of one ansatz and Hamiltonian.
+
+    Create it with `prepare_evaluation` or `PreparedEvaluation.load`. The circuits
+    are shared by all evaluations and must not be modified in place.
+
+    Attributes:
+        ansatz (QuantumCircuit): The (logical) ansatz the state was prepared for.
+        parameters (List[Parameter]): The ansatz parameters in binding order.
+        constant_value (float): Contribution of the all-identity terms.
+        units (List[Dict[str, Any]]): One entry per measurement circuit, with keys 'terms',
+            'circuit' (transpiled for the simulator) and 'z_masks' (None unless the unit
+            holds the shared diagonal terms), as in the evaluation path of
+            `get_hamiltonian_expectation_value`.
+        group_diagonal (bool): Whether the Z/I-only terms share one circuit.
+        light_cone (bool): Whether each circuit holds only the light cone of its terms.
+        target (Optional[Dict[str, Any]]): The hardware target profile the circuits were
+            transpiled for (see `easy_vqe.target`), or None. With a target, the terms
+            act on the physical qubits.
+        prepare_seconds (float): Time spent preparing (building the circuits and transpiling)
+            or loading the state.
+    """
+    def __init__(self,
+                 ansatz: QuantumCircuit,
+                 parameters: List[Parameter],
+                 constant_value: float,
+                 units: List[Dict[str, Any]],
+                 group_diagonal: bool = True,
+                 target: Optional[Dict[str, Any]] = None,
+                 prepare_seconds: float = 0.0,
+                 light_cone: bool = False):
+        self.ansatz = ansatz
+        self.parameters = list(parameters)
+        self.constant_value = float(constant_value)
+        self.units = units
+        self.group_diagonal = group_diagonal
+        self.light_cone = light_cone
+        self.target = target
+        self.prepare_seconds = prepare_seconds
+        # Positions of each circuit's parameters (in Qiskit's order) in the binding-order vector.
+        # Matched by name: transpilation and QPY keep the names, and may drop unused parameters.
+        index = {p.name: i for i, p in enumerate(self.parameters)}
+        self._positions = [np.array([index[p.name] for p in unit['circuit'].parameters], dtype=np.intp)
+                           for unit in units]
+        self._weights = np.array([sum(abs(coefficient) for coefficient, _ in unit['terms']) for unit in units],
+                                 dtype=float)
+
+    def _parameter_vector(self, param_values: Union[Sequence[float], Dict[Parameter, float], None]) -> np.ndarray:
+        if isinstance(param_values, dict):
+            param_map = _resolve_ansatz_parameter_map(self.ansatz, param_values)
+            return np.array([param_map[p] for p in self.parameters], dtype=float)
+        if not self.parameters:
+            return np.zeros(0)
+        if param_values is None:
+            raise ValueError(f"Ansatz expects {len(self.parameters)} parameters, but received None.")
+        try:
+            values = np.asarray(param_values, dtype=float)
+        except (ValueError, TypeError) as e:
+            raise TypeError(f"Ansatz parameter sequence values must be numeric. Error converting: {e}")
+        if values.shape != (len(self.parameters),):
+            raise ValueError(f"Ansatz expects {len(self.parameters)} parameters, but received {values.size}.")
+        return values
+
+    def evaluate(self,
+                 param_values: Union[Sequence[float], Dict[Parameter, float], None],
+                 n_shots: int = 1024,
+                 return_details: bool = False,
+                 engine: Optional[ExecutionEngine] = None) -> Union[float, Dict[str, Any]]:
+        """
+        Estimates <H> with `n_shots` shots per measurement circuit.
+
+        Binds the prepared circuits and runs them as one simulator job; nothing is
+        rebuilt or transpiled.
+
+        Args:
+            param_values: Parameter values in binding order, or a {Parameter: value} dict
+                          keyed by the parameters of `ansatz`.
+            n_shots: Shots per measurement circuit.
+            return_details: If True, return the details dictionary of
+                            `get_hamiltonian_expectation_value` instead of only the value.
+            engine: Execution engine to run on; defaults to the shared default engine.
+
+        Returns:
+            float: The expectation value <H>, or with `return_details` a dictionary with
+            'value', 'variance', 'std_error', 'shots_used', 'term_shots', 'rounds' and 'converged'.
+
+        Raises:
+            ValueError: If `n_shots` is not positive or the parameter values do not match.
+            TypeError: If the parameter values are not numeric.
+        """
+        if n_shots is None or n_shots <= 0:
+            raise ValueError(f"n_shots must be a positive integer, got {n_shots}.")
+        values = self._parameter_vector(param_values)
+        bound = [unit['circuit'].assign_parameters(values[positions]) if positions.size else unit['circuit']
+                 for unit, positions in zip(self.units, self._positions)]
+
+        unit_sums = np.zeros(len(self.units))
+        unit_square_sums = np.zeros(len(self.units))
+        unit_shots = np.zeros(len(self.units), dtype=int)
+        if bound:
+            result = (engine or get_default_engine()).run(bound, shots=int(n_shots))
+            for u, unit in enumerate(self.units):
+                outcomes, frequencies = _outcome_arrays(result.data(u)['counts'])
+                unit_sums[u], unit_square_sums[u], unit_shots[u] = _unit_outcome_sums(unit, outcomes, frequencies)
+
+        variances = _unit_variances(unit_sums, unit_square_sums, unit_shots)
+        total_variance = float(np.sum(self._weights**2 * variances / np.maximum(unit_shots, 1)))
+        value = self.constant_value + float(np.dot(self._weights, unit_sums / np.maximum(unit_shots, 1)))
+        if not return_details:
+            return value
+
+        term_shots: Dict[str, int] = {}
+        for unit, shots in zip(self.units, unit_shots.tolist()):
+            for _, pauli_string in unit['terms']:
+                term_shots[pauli_string] = term_shots.get(pauli_string, 0) + shots
+        return {
+            'value': value,
+            'variance': total_variance,
+            'std_error': float(np.sqrt(total_variance)),
+            'shots_used': int(unit_shots.sum()),
+            'term_shots': term_shots,
+            'rounds': 1,
+            'converged': True,
+        }
+
+    def save(self, path: str) -> None:
+        """
+        Writes the prepared state to one file (see the module docstring for the format).
+
+        The file is written atomically, so concurrent readers never see a partial file.
+
+        Args:
+            path: Destination path (no extension is added).
+        """
+        buffer = io.BytesIO()
+        qpy.dump([self.ansatz] + [unit['circuit'] for unit in self.units], buffer)
+        terms = [(coefficient, pauli_string, u) for u, unit in enumerate(self.units)
+                 for coefficient, pauli_string in unit['terms']]
+        diagonal = [u for u, unit in enumerate(self.units) if unit['z_masks'] is not None]
+        arrays = {
+            'format_version': np.array(PREPARED_FORMAT_VERSION),
+            'circuits': np.frombuffer(buffer.getvalue(), dtype=np.uint8),
+            'parameter_names': np.array([p.name for p in self.parameters], dtype=str),
+            'constant_value': np.array(self.constant_value),
+            'term_coefficients': np.array([term[0] for term in terms], dtype=float),
+            'term_paulis': np.array([term[1] for term in terms], dtype=str),
+            'term_units': np.array([term[2] for term in terms], dtype=np.intp),
+            'z_masks': self.units[diagonal[0]]['z_masks'] if diagonal else np.zeros(0, dtype=np.uint64),
+            'z_mask_unit': np.array(diagonal[0] if diagonal else -1),
+            'options': np.array(json.dumps({'group_diagonal': self.group_diagonal, 'light_cone': self.light_cone,
+                                             'target': self.target})),
+        }
+        directory = os.path.dirname(os.path.abspath(path))
+        handle, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as file:
+                np.savez(file, **arrays)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "PreparedEvaluation":
+        """
+        Reads a prepared state written by `save`.
+
+        Args:
+            path: The file to read.
+
+        Returns:
+            PreparedEvaluation: The state, ready to evaluate.
+
+        Raises:
+            ValueError: If the file is not a prepared state or has an unsupported format version.
+        """
+        start = time.perf_counter()
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Could not read prepared state '{path}': {e}")
+        version = int(arrays['format_version']) if 'format_version' in arrays else None
+        if version != PREPARED_FORMAT_VERSION:
+            raise ValueError(f"Unsupported prepared state format version {version} in '{path}' "
+                             f"(expected {PREPARED_FORMAT_VERSION}).")
+
+        circuits = qpy.load(io.BytesIO(arrays['circuits'].tobytes()))
+        ansatz, unit_circuits = circuits[0], circuits[1:]
+        parameters = parameter_order(ansatz)
+        if [p.name for p in parameters] != arrays['parameter_names'].tolist():
+            raise ValueError(f"Prepared state '{path}' is inconsistent: parameter order does not match the ansatz.")
+        units: List[Dict[str, Any]] = [{'terms': [], 'circuit': circuit, 'z_masks': None} for circuit in unit_circuits]
+        for coefficient, pauli_string, u in zip(arrays['term_coefficients'].tolist(), arrays['term_paulis'].tolist(),
+                                                arrays['term_units'].tolist()):
+            units[u]['terms'].append((coefficient, pauli_string))
+        z_mask_unit = int(arrays['z_mask_unit'])
+        if z_mask_unit >= 0:
+            units[z_mask_unit]['z_masks'] = arrays['z_masks']
+        options = json.loads(str(arrays['options']))
+        return cls(ansatz, parameters, float(arrays['constant_value']), units, options['group_diagonal'],
+                   options['target'], time.perf_counter() - start, options.get('light_cone', False))
+
+
+def prepare_evaluation(ansatz: QuantumCircuit,
+                       parsed_hamiltonian: List[Tuple[float, str]],
+                       engine: Optional[ExecutionEngine] = None,
+                       group_diagonal: bool = True,
+                       light_cone: bool = False) -> PreparedEvaluation:
+    """
+    Builds and transpiles the measurement circuits of an ansatz and Hamiltonian once.
+
+    The terms are grouped as in `get_hamiltonian_expectation_value` (one circuit per
+    term, plus one shared circuit for the Z/I-only terms with `group_diagonal`). If
+    `engine` has a hardware target, the ansatz transpiled for it is used and the
+    terms are moved to its physical qubits (see `easy_vqe.target`). With
+    `light_cone`, each circuit starts from the light-cone reduction of the ansatz
+    to its terms' qubits.
+
+    Args:
+        ansatz: The (parameterized) ansatz circuit, without measurements.
+        parsed_hamiltonian: List of (coefficient, pauli_string) tuples.
+        engine: Engine whose transpilation cache and target are used (default: the shared default engine).
+        group_diagonal: If True, measure all Z/I-only terms with one shared circuit.
+        light_cone: If True, simulate each term on its light-cone-reduced circuit.
+
+    Returns:
+        PreparedEvaluation: The prepared state.
+
+    Raises:
+        ValueError: If a Pauli string length mismatches the ansatz qubits, or a term
+                    measures more qubits than the outcome arrays hold.
+    """
+    start = time.perf_counter()
+    engine = engine or get_default_engine()
+    base, terms, target = ansatz, parsed_hamiltonian, None
+    if engine.target is not None:
+        transpiled = engine.transpile_for_target(ansatz)
+        base, terms, target = transpiled.circuit, transpiled.map_hamiltonian(parsed_hamiltonian), engine.target.to_dict()
+
+    # The same transpiled units as the per-call path of `get_hamiltonian_expectation_value`
+    constant_value, units = _transpiled_measurement_units(base, terms, light_cone, group_diagonal, engine)
+    if any(unit['z_masks'] is None and unit['circuit'].num_clbits > MAX_MASK_QUBITS for unit in units):
+        raise ValueError(f"Prepared evaluations support at most {MAX_MASK_QUBITS} measured qubits per term.")
+    return PreparedEvaluation(ansatz, parameter_order(ansatz), constant_value, units, group_diagonal, target,
+                              time.perf_counter() - start, light_cone)
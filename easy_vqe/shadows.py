@@ -0,0 +1,191 @@
+"""
+Classical-shadow estimation for Easy VQE.
+
+Instead of one measurement circuit per Hamiltonian term, a classical shadow
+measures the prepared state in independently random single-qubit Pauli bases.
+Each snapshot gives an unbiased estimate 3^|P| * prod_q (+-1) of every Pauli
+term P whose non-identity qubits were all measured in the matching basis, so a
+single dataset serves all terms, including observables added later.
+"""
+
+import numpy as np
+from typing import List, Tuple, Dict, Union, Optional, Sequence
+from qiskit import QuantumCircuit, ClassicalRegister
+from qiskit.circuit import Parameter
+
+from .pauli import pauli_masks, bit_parity, bit_count
+from .engine import ExecutionEngine, get_default_engine
+from .measurement import apply_measurement_basis, _resolve_ansatz_parameter_map, _bind_circuit_by_name
+
+_BASIS_LABELS = 'XYZ'
+
+
+class ClassicalShadow:
+    """
+    Stores randomized Pauli-basis snapshots of a state and estimates Pauli observables from them.
+
+    Attributes:
+        num_qubits (int): Number of qubits of the measured state.
+        basis_x (np.ndarray): Per-snapshot X masks of the measurement bases (uint64).
+        basis_z (np.ndarray): Per-snapshot Z masks of the measurement bases (uint64).
+        outcomes (np.ndarray): Per-snapshot measured bits, bit q for qubit q (uint64).
+    """
+    def __init__(self, num_qubits: int, basis_x: np.ndarray, basis_z: np.ndarray, outcomes: np.ndarray):
+        if not (len(basis_x) == len(basis_z) == len(outcomes)):
+            raise ValueError("Snapshot arrays must all have the same length.")
+        self.num_qubits = num_qubits
+        self.basis_x = np.asarray(basis_x, dtype=np.uint64)
+        self.basis_z = np.asarray(basis_z, dtype=np.uint64)
+        self.outcomes = np.asarray(outcomes, dtype=np.uint64)
+
+    @property
+    def num_snapshots(self) -> int:
+        return len(self.outcomes)
+
+    def snapshot_estimates(self, pauli_strings: Sequence[str], chunk_size: int = 256) -> np.ndarray:
+        """
+        Single-snapshot estimates of each Pauli term.
+
+        Args:
+            pauli_strings: Pauli strings to estimate.
+            chunk_size: Number of terms processed per vectorized block.
+
+        Returns:
+            np.ndarray: Array of shape (num_snapshots, num_terms).
+
+        Raises:
+            ValueError: If a Pauli string length mismatches the shadow's qubit count.
+        """
+        for pauli_string in pauli_strings:
+            if len(pauli_string) != self.num_qubits:
+                raise ValueError(f"Pauli string '{pauli_string}' length {len(pauli_string)} mismatches shadow qubits {self.num_qubits}.")
+        x_masks, z_masks = pauli_masks(pauli_strings)
+        supports = x_masks | z_masks
+        weights = 3.0 ** bit_count(supports).astype(float)
+
+        estimates = np.empty((self.num_snapshots, len(pauli_strings)))
+        bx = self.basis_x[:, None]
+        bz = self.basis_z[:, None]
+        outcomes = self.outcomes[:, None]
+        for start in range(0, len(pauli_strings), chunk_size):
+            stop = start + chunk_size
+            support = supports[None, start:stop]
+            matches = ((bx & support) == x_masks[None, start:stop]) & ((bz & support) == z_masks[None, start:stop])
+            signs = 1.0 - 2.0 * bit_parity(outcomes & support)
+            estimates[:, start:stop] = np.where(matches, weights[None, start:stop] * signs, 0.0)
+        return estimates
+
+    def estimate_terms(self, pauli_strings: Sequence[str], n_batches: int = 10) -> np.ndarray:
+        """
+        Median-of-means estimates of each Pauli term.
+
+        Args:
+            pauli_strings: Pauli strings to estimate.
+            n_batches: Number of batches for the median-of-means (clipped to the snapshot count).
+
+        Returns:
+            np.ndarray: One expectation value estimate per term.
+        """
+        batch_means = self._batch_means(self.snapshot_estimates(pauli_strings), n_batches)
+        return np.median(batch_means, axis=0)
+
+    def estimate(self, parsed_hamiltonian: List[Tuple[float, str]], n_batches: int = 10) -> float:
+        """
+        Estimates <H> for a parsed Hamiltonian from the stored snapshots.
+
+        Args:
+            parsed_hamiltonian: List of (coefficient, pauli_string) tuples.
+            n_batches: Number of batches for the median-of-means.
+
+        Returns:
+            float: The estimated expectation value.
+        """
+        return self.estimate_with_error(parsed_hamiltonian, n_batches)[0]
+
+    def estimate_with_error(self, parsed_hamiltonian: List[Tuple[float, str]], n_batches: int = 10) -> Tuple[float, float]:
+        """
+        Estimates <H> and the variance of the estimate from the spread of the batch energies.
+
+        Returns:
+            Tuple[float, float]: The estimated expectation value and its estimated variance.
+        """
+        coefficients = np.array([coefficient for coefficient, _ in parsed_hamiltonian], dtype=float)
+        pauli_strings = [pauli_string for _, pauli_string in parsed_hamiltonian]
+        batch_means = self._batch_means(self.snapshot_estimates(pauli_strings), n_batches)
+        value = float(np.dot(coefficients, np.median(batch_means, axis=0)))
+        batch_energies = batch_means @ coefficients
+        variance = float(np.var(batch_energies, ddof=1) / len(batch_energies)) if len(batch_energies) > 1 else float('inf')
+        return value, variance
+
+    def _batch_means(self, estimates: np.ndarray, n_batches: int) -> np.ndarray:
+        if self.num_snapshots == 0:
+            raise ValueError("Cannot estimate observables from an empty classical shadow.")
+        n_batches = max(1, min(n_batches, self.num_snapshots))
+        return np.array([batch.mean(axis=0) for batch in np.array_split(estimates, n_batches)])
+
+
+def collect_classical_shadow(ansatz: QuantumCircuit,
+                             param_values: Union[Sequence[float], Dict[Parameter, float], None],
+                             n_snapshots: int,
+                             seed: Optional[int] = None,
+                             engine: Optional[ExecutionEngine] = None) -> ClassicalShadow:
+    """
+    Measures the ansatz state in random single-qubit Pauli bases.
+
+    Each snapshot draws a uniformly random basis (X, Y or Z) per qubit. Snapshots that
+    share a basis are taken as shots of one circuit, and all circuits are transpiled
+    and submitted together, grouped by their shot count.
+
+    Args:
+        ansatz: The (parameterized) ansatz circuit. *Should not contain measurements.*
+        param_values: Numerical parameter values for the ansatz (Sequence, dict or None).
+        n_snapshots: Number of snapshots to collect.
+        seed: Seed for the basis sampling and the simulator.
+        engine: Execution engine to run on; defaults to the shared default engine.
+
+    Returns:
+        ClassicalShadow: The collected snapshots.
+
+    Raises:
+        ValueError: If `n_snapshots` is not positive or the ansatz has too many qubits for bit masks.
+        RuntimeError: If simulation fails.
+    """
+    if n_snapshots <= 0:
+        raise ValueError(f"n_snapshots must be positive, got {n_snapshots}.")
+    num_qubits = ansatz.num_qubits
+    values_by_name = {p.name: value for p, value in _resolve_ansatz_parameter_map(ansatz, param_values).items()}
+
+    rng = np.random.default_rng(seed)
+    bases = rng.integers(0, 3, size=(n_snapshots, num_qubits)) # Index into 'XYZ'
+    unique_bases, inverse, counts = np.unique(bases, axis=0, return_inverse=True, return_counts=True)
+    inverse = np.asarray(inverse).reshape(-1)
+
+    basis_strings = [''.join(_BASIS_LABELS[b] for b in row) for row in unique_bases]
+    basis_x, basis_z = pauli_masks(basis_strings)
+    outcomes = np.zeros(n_snapshots, dtype=np.uint64)
+    # Snapshots grouped by basis: those of basis u are order[offsets[u]:offsets[u + 1]]
+    order = np.argsort(inverse, kind='stable')
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    engine = engine or get_default_engine()
+    for shots in np.unique(counts):
+        basis_indices = np.flatnonzero(counts == shots)
+        circuits = []
+        for u in basis_indices:
+            qc = ansatz.copy(name=f"Shadow_{basis_strings[u]}") # Bound after transpiling, so the cache hits across calls
+            apply_measurement_basis(qc, basis_strings[u])
+            cr = ClassicalRegister(num_qubits, name="shadow")
+            qc.add_register(cr)
+            qc.measure(list(range(num_qubits)), cr)
+            circuits.append(qc)
+        try:
+            compiled = [_bind_circuit_by_name(circuit, values_by_name) for circuit in engine.transpile(circuits)]
+            run_options = {'seed_simulator': int(rng.integers(2**31))} if seed is not None else {}
+            result = engine.run(compiled, shots=int(shots), memory=True, **run_options)
+        except Exception as e:
+            raise RuntimeError(f"Error during circuit transpilation or execution: {e}")
+        for u, circuit in zip(basis_indices, compiled):
+            memory = result.data(circuit)['memory'] # Raw per-shot hex strings, bit q holds qubit q
+            outcomes[order[offsets[u]:offsets[u + 1]]] = np.fromiter((int(shot, 16) for shot in memory), dtype=np.uint64, count=len(memory))
+
+    return ClassicalShadow(num_qubits, basis_x[inverse], basis_z[inverse], outcomes)
@@ -0,0 +1,198 @@
+"""
+Shot allocation strategies for Easy VQE.
+
+This module splits a total per-evaluation shot budget over the measurement
+circuits of a Hamiltonian. The variance of the energy estimator is
+sum_i c_i^2 * Var(P_i) / n_i, which for a fixed budget is minimized by
+n_i proportional to |c_i| * std(P_i).
+"""
+
+import warnings
+import numpy as np
+from typing import Dict, Optional, Sequence
+
+SHOT_ALLOCATION_STRATEGIES = ('uniform', 'proportional', 'variance')
+
+
+def allocate_shots(coefficients: Sequence[float],
+                   total_shots: int,
+                   strategy: str = 'uniform',
+                   std_devs: Optional[Sequence[float]] = None,
+                   min_shots: int = 1) -> np.ndarray:
+    """
+    Splits a total shot budget over measurement circuits.
+
+    Args:
+        coefficients: Coefficient of each measured term.
+        total_shots: Total number of shots to distribute.
+        strategy: How to weight the terms:
+            - 'uniform': Equal shots for every term.
+            - 'proportional': Shots proportional to |coefficient|.
+            - 'variance': Shots proportional to |coefficient| * std_dev (variance-optimal).
+        std_devs: Per-term standard deviations of the single-shot outcome, used by
+                  'variance'. Defaults to 1.0 for every term (equivalent to 'proportional').
+        min_shots: Minimum number of shots given to every term.
+
+    Returns:
+        np.ndarray: Integer shot counts, one per term, summing to `total_shots`
+                    (or to `min_shots * len(coefficients)` if the budget is too small).
+
+    Raises:
+        ValueError: If the strategy is unknown or the inputs have inconsistent lengths.
+    """
+    if strategy not in SHOT_ALLOCATION_STRATEGIES:
+        raise ValueError(f"Unknown shot allocation strategy '{strategy}'. Use one of {SHOT_ALLOCATION_STRATEGIES}.")
+    num_terms = len(coefficients)
+    if num_terms == 0:
+        return np.zeros(0, dtype=int)
+    if min_shots < 0:
+        raise ValueError(f"min_shots must be non-negative, got {min_shots}.")
+
+    if strategy == 'uniform':
+        weights = np.ones(num_terms)
+    else:
+        weights = np.abs(np.asarray(coefficients, dtype=float))
+        if strategy == 'variance' and std_devs is not None:
+            if len(std_devs) != num_terms:
+                raise ValueError(f"Expected {num_terms} standard deviations, got {len(std_devs)}.")
+            weights = weights * np.asarray(std_devs, dtype=float)
+    if not np.any(weights > 0):
+        weights = np.ones(num_terms)
+
+    if total_shots < min_shots * num_terms:
+        warnings.warn(f"Shot budget {total_shots} is smaller than min_shots={min_shots} for each of "
+                      f"{num_terms} terms. Using {min_shots} shots per term.", UserWarning)
+        return np.full(num_terms, min_shots, dtype=int)
+
+    # Give every term its minimum, then split the rest by weight (largest remainders first)
+    remaining = total_shots - min_shots * num_terms
+    ideal = remaining * weights / weights.sum()
+    shots = np.floor(ideal).astype(int)
+    leftover = remaining - shots.sum()
+    if leftover > 0:
+        shots[np.argsort(shots - ideal)[:leftover]] += 1
+    return shots + min_shots
+
+
+class ShotAllocator:
+    """
+    Stateful shot allocation that learns per-term variances across evaluations.
+
+    Keeps a shot-weighted running mean of each Pauli term's expectation value and
+    uses Var(P) = 1 - <P>^2 to drive the 'variance' strategy. Older evaluations are
+    down-weighted by `decay` so the estimates follow the optimizer as parameters
+    change. Terms that were never measured are assumed to have unit variance.
+    """
+    def __init__(self, strategy: str = 'variance', min_shots: int = 16, min_std_dev: float = 0.05, decay: float = 0.5):
+        if strategy not in SHOT_ALLOCATION_STRATEGIES:
+            raise ValueError(f"Unknown shot allocation strategy '{strategy}'. Use one of {SHOT_ALLOCATION_STRATEGIES}.")
+        self.strategy = strategy
+        self.min_shots = min_shots
+        self.min_std_dev = min_std_dev
+        self.decay = decay
+        self._sum_expectations: Dict[str, float] = {}
+        self._sum_shots: Dict[str, float] = {}
+
+    def std_devs(self, pauli_strings: Sequence[str]) -> np.ndarray:
+        """Returns the running single-shot standard deviation estimate for each term."""
+        std_devs = np.ones(len(pauli_strings))
+        for i, pauli_string in enumerate(pauli_strings):
+            shots = self._sum_shots.get(pauli_string, 0)
+            if shots > 0:
+                mean = self._sum_expectations[pauli_string] / shots
+                std_devs[i] = np.sqrt(max(1.0 - mean**2, 0.0))
+        return np.maximum(std_devs, self.min_std_dev)
+
+    def allocate(self, pauli_strings: Sequence[str], coefficients: Sequence[float], total_shots: int) -> np.ndarray:
+        """Splits `total_shots` over the given terms using the configured strategy."""
+        std_devs = self.std_devs(pauli_strings) if self.strategy == 'variance' else None
+        return allocate_shots(coefficients, total_shots, self.strategy, std_devs, self.min_shots)
+
+    def update(self, pauli_strings: Sequence[str], expectations: Sequence[float], shots: Sequence[int]) -> None:
+        """Records measured term expectation values and the shots used for them."""
+        for pauli_string, expectation, n in zip(pauli_strings, expectations, shots):
+            self._sum_expectations[pauli_string] = self.decay * self._sum_expectations.get(pauli_string, 0.0) + float(expectation) * int(n)
+            self._sum_shots[pauli_string] = self.decay * self._sum_shots.get(pauli_string, 0.0) + int(n)
+
+    def reset(self) -> None:
+        """Forgets all running estimates."""
+        self._sum_expectations.clear()
+        self._sum_shots.clear()
+
+
+SHOT_SCHEDULES = ('constant', 'geometric', 'gradient', 'step')
+
+
+class ShotSchedule:
+    """
+    Chooses the number of shots for each objective evaluation of an optimization.
+
+    Early iterations take large steps and tolerate noisy energies, while steps near
+    convergence need precise ones. Schedules start at `initial_shots`, never exceed
+    `max_shots` and never decrease:
+        - 'constant': Always `initial_shots`.
+        - 'geometric': `initial_shots * growth**k` at evaluation k.
+        - 'step': Scales with (reference_step / step)^2, where step is the distance
+          from the previously evaluated point and reference_step the first such distance.
+        - 'gradient': Scales with (reference_slope / slope)^2, where slope is a
+          finite-difference estimate |dE| / |dx| over the last evaluations.
+    """
+    def __init__(self, kind: str = 'geometric', initial_shots: int = 128, max_shots: int = 8192,
+                 growth: float = 1.05, smoothing: int = 3):
+        if kind not in SHOT_SCHEDULES:
+            raise ValueError(f"Unknown shot schedule '{kind}'. Use one of {SHOT_SCHEDULES}.")
+        if initial_shots <= 0 or max_shots < initial_shots:
+            raise ValueError(f"Shot schedule needs 0 < initial_shots <= max_shots, got {initial_shots} and {max_shots}.")
+        self.kind = kind
+        self.initial_shots = int(initial_shots)
+        self.max_shots = int(max_shots)
+        self.growth = growth
+        self.smoothing = smoothing
+        self._reference: Optional[float] = None
+        self._current_shots = self.initial_shots
+
+    def next_shots(self, params: np.ndarray,
+                   params_history: Sequence[np.ndarray],
+                   value_history: Sequence[float]) -> int:
+        """
+        Returns the number of shots for evaluating `params`.
+
+        Args:
+            params: The parameters about to be evaluated.
+            params_history: Parameters of all previous evaluations.
+            value_history: Energies of all previous evaluations.
+
+        Returns:
+            int: Shots for this evaluation.
+        """
+        target = float(self._current_shots)
+        if self.kind == 'geometric':
+            target = self.initial_shots * self.growth**len(params_history)
+        elif self.kind == 'step' and params_history:
+            step = float(np.linalg.norm(np.asarray(params) - params_history[-1]))
+            target = self._scaled_target(step)
+        elif self.kind == 'gradient' and len(params_history) >= 2:
+            slopes = []
+            for k in range(max(1, len(params_history) - self.smoothing), len(params_history)):
+                dx = float(np.linalg.norm(params_history[k] - params_history[k - 1]))
+                dv = value_history[k] - value_history[k - 1]
+                if dx > 0 and np.isfinite(dv):
+                    slopes.append(abs(dv) / dx)
+            if slopes:
+                target = self._scaled_target(float(np.mean(slopes)))
+
+        self._current_shots = int(min(max(self._current_shots, np.ceil(target)), self.max_shots))
+        return self._current_shots
+
+    def _scaled_target(self, magnitude: float) -> float:
+        """Shots growing with the inverse square of `magnitude` relative to its first nonzero value."""
+        if magnitude <= 0:
+            return float(self._current_shots) # No information, keep the current level
+        if self._reference is None:
+            self._reference = magnitude
+        return self.initial_shots * (self._reference / magnitude)**2
+
+    def reset(self) -> None:
+        """Restarts the schedule from `initial_shots`."""
+        self._reference = None
+        self._current_shots = self.initial_shots
@@ -0,0 +1,162 @@
+"""
+Peephole simplification of ansatz circuits for Easy VQE.
+
+Generated ansatz structures often contain back-to-back rotations about the same
+axis, pairs of self-inverse gates that cancel, and runs of phase gates.
+`simplify_circuit` removes these with one pass over the circuit, so that every
+later evaluation simulates a shorter circuit. The result is exactly equivalent
+(including the global phase) and keeps all parameters of the input.
+"""
+
+import warnings
+import numpy as np
+from collections import defaultdict
+from typing import Dict, List, Optional, Union
+from qiskit import QuantumCircuit
+from qiskit.circuit import CircuitInstruction, ParameterExpression
+from qiskit.circuit.library import PhaseGate, ZGate, SGate, SdgGate, TGate, TdgGate
+
+# Gates that are their own inverse: two in a row on the same qubits cancel
+SELF_INVERSE_GATES = frozenset({'h', 'x', 'y', 'z', 'cx', 'cy', 'cz', 'ch', 'swap', 'ccx', 'cswap'})
+# Rotations R(a) R(b) = R(a + b) on the same qubits
+ROTATION_GATES = frozenset({'rx', 'ry', 'rz', 'rxx', 'ryy', 'rzz', 'rzx', 'crx', 'cry', 'crz', 'cp'})
+# Gates whose qubits can be given in any order
+SYMMETRIC_GATES = frozenset({'cz', 'swap', 'rxx', 'ryy', 'rzz', 'cp'})
+# Diagonal phase gates diag(1, e^{i angle}), folded into one another
+PHASE_ANGLES: Dict[str, float] = {'z': np.pi, 's': np.pi / 2, 'sdg': -np.pi / 2, 't': np.pi / 4, 'tdg': -np.pi / 4}
+_NAMED_PHASES = [(np.pi, ZGate), (np.pi / 2, SGate), (3 * np.pi / 2, SdgGate), (np.pi / 4, TGate), (7 * np.pi / 4, TdgGate)]
+_ANGLE_TOLERANCE = 1e-12
+
+Angle = Union[float, ParameterExpression]
+
+
+def _numeric(angle: Angle) -> Optional[float]:
+    """The angle as a float, or None if it still depends on parameters."""
+    if isinstance(angle, ParameterExpression):
+        if angle.parameters:
+            return None
+        return float(angle)
+    return float(angle)
+
+
+def _phase_angle(instruction: CircuitInstruction) -> Optional[Angle]:
+    name = instruction.operation.name
+    if name == 'p':
+        return instruction.params[0]
+    return PHASE_ANGLES.get(name)
+
+
+def _phase_instruction(angle: Angle, instruction: CircuitInstruction) -> Optional[CircuitInstruction]:
+    """The cheapest gate for diag(1, e^{i angle}) on the qubit of `instruction`; None for the identity."""
+    value = _numeric(angle)
+    if value is None:
+        return CircuitInstruction(PhaseGate(angle), instruction.qubits)
+    value = value % (2 * np.pi)
+    if value < _ANGLE_TOLERANCE or 2 * np.pi - value < _ANGLE_TOLERANCE:
+        return None
+    for named_angle, gate_class in _NAMED_PHASES:
+        if abs(value - named_angle) < _ANGLE_TOLERANCE:
+            return CircuitInstruction(gate_class(), instruction.qubits)
+    return CircuitInstruction(PhaseGate(value), instruction.qubits)
+
+
+def _is_identity(instruction: CircuitInstruction) -> bool:
+    name = instruction.operation.name
+    if name == 'id':
+        return True
+    if name in ROTATION_GATES or name == 'p':
+        value = _numeric(instruction.params[0])
+        return value is not None and abs(value) < _ANGLE_TOLERANCE
+    return False
+
+
+def _same_target(first: CircuitInstruction, second: CircuitInstruction) -> bool:
+    if first.qubits == second.qubits:
+        return True
+    return first.operation.name in SYMMETRIC_GATES and set(first.qubits) == set(second.qubits)
+
+
+def _combine(previous: CircuitInstruction, instruction: CircuitInstruction) -> Union[CircuitInstruction, None, bool]:
+    """
+    Combines two adjacent instructions on the same qubits.
+
+    Returns:
+        The merged instruction, None if the pair is the identity, or False if it cannot be combined.
+    """
+    name = instruction.operation.name
+    if previous.clbits or instruction.clbits or not _same_target(previous, instruction):
+        return False
+    if len(instruction.qubits) == 1:
+        first_phase, second_phase = _phase_angle(previous), _phase_angle(instruction)
+        if first_phase is not None and second_phase is not None:
+            return _phase_instruction(first_phase + second_phase, instruction)
+    if previous.operation.name != name:
+        return False
+    if name in SELF_INVERSE_GATES:
+        return None
+    if name in ROTATION_GATES:
+        # A new operation, since replacing only the params would leave a stale cached gate object
+        operation = previous.operation.to_mutable()
+        operation.params = [previous.params[0] + instruction.params[0]]
+        merged = previous.replace(operation=operation)
+        return None if _is_identity(merged) else merged
+    return False
+
+
+def simplify_circuit(quantum_circuit: QuantumCircuit) -> QuantumCircuit:
+    """
+    Simplifies a circuit by merging and cancelling adjacent gates.
+
+    One pass over the circuit keeps, for every qubit, the stack of kept gates that
+    touch it. A gate is combined with the previous gate if that gate is the last one
+    on all of its qubits and acts on the same qubits:
+
+    - Self-inverse gates (H, X, CX, SWAP, ...) cancel in pairs.
+    - Rotations about the same axis merge into one whose angle is the sum of both,
+      as a parameter expression if needed (RY(p_0) RY(p_1) -> RY(p_0 + p_1)).
+    - Z, S, Sdg, T, Tdg and P gates fold into the single cheapest equivalent gate.
+    - Identity gates and rotations by a zero angle are removed.
+
+    After a cancellation the gates before it become adjacent, so nested patterns
+    such as H X X H vanish completely. Barriers, measurements and other instructions
+    are kept and block merging across them. The circuit metadata (including the
+    stored parameter order) is kept.
+
+    Args:
+        quantum_circuit: The circuit to simplify.
+
+    Returns:
+        QuantumCircuit: A new, equivalent circuit. If simplifying would remove a
+        parameter altogether (e.g. RX(a) RX(-a)), the input circuit is returned
+        unchanged with a warning, since parameter vectors must keep their length.
+    """
+    kept: List[Optional[CircuitInstruction]] = []
+    stacks: Dict[object, List[int]] = defaultdict(list) # Qubit -> indices into `kept` of the gates on it
+
+    for instruction in quantum_circuit.data:
+        if _is_identity(instruction):
+            continue
+        tops = {stacks[q][-1] if stacks[q] else None for q in instruction.qubits}
+        previous_index = tops.pop() if len(tops) == 1 else None
+        if previous_index is not None:
+            combined = _combine(kept[previous_index], instruction)
+            if combined is None:
+                for q in kept[previous_index].qubits:
+                    stacks[q].pop()
+                kept[previous_index] = None
+                continue
+            if combined is not False:
+                kept[previous_index] = combined
+                continue
+        for q in instruction.qubits:
+            stacks[q].append(len(kept))
+        kept.append(instruction)
+
+    simplified = quantum_circuit.copy_empty_like()
+    for instruction in kept:
+        if instruction is not None:
+            simplified._append(instruction)
+    if set(simplified.parameters) != set(quantum_circuit.parameters):
+        warnings.warn("Simplification would remove parameters from the circuit. Returning it unchanged.", UserWarning)
+        return quantum_circuit
+    return simplified
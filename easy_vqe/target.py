@@ -0,0 +1,291 @@
+"""
+Hardware target profiles for Easy VQE.
+
+A `TargetProfile` describes a device by its coupling map and native basis gates,
+and is usually loaded from a small JSON file:
+
+    {"name": "line_5", "num_qubits": 5,
+     "coupling_map": [[0, 1], [1, 0], [1, 2], [2, 1], [2, 3], [3, 2], [3, 4], [4, 3]],
+     "basis_gates": ["cx", "rz", "sx", "x"], "optimization_level": 1, "seed_transpiler": 7}
+
+`transpile_for_target` maps the unbound ansatz onto the device once: layout,
+routing and basis translation happen a single time, and every measurement basis
+change is appended afterwards on the physical qubits that hold the logical ones
+at the end of the routed circuit. An `ExecutionEngine` created with a target
+caches these transpilations, so shot-based evaluations never route again.
+"""
+
+import json
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from qiskit import QuantumCircuit, ClassicalRegister, transpile
+from qiskit.circuit import Parameter
+
+from .circuit import parameter_order
+
+# Operations that never count as device gates in the reports
+_NON_GATE_OPERATIONS = frozenset({'barrier', 'measure', 'delay', 'reset'})
+
+
+class TargetProfile:
+    """
+    A hardware target: coupling map, basis gates and transpiler settings.
+
+    Attributes:
+        name (str): Label used in reports.
+        num_qubits (int): Number of physical qubits.
+        coupling_map (Optional[List[List[int]]]): Directed [control, target] edges; None for all-to-all.
+        basis_gates (List[str]): Native gate names, e.g. ['cx', 'rz', 'sx', 'x'].
+        optimization_level (int): Qiskit preset optimization level (0-3).
+        seed_transpiler (Optional[int]): Seed of the stochastic layout and routing passes.
+    """
+    def __init__(self,
+                 basis_gates: Sequence[str],
+                 coupling_map: Optional[Sequence[Sequence[int]]] = None,
+                 num_qubits: Optional[int] = None,
+                 optimization_level: int = 1,
+                 seed_transpiler: Optional[int] = None,
+                 name: str = "target"):
+        if isinstance(basis_gates, str) or not basis_gates or not all(isinstance(g, str) for g in basis_gates):
+            raise ValueError(f"basis_gates must be a non-empty list of gate names, got {basis_gates!r}")
+        edges = None
+        if coupling_map is not None:
+            try:
+                edges = [[int(a), int(b)] for a, b in coupling_map]
+            except (TypeError, ValueError):
+                raise ValueError(f"coupling_map must be a list of [control, target] pairs, got {coupling_map!r}")
+            if any(a == b or a < 0 or b < 0 for a, b in edges):
+                raise ValueError("coupling_map edges must join two distinct non-negative qubit indices.")
+            required = 1 + max((q for edge in edges for q in edge), default=-1)
+            if num_qubits is None:
+                num_qubits = required
+            elif num_qubits < required:
+                raise ValueError(f"coupling_map uses qubit {required - 1}, but num_qubits is {num_qubits}.")
+        if num_qubits is not None and (not isinstance(num_qubits, int) or num_qubits <= 0):
+            raise ValueError(f"num_qubits must be a positive integer, got {num_qubits}")
+        if optimization_level not in (0, 1, 2, 3):
+            raise ValueError(f"optimization_level must be 0, 1, 2 or 3, got {optimization_level}")
+        self.name = str(name)
+        self.num_qubits = num_qubits
+        self.coupling_map = edges
+        self.basis_gates = [g.lower() for g in basis_gates]
+        self.optimization_level = optimization_level
+        self.seed_transpiler = seed_transpiler
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TargetProfile":
+        """Builds a profile from a dictionary with the keys of the JSON format (see the module docstring)."""
+        if not isinstance(data, dict):
+            raise ValueError(f"A target profile must be a JSON object, got {type(data).__name__}.")
+        unknown = set(data) - {'name', 'num_qubits', 'coupling_map', 'basis_gates', 'optimization_level', 'seed_transpiler'}
+        if unknown:
+            raise ValueError(f"Unknown target profile keys: {sorted(unknown)}")
+        if 'basis_gates' not in data:
+            raise ValueError("A target profile needs 'basis_gates'.")
+        return cls(data['basis_gates'], data.get('coupling_map'), data.get('num_qubits'),
+                   data.get('optimization_level', 1), data.get('seed_transpiler'), data.get('name', "target"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The profile in the JSON format read by `from_dict`."""
+        return {'name': self.name, 'num_qubits': self.num_qubits, 'coupling_map': self.coupling_map,
+                'basis_gates': list(self.basis_gates), 'optimization_level': self.optimization_level,
+                'seed_transpiler': self.seed_transpiler}
+
+    @property
+    def key(self) -> str:
+        """Canonical form of the profile, used to key cached transpilations."""
+        return json.dumps(self.to_dict(), sort_keys=True)
+
+    def __repr__(self) -> str:
+        return (f"TargetProfile(name={self.name!r}, num_qubits={self.num_qubits}, basis_gates={self.basis_gates}, "
+                f"optimization_level={self.optimization_level})")
+
+
+def load_target_profile(path: str) -> TargetProfile:
+    """
+    Reads a target profile from a JSON file.
+
+    Args:
+        path: Path of the JSON file (format in the module docstring).
+
+    Returns:
+        TargetProfile: The profile.
+
+    Raises:
+        ValueError: If the file is not valid JSON or does not describe a valid profile.
+        OSError: If the file cannot be read.
+    """
+    with open(path, 'r', encoding='utf-8') as handle:
+        try:
+            data = json.load(handle)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Target profile '{path}' is not valid JSON: {e}")
+    return TargetProfile.from_dict(data)
+
+
+def _gate_counts(circuit: QuantumCircuit) -> Tuple[Dict[str, int], int]:
+    """Operation counts without non-gate operations, and the number of two-qubit gates."""
+    counts: Dict[str, int] = {}
+    two_qubit = 0
+    for instruction in circuit.data:
+        name = instruction.name
+        if name in _NON_GATE_OPERATIONS:
+            continue
+        counts[name] = counts.get(name, 0) + 1
+        two_qubit += len(instruction.qubits) == 2
+    return counts, two_qubit
+
+
+class TargetTranspilation:
+    """
+    An ansatz transpiled once for a target, with the layout needed to measure it.
+
+    Attributes:
+        profile (TargetProfile): The target.
+        circuit (QuantumCircuit): The routed, basis-translated ansatz, still parameterized,
+                                  on `profile.num_qubits` (or the ansatz's) physical qubits.
+        parameters (List[Parameter]): The source ansatz's parameters in binding order.
+        initial_layout (List[int]): Physical qubit initially holding each logical qubit.
+        final_layout (List[int]): Physical qubit holding each logical qubit at the end of
+                                  the circuit, where the basis changes are applied.
+        transpile_seconds (float): Wall time of the transpilation.
+    """
+    def __init__(self, ansatz: QuantumCircuit, profile: TargetProfile):
+        if any(instruction.clbits for instruction in ansatz.data):
+            raise ValueError("Target transpilation requires an ansatz without measurements.")
+        if profile.num_qubits is not None and ansatz.num_qubits > profile.num_qubits:
+            raise ValueError(f"The ansatz needs {ansatz.num_qubits} qubits, but target '{profile.name}' "
+                             f"has {profile.num_qubits}.")
+        self.profile = profile
+        self.parameters: List[Parameter] = parameter_order(ansatz)
+        start = time.perf_counter()
+        self.circuit = transpile(ansatz, basis_gates=profile.basis_gates, coupling_map=profile.coupling_map,
+                                 optimization_level=profile.optimization_level,
+                                 seed_transpiler=profile.seed_transpiler)
+        self.transpile_seconds = time.perf_counter() - start
+        layout = self.circuit.layout
+        if layout is None:
+            self.initial_layout = self.final_layout = list(range(ansatz.num_qubits))
+        else:
+            self.initial_layout = layout.initial_index_layout(filter_ancillas=True)
+            self.final_layout = layout.final_index_layout(filter_ancillas=True)
+        self._suffixes: Dict[str, QuantumCircuit] = {}
+
+    def parameter_map(self, values: Sequence[float]) -> Dict[Parameter, float]:
+        """Maps values in the source ansatz's binding order onto the parameters of `circuit`."""
+        by_name = {p.name: float(v) for p, v in zip(self.parameters, values)}
+        return {p: by_name[p.name] for p in self.circuit.parameters}
+
+    def map_pauli_string(self, pauli_string: str) -> str:
+        """Moves each logical qubit's Pauli operator to its final physical qubit (Easy VQE order: qubit 0 first)."""
+        if len(pauli_string) != len(self.final_layout):
+            raise ValueError(f"Pauli string length {len(pauli_string)} mismatches ansatz qubits {len(self.final_layout)}.")
+        physical = ['I'] * self.circuit.num_qubits
+        for q, op in enumerate(pauli_string):
+            physical[self.final_layout[q]] = op
+        return ''.join(physical)
+
+    def map_hamiltonian(self, parsed_hamiltonian: List[Tuple[float, str]]) -> List[Tuple[float, str]]:
+        """`map_pauli_string` applied to every term."""
+        return [(coefficient, self.map_pauli_string(pauli_string)) for coefficient, pauli_string in parsed_hamiltonian]
+
+    def _native_basis_change(self, op: str) -> QuantumCircuit:
+        """One-qubit basis change to Z for 'X' or 'Y', translated to the target's gates once."""
+        suffix = self._suffixes.get(op)
+        if suffix is None:
+            change = QuantumCircuit(1)
+            if op == 'Y':
+                change.sdg(0)
+            change.h(0)
+            suffix = self._suffixes[op] = transpile(change, basis_gates=self.profile.basis_gates,
+                                                    optimization_level=self.profile.optimization_level)
+        return suffix
+
+    def measurement_circuit(self, pauli_string: str) -> QuantumCircuit:
+        """
+        The device-native circuit measuring one Pauli term: the routed ansatz, native basis changes
+        on the final physical qubits and measurements. Nothing is routed again.
+
+        Args:
+            pauli_string: Pauli string over the logical qubits.
+
+        Returns:
+            QuantumCircuit: The (still parameterized) measurement circuit; clbit j holds the
+            j-th non-identity logical qubit.
+        """
+        physical_string = self.map_pauli_string(pauli_string)
+        measured = [self.final_layout[q] for q, op in enumerate(pauli_string) if op != 'I']
+        qc = self.circuit.copy(name=f"Measure_{pauli_string}")
+        for q in measured:
+            op = physical_string[q]
+            if op in 'XY':
+                qc.compose(self._native_basis_change(op), [q], inplace=True)
+        if measured:
+            qc.add_register(ClassicalRegister(len(measured), name="c"))
+            qc.measure(measured, range(len(measured)))
+        return qc
+
+    def report(self, parsed_hamiltonian: Optional[List[Tuple[float, str]]] = None) -> Dict[str, Any]:
+        """
+        Size of the ansatz (and optionally its measurement circuits) on the target.
+
+        Args:
+            parsed_hamiltonian: If given, the depths of the measurement circuits of its
+                                non-identity terms are included.
+
+        Returns:
+            Dict[str, Any]: Dictionary with keys:
+                - 'target' (str): The profile name.
+                - 'optimization_level' (int): The preset level used.
+                - 'depth' (int): Depth of the transpiled ansatz.
+                - 'size' (int): Number of gates of the transpiled ansatz.
+                - 'cx_count' (int): Number of CX gates.
+                - 'two_qubit_count' (int): Number of two-qubit gates of any kind (CX, ECR, CZ, SWAP, ...).
+                - 'gate_counts' (Dict[str, int]): Gates by name.
+                - 'initial_layout' / 'final_layout' (List[int]): See the class attributes.
+                - 'transpile_seconds' (float): Time spent transpiling.
+                - 'measurement_depths' (Dict[str, int]): Depth of each term's measurement
+                  circuit (only with `parsed_hamiltonian`).
+                - 'max_measurement_depth' (int): Largest of those depths (same condition).
+        """
+        counts, two_qubit = _gate_counts(self.circuit)
+        report: Dict[str, Any] = {
+            'target': self.profile.name,
+            'optimization_level': self.profile.optimization_level,
+            'depth': self.circuit.depth(lambda instruction: instruction.name not in _NON_GATE_OPERATIONS),
+            'size': sum(counts.values()),
+            'cx_count': counts.get('cx', 0),
+            'two_qubit_count': two_qubit,
+            'gate_counts': counts,
+            'initial_layout': list(self.initial_layout),
+            'final_layout': list(self.final_layout),
+            'transpile_seconds': self.transpile_seconds,
+        }
+        if parsed_hamiltonian is not None:
+            depths = {pauli_string: self.measurement_circuit(pauli_string).depth(
+                          lambda instruction: instruction.name not in _NON_GATE_OPERATIONS)
+                      for _, pauli_string in parsed_hamiltonian if set(pauli_string) != {'I'}}
+            report['measurement_depths'] = depths
+            report['max_measurement_depth'] = max(depths.values(), default=report['depth'])
+        return report
+
+
+def transpile_for_target(ansatz: QuantumCircuit, profile: Union[TargetProfile, str]) -> TargetTranspilation:
+    """
+    Transpiles an unbound ansatz for a target once (see `TargetTranspilation`).
+
+    Use `ExecutionEngine(target=...)` to cache the result across evaluations.
+
+    Args:
+        ansatz: The (parameterized) ansatz circuit, without measurements.
+        profile: A `TargetProfile` or the path of a JSON profile.
+
+    Returns:
+        TargetTranspilation: The transpiled ansatz with its layout.
+
+    Raises:
+        ValueError: If the ansatz does not fit the target or contains measurements.
+    """
+    if isinstance(profile, str):
+        profile = load_target_profile(profile)
+    return TargetTranspilation(ansatz, profile)
@@ -31,6 +31,8 @@ def print_results_summary(results: Dict[str, Any]) -> None:
         print(f"Determined Number of Qubits: {results.get('num_qubits', 'N/A')}")
         print(f"Optimizer Method: {results.get('optimizer_method', 'N/A')}")
         print(f"Shots per evaluation: {results.get('n_shots', 'N/A')}")
+        if results.get('total_shots') is not None:
+            print(f"Total shots used: {results['total_shots']}")
         print(f"Optimizer Success: {results.get('success', 'N/A')}")
         print(f"Optimizer Message: {results.get('message', 'N/A')}")
 
@@ -10,12 +10,53 @@ import numpy as np
 import matplotlib.pyplot as plt
 import warnings
 import re
-from scipy.optimize import minimize
+from scipy.optimize import minimize, OptimizeResult
 from typing import List, Tuple, Union, Dict, Optional, Any, Sequence
 
 from easy_vqe.hamiltonian import parse_hamiltonian_expression
 from easy_vqe.circuit import create_custom_ansatz
-from easy_vqe.measurement import get_hamiltonian_expectation_value
+from easy_vqe.ansatz_cache import AnsatzCache
+from easy_vqe.simplify import simplify_circuit
+from easy_vqe.measurement import get_hamiltonian_expectation_value, EXPECTATION_ESTIMATORS, _group_measured_terms
+from easy_vqe.decomposition import split_into_subsystems, get_decomposed_expectation_value
+from easy_vqe.shots import ShotAllocator, ShotSchedule
+from easy_vqe.cache import ExpectationCache
+from easy_vqe.engine import ExecutionEngine
+from easy_vqe.parallel import ParallelEvaluator
+
+
+class _ShotBudgetExhausted(Exception):
+    """Raised inside the objective function to stop the optimizer when the shot budget is spent."""
+
+def _evaluation_shot_cost(hamiltonians: List[Tuple[List[Tuple[float, str]], int]],
+                          estimator: str,
+                          shot_allocation: bool,
+                          term_sample_size: Optional[int],
+                          group_diagonal: bool = True) -> Tuple[int, int]:
+    """
+    Upper bound on the shots one evaluation spends, as (per_shot, minimum).
+
+    An evaluation with `n` shots spends at most max(n * per_shot, minimum) shots (for
+    `target_precision`, in its first round). `hamiltonians` holds the (terms, num_qubits)
+    of every independently measured part: subsystems or evaluator term groups.
+    """
+    per_shot, minimum = 0, 0
+    for terms, num_qubits in hamiltonians:
+        _, diagonal_terms, _, other_terms = _group_measured_terms(terms, num_qubits, group_diagonal)
+        num_units = len(other_terms) + (1 if diagonal_terms else 0)
+        if not num_units:
+            continue
+        if estimator == 'shadow':
+            per_shot += 1 # n snapshots
+        elif estimator == 'sampled':
+            per_shot += min(term_sample_size, len(_group_measured_terms(terms, num_qubits, False)[3]))
+        elif shot_allocation:
+            per_shot += 1 # n is the total, but every unit gets at least one shot
+            minimum += num_units
+        else:
+            per_shot += num_units
+    return per_shot, max(per_shot, minimum)
+
 
 class OptimizationLogger:
     """Helper class to store optimization history during scipy.minimize."""
@@ -23,13 +64,19 @@ class OptimizationLogger:
         self.eval_count = 0
         self.params_history: List[np.ndarray] = []
         self.value_history: List[float] = []
+        self.shots_history: List[int] = []
+        self.total_shots = 0
         self._last_print_eval = 0
 
-    def callback(self, current_params: np.ndarray, current_value: float, display_progress: bool = False, print_interval: int = 10):
-        """Stores current parameters and value, optionally prints progress."""
+    def callback(self, current_params: np.ndarray, current_value: float, display_progress: bool = False, print_interval: int = 10,
+                 shots_used: Optional[int] = None):
+        """Stores current parameters, value and (if tracked) shots used, optionally prints progress."""
         self.eval_count += 1
         self.params_history.append(np.copy(current_params))
         self.value_history.append(current_value)
+        if shots_used is not None:
+            self.shots_history.append(shots_used)
+            self.total_shots += shots_used
 
         if display_progress and (self.eval_count - self._last_print_eval >= print_interval):
              # Only print if the value is finite
@@ -47,13 +94,27 @@ class OptimizationLogger:
 def find_ground_state(
     ansatz_structure: List[Union[Tuple[str, List[int]], List]],
     hamiltonian_expression: str,
-    n_shots: int = 2048,
+    n_shots: Optional[int] = 2048,
     optimizer_method: str = 'COBYLA',
     optimizer_options: Optional[Dict[str, Any]] = None,
     initial_params_strategy: Union[str, np.ndarray, Sequence[float]] = 'random',
     max_evaluations: Optional[int] = 150,
     display_progress: bool = True,
-    plot_filename: Optional[str] = None
+    plot_filename: Optional[str] = None,
+    light_cone: bool = False,
+    decompose_subsystems: bool = False,
+    shot_allocation: Optional[str] = None,
+    target_precision: Optional[float] = None,
+    shot_schedule: Union[str, ShotSchedule, None] = None,
+    shot_budget: Optional[int] = None,
+    estimator: str = 'terms',
+    term_sample_size: Optional[int] = None,
+    expectation_cache: Union[bool, ExpectationCache, None] = None,
+    engine: Optional[ExecutionEngine] = None,
+    n_workers: Optional[int] = None,
+    evaluator: Optional[Any] = None,
+    ansatz_cache: Optional[AnsatzCache] = None,
+    simplify_ansatz: bool = False
 ) -> Dict[str, Any]:
     """
     Performs the Variational Quantum Eigensolver (VQE) algorithm to find the
@@ -63,7 +124,8 @@ def find_ground_state(
         ansatz_structure: Definition for `create_custom_ansatz`.
         hamiltonian_expression: Hamiltonian string (e.g., "-1.0*ZZ + 0.5*X").
         n_shots: Number of shots per expectation value estimation. Higher values
-                 reduce noise but increase simulation time.
+                 reduce noise but increase simulation time. None evaluates every
+                 energy exactly from the statevector (exact mode).
         optimizer_method: Name of the SciPy optimizer to use (e.g., 'COBYLA',
                           'Nelder-Mead', 'L-BFGS-B', 'Powell', 'SLSQP').
         optimizer_options: Dictionary of options passed directly to the SciPy
@@ -80,6 +142,66 @@ def find_ground_state(
         plot_filename: If a filename string is provided (e.g., "convergence.png"),
                        saves the energy convergence plot to that file. If None,
                        no plot is saved.
+        light_cone: If True, each Hamiltonian term is simulated on the ansatz
+                    reduced to the term's backward light cone (see
+                    `get_hamiltonian_expectation_value`).
+        decompose_subsystems: If True, detects qubit clusters that are coupled
+                              neither by Hamiltonian terms nor by multi-qubit
+                              ansatz gates and simulates each cluster on its
+                              own, summing the cluster energies exactly.
+        shot_allocation: If set ('uniform', 'proportional' or 'variance'), `n_shots`
+                         is the total budget per evaluation, split over the
+                         measured terms by this strategy. 'variance' learns
+                         per-term variances over the run to minimize the
+                         estimator variance.
+        target_precision: If set, each evaluation samples in rounds (starting
+                          with `n_shots` per term) until the standard error of
+                          the energy is at most this value, e.g. 1e-3 for 1 mHa.
+        shot_schedule: Varies the shots per evaluation during the run instead
+                       of using a constant `n_shots`:
+            - 'geometric', 'step' or 'gradient': A `ShotSchedule` of that kind
+              starting at `n_shots` and capped at 16 * `n_shots`.
+            - ShotSchedule: A configured schedule instance.
+        shot_budget: If set, the optimization stops before the evaluation that
+                     would exceed this many shots in total (the last evaluation
+                     runs with fewer shots if that lets it fit), returning the
+                     best point found. The budget is never overshot.
+        estimator: How each energy is estimated:
+            - 'terms': One measurement circuit per Hamiltonian term (default).
+            - 'shadow': A classical shadow of `n_shots` random-basis snapshots
+              shared by all terms; suited to Hamiltonians with many terms.
+            - 'sampled': Unbiased importance sampling of `term_sample_size`
+              terms per evaluation (drawn proportionally to |coefficient|).
+        term_sample_size: Number of term draws per evaluation for the 'sampled'
+                          estimator. Setting it selects 'sampled' when
+                          `estimator` is left at 'terms'.
+        expectation_cache: If True (or an `ExpectationCache` instance), energies of
+                           parameter vectors that were already evaluated are taken
+                           from an LRU cache instead of being simulated again. With
+                           an instance created with `pool_shots=True`, repeated
+                           points pool their shots instead.
+        engine: `ExecutionEngine` that runs all circuits of this search (default:
+                the shared default engine). Engines are thread-safe, so several
+                searches can run concurrently from a thread pool, either sharing
+                one engine or using one each.
+        n_workers: If set, the Hamiltonian terms are split into groups that are
+                   measured concurrently by this many worker processes (see
+                   `ParallelEvaluator`). The workers are started once for the
+                   whole search. Only supported for shot-based evaluation with
+                   the 'terms' estimator, without `shot_allocation`,
+                   `target_precision`, `expectation_cache`,
+                   `decompose_subsystems` or an `engine` with a hardware target.
+        evaluator: An already started `ParallelEvaluator` or `DistributedEvaluator`
+                   for this ansatz and Hamiltonian (e.g. with workers on several
+                   machines). Used like `n_workers`, with the same restrictions,
+                   but the caller keeps ownership and closes it.
+        ansatz_cache: An `AnsatzCache` that provides the ansatz circuit, so that
+                      searches with the same structure (e.g. a sweep over
+                      Hamiltonians) build it only once.
+        simplify_ansatz: If True, adjacent gates of the ansatz are merged and
+                         cancelled once before the search (see `simplify_circuit`),
+                         so every evaluation simulates the shorter circuit. With
+                         `ansatz_cache`, the simplified circuit is cached as well.
 
     Returns:
         Dict[str, Any]: A dictionary containing VQE results:
@@ -97,6 +219,16 @@ def find_ground_state(
             - 'optimizer_method' (str): Optimizer used.
             - 'hamiltonian_expression' (str): Original Hamiltonian string.
             - 'plot_filename' (Optional[str]): Filename if plot was saved.
+            - 'shots_history' (List[int]): Shots spent on each evaluation (only
+              recorded when `shot_schedule` or `shot_budget` is set).
+            - 'total_shots' (Optional[int]): Cumulative shots spent (same condition).
+            - 'subsystems' (List[List[int]]): Qubit clusters simulated independently
+              (a single cluster with all qubits unless `decompose_subsystems` split the problem).
+            - 'cache_hits' (Optional[int]): Evaluations answered by `expectation_cache`
+              (None if no cache was used).
+            - 'target_report' (Dict[str, Any]): Depth, CX and two-qubit gate counts of the
+              ansatz transpiled for the engine's target (see `TargetTranspilation.report`;
+              only when `engine` has a target).
         Returns {'error': ..., 'details': ...} dictionary on critical failure during setup.
     """
     print("-" * 50)
@@ -122,8 +254,79 @@ def find_ground_state(
         'message': 'Initialization',
         'initial_params': None,
         'initial_params_strategy_used': None,
+        'subsystems': None,
+        'shots_history': [],
+        'total_shots': None,
+        'cache_hits': None,
     }
 
+    # Optional estimator settings, forwarded only when they differ from the defaults
+    expectation_options: Dict[str, Any] = {}
+    if light_cone:
+        expectation_options['light_cone'] = True
+    if shot_allocation is not None:
+        try:
+            expectation_options['shot_allocation'] = ShotAllocator(shot_allocation)
+        except ValueError as e:
+            print(f"\n[Error] Invalid shot allocation: {e}")
+            result_dict.update({'error': 'Invalid shot allocation', 'details': str(e)})
+            return result_dict
+    if target_precision is not None:
+        expectation_options['target_std_error'] = target_precision
+    if term_sample_size is not None and estimator == 'terms':
+        estimator = 'sampled'
+    if estimator != 'terms':
+        if estimator not in EXPECTATION_ESTIMATORS:
+            print(f"\n[Error] Unknown estimator '{estimator}'. Use one of {EXPECTATION_ESTIMATORS}.")
+            result_dict.update({'error': 'Invalid estimator', 'details': f"Unknown estimator '{estimator}'"})
+            return result_dict
+        if estimator == 'sampled' and (term_sample_size is None or term_sample_size <= 0):
+            print(f"\n[Error] estimator='sampled' needs a positive term_sample_size, got {term_sample_size}.")
+            result_dict.update({'error': 'Invalid estimator', 'details': f"Invalid term_sample_size {term_sample_size}"})
+            return result_dict
+        expectation_options['estimator'] = estimator
+    if term_sample_size is not None:
+        expectation_options['term_sample_size'] = term_sample_size
+    if engine is not None:
+        expectation_options['engine'] = engine
+
+    cache: Optional[ExpectationCache] = None
+    if isinstance(expectation_cache, ExpectationCache):
+        cache = expectation_cache
+    elif expectation_cache:
+        cache = ExpectationCache()
+
+    schedule: Optional[ShotSchedule] = None
+    try:
+        if n_shots is None and (shot_schedule is not None or shot_budget is not None):
+            raise ValueError("Exact mode (n_shots=None) cannot be combined with a shot schedule or budget.")
+        if isinstance(shot_schedule, ShotSchedule):
+            schedule = shot_schedule
+            schedule.reset()
+        elif shot_schedule is not None:
+            schedule = ShotSchedule(shot_schedule, initial_shots=n_shots, max_shots=16 * n_shots)
+        if shot_budget is not None and shot_budget <= 0:
+            raise ValueError(f"shot_budget must be a positive integer, got {shot_budget}.")
+    except ValueError as e:
+        print(f"\n[Error] Invalid shot schedule or budget: {e}")
+        result_dict.update({'error': 'Invalid shot schedule or budget', 'details': str(e)})
+        return result_dict
+    track_shots = schedule is not None or shot_budget is not None
+
+    if n_workers is not None or evaluator is not None:
+        unsupported = [name for name, used in [('exact mode', n_shots is None), ('estimator', estimator != 'terms'),
+                                               ('shot_allocation', shot_allocation is not None),
+                                               ('target_precision', target_precision is not None),
+                                               ('expectation_cache', bool(expectation_cache) or isinstance(expectation_cache, ExpectationCache)),
+                                               ('decompose_subsystems', decompose_subsystems),
+                                               ('engine target', engine is not None and engine.target is not None),
+                                               ('n_workers', n_workers is not None and evaluator is not None)] if used]
+        if (n_workers is not None and n_workers <= 0) or unsupported:
+            details = f"n_workers must be positive, got {n_workers}" if not unsupported else f"Parallel evaluation cannot be combined with {', '.join(unsupported)}"
+            print(f"\n[Error] Invalid parallel evaluation settings: {details}.")
+            result_dict.update({'error': 'Invalid parallel evaluation settings', 'details': details})
+            return result_dict
+
     try:
         parsed_hamiltonian = parse_hamiltonian_expression(hamiltonian_expression)
         if not parsed_hamiltonian:
@@ -139,46 +342,124 @@ def find_ground_state(
         return result_dict # Exit early
 
     try:
-        ansatz, parameters = create_custom_ansatz(num_qubits, ansatz_structure)
+        if ansatz_cache is not None:
+            ansatz, parameters = ansatz_cache.get(num_qubits, ansatz_structure, simplify=simplify_ansatz)
+        else:
+            ansatz, parameters = create_custom_ansatz(num_qubits, ansatz_structure)
+            if simplify_ansatz:
+                ansatz = simplify_circuit(ansatz)
         num_params = len(parameters)
-        result_dict.update({'ansatz': ansatz, 'parameters': parameters})
-        print(f"Created Ansatz: {num_params} parameters")
-
-        if num_params == 0:
-            warnings.warn("Ansatz has no parameters. Calculating fixed expectation value.", UserWarning)
-            try:
-                # Use None for param_values when no parameters exist
-                fixed_value = get_hamiltonian_expectation_value(ansatz, parsed_hamiltonian, None, n_shots)
-                print(f"Fixed Expectation Value: {fixed_value:.8f}")
-                result_dict.update({
-                    'optimal_params': np.array([]), 'optimal_value': fixed_value,
-                    'optimization_result': None, 'cost_history': [fixed_value],
-                    'parameter_history': [np.array([])], 'success': True,
-                    'message': 'Static evaluation (no parameters)'
-                 })
-                return result_dict
-            except Exception as e:
-                print(f"\n[Error] Failed to calculate fixed expectation value: {e}")
-                result_dict.update({'error': 'Failed static evaluation', 'details': str(e)})
-                return result_dict
-
+        result_dict.update({'ansatz': ansatz.copy(), 'parameters': parameters}) # The cached circuit is shared
+        print(f"Created Ansatz: {num_params} parameters" + (f" | {ansatz.size()} gates after simplification" if simplify_ansatz else ""))
     except Exception as e:
         print(f"\n[Error] Failed during Ansatz creation: {e}")
         result_dict.update({'error': 'Ansatz creation failed', 'details': str(e)})
         return result_dict # Exit early
 
+    if engine is not None and engine.target is not None:
+        try:
+            # Layout and routing run once here; every evaluation reuses them from the engine
+            target_report = engine.transpile_for_target(ansatz).report(parsed_hamiltonian)
+            result_dict['target_report'] = target_report
+            print(f"Transpiled for target '{target_report['target']}': depth {target_report['depth']} | "
+                  f"{target_report['cx_count']} CX | {target_report['two_qubit_count']} two-qubit gates")
+        except Exception as e:
+            print(f"\n[Error] Failed to transpile the ansatz for the target: {e}")
+            result_dict.update({'error': 'Target transpilation failed', 'details': str(e)})
+            return result_dict
+
+    if num_params == 0:
+        warnings.warn("Ansatz has no parameters. Calculating fixed expectation value.", UserWarning)
+        try:
+            # Use None for param_values when no parameters exist
+            fixed_value = get_hamiltonian_expectation_value(ansatz, parsed_hamiltonian, None, n_shots, **expectation_options)
+            print(f"Fixed Expectation Value: {fixed_value:.8f}")
+            result_dict.update({
+                'optimal_params': np.array([]), 'optimal_value': fixed_value,
+                'optimization_result': None, 'cost_history': [fixed_value],
+                'parameter_history': [np.array([])], 'success': True,
+                'message': 'Static evaluation (no parameters)'
+             })
+            return result_dict
+        except Exception as e:
+            print(f"\n[Error] Failed to calculate fixed expectation value: {e}")
+            result_dict.update({'error': 'Failed static evaluation', 'details': str(e)})
+            return result_dict
+
+    subsystems: Optional[List[Dict[str, Any]]] = None
+    constant_offset = 0.0
+    result_dict['subsystems'] = [list(range(num_qubits))]
+    if decompose_subsystems:
+        try:
+            subsystems, constant_offset = split_into_subsystems(ansatz, parsed_hamiltonian)
+            cluster_qubits = [subsystem['qubits'] for subsystem in subsystems]
+            if len(subsystems) > 1:
+                print(f"Decomposed into {len(subsystems)} independent subsystems: {cluster_qubits}")
+                result_dict['subsystems'] = cluster_qubits
+            else:
+                subsystems = None # Nothing to gain, simulate the full register
+        except Exception as e:
+            print(f"[Warning] Subsystem decomposition failed, simulating the full register: {e}")
+            subsystems = None
+
     logger = OptimizationLogger()
+    parallel: Optional[ParallelEvaluator] = None
+    budget_cost: List[Tuple[int, int]] = []
+
+    def shot_cost() -> Tuple[int, int]:
+        """The `_evaluation_shot_cost` of this search, computed on first use (the evaluator is set up late)."""
+        if not budget_cost:
+            if subsystems is not None:
+                parts = [(subsystem['hamiltonian'], subsystem['ansatz'].num_qubits) for subsystem in subsystems]
+            elif evaluator is not None:
+                parts = [(group, num_qubits) for group in evaluator.groups]
+            else:
+                parts = [(parsed_hamiltonian, num_qubits)]
+            group_diagonal = evaluator.options['group_diagonal'] if evaluator is not None and subsystems is None else True
+            budget_cost.append(_evaluation_shot_cost(parts, estimator, shot_allocation is not None,
+                                                     term_sample_size, group_diagonal))
+        return budget_cost[0]
 
     def objective_function(current_params: np.ndarray) -> float:
         """Closure for the optimizer, calculates Hamiltonian expectation value."""
         value = np.inf # Default to infinity
+        shots_used: Optional[int] = None
+        eval_shots = n_shots
+        if schedule is not None:
+            eval_shots = schedule.next_shots(current_params, logger.params_history, logger.value_history)
+        call_options = dict(expectation_options, return_details=True) if track_shots else expectation_options
+        if shot_budget is not None:
+            # Never start an evaluation the remaining budget cannot pay for; shrink the last one to fit
+            shots_left = shot_budget - logger.total_shots
+            per_shot, minimum = shot_cost()
+            if shots_left <= 0 or shots_left < minimum:
+                raise _ShotBudgetExhausted(f"Shot budget of {shot_budget} exhausted after {logger.eval_count} evaluations.")
+            if per_shot:
+                eval_shots = min(eval_shots, shots_left // per_shot)
+            if target_precision is not None:
+                call_options['max_shots'] = shots_left
         try:
-            exp_val = get_hamiltonian_expectation_value(
-                ansatz=ansatz,
-                parsed_hamiltonian=parsed_hamiltonian,
-                param_values=current_params,
-                n_shots=n_shots
-            )
+            if subsystems is not None:
+                exp_val = get_decomposed_expectation_value(
+                    subsystems, constant_offset, current_params, parameters,
+                    n_shots=eval_shots, cache=cache, **call_options
+                )
+            elif evaluator is not None:
+                exp_val = evaluator.evaluate(current_params, n_shots=eval_shots, return_details=track_shots)
+            elif cache is not None:
+                exp_val = cache.evaluate(ansatz, parsed_hamiltonian, current_params,
+                                         n_shots=eval_shots, **call_options)
+            else:
+                exp_val = get_hamiltonian_expectation_value(
+                    ansatz=ansatz,
+                    parsed_hamiltonian=parsed_hamiltonian,
+                    param_values=current_params,
+                    n_shots=eval_shots,
+                    **call_options
+                )
+            if track_shots:
+                shots_used = exp_val['shots_used']
+                exp_val = exp_val['value']
             value = exp_val
         except (ValueError, RuntimeError, TypeError) as e:
              print(f"\n[Warning] Error during expectation value calculation (params={np.round(current_params[:4], 3)}...): {e}")
@@ -188,7 +469,8 @@ def find_ground_state(
              # value remains inf
         finally:
              # Log the attempt regardless of success, potentially with inf value
-             logger.callback(current_params, value, display_progress=display_progress)
+             logger.callback(current_params, value, display_progress=display_progress,
+                             shots_used=(shots_used or 0) if track_shots else None)
              return value # Return the calculated value or inf
 
     initial_params: np.ndarray
@@ -267,8 +549,20 @@ def find_ground_state(
     print(f"\nStarting Optimization with {optimizer_method}...")
     print(f"Initial Parameters (first 5): {np.round(initial_params[:5], 5)}")
 
+    if evaluator is not None and not evaluator.matches(ansatz, parsed_hamiltonian):
+        print("[Error] The evaluator was set up for a different ansatz or Hamiltonian.")
+        result_dict.update({'error': 'Invalid parallel evaluation settings',
+                            'details': 'Evaluator does not match the ansatz or Hamiltonian'})
+        return result_dict
+    if n_workers is not None:
+        parallel = ParallelEvaluator(ansatz, parsed_hamiltonian, n_workers, light_cone=light_cone)
+        evaluator = parallel
+        print(f"Parallel evaluation: {len(parallel.groups)} term groups on {n_workers} worker processes.")
+
     initial_energy = objective_function(initial_params) # This also logs the first point
     if not np.isfinite(initial_energy): # Check for inf or nan
+        if parallel is not None:
+            parallel.close()
         print("[Error] Objective function returned non-finite value for initial parameters. Cannot start optimization.")
         result_dict.update({
             'error': 'Initial parameters yield invalid energy (inf/nan).',
@@ -287,6 +581,13 @@ def find_ground_state(
                           method=optimizer_method,
                           options=opt_options)
 
+    except _ShotBudgetExhausted as e:
+        print(f"\n[Info] {e} Returning the best point evaluated so far.")
+        finite_values = [(v, i) for i, v in enumerate(logger.value_history) if np.isfinite(v)]
+        best_value, best_index = min(finite_values)
+        result = OptimizeResult(x=np.copy(logger.params_history[best_index]), fun=best_value,
+                                success=False, message=str(e), nfev=logger.eval_count)
+
     except Exception as e:
         print(f"\n[Error] Optimization process failed unexpectedly: {e}")
         cost_history, param_history = logger.get_history()
@@ -294,12 +595,19 @@ def find_ground_state(
             'error': 'Optimization process failed', 'details': str(e),
             'cost_history': cost_history, # Log history up to failure
             'parameter_history': param_history,
+            'shots_history': logger.shots_history,
+            'total_shots': logger.total_shots if track_shots else None,
+            'cache_hits': cache.hits if cache is not None else None,
             'optimization_result': None, # No result object from minimize
             'success': False, # Mark as unsuccessful
             'message': f'Optimization terminated due to error: {e}'
         })
         return result_dict # Exit here
 
+    finally:
+        if parallel is not None:
+            parallel.close()
+
 
     print("\n" + "-"*20 + " Optimization Finished " + "-"*20)
     cost_history, param_history = logger.get_history()
@@ -309,6 +617,9 @@ def find_ground_state(
         'optimization_result': result,
         'cost_history': cost_history,
         'parameter_history': param_history,
+        'shots_history': logger.shots_history,
+        'total_shots': logger.total_shots if track_shots else None,
+        'cache_hits': cache.hits if cache is not None else None,
         'success': result.success,
         'message': result.message,
     })
@@ -354,7 +665,8 @@ def find_ground_state(
                  ax.set_ylabel("Value") # Generic label if no energy
 
             ax.set_xlabel("Optimization Evaluation Step")
-            ax.set_title(f"VQE Convergence ({optimizer_method}, {n_shots} shots)")
+            shots_label = "exact" if n_shots is None else f"{n_shots} shots"
+            ax.set_title(f"VQE Convergence ({optimizer_method}, {shots_label})")
             ax.grid(True, linestyle='--', alpha=0.6)
             fig.tight_layout()
             fig.savefig(plot_filename)
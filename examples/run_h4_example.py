@@ -1,5 +1,5 @@
 import numpy as np
-from easy_vqe import find_ground_state, draw_final_bound_circuit, print_results_summary, get_theoretical_ground_state_energy
+from easy_vqe import find_ground_state, Repeat, draw_final_bound_circuit, print_results_summary, get_theoretical_ground_state_energy
 
 # --- Define Hamiltonian ---
 # Example: Simpler 4-Qubit Hamiltonian (adjust as needed)
@@ -37,8 +37,7 @@ ansatz_block = [
     ('cx', [2, 3]),
 ]
 ansatz_structure = [
-    ansatz_block,
-    ansatz_block
+    Repeat(ansatz_block, 2)  # Two layers of the block, each with its own parameters
 ]
 
 # --- Run VQE ---
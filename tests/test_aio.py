@@ -0,0 +1,66 @@
+import asyncio
+import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+
+from easy_vqe.aio import get_hamiltonian_expectation_value_async, gather_expectation_values, find_ground_state_async
+
+# === Fixtures ===
+
+@pytest.fixture
+def ry_ansatz():
+    theta = Parameter('theta')
+    qc = QuantumCircuit(1)
+    qc.ry(theta, 0)
+    return qc
+
+# === Tests for the async expectation API ===
+
+def test_expectation_value_async(ry_ansatz):
+    value = asyncio.run(get_hamiltonian_expectation_value_async(ry_ansatz, [(1.0, 'Z')], [0.7], n_shots=None))
+    assert value == pytest.approx(np.cos(0.7))
+    details = asyncio.run(get_hamiltonian_expectation_value_async(ry_ansatz, [(1.0, 'Z')], [0.7], n_shots=100,
+                                                                  return_details=True))
+    assert details['shots_used'] == 100
+
+def test_expectation_value_async_does_not_block_loop(ry_ansatz):
+    """Other coroutines keep running while the evaluation is in progress."""
+    async def main():
+        ticks = 0
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+        task = asyncio.create_task(ticker())
+        await get_hamiltonian_expectation_value_async(ry_ansatz, [(1.0, 'Z'), (0.5, 'X')], [0.3], n_shots=2000)
+        task.cancel()
+        return ticks
+    assert asyncio.run(main()) > 1
+
+def test_gather_expectation_values(ry_ansatz):
+    angles = [0.0, np.pi / 2, np.pi]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        values = asyncio.run(gather_expectation_values(ry_ansatz, [(1.0, 'Z')], [[a] for a in angles],
+                                                       n_shots=None, executor=executor))
+    assert np.allclose(values, np.cos(angles))
+
+def test_expectation_value_async_propagates_errors(ry_ansatz):
+    with pytest.raises(ValueError, match="Ansatz expects 1 parameters"):
+        asyncio.run(get_hamiltonian_expectation_value_async(ry_ansatz, [(1.0, 'Z')], [0.1, 0.2], n_shots=None))
+
+# === Tests for find_ground_state_async ===
+
+def test_find_ground_state_async_overlapping_runs():
+    async def main():
+        return await asyncio.gather(
+            find_ground_state_async([('ry', [0])], "1.0 * Z", n_shots=None, initial_params_strategy=[1.0],
+                                    max_evaluations=30, display_progress=False),
+            find_ground_state_async([('ry', [0])], "-1.0 * Z", n_shots=None, initial_params_strategy=[1.0],
+                                    max_evaluations=30, display_progress=False))
+    first, second = asyncio.run(main())
+    assert first['optimal_value'] == pytest.approx(-1.0, abs=1e-3)
+    assert second['optimal_value'] == pytest.approx(-1.0, abs=1e-3)
+    assert np.cos(first['optimal_params'][0]) < 0 < np.cos(second['optimal_params'][0])
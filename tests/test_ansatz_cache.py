@@ -0,0 +1,83 @@
+import pytest
+import numpy as np
+
+from easy_vqe.ansatz_cache import AnsatzCache, structure_fingerprint
+from easy_vqe.circuit import create_custom_ansatz, Repeat
+from easy_vqe.engine import ExecutionEngine
+from easy_vqe.vqe_core import find_ground_state
+
+STRUCTURE = [('h', [0, 1]), Repeat([('ry', [0, 1]), ('cx', [0, 1])], 2), ('rz', [1])]
+
+# === Tests for structure_fingerprint ===
+
+def test_structure_fingerprint_canonical():
+    assert structure_fingerprint(2, STRUCTURE) == structure_fingerprint(
+        2, [('H', [0, 1]), Repeat([('ry', [0, 1]), ('CX', [0, 1])], 2), ('rz', [1])])
+    assert structure_fingerprint(2, STRUCTURE) != structure_fingerprint(3, STRUCTURE)
+    assert structure_fingerprint(2, STRUCTURE) != structure_fingerprint(
+        2, [('h', [0, 1]), Repeat([('ry', [0, 1]), ('cx', [0, 1])], 2, share_params=True), ('rz', [1])])
+    assert structure_fingerprint(2, [('cx', [0, 1])]) != structure_fingerprint(2, [('cx', [1, 0])])
+    assert structure_fingerprint(1, [[('h', [0])], ('x', [0])]) != structure_fingerprint(1, [[('h', [0]), ('x', [0])]])
+
+# === Tests for AnsatzCache ===
+
+def test_ansatz_cache_memory_hits():
+    cache = AnsatzCache()
+    ansatz, params = cache.get(2, STRUCTURE)
+    again, params_again = cache.get(2, [('h', [0, 1]), Repeat([('ry', [0, 1]), ('cx', [0, 1])], 2), ('rz', [1])])
+    assert again is ansatz
+    assert params_again == params and params_again is not params
+    assert [p.name for p in params] == [p.name for p in create_custom_ansatz(2, STRUCTURE)[1]]
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+def test_ansatz_cache_eviction_and_errors():
+    cache = AnsatzCache(max_size=1)
+    cache.get(1, [('h', [0])])
+    cache.get(1, [('x', [0])])
+    cache.get(1, [('h', [0])])
+    assert cache.misses == 3 and len(cache) == 1
+    with pytest.raises(ValueError, match="out of bounds"):
+        cache.get(1, [('h', [3])])
+    with pytest.raises(ValueError, match="max_size must be positive"):
+        AnsatzCache(max_size=0)
+
+def test_ansatz_cache_persists_to_disk(tmp_path):
+    engine = ExecutionEngine()
+    cache = AnsatzCache(directory=str(tmp_path))
+    ansatz, params = cache.get(2, STRUCTURE)
+    transpiled = cache.transpiled(2, STRUCTURE, engine=engine)
+    assert cache.transpiled(2, STRUCTURE, engine=engine) is transpiled
+    assert len(list(tmp_path.glob("ansatz_*.qpy"))) == 1
+
+    warm = AnsatzCache(directory=str(tmp_path))
+    loaded, loaded_params = warm.get(2, STRUCTURE)
+    assert (warm.disk_hits, warm.misses) == (1, 0)
+    assert [p.name for p in loaded_params] == [p.name for p in params]
+    assert [i.operation.name for i in loaded.data] == [i.operation.name for i in ansatz.data]
+    assert warm.transpiled(2, STRUCTURE).count_ops() == transpiled.count_ops()
+
+def test_ansatz_cache_unreadable_file(tmp_path):
+    cache = AnsatzCache(directory=str(tmp_path))
+    cache.get(1, [('ry', [0])])
+    path = next(tmp_path.glob("ansatz_*.qpy"))
+    path.write_bytes(b"not a qpy file")
+    fresh = AnsatzCache(directory=str(tmp_path))
+    with pytest.warns(UserWarning, match="Could not load cached ansatz"):
+        _, params = fresh.get(1, [('ry', [0])])
+    assert [p.name for p in params] == ['p_0'] and fresh.misses == 1
+
+# === Tests for find_ground_state with ansatz_cache ===
+
+def test_find_ground_state_uses_ansatz_cache():
+    cache = AnsatzCache()
+    np.random.seed(0)
+    first = find_ground_state([('ry', [0])], "1.0 * Z", n_shots=None, max_evaluations=10,
+                              display_progress=False, ansatz_cache=cache)
+    second = find_ground_state([('ry', [0])], "-1.0 * Z", n_shots=None, max_evaluations=10,
+                               display_progress=False, ansatz_cache=cache)
+    assert 'error' not in first and 'error' not in second
+    assert (cache.hits, cache.misses) == (1, 1)
+    cached, _ = cache.get(1, [('ry', [0])])
+    assert first['ansatz'] is not cached and second['ansatz'] is not cached
+    first['ansatz'].x(0) # Changing a returned ansatz leaves the cache entry intact
+    assert cached.size() == 1 and second['ansatz'].size() == 1
@@ -0,0 +1,89 @@
+import pytest
+import numpy as np
+from qiskit.quantum_info import Statevector
+
+from easy_vqe.ansatz_library import (hardware_efficient_ansatz, brick_wall_ansatz, particle_conserving_ansatz,
+                                     uccsd_ansatz, build_ansatz, get_ansatz_metadata)
+from easy_vqe.circuit import create_custom_ansatz, bind_parameter_array
+from easy_vqe.hamiltonian import parse_hamiltonian_expression
+from easy_vqe.lightcone import reduce_to_light_cone, get_light_cone_circuit, clear_light_cone_cache
+from easy_vqe.measurement import get_hamiltonian_expectation_value
+
+def _occupations(circuit, values):
+    """Numbers of ones of the basis states with non-zero amplitude."""
+    state = Statevector(bind_parameter_array(circuit, values)).data
+    return {bin(i).count('1') for i in np.flatnonzero(np.abs(state) > 1e-9)}
+
+# === Tests for the generators ===
+
+@pytest.mark.parametrize("generated", [
+    hardware_efficient_ansatz(5, 2),
+    hardware_efficient_ansatz(4, 1, rotations=('rx',), entanglement='circular', entangler='rzz'),
+    hardware_efficient_ansatz(4, 2, entanglement='full', final_rotations=False),
+    brick_wall_ansatz(6, 3),
+    particle_conserving_ansatz(5, 2, 2),
+    uccsd_ansatz(4, 2),
+])
+def test_metadata_matches_built_circuit(generated):
+    structure, metadata = generated
+    ansatz, params = build_ansatz(structure, metadata)
+    assert len(params) == metadata['num_parameters'] and ansatz.size() == metadata['num_gates']
+    assert get_ansatz_metadata(ansatz) is metadata
+    for layer in metadata['layers']:
+        start, stop = layer['gates']
+        layer_params = {instruction.params[0].name for instruction in ansatz.data[start:stop] if instruction.params}
+        assert layer_params == {f"p_{k}" for k in range(*layer['parameters'])}
+    for q in range(ansatz.num_qubits):
+        assert reduce_to_light_cone(ansatz, [q])[1] == metadata['light_cone'][q]
+
+def test_hardware_efficient_and_brick_wall_layers():
+    structure, metadata = hardware_efficient_ansatz(4, 2, entanglement='circular')
+    assert [layer['entangling_pairs'] for layer in metadata['layers']] == [[[0, 1], [1, 2], [2, 3], [0, 3]]] * 2 + [[]]
+    assert create_custom_ansatz(4, structure)[0].size() == metadata['num_gates']
+
+    _, metadata = brick_wall_ansatz(5, 3)
+    assert [layer['entangling_pairs'] for layer in metadata['layers']] == [[[0, 1], [2, 3]], [[1, 2], [3, 4]], [[0, 1], [2, 3]]]
+    assert metadata['light_cone'][0] == [0, 1, 2, 3]
+
+def test_particle_conserving_and_uccsd_keep_particle_number():
+    rng = np.random.default_rng(7)
+    ansatz, params = build_ansatz(*particle_conserving_ansatz(5, 2, 2))
+    assert _occupations(ansatz, rng.uniform(-3, 3, len(params))) == {2}
+
+    ansatz, params = build_ansatz(*uccsd_ansatz(4, 2))
+    layers = get_ansatz_metadata(ansatz)['layers']
+    assert [(layer['occupied'], layer['virtual']) for layer in layers] == \
+        [([0], [2]), ([0], [3]), ([1], [2]), ([1], [3]), ([0, 1], [2, 3])]
+    values = rng.uniform(-3, 3, len(params))
+    start, stop = layers[-1]['parameters']
+    values[start:stop] = values[start] # Equal angles within the double excitation
+    assert _occupations(ansatz, values) == {2}
+
+def test_generator_errors():
+    with pytest.raises(ValueError, match="Unknown rotation gate 'h'"):
+        hardware_efficient_ansatz(3, 1, rotations=('h',))
+    with pytest.raises(ValueError, match="Unknown entanglement"):
+        hardware_efficient_ansatz(3, 1, entanglement='star')
+    with pytest.raises(ValueError, match="not a supported two-qubit gate"):
+        brick_wall_ansatz(3, 1, entangler='ccx')
+    with pytest.raises(ValueError, match="num_particles"):
+        uccsd_ansatz(4, 4)
+    with pytest.raises(ValueError, match="layers must be an integer"):
+        particle_conserving_ansatz(4, 2, -1)
+
+# === Tests for the light-cone shortcut ===
+
+def test_light_cone_uses_stored_metadata():
+    clear_light_cone_cache()
+    ansatz, params = build_ansatz(*hardware_efficient_ansatz(4, 3))
+    reduced, kept = get_light_cone_circuit(ansatz, [3]) # Cone covers every qubit: no reduction needed
+    assert reduced is ansatz and kept == [0, 1, 2, 3]
+    shallow, _ = build_ansatz(*brick_wall_ansatz(4, 1))
+    reduced, kept = get_light_cone_circuit(shallow, [0])
+    assert kept == [0, 1] and reduced.num_qubits == 2
+
+    parsed_ham = parse_hamiltonian_expression("1.0 * ZIII + 0.5 * XXII - 0.3 * IIZZ")
+    values = np.linspace(-1.0, 1.0, len(params))
+    exact = get_hamiltonian_expectation_value(ansatz, parsed_ham, values, n_shots=None)
+    assert np.isclose(get_hamiltonian_expectation_value(ansatz, parsed_ham, values, n_shots=8192, light_cone=True),
+                      exact, atol=0.05)
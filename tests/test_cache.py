@@ -0,0 +1,115 @@
+import os
+import pytest
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+
+from easy_vqe import measurement
+from easy_vqe.cache import ExpectationCache
+from easy_vqe.engine import ExecutionEngine
+from easy_vqe.shots import ShotAllocator
+from easy_vqe.vqe_core import find_ground_state
+
+# === Fixtures ===
+
+@pytest.fixture
+def ry_ansatz():
+    theta = Parameter('theta')
+    qc = QuantumCircuit(1)
+    qc.ry(theta, 0)
+    return qc
+
+@pytest.fixture
+def counted_evaluations(monkeypatch):
+    """Counts calls that reach the simulator-backed expectation function."""
+    calls = []
+    original = measurement.get_hamiltonian_expectation_value
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+    monkeypatch.setattr('easy_vqe.cache.get_hamiltonian_expectation_value', counting)
+    return calls
+
+# === Tests for ExpectationCache ===
+
+def test_cache_exact_mode_hits(ry_ansatz, counted_evaluations):
+    cache = ExpectationCache()
+    first = cache.evaluate(ry_ansatz, [(1.0, 'Z')], [0.4], n_shots=None)
+    second = cache.evaluate(ry_ansatz, [(1.0, 'Z')], np.array([0.4]), n_shots=None)
+    assert first == second == pytest.approx(np.cos(0.4))
+    assert len(counted_evaluations) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    details = cache.evaluate(ry_ansatz, [(1.0, 'Z')], [0.4], n_shots=None, return_details=True)
+    assert details['shots_used'] == 0
+
+def test_cache_key_distinguishes_inputs(ry_ansatz, counted_evaluations):
+    cache = ExpectationCache()
+    cache.evaluate(ry_ansatz, [(1.0, 'Z')], [0.4], n_shots=None)
+    cache.evaluate(ry_ansatz, [(1.0, 'Z')], [0.4 + 1e-15], n_shots=None) # Different bits
+    cache.evaluate(ry_ansatz, [(2.0, 'Z')], [0.4], n_shots=None)
+    cache.evaluate(ry_ansatz, [(1.0, 'Z')], [0.4], n_shots=100)
+    cache.evaluate(ry_ansatz, [(1.0, 'Z')], [0.4], n_shots=100, light_cone=True)
+    assert len(counted_evaluations) == 5
+    assert cache.hits == 0
+
+def test_cache_lru_eviction(ry_ansatz):
+    cache = ExpectationCache(max_size=2)
+    for value in (0.1, 0.2, 0.1, 0.3): # 0.2 is least recently used when 0.3 arrives
+        cache.evaluate(ry_ansatz, [(1.0, 'Z')], [value], n_shots=None)
+    assert len(cache) == 2
+    cache.evaluate(ry_ansatz, [(1.0, 'Z')], [0.1], n_shots=None)
+    assert cache.hits == 2
+    cache.evaluate(ry_ansatz, [(1.0, 'Z')], [0.2], n_shots=None)
+    assert cache.misses == 4
+    cache.clear()
+    assert len(cache) == 0 and cache.hits == 0
+    with pytest.raises(ValueError, match="max_size must be positive"):
+        ExpectationCache(max_size=0)
+
+def test_cache_pools_shots(ry_ansatz, counted_evaluations):
+    cache = ExpectationCache(pool_shots=True)
+    first = cache.evaluate(ry_ansatz, [(1.0, 'Z')], [1.0], n_shots=200, return_details=True)
+    second = cache.evaluate(ry_ansatz, [(1.0, 'Z')], [1.0], n_shots=600, return_details=True)
+    assert len(counted_evaluations) == 2
+    assert second['shots_used'] == 600
+    assert second['pooled_shots'] == 800
+    assert second['variance'] < first['variance']
+    assert second['value'] == pytest.approx(np.cos(1.0), abs=0.15)
+
+def test_cache_pooled_value_is_unbiased(ry_ansatz):
+    """Small batches with noisy variance estimates must not pull the pooled value towards |<Z>| = 1."""
+    cache = ExpectationCache(pool_shots=True)
+    theta = [np.arccos(0.9)] # <Z> = 0.9
+    for _ in range(200):
+        details = cache.evaluate(ry_ansatz, [(1.0, 'Z')], theta, n_shots=16, return_details=True)
+    assert details['pooled_shots'] == 3200
+    assert details['std_error'] == pytest.approx(np.sqrt((1 - 0.9**2) / 3200), rel=0.2)
+    assert details['value'] == pytest.approx(0.9, abs=4 * details['std_error'])
+
+def test_cache_seeded_calls_are_not_pooled(ry_ansatz, counted_evaluations):
+    cache = ExpectationCache(pool_shots=True)
+    first = cache.evaluate(ry_ansatz, [(1.0, 'Z')], [1.0], n_shots=100, seed=7, return_details=True)
+    second = cache.evaluate(ry_ansatz, [(1.0, 'Z')], [1.0], n_shots=100, seed=7, return_details=True)
+    assert len(counted_evaluations) == 1 and cache.hits == 1
+    assert second['value'] == first['value'] and second['pooled_shots'] == 100
+
+def test_cache_keys_engine_target_and_skips_allocators(ry_ansatz, counted_evaluations):
+    cache = ExpectationCache()
+    profile = os.path.join(os.path.dirname(__file__), '..', 'examples', 'line_5_target.json')
+    for engine in (ExecutionEngine(), ExecutionEngine(), ExecutionEngine(target=profile)):
+        cache.evaluate(ry_ansatz, [(1.0, 'Z')], [0.4], n_shots=64, seed=3, engine=engine)
+    assert len(counted_evaluations) == 2 # Engines without a target share entries, the targeted one does not
+
+    allocator = ShotAllocator()
+    for _ in range(2):
+        cache.evaluate(ry_ansatz, [(1.0, 'Z')], [0.4], n_shots=64, shot_allocation=allocator)
+    assert len(counted_evaluations) == 4 and len(cache) == 2
+
+def test_find_ground_state_with_cache():
+    cache = ExpectationCache()
+    result = find_ground_state([('ry', [0])], "1.0 * Z", n_shots=None, optimizer_method='Nelder-Mead',
+                               initial_params_strategy='zeros', max_evaluations=40,
+                               display_progress=False, expectation_cache=cache)
+    assert 'error' not in result
+    assert result['cache_hits'] == cache.hits
+    assert cache.misses + cache.hits == len(result['cost_history'])
@@ -1,8 +1,9 @@
 import warnings
 import pytest
+import numpy as np
 from qiskit import QuantumCircuit
 from qiskit.circuit import Parameter
-from easy_vqe.circuit import create_custom_ansatz, PARAMETRIC_SINGLE_QUBIT_TARGET, PARAMETRIC_MULTI_QUBIT, NON_PARAM_SINGLE, NON_PARAM_MULTI, MULTI_PARAM_GATES
+from easy_vqe.circuit import create_custom_ansatz, Repeat, parameter_order, bind_parameter_array, PARAMETER_ORDER_KEY, PARAMETRIC_SINGLE_QUBIT_TARGET, PARAMETRIC_MULTI_QUBIT, NON_PARAM_SINGLE, NON_PARAM_MULTI, MULTI_PARAM_GATES
 
 # === Tests for create_custom_ansatz ===
 
@@ -233,6 +234,87 @@ def test_parameter_sorting():
     assert len(params_large) == 14
     assert [p.name for p in params_large] == [f"p_{i}" for i in range(14)]
 
+def test_create_deeply_nested_structure():
+    """Test that nesting depth is not limited by the recursion limit."""
+    structure = [('ry', [0])]
+    for _ in range(5000):
+        structure = [structure, ('cx', [0, 1])]
+    ansatz, params = create_custom_ansatz(2, structure)
+    assert len(ansatz.data) == 5001
+    assert ansatz.data[0].operation.name == 'ry'
+    assert len(params) == 1
+
+def test_create_matches_circuit_methods():
+    """Test that the dispatch-table path builds the same circuit as the QuantumCircuit methods."""
+    structure = [('h', [0, 2]), [('CNOT', [0, 1]), ('toffoli', [2, 1, 0])], ('u1', [1]), ('rzz', [2, 0]),
+                 ('barrier', [1, 1, 0]), ('barrier', []), ('swap', [0, 2])]
+    ansatz, params = create_custom_ansatz(3, structure)
+
+    expected = QuantumCircuit(3)
+    expected.h([0, 2])
+    expected.cx(0, 1)
+    expected.ccx(2, 1, 0)
+    expected.p(params[0], 1)
+    expected.rzz(params[1], 2, 0)
+    expected.barrier([1, 0])
+    expected.barrier()
+    expected.swap(0, 2)
+    assert [(i.operation.name, i.operation.params, [ansatz.find_bit(q).index for q in i.qubits]) for i in ansatz.data] == \
+           [(i.operation.name, i.operation.params, [expected.find_bit(q).index for q in i.qubits]) for i in expected.data]
+    assert set(ansatz.parameters) == set(params)
+
+def test_create_duplicate_qubits_error():
+    """Test that repeated qubits in a multi-qubit gate still raise Qiskit's error."""
+    with pytest.raises(RuntimeError, match="Unexpected error applying gate 'cx'"):
+        create_custom_ansatz(2, [('cx', [1, 1])])
+
+def _instruction_summary(circuit):
+    return [(i.operation.name, [str(p) for p in i.operation.params], [circuit.find_bit(q).index for q in i.qubits])
+            for i in circuit.data]
+
+def test_create_repeat_matches_expanded_structure():
+    """Test that Repeat builds the same circuit and parameters as the written-out structure."""
+    block = [('ry', [0, 1, 2]), [('cx', [0, 1]), ('crz', [1, 2])], ('barrier', []), Repeat(('rzz', [0, 2]), 2)]
+    expanded = [('h', [0])] + [[('ry', [0, 1, 2]), [('cx', [0, 1]), ('crz', [1, 2])], ('barrier', []),
+                                ('rzz', [0, 2]), ('rzz', [0, 2])]] * 3
+    ansatz, params = create_custom_ansatz(3, [('h', [0]), Repeat(block, 3)])
+    expected, expected_params = create_custom_ansatz(3, expanded)
+    assert _instruction_summary(ansatz) == _instruction_summary(expected)
+    assert [p.name for p in params] == [p.name for p in expected_params]
+    assert len(params) == 18
+
+def test_create_without_native_standard_gates(monkeypatch):
+    """Test that the gate-object fallback for Qiskit versions without native standard gates builds the same circuits."""
+    import easy_vqe.circuit as circuit
+    block = [('ry', [0, 1, 2]), ('cx', [0, 1]), ('crz', [1, 2]), ('barrier', []), ('ccx', [0, 1, 2])]
+    structure = [('h', [0]), Repeat(block, 2), Repeat([('rzz', [0, 2])], 2, share_params=True), ('measure', [1])]
+    native, native_params = create_custom_ansatz(3, structure)
+    monkeypatch.setattr(circuit, '_NATIVE_STANDARD_GATES', False)
+    monkeypatch.setattr(circuit, '_GATE_DISPATCH', {name: (gate_class, num_gate_qubits, parametric) for name, (gate_class, num_gate_qubits, parametric)
+                                                    in circuit._GATE_CLASSES.items()})
+    fallback, fallback_params = create_custom_ansatz(3, structure)
+    assert _instruction_summary(fallback) == _instruction_summary(native)
+    assert [p.name for p in fallback_params] == [p.name for p in native_params]
+
+def test_create_repeat_shared_parameters():
+    """Test that share_params ties the parameters of all repetitions."""
+    ansatz, params = create_custom_ansatz(2, [Repeat([('ry', [0, 1]), ('cx', [0, 1])], 4, share_params=True), ('rz', [0])])
+    assert [p.name for p in params] == ['p_0', 'p_1', 'p_2']
+    assert len(ansatz.data) == 13
+    assert [i.operation.params[0].name for i in ansatz.data if i.operation.name == 'ry'] == ['p_0', 'p_1'] * 4
+    assert create_custom_ansatz(2, [Repeat([('ry', [0])], 0)])[0].size() == 0
+
+def test_create_repeat_errors(recwarn):
+    """Test Repeat argument validation and that block errors surface once at build time."""
+    with pytest.raises(ValueError, match="non-negative integer"):
+        Repeat([('h', [0])], -1)
+    with pytest.raises(TypeError, match="Repeat block must be a list"):
+        Repeat("h", 2)
+    with pytest.raises(ValueError, match="out of bounds"):
+        create_custom_ansatz(1, [Repeat([('h', [1])], 3)])
+    with pytest.raises(ValueError, match="cannot contain measurements"):
+        create_custom_ansatz(1, [Repeat([('measure', [0])], 2)])
+
 @pytest.mark.filterwarnings("ignore:Could not sort parameters numerically") # Ignore sort warning if triggered
 def test_parameter_sorting_fallback(recwarn):
     """Test fallback string sorting if numerical sort fails."""
@@ -267,4 +349,34 @@ def test_parameter_sorting_fallback(recwarn):
     # Expected order by name: p_1, param_a, param_b
     assert sorted_parameters_sim[0] == p_1
     assert sorted_parameters_sim[1] == p_a
-    assert sorted_parameters_sim[2] == p_b
\ No newline at end of file
+    assert sorted_parameters_sim[2] == p_b
+
+# === Tests for parameter_order and bind_parameter_array ===
+
+def test_parameter_order_stored_by_create():
+    """Test that create_custom_ansatz records the p_0, p_1, ... order in the metadata."""
+    ansatz, params = create_custom_ansatz(2, [('ry', [0, 1])] * 6)
+    assert len(ansatz.metadata[PARAMETER_ORDER_KEY]) == 12
+    assert [p.name for p in ansatz.parameters][:3] == ['p_0', 'p_1', 'p_10'] # Qiskit's own order is by name
+    assert parameter_order(ansatz) == params
+
+def test_parameter_order_without_metadata():
+    """Test the numeric-name fallback for circuits not built by create_custom_ansatz."""
+    qc = QuantumCircuit(1)
+    names = ['p_10', 'p_2', 'p_1']
+    for name in names:
+        qc.rx(Parameter(name), 0)
+    assert [p.name for p in parameter_order(qc)] == ['p_1', 'p_2', 'p_10']
+
+def test_bind_parameter_array():
+    """Test that array binding matches dictionary binding and validates its input."""
+    ansatz, params = create_custom_ansatz(2, [('ry', [0, 1])] * 6)
+    values = np.linspace(0.1, 1.2, 12)
+    bound = bind_parameter_array(ansatz, values)
+    expected = ansatz.assign_parameters(dict(zip(params, values)))
+    assert bound.num_parameters == 0
+    assert [i.operation.params for i in bound.data] == [i.operation.params for i in expected.data]
+    with pytest.raises(ValueError, match="expects 12 parameters, but received 3"):
+        bind_parameter_array(ansatz, [0.0, 1.0, 2.0])
+    with pytest.raises(TypeError, match="must be numeric"):
+        bind_parameter_array(ansatz, ['a'] * 12)
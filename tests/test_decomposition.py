@@ -0,0 +1,75 @@
+import pytest
+import numpy as np
+from qiskit import QuantumCircuit
+
+from easy_vqe.decomposition import find_qubit_clusters, split_into_subsystems, get_decomposed_expectation_value
+from easy_vqe.circuit import create_custom_ansatz
+from easy_vqe.hamiltonian import parse_hamiltonian_expression
+from easy_vqe.measurement import get_hamiltonian_expectation_value
+from easy_vqe import vqe_core
+
+# === Fixtures ===
+
+@pytest.fixture
+def product_problem():
+    """Two 2-qubit blocks (0,1) and (2,3) that never interact."""
+    structure = [('ry', [0, 1, 2, 3]), ('cx', [0, 1]), ('cx', [2, 3]), ('barrier', []), ('rz', [0, 1, 2, 3])]
+    ansatz, params = create_custom_ansatz(4, structure)
+    parsed_ham = parse_hamiltonian_expression("0.5 * ZZII - 0.4 * IIXX + 0.3 * IZII - 1.2 * IIII")
+    return ansatz, params, parsed_ham
+
+# === Tests for find_qubit_clusters ===
+
+def test_clusters_from_terms_and_gates(product_problem):
+    ansatz, _, parsed_ham = product_problem
+    assert find_qubit_clusters(ansatz, parsed_ham) == [[0, 1], [2, 3]]
+
+def test_clusters_merged_by_hamiltonian_term(product_problem):
+    ansatz, _, _ = product_problem
+    parsed_ham = parse_hamiltonian_expression("1.0 * IZZI")
+    assert find_qubit_clusters(ansatz, parsed_ham) == [[0, 1, 2, 3]]
+
+def test_clusters_merged_by_gate():
+    qc = QuantumCircuit(3)
+    qc.cx(0, 2)
+    assert find_qubit_clusters(qc, [(1.0, 'ZII')]) == [[0, 2], [1]]
+
+def test_clusters_single_with_classical_ops():
+    qc = QuantumCircuit(2, 1)
+    qc.measure(0, 0)
+    assert find_qubit_clusters(qc, [(1.0, 'ZI')]) == [[0, 1]]
+
+# === Tests for split_into_subsystems ===
+
+def test_split_into_subsystems(product_problem):
+    ansatz, params, parsed_ham = product_problem
+    subsystems, offset = split_into_subsystems(ansatz, parsed_ham)
+    assert offset == pytest.approx(-1.2)
+    assert [s['qubits'] for s in subsystems] == [[0, 1], [2, 3]]
+    assert subsystems[0]['hamiltonian'] == [(0.5, 'ZZ'), (0.3, 'IZ')]
+    assert subsystems[1]['hamiltonian'] == [(-0.4, 'XX')]
+    assert all(s['ansatz'].num_qubits == 2 for s in subsystems)
+    assert sorted(p.name for p in subsystems[0]['parameters']) == ['p_0', 'p_1', 'p_4', 'p_5']
+
+def test_split_error_length_mismatch(product_problem):
+    ansatz, _, _ = product_problem
+    with pytest.raises(ValueError, match="mismatches ansatz qubits 4"):
+        split_into_subsystems(ansatz, [(1.0, 'ZZ')])
+
+def test_decomposed_expectation_matches_full(product_problem):
+    ansatz, params, parsed_ham = product_problem
+    values = np.linspace(0.2, 1.6, len(params))
+    subsystems, offset = split_into_subsystems(ansatz, parsed_ham)
+    decomposed = get_decomposed_expectation_value(subsystems, offset, values, params, n_shots=8192)
+    full = get_hamiltonian_expectation_value(ansatz, parsed_ham, values, n_shots=8192)
+    assert np.isclose(decomposed, full, atol=0.05)
+
+# === Integration with find_ground_state ===
+
+def test_find_ground_state_reports_subsystems():
+    structure = [('ry', [0, 1, 2, 3]), ('cx', [0, 1]), ('cx', [2, 3])]
+    result = vqe_core.find_ground_state(structure, "0.5 * ZZII - 0.4 * IIXX", n_shots=256,
+                                        max_evaluations=5, display_progress=False,
+                                        decompose_subsystems=True)
+    assert result['subsystems'] == [[0, 1], [2, 3]]
+    assert np.isfinite(result['optimal_value'])
@@ -0,0 +1,102 @@
+import pytest
+import threading
+import numpy as np
+from multiprocessing.connection import Client
+
+from easy_vqe.circuit import create_custom_ansatz
+from easy_vqe.hamiltonian import parse_hamiltonian_expression
+from easy_vqe.measurement import get_hamiltonian_expectation_value
+from easy_vqe.distributed import DistributedEvaluator, run_worker, _parse_address
+from easy_vqe.vqe_core import find_ground_state
+
+HAMILTONIAN = "0.5 * ZZI + 0.3 * IZZ + 0.2 * XII + 0.4 * IXI - 0.1 * YYI + 1.5 * III"
+STRUCTURE = [('ry', [0, 1, 2]), ('cx', [0, 1]), ('ry', [0, 1, 2])]
+
+# === Fixtures ===
+
+@pytest.fixture(scope="module")
+def problem():
+    ansatz, parameters = create_custom_ansatz(3, STRUCTURE)
+    return ansatz, parameters, parse_hamiltonian_expression(HAMILTONIAN)
+
+@pytest.fixture(scope="module")
+def coordinator(problem):
+    ansatz, _, parsed_ham = problem
+    with DistributedEvaluator(ansatz, parsed_ham, num_groups=4) as ev:
+        ev.start_local_workers(2)
+        yield ev
+
+def _start_thread_worker(ev):
+    """Runs a worker in a thread of the test process (cheaper than a subprocess)."""
+    thread = threading.Thread(target=run_worker, args=(ev.address, ev.authkey), daemon=True)
+    thread.start()
+    return thread
+
+# === Tests for addresses ===
+
+def test_parse_address():
+    assert _parse_address("localhost:5000") == ('localhost', 5000)
+    assert _parse_address("/tmp/easy_vqe.sock") == "/tmp/easy_vqe.sock"
+
+# === Tests for DistributedEvaluator ===
+
+def test_distributed_matches_exact(problem, coordinator):
+    ansatz, parameters, parsed_ham = problem
+    params = np.linspace(0.1, 1.0, len(parameters))
+    exact = get_hamiltonian_expectation_value(ansatz, parsed_ham, params, n_shots=None)
+    details = coordinator.evaluate(params, n_shots=20000, return_details=True)
+    assert coordinator.num_workers == 2
+    assert len(coordinator.groups) == 4
+    assert np.isclose(details['value'], exact, atol=5 * details['std_error'] + 1e-3)
+    assert details['shots_used'] == 4 * 20000
+
+def test_distributed_through_expectation_function(problem, coordinator):
+    ansatz, parameters, parsed_ham = problem
+    zeros = [0.0] * len(parameters)
+    value = get_hamiltonian_expectation_value(ansatz, parsed_ham, zeros, n_shots=500, evaluator=coordinator)
+    assert np.isclose(value, 0.5 + 0.3 + 1.5, atol=0.2) # |000>: only the ZZ terms contribute
+    with pytest.raises(ValueError, match="different ansatz or Hamiltonian"):
+        get_hamiltonian_expectation_value(ansatz, parsed_ham[:2], zeros, n_shots=500, evaluator=coordinator)
+    with pytest.raises(ValueError, match="only supports shot-based"):
+        get_hamiltonian_expectation_value(ansatz, parsed_ham, zeros, n_shots=None, evaluator=coordinator)
+
+def test_distributed_find_ground_state(coordinator):
+    np.random.seed(5)
+    result = find_ground_state(STRUCTURE, HAMILTONIAN, n_shots=256, max_evaluations=10,
+                               display_progress=False, evaluator=coordinator)
+    assert 'error' not in result
+    assert len(result['cost_history']) > 1
+    mismatch = find_ground_state([('ry', [0, 1, 2])], HAMILTONIAN, display_progress=False, evaluator=coordinator)
+    assert mismatch['error'] == 'Invalid parallel evaluation settings'
+
+def test_distributed_reassigns_lost_worker(problem):
+    ansatz, parameters, parsed_ham = problem
+    with DistributedEvaluator(ansatz, parsed_ham, num_groups=4, worker_timeout=30) as ev:
+        ev.start_local_workers(1)
+        _start_thread_worker(ev)
+        assert ev.wait_for_workers(2, timeout=30)
+        local = ev._processes[0]
+        local.kill()
+        local.wait()
+        value = ev.evaluate([0.0] * len(parameters), n_shots=200)
+        assert np.isclose(value, 2.3, atol=0.3)
+        assert ev.workers_lost == 1
+        assert ev.num_workers == 1
+
+def test_distributed_worker_error_and_bad_key(problem, monkeypatch):
+    import easy_vqe.distributed as distributed
+    ansatz, parameters, parsed_ham = problem
+    with DistributedEvaluator(ansatz, parsed_ham, num_groups=2) as ev:
+        with pytest.raises(Exception):
+            Client(ev.address, authkey=b'wrong key')
+        _start_thread_worker(ev)
+        assert ev.wait_for_workers(1, timeout=30)
+        with monkeypatch.context() as patch: # The thread worker shares this process's modules
+            def failing(*args, **kwargs):
+                raise RuntimeError("simulator crashed")
+            patch.setattr(distributed, 'evaluate_term_group', failing)
+            with pytest.raises(RuntimeError, match="Worker failed to evaluate term group .*simulator crashed"):
+                ev.evaluate([0.0] * len(parameters), n_shots=100)
+        assert np.isclose(ev.evaluate([0.0] * len(parameters), n_shots=100), 2.3, atol=0.4) # No stale replies
+    with pytest.raises(ValueError, match="closed"):
+        ev.evaluate([0.0] * len(parameters))
@@ -0,0 +1,124 @@
+import pytest
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit_aer import AerSimulator
+
+from easy_vqe.engine import ExecutionEngine, get_default_engine
+from easy_vqe.measurement import get_simulator, run_circuit_and_get_counts, get_hamiltonian_expectation_value
+from easy_vqe.vqe_core import find_ground_state
+
+# === Fixtures ===
+
+@pytest.fixture
+def bell_circuit():
+    qc = QuantumCircuit(2, name="bell")
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure_all()
+    return qc
+
+# === Tests for ExecutionEngine ===
+
+def test_engine_simulator_per_thread():
+    engine = ExecutionEngine(max_parallel_threads=1)
+    main_sim = engine.simulator
+    assert isinstance(main_sim, AerSimulator)
+    assert engine.simulator is main_sim
+    assert main_sim.options.max_parallel_threads == 1
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(engine.simulator))
+    thread.start()
+    thread.join()
+    assert other[0] is not main_sim
+    assert engine.stats()['simulators'] == 2
+
+def test_engine_transpile_cache(bell_circuit):
+    engine = ExecutionEngine()
+    first = engine.transpile(bell_circuit)
+    second = engine.transpile(bell_circuit.copy())
+    assert first is second
+    renamed = engine.transpile(bell_circuit.copy(name="other"))
+    assert renamed is not first
+    stats = engine.stats()
+    assert (stats['transpile_hits'], stats['transpile_misses'], stats['cached_circuits']) == (1, 2, 2)
+
+def test_engine_transpile_cache_eviction_and_disabled(bell_circuit):
+    engine = ExecutionEngine(transpile_cache_size=1)
+    engine.transpile([bell_circuit, bell_circuit.copy(name="other")])
+    assert engine.stats()['cached_circuits'] == 1
+    uncached = ExecutionEngine(transpile_cache_size=0)
+    assert uncached.transpile(bell_circuit) is not uncached.transpile(bell_circuit)
+    assert uncached.stats()['cached_circuits'] == 0
+    with pytest.raises(ValueError, match="transpile_cache_size must be non-negative"):
+        ExecutionEngine(transpile_cache_size=-1)
+
+def test_engine_counters(bell_circuit):
+    engine = ExecutionEngine()
+    counts = run_circuit_and_get_counts(bell_circuit, shots=100, engine=engine)
+    assert sum(counts.values()) == 100
+    assert set(counts) <= {'00', '11'}
+    stats = engine.stats()
+    assert (stats['jobs'], stats['circuits_run'], stats['shots_run']) == (1, 1, 100)
+    engine.reset_stats()
+    stats = engine.stats()
+    assert stats['jobs'] == 0 and stats['cached_circuits'] == 1
+
+def test_engine_transpiles_measurement_circuits_once():
+    def ansatz_with_new_parameters():
+        theta, phi = Parameter('theta'), Parameter('phi')
+        qc = QuantumCircuit(2)
+        qc.ry(theta, 0)
+        qc.cx(0, 1)
+        qc.rz(phi, 1)
+        return qc
+    parsed_ham = [(1.0, 'XX'), (0.5, 'YI'), (0.3, 'IY')]
+    engine = ExecutionEngine()
+    for angle in np.linspace(0.1, 1.0, 4): # Equal structures, distinct Parameter objects
+        value = get_hamiltonian_expectation_value(ansatz_with_new_parameters(), parsed_ham, [0.4, angle],
+                                                  n_shots=100, engine=engine)
+        assert -1.8 <= value <= 1.8
+    stats = engine.stats()
+    assert (stats['transpile_hits'], stats['transpile_misses'], stats['cached_circuits']) == (9, 3, 3)
+
+def test_default_engine_shared():
+    assert get_default_engine() is get_default_engine()
+    assert get_simulator() is get_default_engine().simulator
+
+# === Tests for concurrent execution ===
+
+def test_engine_concurrent_expectation_values():
+    """A shared engine gives correct, independent results from several threads."""
+    theta = Parameter('theta')
+    ansatz = QuantumCircuit(2)
+    ansatz.ry(theta, 0)
+    ansatz.cx(0, 1)
+    parsed_ham = [(1.0, 'ZZ'), (0.5, 'ZI'), (0.5, 'XX')]
+    engine = ExecutionEngine()
+    angles = np.linspace(0.0, np.pi, 8)
+
+    def evaluate(angle):
+        return get_hamiltonian_expectation_value(ansatz, parsed_ham, [angle], n_shots=4000, engine=engine)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        values = list(pool.map(evaluate, angles))
+    expected = 1.0 + 0.5 * np.cos(angles) + 0.5 * np.sin(angles)
+    assert np.allclose(values, expected, atol=0.1)
+    assert engine.stats()['circuits_run'] == 2 * len(angles) # ZZ+ZI share one circuit
+
+def test_find_ground_state_concurrent_runs():
+    engine = ExecutionEngine(max_parallel_threads=1)
+    def search(seed):
+        np.random.seed(seed)
+        return find_ground_state([('ry', [0])], "1.0 * Z", n_shots=256, max_evaluations=15,
+                                 display_progress=False, engine=engine)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(pool.map(search, [0, 1]))
+    for result in results:
+        assert 'error' not in result
+        assert result['optimal_value'] < -0.8
+    assert engine.stats()['jobs'] >= sum(len(result['cost_history']) for result in results)
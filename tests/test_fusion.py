@@ -0,0 +1,126 @@
+import pytest
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.quantum_info import Statevector, Pauli
+
+from easy_vqe.circuit import create_custom_ansatz, parameter_order, Repeat
+from easy_vqe.engine import ExecutionEngine
+from easy_vqe.fusion import compile_ansatz, get_compiled_ansatz, clear_compiled_ansatz_cache, CheckpointedAnsatz
+from easy_vqe.hamiltonian import parse_hamiltonian_expression
+from easy_vqe.measurement import get_hamiltonian_expectation_value
+from easy_vqe.simplify import simplify_circuit
+
+def _reference_states(circuit, values):
+    order = parameter_order(circuit)
+    return np.array([Statevector(circuit.assign_parameters(dict(zip(order, row)))).data for row in values])
+
+# === Tests for compile_ansatz ===
+
+def test_compiled_ansatz_matches_statevector():
+    structure = [('h', [0, 1, 2]), Repeat([('ry', [0, 1, 2]), ('crz', [0, 1]), ('rzz', [1, 2]),
+                                          ('cx', [2, 0]), ('p', [1]), ('ccx', [0, 1, 2])], 2, share_params=True),
+                 ('rx', [2]), ('rx', [2]), ('swap', [0, 2])]
+    ansatz, params = create_custom_ansatz(3, structure)
+    simplified = simplify_circuit(ansatz) # Angles such as p_6 + p_7
+    values = np.random.default_rng(5).uniform(-3, 3, (4, len(params)))
+    for circuit in (ansatz, simplified):
+        compiled = compile_ansatz(circuit)
+        assert np.allclose(compiled.statevectors(values), _reference_states(circuit, values))
+        assert np.allclose(compiled.statevector(values[1]), _reference_states(circuit, values[1:2])[0])
+
+def test_compiled_ansatz_expressions_and_global_phase():
+    a, b = Parameter('p_0'), Parameter('p_1')
+    qc = QuantumCircuit(2)
+    qc.ry(2 * a - 0.3, 0)
+    qc.rx(a * b, 1) # Not affine: evaluated per parameter vector
+    qc.cry(b, 1, 0)
+    qc.u(a, b, 0.2, 1) # Several parameters: built from the gate class
+    qc.barrier()
+    qc.global_phase = b / 2
+    values = np.array([[0.4, -1.2], [2.0, 0.7]])
+    assert np.allclose(compile_ansatz(qc).statevectors(values), _reference_states(qc, values))
+
+def test_compiled_ansatz_fuses_gates():
+    ansatz, params = create_custom_ansatz(2, [Repeat([('ry', [0, 1]), ('rz', [0, 1]), ('cx', [0, 1])], 3)])
+    compiled = compile_ansatz(ansatz)
+    assert compiled.num_gates == 15 and compiled.num_kernels == 1
+    assert compiled.parameters == params
+
+    ansatz, _ = create_custom_ansatz(4, [('ry', [0, 1, 2, 3]), ('cx', [0, 1]), ('cx', [2, 3]), ('cx', [1, 2])])
+    assert compile_ansatz(ansatz).num_kernels == 3
+
+def test_compiled_ansatz_errors():
+    qc = QuantumCircuit(1, 1)
+    qc.h(0)
+    qc.measure(0, 0)
+    with pytest.raises(ValueError, match="Cannot compile 'measure'"):
+        compile_ansatz(qc)
+    compiled = compile_ansatz(create_custom_ansatz(1, [('ry', [0])])[0])
+    with pytest.raises(ValueError, match="shape"):
+        compiled.statevectors(np.zeros((2, 3)))
+    with pytest.raises(TypeError, match="numeric"):
+        compiled.statevectors([['a']])
+
+# === Tests for the compiled program cache and exact expectation values ===
+
+def test_compiled_ansatz_cache_and_exact_expectation():
+    clear_compiled_ansatz_cache()
+    structure = [('ry', [0, 1]), ('cx', [0, 1]), ('rx', [1])]
+    first, _ = create_custom_ansatz(2, structure)
+    second, params = create_custom_ansatz(2, structure) # Equal, but distinct Parameter objects
+    assert get_compiled_ansatz(first) is get_compiled_ansatz(second)
+
+    parsed_ham = parse_hamiltonian_expression("0.5 * ZI - 1.0 * XY + 0.2 * II")
+    values = [0.3, -0.8, 1.9]
+    state = Statevector(_reference_states(second, [values])[0])
+    # Qiskit labels put qubit 0 last
+    expected = 0.2 + 0.5 * state.expectation_value(Pauli('IZ')).real - 1.0 * state.expectation_value(Pauli('YX')).real
+    assert np.isclose(get_hamiltonian_expectation_value(second, parsed_ham, values, n_shots=None), expected)
+    assert np.isclose(get_hamiltonian_expectation_value(second, parsed_ham, dict(zip(params, values)), n_shots=None), expected)
+
+# === Tests for CheckpointedAnsatz ===
+
+LAYERED = [Repeat([('ry', [0, 1, 2, 3]), ('cx', [0, 1]), ('cx', [2, 3]), ('cx', [1, 2])], 3)]
+
+def test_checkpointed_ansatz_parameter_shift_sweep():
+    ansatz, params = create_custom_ansatz(4, LAYERED)
+    compiled = compile_ansatz(ansatz)
+    checkpointed = CheckpointedAnsatz(compiled)
+    assert checkpointed.checkpoint_kernels == sorted(checkpointed.checkpoint_kernels) and checkpointed.checkpoint_kernels
+    values = np.random.default_rng(2).uniform(-3, 3, len(params))
+    for k in range(len(params)):
+        for shift in (np.pi / 2, -np.pi / 2):
+            shifted = values.copy()
+            shifted[k] += shift
+            assert np.allclose(checkpointed.statevector(shifted), compiled.statevector(shifted))
+    assert checkpointed.kernels_skipped > 0
+    assert checkpointed.kernels_applied + checkpointed.kernels_skipped == 2 * len(params) * compiled.num_kernels
+    assert np.allclose(checkpointed.statevector(values), compiled.statevector(values)) # Several parameters changed
+
+def test_checkpointed_ansatz_memory_budget():
+    compiled = compile_ansatz(create_custom_ansatz(4, LAYERED)[0])
+    state_bytes = 16 * 2**4
+    assert len(CheckpointedAnsatz(compiled, memory_budget=2 * state_bytes).checkpoint_kernels) == 2
+    unbudgeted = CheckpointedAnsatz(compiled, memory_budget=0)
+    values = np.zeros(len(compiled.parameters))
+    unbudgeted.statevector(values)
+    values[-1] = 1.0
+    assert np.allclose(unbudgeted.statevector(values), compiled.statevector(values))
+    assert unbudgeted.checkpoint_kernels == [] and unbudgeted.kernels_skipped == 0 and unbudgeted.nbytes == 0
+    with pytest.raises(ValueError, match="memory_budget must be non-negative"):
+        CheckpointedAnsatz(compiled, memory_budget=-1)
+
+def test_engine_statevector_checkpoints_exact_evaluations():
+    ansatz, params = create_custom_ansatz(4, LAYERED)
+    parsed_ham = parse_hamiltonian_expression("1.0 * ZZII + 0.5 * IXXI")
+    values = np.linspace(0.1, 1.2, len(params))
+    engine, uncheckpointed = ExecutionEngine(), ExecutionEngine(checkpoint_memory=0)
+    for k in (0, len(params) - 1):
+        values[k] += 0.3
+        assert np.isclose(get_hamiltonian_expectation_value(ansatz, parsed_ham, values, n_shots=None, engine=engine),
+                          get_hamiltonian_expectation_value(ansatz, parsed_ham, values, n_shots=None, engine=uncheckpointed))
+    assert engine.stats()['kernels_skipped'] > 0
+    assert uncheckpointed.stats()['kernels_skipped'] == 0
+    with pytest.raises(ValueError, match="checkpoint_memory must be non-negative"):
+        ExecutionEngine(checkpoint_memory=-1)
@@ -0,0 +1,78 @@
+import pytest
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+
+from easy_vqe.lightcone import reduce_to_light_cone, get_light_cone_circuit, clear_light_cone_cache
+from easy_vqe.circuit import create_custom_ansatz
+from easy_vqe.hamiltonian import parse_hamiltonian_expression
+from easy_vqe.measurement import get_hamiltonian_expectation_value
+
+# === Fixtures ===
+
+@pytest.fixture
+def shallow_chain_ansatz():
+    """Wide, shallow 6-qubit ansatz: ry layer, one CX ladder, rz layer."""
+    structure = [('ry', list(range(6))), ('cx', [0, 1]), ('cx', [2, 3]), ('cx', [4, 5]), ('rz', list(range(6)))]
+    return create_custom_ansatz(6, structure)
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_light_cone_cache()
+    yield
+    clear_light_cone_cache()
+
+# === Tests for reduce_to_light_cone ===
+
+def test_reduce_keeps_only_causal_qubits(shallow_chain_ansatz):
+    """A term on qubit 3 only depends on qubits 2 and 3 through cx(2, 3)."""
+    ansatz, _ = shallow_chain_ansatz
+    reduced, kept = reduce_to_light_cone(ansatz, [3])
+    assert kept == [2, 3]
+    assert reduced.num_qubits == 2
+    assert sorted(p.name for p in reduced.parameters) == ['p_2', 'p_3', 'p_9']
+
+def test_reduce_respects_gate_order():
+    """Gates after the last interaction with the cone are not pulled in."""
+    qc = QuantumCircuit(2)
+    qc.h(1)
+    qc.cx(0, 1) # Qubit 1 joins the cone of qubit 0 here
+    qc.x(1)     # Outside the cone of qubit 0 (acts after the only interaction)
+    reduced, kept = reduce_to_light_cone(qc, [0])
+    assert kept == [0, 1]
+    assert [instr.operation.name for instr in reduced.data] == ['h', 'cx']
+
+def test_reduce_drops_barriers():
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.barrier()
+    qc.h(1)
+    reduced, kept = reduce_to_light_cone(qc, [1])
+    assert kept == [1]
+    assert [instr.operation.name for instr in reduced.data] == ['h']
+
+def test_reduce_error_on_measurements():
+    qc = QuantumCircuit(1, 1)
+    qc.measure(0, 0)
+    with pytest.raises(ValueError, match="without classical operations"):
+        reduce_to_light_cone(qc, [0])
+
+def test_reduce_error_out_of_bounds():
+    with pytest.raises(ValueError, match="out of bounds"):
+        reduce_to_light_cone(QuantumCircuit(2), [2])
+
+def test_get_light_cone_circuit_is_cached(shallow_chain_ansatz):
+    ansatz, _ = shallow_chain_ansatz
+    first = get_light_cone_circuit(ansatz, [1, 0])
+    second = get_light_cone_circuit(ansatz.copy(), [0, 1]) # Same structure, different object
+    assert first is second
+
+# === Integration with get_hamiltonian_expectation_value ===
+
+def test_expectation_with_light_cone_matches_full(shallow_chain_ansatz):
+    ansatz, params = shallow_chain_ansatz
+    parsed_ham = parse_hamiltonian_expression("0.5 * IIZZII - 0.3 * XIIIII + 0.2 * IIIIIY + 1.5 * IIIIII")
+    values = np.linspace(0.1, 1.1, len(params))
+    full = get_hamiltonian_expectation_value(ansatz, parsed_ham, values, n_shots=8192)
+    reduced = get_hamiltonian_expectation_value(ansatz, parsed_ham, values, n_shots=8192, light_cone=True)
+    assert np.isclose(full, reduced, atol=0.05)
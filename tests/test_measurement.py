@@ -9,7 +9,9 @@ from easy_vqe.measurement import (
     get_simulator,
     apply_measurement_basis,
     run_circuit_and_get_counts,
+    run_circuit_and_get_outcomes,
     calculate_term_expectation,
+    calculate_outcome_expectation,
     get_hamiltonian_expectation_value
 )
 # Import other needed modules from easy_vqe
@@ -205,6 +207,41 @@ def test_run_circuit_sim_error(basic_circuit_no_params, monkeypatch):
         run_circuit_and_get_counts(qc, shots=10)
 
 
+# === Tests for run_circuit_and_get_outcomes ===
+
+def test_run_circuit_outcomes_match_counts():
+    """Outcomes are packed with clbit j in bit j and agree with the counts."""
+    qc = QuantumCircuit(3, 3)
+    qc.x(0)
+    qc.h(2)
+    qc.measure([0, 1, 2], [0, 1, 2])
+    outcomes, frequencies = run_circuit_and_get_outcomes(qc, shots=200)
+    assert outcomes.dtype == np.uint64
+    assert set(outcomes.tolist()) <= {0b001, 0b101}
+    assert frequencies.sum() == 200
+
+def test_run_circuit_outcomes_with_params(basic_circuit_with_params):
+    qc, params = basic_circuit_with_params
+    qc = qc.copy()
+    qc.measure_all()
+    outcomes, frequencies = run_circuit_and_get_outcomes(qc, {params[0]: np.pi, params[1]: 0.0}, shots=50)
+    assert outcomes.tolist() == [0b11] # RX(pi) flips qubit 0, CX copies it to qubit 1
+    assert frequencies.tolist() == [50]
+
+def test_run_circuit_outcomes_edge_cases():
+    qc = QuantumCircuit(1)
+    with pytest.warns(UserWarning, match="Returning empty outcomes"):
+        outcomes, frequencies = run_circuit_and_get_outcomes(qc, shots=10)
+    assert len(outcomes) == 0 and len(frequencies) == 0
+    with pytest.raises(ValueError, match="at most 63 clbits"):
+        run_circuit_and_get_outcomes(QuantumCircuit(1, 64), shots=10)
+
+def test_calculate_outcome_expectation():
+    outcomes = np.array([0b00, 0b10, 0b11], dtype=np.uint64)
+    assert np.isclose(calculate_outcome_expectation(outcomes, np.array([60, 30, 10])), (60 - 30 + 10) / 100)
+    assert calculate_outcome_expectation(np.zeros(0, dtype=np.uint64), np.zeros(0)) == 0.0
+
+
 # === Tests for calculate_term_expectation ===
 
 @pytest.mark.parametrize("counts, expected_value", [
@@ -359,4 +396,94 @@ def test_get_hamiltonian_expval_error_param_binding():
          get_hamiltonian_expectation_value(ansatz, parsed_ham, [0.1, 0.2], n_shots=10)
     # Provide wrong type
     with pytest.raises(TypeError, match="Unsupported type for 'param_values'"):
-         get_hamiltonian_expectation_value(ansatz, parsed_ham, "bad_params", n_shots=10)
\ No newline at end of file
+         get_hamiltonian_expectation_value(ansatz, parsed_ham, "bad_params", n_shots=10)
+# === Tests for the 'sampled' estimator ===
+
+def test_get_hamiltonian_expval_sampled_unbiased():
+    """With many draws the sampled estimate approaches the exact energy."""
+    ansatz = QuantumCircuit(3)
+    ansatz.x(0) # |100> in qubit order: <Z0> = -1, <Z1> = <Z2> = 1
+    parsed_ham = [(0.5, "III"), (1.0, "ZII"), (-0.4, "IZI"), (0.2, "IIZ"), (0.3, "ZZI")]
+    exact = 0.5 - 1.0 - 0.4 + 0.2 - 0.3
+    estimate = get_hamiltonian_expectation_value(ansatz, parsed_ham, None, n_shots=16, estimator='sampled',
+                                                 term_sample_size=2000, seed=5)
+    assert estimate == pytest.approx(exact, abs=0.2) # Draw std error is about 0.045
+
+def test_get_hamiltonian_expval_sampled_details():
+    ansatz = QuantumCircuit(2)
+    parsed_ham = [(1.0, "II"), (1.0, "ZI"), (0.5, "IZ"), (0.0, "XX")]
+    details = get_hamiltonian_expectation_value(ansatz, parsed_ham, None, n_shots=32, estimator='sampled',
+                                                term_sample_size=10, seed=1, return_details=True)
+    # Both terms are +1 eigenvalues of |00>, so every draw equals lambda = 1.5
+    assert details['value'] == pytest.approx(2.5)
+    assert details['variance'] == pytest.approx(0.0, abs=0.01) # Only the 1/n floor on the shot noise
+    assert details['shots_used'] == 32 * details['sampled_terms']
+    assert set(details['term_shots']) <= {"ZI", "IZ"}
+
+def test_get_hamiltonian_expval_sampled_std_error_covers_shot_noise():
+    """The reported std_error tracks the spread over seeds when shot noise dominates."""
+    ansatz = QuantumCircuit(2)
+    ansatz.h([0, 1]) # <ZI> = <IZ> = 0, so every draw has single-shot variance lambda^2
+    parsed_ham = [(1.0, "ZI"), (1.0, "IZ")]
+    runs = [get_hamiltonian_expectation_value(ansatz, parsed_ham, None, n_shots=64, estimator='sampled',
+                                              term_sample_size=1000, seed=seed, return_details=True)
+            for seed in range(60)]
+    empirical_std = np.std([run['value'] for run in runs], ddof=1) # About 2 / sqrt(128) = 0.18
+    reported_std = np.mean([run['std_error'] for run in runs])
+    assert 0.67 < reported_std / empirical_std < 1.5
+
+def test_get_hamiltonian_expval_sampled_errors():
+    ansatz = QuantumCircuit(1)
+    with pytest.raises(ValueError, match="positive term_sample_size"):
+        get_hamiltonian_expectation_value(ansatz, [(1.0, "Z")], None, n_shots=10, estimator='sampled')
+    with pytest.raises(ValueError, match="does not support"):
+        get_hamiltonian_expectation_value(ansatz, [(1.0, "Z")], None, n_shots=10, estimator='sampled',
+                                          term_sample_size=1, shot_allocation='uniform')
+
+# === Tests for diagonal grouping and exact mode ===
+
+def test_get_hamiltonian_expval_diagonal_grouping_single_circuit(monkeypatch):
+    """All Z/I terms share one circuit; other terms keep their own."""
+    import easy_vqe.measurement as measurement
+    calls = []
+    original = measurement._run_unit
+    def counting_run(unit, shots, engine=None):
+        calls.append(unit['circuit'].name)
+        return original(unit, shots, engine)
+    monkeypatch.setattr(measurement, '_run_unit', counting_run)
+
+    ansatz = QuantumCircuit(3)
+    ansatz.x(1)
+    parsed_ham = parse_hamiltonian_expression("0.5 * ZII + 0.25 * IZI + 0.1 * ZZZ + 0.3 * XII + 1.0 * III")
+    details = get_hamiltonian_expectation_value(ansatz, parsed_ham, None, n_shots=200, return_details=True)
+    assert sorted(calls) == ["Measure_XII", "Measure_diagonal"]
+    # |010>: <ZII> = 1, <IZI> = -1, <ZZZ> = -1, <XII> = 0
+    assert np.isclose(details['value'], 0.5 - 0.25 - 0.1 + 1.0, atol=0.15)
+    assert details['term_shots'] == {"ZII": 200, "IZI": 200, "ZZZ": 200, "XII": 200}
+    assert details['shots_used'] == 400
+
+def test_get_hamiltonian_expval_diagonal_grouping_matches_ungrouped():
+    ansatz = QuantumCircuit(2)
+    ansatz.ry(1.1, 0)
+    ansatz.cx(0, 1)
+    parsed_ham = parse_hamiltonian_expression("0.7 * ZI - 0.4 * IZ + 0.2 * ZZ")
+    exact = get_hamiltonian_expectation_value(ansatz, parsed_ham, None, n_shots=None)
+    grouped = get_hamiltonian_expectation_value(ansatz, parsed_ham, None, n_shots=8000, return_details=True)
+    ungrouped = get_hamiltonian_expectation_value(ansatz, parsed_ham, None, n_shots=8000, group_diagonal=False)
+    assert np.isclose(exact, (0.7 - 0.4) * np.cos(1.1) + 0.2)
+    assert np.isclose(grouped['value'], exact, atol=5 * grouped['std_error'] + 1e-3)
+    assert np.isclose(ungrouped, exact, atol=0.05)
+
+def test_get_hamiltonian_expval_exact_mode():
+    """n_shots=None evaluates all terms exactly from the statevector."""
+    theta = Parameter('theta')
+    ansatz = QuantumCircuit(2)
+    ansatz.ry(theta, 0)
+    ansatz.h(1)
+    ansatz.s(1)
+    parsed_ham = parse_hamiltonian_expression("1.0 * ZI + 0.5 * XY + 2.0 * II")
+    details = get_hamiltonian_expectation_value(ansatz, parsed_ham, [0.3], n_shots=None, return_details=True)
+    assert np.isclose(details['value'], np.cos(0.3) + 0.5 * np.sin(0.3) + 2.0)
+    assert details['shots_used'] == 0 and details['variance'] == 0.0
+    with pytest.raises(ValueError, match="Exact mode"):
+        get_hamiltonian_expectation_value(ansatz, parsed_ham, [0.3], n_shots=None, target_std_error=0.1)
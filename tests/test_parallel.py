@@ -0,0 +1,111 @@
+import os
+import pytest
+import numpy as np
+from qiskit import QuantumCircuit
+
+from easy_vqe.circuit import create_custom_ansatz
+from easy_vqe.engine import ExecutionEngine
+from easy_vqe.hamiltonian import parse_hamiltonian_expression
+from easy_vqe.measurement import get_hamiltonian_expectation_value
+from easy_vqe.parallel import ParallelEvaluator, partition_terms, _worker_engine_stats, _TermGroupEvaluator
+from easy_vqe.vqe_core import find_ground_state
+
+EXAMPLE_PROFILE = os.path.join(os.path.dirname(__file__), '..', 'examples', 'line_5_target.json')
+
+# === Fixtures ===
+
+@pytest.fixture(scope="module")
+def problem():
+    parsed_ham = parse_hamiltonian_expression("0.5 * ZZI + 0.3 * IZZ + 0.2 * XII + 0.4 * IXI - 0.1 * YYI + 1.5 * III")
+    ansatz, parameters = create_custom_ansatz(3, [('ry', [0, 1, 2]), ('cx', [0, 1]), ('ry', [0, 1, 2])])
+    return ansatz, parameters, parsed_ham
+
+@pytest.fixture(scope="module")
+def evaluator(problem):
+    ansatz, _, parsed_ham = problem
+    with ParallelEvaluator(ansatz, parsed_ham, num_workers=2) as ev:
+        yield ev
+
+# === Tests for partition_terms ===
+
+def test_partition_terms_keeps_diagonal_together():
+    terms = [(1.0, 'ZZ'), (1.0, 'XI'), (1.0, 'IZ'), (1.0, 'IX'), (1.0, 'YY')]
+    groups = partition_terms(terms, 3)
+    assert groups == [[(1.0, 'ZZ'), (1.0, 'IZ')], [(1.0, 'XI'), (1.0, 'YY')], [(1.0, 'IX')]]
+    assert sorted(sum(partition_terms(terms, 3, group_diagonal=False), [])) == sorted(terms)
+
+def test_partition_terms_edge_cases():
+    assert partition_terms([(1.0, 'ZZ'), (1.0, 'XX')], 1) == [[(1.0, 'ZZ'), (1.0, 'XX')]]
+    assert partition_terms([(1.0, 'XI')], 4) == [[(1.0, 'XI')]]
+    assert partition_terms([], 2) == []
+    with pytest.raises(ValueError, match="num_groups must be positive"):
+        partition_terms([(1.0, 'Z')], 0)
+
+# === Tests for ParallelEvaluator ===
+
+def test_parallel_evaluator_matches_exact(problem, evaluator):
+    ansatz, parameters, parsed_ham = problem
+    params = np.linspace(0.1, 1.0, len(parameters))
+    exact = get_hamiltonian_expectation_value(ansatz, parsed_ham, params, n_shots=None)
+    details = evaluator.evaluate(params, n_shots=20000, return_details=True)
+    assert len(evaluator.groups) == 2
+    assert np.isclose(details['value'], exact, atol=5 * details['std_error'] + 1e-3)
+    assert details['shots_used'] == 4 * 20000 # Diagonal terms share one circuit
+    assert set(details['term_shots']) == {'ZZI', 'IZZ', 'XII', 'IXI', 'YYI'}
+
+def test_parallel_workers_transpile_only_at_setup(problem, evaluator):
+    _, parameters, _ = problem
+    for angle in (0.2, 0.7, 1.3):
+        evaluator.evaluate(np.full(len(parameters), angle), n_shots=100)
+    # Every worker transpiled the 4 measurement circuits (ZZ terms shared, XII, IXI, YYI) when it started, and nothing since
+    worker_stats = [evaluator._pool.submit(_worker_engine_stats).result() for _ in range(4)]
+    assert all((stats['transpile_misses'], stats['transpile_hits']) == (4, 0) for stats in worker_stats)
+
+def test_parallel_evaluator_dict_params_and_errors(problem, evaluator):
+    ansatz, parameters, parsed_ham = problem
+    zeros = evaluator.evaluate({p: 0.0 for p in parameters}, n_shots=500)
+    assert np.isclose(zeros, 0.5 + 0.3 + 1.5, atol=0.2) # |000>: only ZZ terms contribute
+    with pytest.raises(ValueError, match="Ansatz expects 6 parameters"):
+        evaluator.evaluate([0.0, 1.0], n_shots=100)
+    targeted = ExecutionEngine(target=EXAMPLE_PROFILE)
+    with pytest.raises(ValueError, match="hardware target"):
+        get_hamiltonian_expectation_value(ansatz, parsed_ham, np.zeros(len(parameters)), n_shots=100,
+                                          evaluator=evaluator, engine=targeted)
+
+def test_incomplete_evaluator_subclass_fails_on_creation(problem):
+    ansatz, _, parsed_ham = problem
+    class NoClose(_TermGroupEvaluator):
+        def _run_groups(self, values, n_shots):
+            return []
+    with pytest.raises(TypeError, match="abstract"):
+        NoClose(ansatz, parsed_ham, 2, False, True)
+
+def test_parallel_evaluator_identity_only_and_closed():
+    ansatz = QuantumCircuit(1)
+    ev = ParallelEvaluator(ansatz, [(2.0, 'I')], num_workers=2)
+    assert ev.groups == []
+    assert ev.evaluate(None, n_shots=10) == 2.0
+    ev.close()
+    ev.close() # Idempotent
+    with pytest.raises(ValueError, match="closed"):
+        ev.evaluate(None)
+
+# === Tests for find_ground_state with n_workers ===
+
+def test_find_ground_state_parallel():
+    np.random.seed(3)
+    result = find_ground_state([('ry', [0, 1])], "1.0 * ZI + 1.0 * IZ + 0.5 * XX", n_shots=256, max_evaluations=20,
+                               display_progress=False, n_workers=2, shot_budget=100000)
+    assert 'error' not in result
+    assert result['total_shots'] == 2 * 256 * len(result['cost_history'])
+    assert result['optimal_value'] < -1.0
+
+def test_find_ground_state_parallel_invalid_settings():
+    result = find_ground_state([('ry', [0])], "1.0 * Z", n_shots=None, display_progress=False, n_workers=2)
+    assert result['error'] == 'Invalid parallel evaluation settings'
+    assert 'exact mode' in result['details']
+    result = find_ground_state([('ry', [0])], "1.0 * Z", display_progress=False, n_workers=0)
+    assert result['error'] == 'Invalid parallel evaluation settings'
+    result = find_ground_state([('ry', [0])], "1.0 * Z", display_progress=False, n_workers=2,
+                               engine=ExecutionEngine(target=EXAMPLE_PROFILE))
+    assert 'engine target' in result['details']
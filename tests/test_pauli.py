@@ -0,0 +1,61 @@
+import pytest
+import numpy as np
+
+from qiskit.quantum_info import SparsePauliOp, random_statevector
+
+from easy_vqe.pauli import (pauli_masks, bit_parity, bit_count, z_parity_signs, diagonal_expectations,
+                            compile_hamiltonian, pauli_expectations)
+
+# === Tests for pauli_masks ===
+
+def test_pauli_masks_bit_order():
+    x_masks, z_masks = pauli_masks(['XIZ', 'YII', 'III'])
+    assert x_masks.dtype == np.uint64
+    assert x_masks.tolist() == [0b001, 0b001, 0]
+    assert z_masks.tolist() == [0b100, 0b001, 0]
+
+def test_pauli_masks_errors():
+    with pytest.raises(ValueError, match="Invalid Pauli operator 'A'"):
+        pauli_masks(['XA'])
+    with pytest.raises(ValueError, match="at most 63"):
+        pauli_masks(['Z' * 64])
+
+# === Tests for bit helpers ===
+
+def test_bit_parity_and_count():
+    values = np.array([0, 1, 0b1011, 2**63 + 1], dtype=np.uint64)
+    assert bit_count(values).tolist() == [0, 1, 3, 2]
+    assert bit_parity(values).tolist() == [0, 1, 1, 0]
+
+def test_z_parity_signs_and_diagonal_expectations():
+    _, z_masks = pauli_masks(['ZI', 'IZ', 'ZZ'])
+    signs = z_parity_signs(np.array([0b00, 0b01, 0b11], dtype=np.uint64), z_masks)
+    assert signs.tolist() == [[1, 1, 1], [-1, 1, -1], [-1, -1, 1]]
+    probabilities = np.array([0.5, 0.5, 0.0, 0.0]) # Qubit 0 in |+>, qubit 1 in |0>
+    assert diagonal_expectations(probabilities, z_masks, chunk_size=2).tolist() == [0.0, 1.0, 0.0]
+
+# === Tests for pauli_expectations ===
+
+@pytest.mark.parametrize("num_qubits", [1, 2, 5])
+def test_pauli_expectations_match_qiskit(num_qubits):
+    rng = np.random.default_rng(num_qubits)
+    state = random_statevector(2**num_qubits, seed=num_qubits)
+    terms = [''.join(rng.choice(list('IXYZ'), num_qubits)) for _ in range(40)] + ['X' * num_qubits] * 2
+    _, x_masks, z_masks = compile_hamiltonian([(1.0, t) for t in terms])
+    expected = [state.expectation_value(SparsePauliOp(t[::-1])).real for t in terms] # Qiskit labels are reversed
+    assert np.allclose(pauli_expectations(state.data, x_masks, z_masks), expected)
+
+def test_pauli_expectations_shared_x_mask():
+    """Many terms with the same X mask are evaluated together."""
+    state = random_statevector(8, seed=3)
+    terms = ['XII', 'XIZ', 'XZI', 'XZZ', 'YII', 'YZZ', 'III', 'ZZZ']
+    _, x_masks, z_masks = compile_hamiltonian([(1.0, t) for t in terms])
+    expected = [state.expectation_value(SparsePauliOp(t[::-1])).real for t in terms]
+    assert np.allclose(pauli_expectations(state.data, x_masks, z_masks), expected)
+
+def test_pauli_expectations_errors():
+    x_masks, z_masks = pauli_masks(['ZZZ'])
+    with pytest.raises(ValueError, match="not a power of two"):
+        pauli_expectations(np.ones(3), x_masks, z_masks)
+    with pytest.raises(ValueError, match="more than the statevector's 2 qubits"):
+        pauli_expectations(np.array([1, 0, 0, 0]), x_masks, z_masks)
@@ -0,0 +1,83 @@
+import os
+import json
+import pytest
+import numpy as np
+
+from easy_vqe.circuit import create_custom_ansatz, Repeat
+from easy_vqe.engine import ExecutionEngine
+from easy_vqe.hamiltonian import parse_hamiltonian_expression
+from easy_vqe.measurement import get_hamiltonian_expectation_value
+from easy_vqe.prepared import PreparedEvaluation, prepare_evaluation, PREPARED_FORMAT_VERSION
+
+EXAMPLE_PROFILE = os.path.join(os.path.dirname(__file__), '..', 'examples', 'line_5_target.json')
+STRUCTURE = [Repeat([('ry', [0, 1, 2, 3]), ('cx', [0, 1]), ('cx', [1, 2]), ('cx', [2, 3])], 2), ('rz', [3])]
+HAMILTONIAN = "1.0 * ZIIZ + 0.5 * XXII - 0.4 * IYZY + 0.2 * IIII + 0.3 * ZZII"
+
+# === Tests for prepare_evaluation ===
+
+def test_prepared_evaluation_matches_exact_value():
+    ansatz, params = create_custom_ansatz(4, STRUCTURE)
+    parsed_ham = parse_hamiltonian_expression(HAMILTONIAN)
+    values = np.linspace(0.2, 1.1, len(params))
+    exact = get_hamiltonian_expectation_value(ansatz, parsed_ham, values, n_shots=None)
+
+    prepared = prepare_evaluation(ansatz, parsed_ham, engine=ExecutionEngine())
+    assert len(prepared.units) == 3 and np.isclose(prepared.constant_value, 0.2) # XXII, IYZY, shared Z unit
+    details = prepared.evaluate(values, n_shots=20000, return_details=True)
+    assert np.isclose(details['value'], exact, atol=5 * details['std_error'])
+    assert details['shots_used'] == 60000 and details['term_shots']['ZZII'] == 20000
+    by_dict = prepared.evaluate(dict(zip(params, values)), n_shots=20000)
+    assert np.isclose(by_dict, exact, atol=5 * details['std_error'])
+
+    with pytest.raises(ValueError, match="expects 9 parameters"):
+        prepared.evaluate(values[:-1])
+    with pytest.raises(ValueError, match="n_shots"):
+        prepared.evaluate(values, n_shots=0)
+
+# === Tests for save / load ===
+
+def test_saved_state_loads_without_transpiling(tmp_path):
+    ansatz, params = create_custom_ansatz(4, STRUCTURE)
+    parsed_ham = parse_hamiltonian_expression(HAMILTONIAN)
+    values = np.linspace(-0.5, 0.9, len(params))
+    exact = get_hamiltonian_expectation_value(ansatz, parsed_ham, values, n_shots=None)
+    path = str(tmp_path / "state.npz")
+    prepare_evaluation(ansatz, parsed_ham, engine=ExecutionEngine()).save(path)
+
+    loaded = PreparedEvaluation.load(path)
+    assert [p.name for p in loaded.parameters] == [p.name for p in params]
+    assert [unit['terms'] for unit in loaded.units] == [[(0.5, 'XXII')], [(-0.4, 'IYZY')], [(1.0, 'ZIIZ'), (0.3, 'ZZII')]]
+    engine = ExecutionEngine()
+    details = loaded.evaluate(values, n_shots=20000, return_details=True, engine=engine)
+    assert np.isclose(details['value'], exact, atol=5 * details['std_error'])
+    assert engine.stats()['transpile_misses'] == 0 and engine.stats()['jobs'] == 1
+
+def test_saved_state_keeps_target(tmp_path):
+    ansatz, params = create_custom_ansatz(4, STRUCTURE)
+    parsed_ham = parse_hamiltonian_expression(HAMILTONIAN)
+    values = np.linspace(0.3, 1.4, len(params))
+    exact = get_hamiltonian_expectation_value(ansatz, parsed_ham, values, n_shots=None)
+    path = str(tmp_path / "state.npz")
+    prepare_evaluation(ansatz, parsed_ham, engine=ExecutionEngine(target=EXAMPLE_PROFILE)).save(path)
+
+    loaded = PreparedEvaluation.load(path)
+    assert loaded.target['name'] == "line_5" and loaded.ansatz.num_qubits == 4
+    assert all(len(pauli_string) == 5 for unit in loaded.units for _, pauli_string in unit['terms'])
+    details = loaded.evaluate(values, n_shots=20000, return_details=True)
+    assert np.isclose(details['value'], exact, atol=5 * details['std_error'])
+
+def test_load_rejects_other_versions(tmp_path):
+    ansatz, _ = create_custom_ansatz(2, [('ry', [0, 1]), ('cx', [0, 1])])
+    path = str(tmp_path / "state.npz")
+    prepare_evaluation(ansatz, parse_hamiltonian_expression("1.0 * ZZ")).save(path)
+    with np.load(path) as data:
+        arrays = {name: data[name] for name in data.files}
+    arrays['format_version'] = np.array(PREPARED_FORMAT_VERSION + 1)
+    with open(path, 'wb') as file:
+        np.savez(file, **arrays)
+    with pytest.raises(ValueError, match="Unsupported prepared state format version"):
+        PreparedEvaluation.load(path)
+
+    (tmp_path / "junk.npz").write_text(json.dumps({'not': 'a state'}))
+    with pytest.raises(ValueError, match="Could not read prepared state"):
+        PreparedEvaluation.load(str(tmp_path / "junk.npz"))
@@ -0,0 +1,71 @@
+import pytest
+import numpy as np
+from qiskit import QuantumCircuit
+
+from easy_vqe.shadows import ClassicalShadow, collect_classical_shadow
+from easy_vqe.measurement import get_hamiltonian_expectation_value
+from easy_vqe.vqe_core import find_ground_state
+
+# === Tests for ClassicalShadow ===
+
+def test_snapshot_estimates_match_only_compatible_bases():
+    # Two snapshots: basis ZZ with outcome 01 (qubit 0 = 1), basis XZ with outcome 00
+    shadow = ClassicalShadow(2, basis_x=[0b00, 0b01], basis_z=[0b11, 0b10], outcomes=[0b01, 0b00])
+    estimates = shadow.snapshot_estimates(['ZI', 'IZ', 'ZZ', 'XI'])
+    assert estimates[0].tolist() == [-3.0, 3.0, -9.0, 0.0]
+    assert estimates[1].tolist() == [0.0, 3.0, 0.0, 3.0]
+
+def test_shadow_errors():
+    with pytest.raises(ValueError, match="same length"):
+        ClassicalShadow(1, [0], [1, 1], [0])
+    shadow = ClassicalShadow(2, [0], [3], [0])
+    with pytest.raises(ValueError, match="mismatches shadow qubits 2"):
+        shadow.snapshot_estimates(['ZZZ'])
+    with pytest.raises(ValueError, match="n_snapshots must be positive"):
+        collect_classical_shadow(QuantumCircuit(1), None, 0)
+
+def test_collect_shadow_basis_state():
+    qc = QuantumCircuit(3)
+    qc.x(0)
+    shadow = collect_classical_shadow(qc, None, 600, seed=7)
+    assert shadow.num_snapshots == 600
+    estimates = shadow.estimate_terms(['ZII', 'IZI', 'ZZI'])
+    # Z terms measured in a matching basis are deterministic for a basis state
+    assert estimates == pytest.approx([-1.0, 1.0, -1.0], abs=0.35)
+
+def test_shadow_reusable_for_new_observables():
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1) # Bell state: <XX> = <ZZ> = 1, <XI> = 0
+    shadow = collect_classical_shadow(qc, None, 2000, seed=3)
+    assert shadow.estimate([(1.0, 'ZZ')]) == pytest.approx(1.0, abs=0.25)
+    assert shadow.estimate([(1.0, 'XX'), (0.5, 'XI')]) == pytest.approx(1.0, abs=0.3)
+
+# === Tests for the 'shadow' estimator ===
+
+def test_expectation_value_shadow_estimator():
+    qc = QuantumCircuit(2)
+    qc.x(1)
+    ham = [(2.0, 'II'), (0.5, 'ZZ'), (0.0, 'XX')]
+    details = get_hamiltonian_expectation_value(qc, ham, None, 1500, estimator='shadow', seed=11, return_details=True)
+    assert details['value'] == pytest.approx(1.5, abs=0.2)
+    assert details['shots_used'] == 1500
+    assert isinstance(details['shadow'], ClassicalShadow)
+    assert details['std_error'] < 0.2
+
+def test_expectation_value_estimator_errors():
+    qc = QuantumCircuit(1)
+    with pytest.raises(ValueError, match="Unknown estimator"):
+        get_hamiltonian_expectation_value(qc, [(1.0, 'Z')], None, 100, estimator='magic')
+    with pytest.raises(ValueError, match="does not support"):
+        get_hamiltonian_expectation_value(qc, [(1.0, 'Z')], None, 100, estimator='shadow', target_std_error=0.1)
+
+def test_find_ground_state_shadow_estimator():
+    result = find_ground_state([('ry', [0])], "1.0 * Z", n_shots=500, estimator='shadow',
+                               initial_params_strategy='zeros', max_evaluations=5, display_progress=False)
+    assert 'error' not in result
+    assert result['optimal_value'] is not None
+
+def test_find_ground_state_invalid_estimator():
+    result = find_ground_state([('ry', [0])], "1.0 * Z", estimator='magic', display_progress=False)
+    assert result['error'] == 'Invalid estimator'
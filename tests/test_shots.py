@@ -0,0 +1,152 @@
+import pytest
+import numpy as np
+from qiskit import QuantumCircuit
+
+from easy_vqe.shots import allocate_shots, ShotAllocator, ShotSchedule
+from easy_vqe.vqe_core import find_ground_state
+from easy_vqe.hamiltonian import parse_hamiltonian_expression
+from easy_vqe.measurement import get_hamiltonian_expectation_value, estimate_expectation_value
+
+# === Tests for allocate_shots ===
+
+def test_allocate_uniform():
+    shots = allocate_shots([0.8, -0.05, 0.3], 300, 'uniform')
+    assert shots.tolist() == [100, 100, 100]
+
+def test_allocate_proportional_sums_to_budget():
+    shots = allocate_shots([0.81, -0.045, 0.17], 1000, 'proportional', min_shots=1)
+    assert shots.sum() == 1000
+    assert shots[0] > shots[2] > shots[1] >= 1
+
+def test_allocate_variance_uses_std_devs():
+    shots = allocate_shots([1.0, 1.0], 100, 'variance', std_devs=[1.0, 0.0], min_shots=10)
+    assert shots.tolist() == [90, 10]
+
+def test_allocate_small_budget_warns():
+    with pytest.warns(UserWarning, match="smaller than min_shots"):
+        shots = allocate_shots([1.0, 1.0, 1.0], 2, 'uniform', min_shots=1)
+    assert shots.tolist() == [1, 1, 1]
+
+def test_allocate_errors():
+    with pytest.raises(ValueError, match="Unknown shot allocation strategy"):
+        allocate_shots([1.0], 10, 'greedy')
+    with pytest.raises(ValueError, match="Expected 2 standard deviations"):
+        allocate_shots([1.0, 1.0], 10, 'variance', std_devs=[1.0])
+
+# === Tests for ShotAllocator ===
+
+def test_shot_allocator_learns_variances():
+    allocator = ShotAllocator('variance', min_shots=0)
+    assert allocator.std_devs(['ZZ']).tolist() == [1.0] # Unseen term
+    allocator.update(['ZZ', 'XX'], [1.0, 0.0], [100, 100])
+    std_devs = allocator.std_devs(['ZZ', 'XX'])
+    assert std_devs[0] == pytest.approx(allocator.min_std_dev)
+    assert std_devs[1] == pytest.approx(1.0)
+    shots = allocator.allocate(['ZZ', 'XX'], [1.0, 1.0], 1000)
+    assert shots[1] > 10 * shots[0]
+    allocator.reset()
+    assert allocator.std_devs(['ZZ']).tolist() == [1.0]
+
+# === Integration with get_hamiltonian_expectation_value ===
+
+def test_expectation_details_with_allocation():
+    ansatz = QuantumCircuit(2)
+    ansatz.h(0)
+    parsed_ham = parse_hamiltonian_expression("0.8 * XI + 0.1 * IZ + 2.0 * II")
+    details = get_hamiltonian_expectation_value(ansatz, parsed_ham, None, n_shots=902,
+                                                shot_allocation='proportional', return_details=True)
+    assert details['shots_used'] == 902
+    assert details['term_shots']['XI'] == 801 # One guaranteed shot plus its proportional share
+    assert details['term_shots']['IZ'] == 101
+    assert np.isclose(details['value'], 2.9, atol=1e-9) # |+>|0> is an eigenstate of both terms
+    assert details['variance'] < 1e-5 # Eigenstate: only the 1/n variance floor remains
+
+def test_expectation_details_variance_default_shots():
+    ansatz = QuantumCircuit(1)
+    ansatz.h(0)
+    details = get_hamiltonian_expectation_value(ansatz, [(0.5, 'Z')], None, n_shots=1000, return_details=True)
+    assert details['shots_used'] == 1000
+    # Var(Z) on |+> is ~1, so Var = 0.25 * 1 / 1000
+    assert details['variance'] == pytest.approx(0.25 / 1000, rel=0.05)
+    assert details['std_error'] == pytest.approx(np.sqrt(details['variance']))
+
+# === Precision-targeted estimation ===
+
+def test_estimate_expectation_reaches_target():
+    ansatz = QuantumCircuit(2)
+    ansatz.h(0)
+    ansatz.ry(0.7, 1)
+    parsed_ham = parse_hamiltonian_expression("0.8 * ZZ + 0.3 * XI - 0.2 * IX")
+    details = estimate_expectation_value(ansatz, parsed_ham, None, target_std_error=0.01, initial_shots=128)
+    assert details['converged']
+    assert details['std_error'] <= 0.01
+    assert details['rounds'] >= 2
+    # ZZ on |+>(ry|0>) has <ZZ> = 0, <XI> = 1, <IX> = sin(0.7)
+    assert np.isclose(details['value'], 0.3 - 0.2 * np.sin(0.7), atol=0.05)
+
+def test_estimate_expectation_stops_at_max_shots():
+    ansatz = QuantumCircuit(1)
+    ansatz.h(0)
+    details = estimate_expectation_value(ansatz, [(1.0, 'Z')], None, target_std_error=1e-4,
+                                         initial_shots=100, max_shots=500)
+    assert not details['converged']
+    assert details['shots_used'] == 500
+
+def test_estimate_expectation_error_invalid_target():
+    with pytest.raises(ValueError, match="target_std_error must be positive"):
+        estimate_expectation_value(QuantumCircuit(1), [(1.0, 'Z')], None, target_std_error=0.0)
+
+# === Tests for ShotSchedule ===
+
+def test_schedule_geometric_growth_and_cap():
+    schedule = ShotSchedule('geometric', initial_shots=100, max_shots=150, growth=1.2)
+    history = []
+    shots = []
+    for k in range(5):
+        shots.append(schedule.next_shots(np.zeros(1), history, []))
+        history.append(np.zeros(1))
+    assert shots == [100, 120, 144, 150, 150]
+
+def test_schedule_step_grows_as_steps_shrink():
+    schedule = ShotSchedule('step', initial_shots=100, max_shots=10000)
+    history = [np.array([0.0])]
+    assert schedule.next_shots(np.array([1.0]), history, [0.0]) == 100 # Reference step
+    history.append(np.array([1.0]))
+    assert schedule.next_shots(np.array([1.5]), history, [0.0, 0.0]) == 400 # Half the step
+    history.append(np.array([1.5]))
+    assert schedule.next_shots(np.array([3.5]), history, [0.0] * 3) == 400 # Never decreases
+
+def test_schedule_gradient_uses_slopes():
+    schedule = ShotSchedule('gradient', initial_shots=100, max_shots=10000, smoothing=1)
+    params = [np.array([0.0]), np.array([1.0])]
+    assert schedule.next_shots(np.array([2.0]), params, [0.0, -1.0]) == 100 # Reference slope 1
+    params.append(np.array([2.0]))
+    assert schedule.next_shots(np.array([3.0]), params, [0.0, -1.0, -1.5]) == 400 # Slope 0.5
+
+def test_schedule_errors():
+    with pytest.raises(ValueError, match="Unknown shot schedule"):
+        ShotSchedule('linear')
+    with pytest.raises(ValueError, match="initial_shots <= max_shots"):
+        ShotSchedule('geometric', initial_shots=100, max_shots=10)
+
+# === Integration with find_ground_state ===
+
+def test_find_ground_state_shot_budget_and_history():
+    result = find_ground_state([('ry', [0])], "1.0 * Z", n_shots=100, max_evaluations=50,
+                               display_progress=False, shot_schedule='geometric', shot_budget=250)
+    assert 'error' not in result
+    assert "Shot budget of 250 exhausted" in result['message']
+    assert len(result['shots_history']) == len(result['cost_history'])
+    assert result['total_shots'] == sum(result['shots_history'])
+    assert result['total_shots'] == 250 # The last evaluation is shrunk to the shots left
+    assert result['optimal_value'] == min(result['cost_history'])
+
+@pytest.mark.parametrize("options", [{}, {'shot_allocation': 'variance'}, {'term_sample_size': 2},
+                                     {'target_precision': 0.01}])
+def test_find_ground_state_never_exceeds_shot_budget(options):
+    np.random.seed(5)
+    result = find_ground_state([('ry', [0, 1]), ('cx', [0, 1])], "1.0 * ZI + 0.5 * XX - 0.3 * IY", n_shots=1024,
+                               max_evaluations=50, display_progress=False, shot_budget=5000, **options)
+    assert 'error' not in result
+    assert "Shot budget of 5000 exhausted" in result['message']
+    assert result['total_shots'] <= 5000
@@ -0,0 +1,116 @@
+import pytest
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.quantum_info import Operator
+
+from easy_vqe.ansatz_cache import AnsatzCache
+from easy_vqe.circuit import create_custom_ansatz, parameter_order, bind_parameter_array
+from easy_vqe.measurement import get_hamiltonian_expectation_value
+from easy_vqe.hamiltonian import parse_hamiltonian_expression
+from easy_vqe.simplify import simplify_circuit
+from easy_vqe.vqe_core import find_ground_state
+
+def _names(circuit):
+    return [instruction.operation.name for instruction in circuit.data]
+
+def _assert_equivalent(original, simplified, values):
+    bound_original = original.assign_parameters({p: values[p.name] for p in original.parameters})
+    bound_simplified = simplified.assign_parameters({p: values[p.name] for p in simplified.parameters})
+    assert np.allclose(Operator(bound_original).data, Operator(bound_simplified).data) # Including global phase
+
+# === Tests for simplify_circuit ===
+
+def test_simplify_cancels_nested_self_inverse_pairs():
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.x(1)
+    qc.x(1)
+    qc.cx(0, 1)
+    qc.h(0)
+    qc.cz(0, 1)
+    qc.cz(1, 0) # Symmetric: cancels the reversed CZ
+    qc.cx(0, 1)
+    qc.cx(1, 0) # Not the same gate
+    assert _names(simplify_circuit(qc)) == ['cx', 'cx']
+
+def test_simplify_merges_rotations_with_expressions():
+    a, b = Parameter('p_0'), Parameter('p_1')
+    qc = QuantumCircuit(2)
+    qc.ry(a, 0)
+    qc.ry(b, 0)
+    qc.ry(0.5, 0)
+    qc.rzz(a, 0, 1)
+    qc.rzz(0.25, 1, 0)
+    qc.rx(0.3, 1)
+    qc.rx(-0.3, 1)
+    simplified = simplify_circuit(qc)
+    assert _names(simplified) == ['ry', 'rzz']
+    assert set(simplified.parameters) == {a, b}
+    assert simplified.data[0].operation.params[0].parameters == {a, b} # Gate object in sync with the instruction
+    _assert_equivalent(qc, simplified, {'p_0': 0.7, 'p_1': -1.3})
+
+def test_simplify_folds_phase_gates_and_removes_identities():
+    qc = QuantumCircuit(1)
+    qc.s(0)
+    qc.t(0)
+    qc.t(0) # S T T = Z
+    qc.id(0)
+    qc.p(0.0, 0)
+    assert _names(simplify_circuit(qc)) == ['z']
+    qc.sdg(0)
+    qc.s(0)
+    qc.z(0)
+    assert _names(simplify_circuit(qc)) == []
+
+def test_simplify_keeps_barriers_measurements_and_equivalence():
+    qc = QuantumCircuit(2, 1)
+    qc.h(0)
+    qc.barrier()
+    qc.h(0)
+    qc.measure(1, 0)
+    qc.x(1)
+    qc.x(1)
+    assert _names(simplify_circuit(qc)) == ['h', 'barrier', 'h', 'measure']
+
+    rng = np.random.default_rng(4)
+    ansatz, params = create_custom_ansatz(3, [('h', [0, 1, 2]), ('ry', [0, 0, 1]), ('cx', [0, 1]), ('cx', [0, 1]),
+                                              ('s', [2]), ('s', [2]), ('rz', [2]), ('h', [1]), ('h', [1])])
+    simplified = simplify_circuit(ansatz)
+    assert simplified.size() < ansatz.size()
+    assert parameter_order(simplified) == params
+    _assert_equivalent(ansatz, simplified, {p.name: rng.uniform(-3, 3) for p in params})
+
+def test_simplify_never_drops_parameters():
+    a = Parameter('p_0')
+    qc = QuantumCircuit(1)
+    qc.rx(a, 0)
+    qc.rx(-a, 0)
+    qc.p(a, 0)
+    qc.p(-a, 0)
+    simplified = simplify_circuit(qc)
+    assert _names(simplified) == ['rx', 'p'] # RX(p_0 - p_0) still depends on p_0
+    assert set(simplified.parameters) == {a}
+    _assert_equivalent(qc, simplified, {'p_0': 1.1})
+
+# === Tests for the simplified ansatz in the cache and find_ground_state ===
+
+def test_simplified_ansatz_in_cache_and_search():
+    structure = [('ry', [0, 1]), ('ry', [0]), ('cx', [0, 1]), ('cx', [0, 1]), ('rz', [1])]
+    cache = AnsatzCache()
+    simplified, params = cache.get(2, structure, simplify=True)
+    plain, plain_params = cache.get(2, structure)
+    assert params == plain_params
+    assert simplified.size() == 3 and plain.size() == 6
+    assert cache.get(2, structure, simplify=True)[0] is simplified
+
+    parsed_ham = parse_hamiltonian_expression("1.0 * ZI + 0.5 * XX")
+    values = np.linspace(0.2, 0.8, len(params))
+    assert np.isclose(get_hamiltonian_expectation_value(simplified, parsed_ham, values, n_shots=None),
+                      get_hamiltonian_expectation_value(plain, parsed_ham, values, n_shots=None))
+
+    result = find_ground_state(structure, "1.0 * ZI + 0.5 * XX", n_shots=None, max_evaluations=5,
+                               display_progress=False, simplify_ansatz=True)
+    assert 'error' not in result
+    assert result['ansatz'].size() == 3 and len(result['parameters']) == 4
@@ -0,0 +1,101 @@
+import json
+import os
+import pytest
+import numpy as np
+from qiskit.quantum_info import Statevector, Pauli
+
+from easy_vqe.circuit import create_custom_ansatz, bind_parameter_array
+from easy_vqe.engine import ExecutionEngine
+from easy_vqe.hamiltonian import parse_hamiltonian_expression
+from easy_vqe.measurement import get_hamiltonian_expectation_value, run_circuit_and_get_counts, calculate_term_expectation
+from easy_vqe.target import TargetProfile, load_target_profile, transpile_for_target
+from easy_vqe.vqe_core import find_ground_state
+
+EXAMPLE_PROFILE = os.path.join(os.path.dirname(__file__), '..', 'examples', 'line_5_target.json')
+LINE_5 = [[q, q + 1] for q in range(4)] + [[q + 1, q] for q in range(4)]
+# All-to-all CX pattern: needs SWAPs on a line
+ROUTED_STRUCTURE = [('ry', [0, 1, 2, 3])] + [('cx', [a, b]) for a in range(4) for b in range(a + 1, 4)] + \
+                   [('rx', [0, 1, 2, 3]), ('cx', [3, 0])]
+
+# === Tests for TargetProfile ===
+
+def test_load_target_profile(tmp_path):
+    profile = load_target_profile(EXAMPLE_PROFILE)
+    assert (profile.name, profile.num_qubits, profile.optimization_level) == ("line_5", 5, 1)
+    assert profile.basis_gates == ['cx', 'rz', 'sx', 'x'] and [0, 1] in profile.coupling_map
+    assert TargetProfile.from_dict(profile.to_dict()).key == profile.key
+
+    path = tmp_path / "bad.json"
+    path.write_text(json.dumps({'basis_gates': ['cx'], 'coupling': []}))
+    with pytest.raises(ValueError, match="Unknown target profile keys"):
+        load_target_profile(str(path))
+    path.write_text("{not json")
+    with pytest.raises(ValueError, match="not valid JSON"):
+        load_target_profile(str(path))
+    with pytest.raises(ValueError, match="num_qubits is 2"):
+        TargetProfile(['cx'], [[0, 3]], num_qubits=2)
+    with pytest.raises(ValueError, match="optimization_level"):
+        TargetProfile(['cx'], optimization_level=4)
+
+# === Tests for transpile_for_target ===
+
+def test_transpiled_ansatz_respects_target_and_layout():
+    ansatz, params = create_custom_ansatz(4, ROUTED_STRUCTURE)
+    transpiled = transpile_for_target(ansatz, EXAMPLE_PROFILE)
+    edges = {tuple(edge) for edge in LINE_5}
+    for instruction in transpiled.circuit.data:
+        assert instruction.name in {'cx', 'rz', 'sx', 'x'}
+        if len(instruction.qubits) == 2:
+            assert tuple(transpiled.circuit.find_bit(q).index for q in instruction.qubits) in edges
+    assert set(transpiled.circuit.parameters) == set(params)
+
+    report = transpiled.report(parse_hamiltonian_expression("1.0 * XIIZ + 0.5 * IIII"))
+    assert report['cx_count'] == report['two_qubit_count'] == report['gate_counts']['cx'] > 7 # Routing adds CXs
+    assert report['depth'] == transpiled.circuit.depth() and list(report['measurement_depths']) == ['XIIZ']
+    assert report['max_measurement_depth'] >= report['depth']
+
+    # Native measurement circuit: basis changes on the final physical qubits, nothing routed again
+    values = np.linspace(-1.0, 1.2, len(params))
+    state = Statevector(bind_parameter_array(ansatz, values))
+    for pauli_string in ("XIIZ", "IYZI"):
+        circuit = transpiled.measurement_circuit(pauli_string)
+        assert circuit.count_ops().get('cx') == report['cx_count']
+        counts = run_circuit_and_get_counts(circuit, transpiled.parameter_map(values), shots=20000)
+        expected = state.expectation_value(Pauli(pauli_string[::-1])).real # Qiskit labels put qubit 0 last
+        assert np.isclose(calculate_term_expectation(counts), expected, atol=0.05)
+
+    with pytest.raises(ValueError, match="needs 6 qubits"):
+        transpile_for_target(create_custom_ansatz(6, [('h', [5])])[0], EXAMPLE_PROFILE)
+
+# === Tests for the engine target ===
+
+def test_engine_target_transpiles_once():
+    ansatz, params = create_custom_ansatz(4, ROUTED_STRUCTURE)
+    parsed_ham = parse_hamiltonian_expression("1.0 * ZIIZ + 0.5 * XXII - 0.4 * IYZY + 0.2 * IIII")
+    values = np.linspace(0.2, 1.1, len(params))
+    engine = ExecutionEngine(target=load_target_profile(EXAMPLE_PROFILE))
+    for shift in (0.0, 0.3):
+        values[0] += shift
+        exact = get_hamiltonian_expectation_value(ansatz, parsed_ham, values, n_shots=None)
+        details = get_hamiltonian_expectation_value(ansatz, parsed_ham, values, n_shots=20000, engine=engine,
+                                                    return_details=True)
+        assert np.isclose(details['value'], exact, atol=5 * details['std_error'])
+    same_structure, _ = create_custom_ansatz(4, ROUTED_STRUCTURE) # Equal, but distinct Parameter objects
+    get_hamiltonian_expectation_value(same_structure, parsed_ham, values, n_shots=100, engine=engine)
+    assert engine.stats()['target_transpiles'] == 1
+    assert engine.transpile_for_target(ansatz) is engine.transpile_for_target(same_structure)
+
+    with pytest.raises(ValueError, match="no target"):
+        ExecutionEngine().transpile_for_target(ansatz)
+
+def test_find_ground_state_reports_target():
+    engine = ExecutionEngine(target=EXAMPLE_PROFILE)
+    result = find_ground_state(ROUTED_STRUCTURE, "1.0 * ZIIZ + 0.5 * XXII", n_shots=256, max_evaluations=3,
+                               display_progress=False, engine=engine)
+    assert 'error' not in result
+    assert result['target_report']['cx_count'] > 0 and set(result['target_report']['measurement_depths']) == {'ZIIZ', 'XXII'}
+    assert engine.stats()['target_transpiles'] == 1
+
+    too_wide = find_ground_state([('h', [0])], "1.0 * ZIIIII", n_shots=64, max_evaluations=2,
+                                 display_progress=False, engine=engine)
+    assert too_wide['error'] == 'Target transpilation failed'
@@ -473,4 +473,24 @@ def test_find_ground_state_plot_error(mock_print, mock_vqe_dependencies, simple_
 
     # Check for warning print message
     output = "\n".join([str(c.args[0]) for c in mock_print.call_args_list])
-    assert f"[Warning] Could not save convergence plot to '{plot_file}': {error_msg}" in output
\ No newline at end of file
+    assert f"[Warning] Could not save convergence plot to '{plot_file}': {error_msg}" in output
+
+def test_find_ground_state_term_sample_size():
+    """Setting term_sample_size switches to the sampled estimator."""
+    result = vqe_core.find_ground_state([('ry', [0]), ('ry', [1])], "1.0 * ZI + 0.5 * IZ", n_shots=64,
+                                        term_sample_size=1, initial_params_strategy='zeros',
+                                        max_evaluations=5, display_progress=False)
+    assert 'error' not in result
+    assert result['optimal_value'] is not None
+
+    result = vqe_core.find_ground_state([('ry', [0])], "1.0 * Z", estimator='sampled', display_progress=False)
+    assert result['error'] == 'Invalid estimator'
+
+def test_find_ground_state_exact_mode():
+    """n_shots=None optimizes the exact energy."""
+    result = vqe_core.find_ground_state([('ry', [0]), ('ry', [1])], "1.0 * ZI + 0.5 * IZ", n_shots=None,
+                                        initial_params_strategy=[2.5, 2.5], max_evaluations=80,
+                                        display_progress=False)
+    assert 'error' not in result
+    assert np.isclose(result['optimal_value'], -1.5, atol=1e-3)
+    assert result['n_shots'] is None